@@ -3,16 +3,56 @@ Best Practice Analyzer for Semantic Models
 Analyzes TMSL models against a comprehensive set of best practice rules
 """
 
+import hashlib
 import json
 import re
 import time
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field
 from enum import IntEnum
 import logging
 
+from core.config.config_manager import config
+from .bpa_expression import BPACompileError, compile_rule_expression
+
 logger = logging.getLogger(__name__)
 
+# Expression identifiers that reach objects other than the one a rule is
+# evaluated on; rules using them are re-evaluated on every incremental run
+_CROSS_OBJECT_NAMES = frozenset({
+    'Model', 'model', 'Tables', 'FromTable', 'ToTable', 'AllColumns', 'AllMeasures',
+    'AllCalculationItems', 'AllRelationships', 'Relationships', 'Roles', 'Perspectives',
+    'UsedInRelationships', 'UsedInHierarchies', 'ReferencedBy', 'DependsOn',
+})
+# Rule-scoped objects nested in a table: (object type, TMSL key)
+_TABLE_CHILDREN = (('Column', 'columns'), ('Measure', 'measures'), ('Hierarchy', 'hierarchies'),
+                   ('Partition', 'partitions'), ('CalculationGroup', 'calculationGroup'))
+_TABLE_CHILD_KEYS = frozenset(key for _, key in _TABLE_CHILDREN)
+# Rule scope -> fingerprinted object type
+_SCOPE_KINDS = {
+    'Table': 'Table', 'CalculatedTable': 'Table', 'DataColumn': 'Column', 'CalculatedColumn': 'Column',
+    'CalculatedTableColumn': 'Column', 'Measure': 'Measure', 'Hierarchy': 'Hierarchy',
+    'CalculationGroup': 'CalculationGroup', 'Relationship': 'Relationship', 'Partition': 'Partition',
+}
+# Identifiers that read the object's parent table
+_PARENT_TABLE_NAMES = frozenset({'Table', 'table', 'RowLevelSecurity'})
+_STRING_LITERAL = re.compile(r'"(?:[^"\\]|\\.|"")*"')
+_IDENTIFIER = re.compile(r'[A-Za-z_]\w*')
+
+
+def _rule_locality(scope: List[str], expression: str) -> Optional[str]:
+    """
+    What a rule's outcome depends on: 'object' (the evaluated object only),
+    'table' (the object and its parent table) or None (anything in the model).
+    """
+    if 'Model' in scope or not expression:
+        return None
+    names = set(_IDENTIFIER.findall(_STRING_LITERAL.sub('""', expression)))
+    if names & _CROSS_OBJECT_NAMES:
+        return None
+    return 'table' if names & _PARENT_TABLE_NAMES else 'object'
+
+
 class BPASeverity(IntEnum):
     """BPA Rule Severity Levels"""
     INFO = 1
@@ -45,6 +85,10 @@ class BPARule:
     expression: str
     fix_expression: Optional[str] = None
     compatibility_level: int = 1200
+    # Closure compiled from expression at load time (None = use the string interpreter)
+    compiled: Optional[Callable[[Dict[str, Any], Any], Any]] = field(default=None, repr=False, compare=False)
+    # 'object' / 'table' when the outcome can be reused for unchanged objects (see _rule_locality)
+    locality: Optional[str] = field(default=None, repr=False, compare=False)
 
 class BPAAnalyzer:
     """
@@ -75,6 +119,13 @@ class BPAAnalyzer:
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Incremental re-evaluation: object fingerprints, violating object
+        # keys per rule and each rule's violations from the last incremental run
+        self._incremental_state: Optional[Dict[str, Any]] = None
+        self._incremental_run: Optional[Dict[str, Any]] = None
+        self._incremental_stats: Dict[str, Any] = {}
+        self._truncated_rules: Set[str] = set()
+
         if rules_file_path:
             self.load_rules(rules_file_path)
 
@@ -124,9 +175,12 @@ class BPAAnalyzer:
                     fix_expression=rule_data.get('FixExpression'),
                     compatibility_level=rule_data.get('CompatibilityLevel', 1200)
                 )
+                rule.locality = _rule_locality(rule.scope, rule.expression)
                 self.rules.append(rule)
 
-            logger.info(f"Loaded {len(self.rules)} BPA rules")
+            compiled = self.compile_rules()
+            logger.info(f"Loaded {len(self.rules)} BPA rules ({compiled} compiled, "
+                        f"{len(self.rules) - compiled} interpreted)")
 
             # Eagerly compile common patterns for performance
             self._precompile_common_patterns()
@@ -135,6 +189,192 @@ class BPAAnalyzer:
             logger.error(f"Error loading BPA rules: {str(e)}")
             raise
 
+    def compile_rules(self) -> int:
+        """
+        Compile each rule expression into a closure (see bpa_expression)
+
+        Rules using constructs the compiler does not support keep
+        compiled=None and are evaluated by the string interpreter.
+
+        Returns:
+            Number of compiled rules
+        """
+        enabled = bool(config.get('bpa.compile_rules', True))
+        count = 0
+        for rule in self.rules:
+            rule.compiled = None
+            if not enabled:
+                continue
+            try:
+                rule.compiled = compile_rule_expression(rule.expression, self._compile_regex)
+                count += 1
+            except BPACompileError as e:
+                logger.debug(f"BPA rule {rule.id} falls back to the interpreter: {e}")
+        return count
+
+    def _evaluate_rule(self, rule: BPARule, context: Dict) -> Union[bool, int, float, str]:
+        """Evaluate a rule against one object context (compiled closure or interpreter)"""
+        run = self._incremental_run
+        if run is not None and rule.locality:
+            entry = run['objects'].get(id(context.get('obj')))
+            if entry is not None:
+                unchanged = entry[1] and (entry[2] or rule.locality == 'object')
+                if unchanged and rule.id in run['reusable_rules']:
+                    run['reused'] += 1
+                    result = entry[0] in run['previous'].get(rule.id, ())
+                else:
+                    run['evaluated'] += 1
+                    result = bool(self._evaluate_rule_now(rule, context))
+                if result:
+                    run['violations'].setdefault(rule.id, set()).add(entry[0])
+                return result
+        return self._evaluate_rule_now(rule, context)
+
+    def _evaluate_rule_now(self, rule: BPARule, context: Dict) -> Union[bool, int, float, str]:
+        if rule.compiled is None:
+            return self.evaluate_expression(rule.expression, context)
+        try:
+            return rule.compiled(context, context.get('current', context.get('obj')))
+        except Exception as e:
+            logger.debug(f"Compiled rule {rule.id} failed: {e}")
+            return False
+
+    def _fingerprint_objects(self, model: Dict[str, Any]) -> Dict[int, Tuple[str, str, Optional[str]]]:
+        """
+        Map id(obj) -> (object_key, digest, parent_table_key) for every object a rule can be scoped to.
+
+        Keys are stable across TMSL fetches (type, table and object names).
+        Digests hash the object's JSON; a table's digest combines its own
+        properties with the digests of its columns, measures, hierarchies,
+        partitions and calculation group.
+        """
+        objects: Dict[int, Tuple[str, str, Optional[str]]] = {}
+        seen: Dict[str, int] = {}
+
+        def unique(key: str) -> str:
+            count = seen.get(key, 0)
+            seen[key] = count + 1
+            return f"{key}#{count}" if count else key
+
+        def digest(obj: Any, extra: str = '') -> str:
+            raw = json.dumps(obj, sort_keys=True, default=str) + extra
+            return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+        for table in model.get('tables', []) or []:
+            if not isinstance(table, dict):
+                continue
+            table_name = table.get('name', '')
+            table_key = unique(f"Table|{table_name}")
+            children: List[str] = []
+            for kind, collection in _TABLE_CHILDREN:
+                items = table.get(collection)
+                for obj in (items if isinstance(items, list) else [items]):
+                    if isinstance(obj, dict):
+                        name = obj.get('name', '') if collection != 'calculationGroup' else ''
+                        children.append(digest(obj))
+                        objects[id(obj)] = (unique(f"{kind}|{table_name}|{name}"), children[-1], table_key)
+            own = {k: v for k, v in table.items() if k not in _TABLE_CHILD_KEYS}
+            objects[id(table)] = (table_key, digest(own, ''.join(children)), None)
+        for rel in model.get('relationships', []) or []:
+            if isinstance(rel, dict):
+                key = "Relationship|{}|{}|{}|{}".format(rel.get('fromTable'), rel.get('fromColumn'),
+                                                       rel.get('toTable'), rel.get('toColumn'))
+                objects[id(rel)] = (unique(key), digest(rel), None)
+        return objects
+
+    def _begin_incremental(self, model: Dict[str, Any]) -> None:
+        """Fingerprint the model and diff it against the previous incremental run."""
+        start = time.perf_counter()
+        fingerprints = self._fingerprint_objects(model)
+        state = self._incremental_state or {}
+        old_digests: Dict[str, str] = state.get('digests', {})
+        old_rules: Dict[str, str] = state.get('rules', {})
+
+        digests = {key: digest for key, digest, _ in fingerprints.values()}
+        same = {key for key, digest in digests.items() if old_digests.get(key) == digest}
+        removed = [key for key in old_digests if key not in digests]
+        changed_kinds = {key.split('|', 1)[0] for key in digests if key not in same}
+        changed_kinds.update(key.split('|', 1)[0] for key in removed)
+        # id(obj) -> (object_key, object unchanged, parent table unchanged)
+        objects = {obj_id: (key, key in same, parent is None or parent in same)
+                   for obj_id, (key, _, parent) in fingerprints.items()}
+
+        self._incremental_run = {
+            'objects': objects,
+            'digests': digests,
+            'reusable_rules': {r.id for r in self.rules if r.locality and old_rules.get(r.id) == r.expression},
+            'changed_kinds': changed_kinds,
+            'previous': state.get('violations', {}),
+            'replay': state.get('replay', {}),
+            'violations': {},
+            'rule_violations': {},
+            'replayed': 0,
+            'reused': 0,
+            'evaluated': 0,
+        }
+        self._incremental_stats = {
+            'baseline': bool(state),
+            'objects_total': len(objects),
+            'objects_changed': len(objects) - len(same),
+            'objects_skipped': len(same),
+            'objects_removed': len(removed),
+            'fingerprint_ms': round((time.perf_counter() - start) * 1000, 2),
+        }
+
+    def _finish_incremental(self, completed_rules: List[BPARule]) -> None:
+        """Store fingerprints and violations for the next incremental run."""
+        run = self._incremental_run
+        self._incremental_run = None
+        if run is None:
+            return
+        rules = {r.id: r.expression for r in completed_rules
+                 if r.locality and r.id not in self._truncated_rules}
+        self._incremental_state = {
+            'digests': run['digests'],
+            'rules': rules,
+            'violations': {rule_id: keys for rule_id, keys in run['violations'].items() if rule_id in rules},
+            'replay': {rule_id: found for rule_id, found in run['rule_violations'].items() if rule_id in rules},
+        }
+        self._incremental_stats.update({
+            'rules_replayed': run['replayed'],
+            'evaluations_skipped': run['reused'],
+            'evaluations_run': run['evaluated'],
+            'rules_reused': len(run['reusable_rules']),
+            'rules_always_evaluated': sum(1 for r in completed_rules if not r.locality),
+        })
+
+    def _run_rule(self, rule: BPARule, model: Dict, index: Optional[Dict[str, Any]]) -> None:
+        """
+        Analyze one rule, replaying the previous incremental run's violations
+        when nothing the rule can see has changed.
+        """
+        run = self._incremental_run
+        if run is None:
+            self._analyze_rule(rule, model, index)
+            return
+        kinds = {_SCOPE_KINDS.get(scope) for scope in rule.scope}
+        if rule.locality == 'table':
+            kinds.add('Table')
+        stored = run['replay'].get(rule.id)
+        if stored is not None and rule.id in run['reusable_rules'] and not (kinds & run['changed_kinds']):
+            self.violations.extend(stored)
+            run['violations'][rule.id] = run['previous'].get(rule.id, set())
+            run['rule_violations'][rule.id] = stored
+            run['replayed'] += 1
+            return
+        start = len(self.violations)
+        self._analyze_rule(rule, model, index)
+        run['rule_violations'][rule.id] = self.violations[start:]
+
+    def get_incremental_stats(self) -> Dict[str, Any]:
+        """Return skip statistics from the most recent incremental run ({} if none)."""
+        return dict(self._incremental_stats)
+
+    def clear_incremental_state(self) -> None:
+        """Forget stored fingerprints so the next incremental run is a full one."""
+        self._incremental_state = None
+        self._incremental_stats = {}
+
     def validate_rules_file(self, rules_file_path: str) -> bool:
         """Validate BPA rules file schema"""
         try:
@@ -176,11 +416,16 @@ class BPAAnalyzer:
         all_measures: List[Dict[str, Any]] = []
         all_calc_items: List[Dict[str, Any]] = []
         tables_by_name: Dict[str, Dict[str, Any]] = {}
+        # Owning table of each column/measure/hierarchy/partition (keyed by id())
+        table_by_object: Dict[int, Dict[str, Any]] = {}
         for t in tables:
             try:
                 tname = t.get('name')
                 if isinstance(tname, str):
                     tables_by_name[tname] = t
+                for key in ('columns', 'measures', 'hierarchies', 'partitions'):
+                    for obj in t.get(key, []) or []:
+                        table_by_object[id(obj)] = t
                 cols = t.get('columns', []) or []
                 if cols:
                     all_columns.extend(cols)
@@ -199,6 +444,7 @@ class BPAAnalyzer:
             'all_measures': all_measures,
             'all_calc_items': all_calc_items,
             'tables_by_name': tables_by_name,
+            'table_by_object': table_by_object,
             'relationships': model.get('relationships', []) or [],
             'tables': tables,
         }
@@ -712,11 +958,22 @@ class BPAAnalyzer:
                         missing.append(f"{req} missing in {table.get('name', 'unknown')}.{column.get('name', 'unknown')}")
         return list(set(missing))[:10]  # Limit to first 10
 
-    def analyze_model(self, tmsl_json: Union[str, Dict]) -> List[BPAViolation]:
-        """Analyze model against BPA rules"""
+    def analyze_model(self, tmsl_json: Union[str, Dict], incremental: bool = False) -> List[BPAViolation]:
+        """
+        Analyze model against BPA rules
+
+        With incremental=True, objects whose fingerprint is unchanged since
+        the previous incremental run reuse their stored outcome for rules that
+        only read the object (and its parent table), and such rules replay
+        their stored violations when no object of their scope changed.
+        Model-scoped and cross-object rules are always evaluated. The result
+        equals a full run; see get_incremental_stats() for what was skipped.
+        """
         # Reset violations at the start of each analysis run
         self.violations = []
         self._run_notes = []
+        self._truncated_rules = set()
+        self._incremental_stats = {}
 
         if isinstance(tmsl_json, str):
             try:
@@ -760,19 +1017,26 @@ class BPAAnalyzer:
                 details=", ".join(missing_ann[:5])  # Show first 5
             ))
 
+        if incremental:
+            self._begin_incremental(model)
+        completed: List[BPARule] = []
         start_time = time.perf_counter()
         # Generous default budget for full analyze
         max_seconds = 60.0
-        for rule in self.rules:
-            try:
-                self._eval_depth = 0  # Reset depth counter for each rule
-                self._analyze_rule(rule, model, index)
-                if (time.perf_counter() - start_time) > max_seconds:
-                    self._run_notes.append(f"BPA analyze_model timed out after {int(max_seconds)}s; results may be partial")
-                    break
-            except Exception as e:
-                logger.error(f"Rule {rule.id} evaluation failed: {str(e)}")
-                # Don't add error violations for failed rules - just skip them
+        try:
+            for rule in self.rules:
+                try:
+                    self._eval_depth = 0  # Reset depth counter for each rule
+                    self._run_rule(rule, model, index)
+                    completed.append(rule)
+                    if (time.perf_counter() - start_time) > max_seconds:
+                        self._run_notes.append(f"BPA analyze_model timed out after {int(max_seconds)}s; results may be partial")
+                        break
+                except Exception as e:
+                    logger.error(f"Rule {rule.id} evaluation failed: {str(e)}")
+                    # Don't add error violations for failed rules - just skip them
+        finally:
+            self._finish_incremental(completed)
 
         return self.violations
 
@@ -784,6 +1048,7 @@ class BPAAnalyzer:
           - severity_at_least: 'INFO'|'WARNING'|'ERROR' (filter rules below threshold)
           - include_categories: list[str] (only evaluate these categories)
           - max_tables: int (limit number of tables processed)
+          - incremental: bool (reuse outcomes for unchanged objects, see analyze_model)
         """
         if isinstance(tmsl_json, str):
             try:
@@ -839,9 +1104,14 @@ class BPAAnalyzer:
         # Evaluate filtered/limited rule set
         self.violations = []
         self._run_notes = []
+        self._truncated_rules = set()
+        self._incremental_stats = {}
         # Capture config for use inside per-scope checks
         self._fast_cfg = dict(cfg or {})
         index = self._build_model_index(model)
+        if cfg.get('incremental'):
+            self._begin_incremental(model)
+        completed: List[BPARule] = []
         # Time budgets
         try:
             max_seconds = float(cfg.get('max_seconds', 20))
@@ -853,22 +1123,26 @@ class BPAAnalyzer:
             per_rule_max_ms = 150.0
         start_time = time.perf_counter()
         evaluated_rules = 0
-        for rule in rules:
-            try:
-                self._eval_depth = 0
-                rule_start = time.perf_counter()
-                self._analyze_rule(rule, model, index)
-                evaluated_rules += 1
-                # Check per rule budget
-                elapsed_ms = (time.perf_counter() - rule_start) * 1000.0
-                if elapsed_ms > per_rule_max_ms:
-                    self._run_notes.append(f"Rule {rule.id} exceeded {int(per_rule_max_ms)}ms ({int(elapsed_ms)}ms)")
-                # Check global budget
-                if (time.perf_counter() - start_time) > max_seconds:
-                    self._run_notes.append(f"BPA fast mode budget reached after {evaluated_rules} rules and {int(max_seconds)}s; results truncated")
-                    break
-            except Exception:
-                pass
+        try:
+            for rule in rules:
+                try:
+                    self._eval_depth = 0
+                    rule_start = time.perf_counter()
+                    self._run_rule(rule, model, index)
+                    evaluated_rules += 1
+                    completed.append(rule)
+                    # Check per rule budget
+                    elapsed_ms = (time.perf_counter() - rule_start) * 1000.0
+                    if elapsed_ms > per_rule_max_ms:
+                        self._run_notes.append(f"Rule {rule.id} exceeded {int(per_rule_max_ms)}ms ({int(elapsed_ms)}ms)")
+                    # Check global budget
+                    if (time.perf_counter() - start_time) > max_seconds:
+                        self._run_notes.append(f"BPA fast mode budget reached after {evaluated_rules} rules and {int(max_seconds)}s; results truncated")
+                        break
+                except Exception:
+                    pass
+        finally:
+            self._finish_incremental(completed)
         return self.violations
 
     def get_violations_summary(self) -> Dict[str, int]:
@@ -912,7 +1186,7 @@ class BPAAnalyzer:
             if ("Table" in rule.scope and not is_calc) or ("CalculatedTable" in rule.scope and is_calc):
                 context = {'obj': table, 'table': table, 'model': model, 'index': index, 'current': table, 'outerIt': table}
                 try:
-                    if self.evaluate_expression(rule.expression, context):
+                    if self._evaluate_rule(rule, context):
                         self.violations.append(BPAViolation(
                             rule_id=rule.id,
                             rule_name=rule.name,
@@ -949,7 +1223,7 @@ class BPAAnalyzer:
                 if column_type in scope or 'DataColumn' in scope:
                     context = {'obj': column, 'table': table, 'model': model, 'index': index, 'current': column, 'outerIt': column}
                     try:
-                        if self.evaluate_expression(rule.expression, context):
+                        if self._evaluate_rule(rule, context):
                             self.violations.append(BPAViolation(
                                 rule_id=rule.id,
                                 rule_name=rule.name,
@@ -966,9 +1240,11 @@ class BPAAnalyzer:
                     evaluated += 1
                     # Enforce fast-mode iteration/time budgets
                     if max_items and evaluated >= max_items:
+                        self._truncated_rules.add(rule.id)
                         self._run_notes.append(f"Rule {rule.id} truncated after {evaluated} column evaluations")
                         return
                     if per_rule_ms and ((time.perf_counter() - rule_start) * 1000.0) > per_rule_ms:
+                        self._truncated_rules.add(rule.id)
                         self._run_notes.append(f"Rule {rule.id} truncated due to per-rule time budget ({int(per_rule_ms)}ms)")
                         return
 
@@ -993,7 +1269,7 @@ class BPAAnalyzer:
             for measure in measures:
                 context = {'obj': measure, 'table': table, 'model': model, 'index': index, 'current': measure, 'outerIt': measure}
                 try:
-                    if self.evaluate_expression(rule.expression, context):
+                    if self._evaluate_rule(rule, context):
                         self.violations.append(BPAViolation(
                             rule_id=rule.id,
                             rule_name=rule.name,
@@ -1009,9 +1285,11 @@ class BPAAnalyzer:
                     logger.debug(f"Error checking measure rule {rule.id}: {e}")
                 evaluated += 1
                 if max_items and evaluated >= max_items:
+                    self._truncated_rules.add(rule.id)
                     self._run_notes.append(f"Rule {rule.id} truncated after {evaluated} measure evaluations")
                     return
                 if per_rule_ms and ((time.perf_counter() - rule_start) * 1000.0) > per_rule_ms:
+                    self._truncated_rules.add(rule.id)
                     self._run_notes.append(f"Rule {rule.id} truncated due to per-rule time budget ({int(per_rule_ms)}ms)")
                     return
 
@@ -1019,7 +1297,7 @@ class BPAAnalyzer:
         """Check rule against model"""
         context = {'obj': model, 'model': model, 'index': index, 'current': model, 'outerIt': model}
         try:
-            if self.evaluate_expression(rule.expression, context):
+            if self._evaluate_rule(rule, context):
                 self.violations.append(BPAViolation(
                     rule_id=rule.id,
                     rule_name=rule.name,
@@ -1040,7 +1318,7 @@ class BPAAnalyzer:
             for hierarchy in hierarchies:
                 context = {'obj': hierarchy, 'table': table, 'model': model, 'index': index, 'current': hierarchy, 'outerIt': hierarchy}
                 try:
-                    if self.evaluate_expression(rule.expression, context):
+                    if self._evaluate_rule(rule, context):
                         self.violations.append(BPAViolation(
                             rule_id=rule.id,
                             rule_name=rule.name,
@@ -1062,7 +1340,7 @@ class BPAAnalyzer:
             if calc_group:
                 context = {'obj': calc_group, 'table': table, 'model': model, 'index': index, 'current': calc_group, 'outerIt': calc_group}
                 try:
-                    if self.evaluate_expression(rule.expression, context):
+                    if self._evaluate_rule(rule, context):
                         self.violations.append(BPAViolation(
                             rule_id=rule.id,
                             rule_name=rule.name,
@@ -1095,7 +1373,7 @@ class BPAAnalyzer:
         for relationship in relationships:
             context = {'obj': relationship, 'model': model, 'index': index, 'current': relationship, 'outerIt': relationship}
             try:
-                if self.evaluate_expression(rule.expression, context):
+                if self._evaluate_rule(rule, context):
                     self.violations.append(BPAViolation(
                         rule_id=rule.id,
                         rule_name=rule.name,
@@ -1109,9 +1387,11 @@ class BPAAnalyzer:
                 logger.debug(f"Error checking relationship rule {rule.id}: {e}")
             evaluated += 1
             if max_items and evaluated >= max_items:
+                self._truncated_rules.add(rule.id)
                 self._run_notes.append(f"Rule {rule.id} truncated after {evaluated} relationship evaluations")
                 return
             if per_rule_ms and ((time.perf_counter() - rule_start) * 1000.0) > per_rule_ms:
+                self._truncated_rules.add(rule.id)
                 self._run_notes.append(f"Rule {rule.id} truncated due to per-rule time budget ({int(per_rule_ms)}ms)")
                 return
 
@@ -1123,7 +1403,7 @@ class BPAAnalyzer:
             for partition in partitions:
                 context = {'obj': partition, 'table': table, 'model': model, 'index': index, 'current': partition, 'outerIt': partition}
                 try:
-                    if self.evaluate_expression(rule.expression, context):
+                    if self._evaluate_rule(rule, context):
                         self.violations.append(BPAViolation(
                             rule_id=rule.id,
                             rule_name=rule.name,
@@ -0,0 +1,662 @@
+"""
+BPA rule expression compiler
+
+Rule expressions (the Dynamic LINQ dialect used by Tabular Editor BPA rules)
+are parsed once into an AST and compiled into Python closures over the rule
+context, so checking a rule against 20k columns does not re-tokenize the
+expression 20k times.
+
+Supported:
+- literals: "string" (\" or "" escapes a quote), numbers, true, false, null
+- operators: or / ||, and / &&, not / !, ==, =, !=, <>, <, <=, >, >=, + - * / %
+- property paths: Name, Table.Name, Model.Tables, current.Name, it.Name, ...
+- string methods: ToUpper, ToLower, Trim, TrimStart, TrimEnd, Contains,
+  StartsWith, EndsWith, Replace, Length
+- model collections: AllColumns, AllMeasures, AllCalculationItems, AllRelationships
+- collections: Count, Count(), Count(pred), Any(), Any(pred), All(pred),
+  Where(pred), AnyTrue, AnyFalse
+- static calls: RegEx.IsMatch, RegEx.Matches(...).Count,
+  string.IsNullOrWhiteSpace, string.IsNullOrEmpty, Convert.ToInt64,
+  Convert.ToString, Math.Max, Math.Min, Math.Abs, GetAnnotation, HasAnnotation
+
+Inside a lambda argument (Any/Where/...) bare names resolve against the item;
+`current` and `outerIt` stay the object the rule is checked against.
+String equality ignores case, since TMSL serializes enum values in camelCase
+("bothDirections") while rules use the .NET names ("BothDirections").
+
+Anything else raises BPACompileError; BPAAnalyzer then keeps the string
+interpreter for that rule.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Compiled = Callable[[Dict[str, Any], Any], Any]
+
+
+class BPACompileError(ValueError):
+    """Expression uses syntax or a function the compiler does not support"""
+
+
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"\\]|\\.|"")*")
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<op>==|!=|<>|<=|>=|&&|\|\||[<>=!+\-*/%(),.])
+""", re.VERBOSE)
+
+_KEYWORDS = {"and": "&&", "or": "||", "not": "!"}
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+def tokenize(expression: str) -> List[Tuple[str, Any]]:
+    """Split an expression into (kind, value) tokens"""
+    tokens: List[Tuple[str, Any]] = []
+    position = 0
+    while position < len(expression):
+        match = _TOKEN_PATTERN.match(expression, position)
+        if not match:
+            raise BPACompileError(f"Unexpected character {expression[position]!r} at {position}")
+        position = match.end()
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "ws":
+            continue
+        if kind == "string":
+            # \" and "" escape a quote; other backslashes are kept for regex patterns
+            tokens.append(("literal", text[1:-1].replace('\\"', '"').replace('""', '"')))
+        elif kind == "number":
+            tokens.append(("literal", float(text) if "." in text else int(text)))
+        elif kind == "ident" and text.lower() in _KEYWORDS:
+            tokens.append(("op", _KEYWORDS[text.lower()]))
+        elif kind == "ident" and text.lower() in _LITERALS:
+            tokens.append(("literal", _LITERALS[text.lower()]))
+        elif kind == "op" and text == "=":
+            tokens.append(("op", "=="))
+        elif kind == "op" and text == "<>":
+            tokens.append(("op", "!="))
+        else:
+            tokens.append((kind, text))
+    tokens.append(("end", None))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing nested tuples (the AST)"""
+
+    def __init__(self, expression: str):
+        self.tokens = tokenize(expression)
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> Tuple[str, Any]:
+        return self.tokens[min(self.position + offset, len(self.tokens) - 1)]
+
+    def take(self) -> Tuple[str, Any]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def accept(self, value: str) -> bool:
+        kind, text = self.peek()
+        if kind == "op" and text == value:
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, value: str):
+        if not self.accept(value):
+            raise BPACompileError(f"Expected '{value}', found {self.peek()[1]!r}")
+
+    def parse(self):
+        node = self.parse_or()
+        if self.peek()[0] != "end":
+            raise BPACompileError(f"Unexpected token {self.peek()[1]!r}")
+        return node
+
+    def parse_or(self):
+        nodes = [self.parse_and()]
+        while self.accept("||"):
+            nodes.append(self.parse_and())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def parse_and(self):
+        nodes = [self.parse_not()]
+        while self.accept("&&"):
+            nodes.append(self.parse_not())
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def parse_not(self):
+        # `not` binds looser than comparisons: not DataCategory == "Time"
+        if self.accept("!"):
+            return ("not", self.parse_not())
+        return self.parse_comparison()
+
+    def parse_comparison(self):
+        left = self.parse_additive()
+        kind, text = self.peek()
+        if kind == "op" and text in ("==", "!=", "<", "<=", ">", ">="):
+            self.position += 1
+            return ("compare", text, left, self.parse_additive())
+        return left
+
+    def parse_additive(self):
+        node = self.parse_multiplicative()
+        while True:
+            kind, text = self.peek()
+            if kind == "op" and text in ("+", "-"):
+                self.position += 1
+                node = ("arith", text, node, self.parse_multiplicative())
+            else:
+                return node
+
+    def parse_multiplicative(self):
+        node = self.parse_unary()
+        while True:
+            kind, text = self.peek()
+            if kind == "op" and text in ("*", "/", "%"):
+                self.position += 1
+                node = ("arith", text, node, self.parse_unary())
+            else:
+                return node
+
+    def parse_unary(self):
+        if self.accept("-"):
+            return ("arith", "-", ("literal", 0), self.parse_unary())
+        if self.accept("!"):
+            return ("not", self.parse_unary())
+        return self.parse_postfix()
+
+    def parse_args(self) -> List[Any]:
+        args: List[Any] = []
+        if self.accept(")"):
+            return args
+        while True:
+            args.append(self.parse_or())
+            if self.accept(")"):
+                return args
+            self.expect(",")
+
+    def parse_postfix(self):
+        kind, text = self.take()
+        if kind == "literal":
+            node = ("literal", text)
+        elif kind == "op" and text == "(":
+            node = self.parse_or()
+            self.expect(")")
+        elif kind == "ident":
+            if text in _STATIC_CLASSES and self.peek() == ("op", "."):
+                self.position += 1
+                member_kind, member = self.take()
+                if member_kind != "ident":
+                    raise BPACompileError(f"Expected member name after {text}.")
+                self.expect("(")
+                node = ("static", _STATIC_CLASSES[text], member, self.parse_args())
+            elif self.accept("("):
+                node = ("call", ("name", "it"), text, self.parse_args())
+            else:
+                node = ("name", text)
+        else:
+            raise BPACompileError(f"Unexpected token {text!r}")
+
+        while self.accept("."):
+            member_kind, member = self.take()
+            if member_kind != "ident":
+                raise BPACompileError(f"Expected member name, found {member!r}")
+            if self.accept("("):
+                node = ("call", node, member, self.parse_args())
+            else:
+                node = ("member", node, member)
+        return node
+
+
+_STATIC_CLASSES = {
+    "RegEx": "regex", "Regex": "regex",
+    "string": "string", "String": "string",
+    "Convert": "convert",
+    "Math": "math",
+}
+
+
+def parse_expression(expression: str):
+    """Parse a rule expression into its AST (nested tuples)"""
+    return _Parser(expression).parse()
+
+
+# ---------------------------------------------------------------------------
+# Runtime helpers
+# ---------------------------------------------------------------------------
+
+# TMSL stores these under partition.source
+_PARTITION_SOURCE_TYPES = {
+    "m": "M", "calculated": "Calculated", "query": "Query", "entity": "Entity",
+    "policyrange": "PolicyRange", "calculationgroup": "CalculationGroup",
+}
+
+
+def _key_variants(name: str) -> Tuple[str, ...]:
+    """Key spellings tried on dict objects: as written, lower, camelCase"""
+    variants = [name]
+    for variant in (name.lower(), name[:1].lower() + name[1:]):
+        if variant not in variants:
+            variants.append(variant)
+    return tuple(variants)
+
+
+def _index(ctx: Dict[str, Any]) -> Dict[str, Any]:
+    return ctx.get("index") or {}
+
+
+def _table_of(ctx: Dict[str, Any], obj: Any) -> Any:
+    if obj is ctx.get("obj") and ctx.get("table") is not None and obj is not ctx.get("table"):
+        return ctx.get("table")
+    return _index(ctx).get("table_by_object", {}).get(id(obj))
+
+
+def _member_getter(name: str) -> Callable[[Dict[str, Any], Any], Any]:
+    """Property lookup for `value.Name` against TMSL dicts"""
+    keys = _key_variants(name)
+    model_lists = {"AllColumns": "all_columns", "AllMeasures": "all_measures",
+                   "AllCalculationItems": "all_calc_items", "AllRelationships": "relationships"}
+
+    def get(ctx: Dict[str, Any], value: Any) -> Any:
+        if isinstance(value, dict):
+            for key in keys:
+                if key in value:
+                    found = value[key]
+                    if name in ("FromTable", "ToTable") and isinstance(found, str):
+                        return _index(ctx).get("tables_by_name", {}).get(found, found)
+                    return found
+            if name in model_lists:
+                return _index(ctx).get(model_lists[name]) or []
+            if name == "Table":
+                return _table_of(ctx, value)
+            if name == "Model":
+                return ctx.get("model")
+            if name == "RowLevelSecurity":
+                return (ctx.get("table") or {}).get("roles", [])
+            source = value.get("source")
+            if isinstance(source, dict):
+                if name == "SourceType":
+                    kind = source.get("type")
+                    return _PARTITION_SOURCE_TYPES.get(str(kind).lower(), kind) if kind is not None else None
+                if name == "Query":
+                    return source.get("query", source.get("expression"))
+            return None
+        if isinstance(value, str) and name == "Name":
+            # Unresolved object references (e.g. a relationship's table name)
+            return value
+        if isinstance(value, (str, list, dict)) and name in ("Length", "Count"):
+            return len(value)
+        if value is None and name in ("Length", "Count"):
+            return 0
+        return None
+
+    return get
+
+
+def _truthy_item(item: Any) -> bool:
+    if isinstance(item, dict):
+        return bool(item.get("value") if "value" in item else (item.get("used") if "used" in item else item))
+    return bool(item)
+
+
+def _as_list(value: Any) -> List[Any]:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, dict):
+        return list(value.values())
+    return []
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "True" if value else "False"
+    return str(value)
+
+
+def _equals(left: Any, right: Any) -> bool:
+    if isinstance(left, str) and isinstance(right, str):
+        return left.casefold() == right.casefold()
+    if isinstance(left, bool) or isinstance(right, bool):
+        return left is right or left == right
+    return left == right
+
+
+def _lookup_key(value: Any) -> Any:
+    """Hash key consistent with _equals (strings compare case-insensitively)"""
+    return value.casefold() if isinstance(value, str) else value
+
+
+_OUTER_NAMES = ("current", "outerIt", "obj", "Model", "model", "table")
+
+
+def _item_independent(node) -> bool:
+    """True if a node never reads the lambda item (bare names other than outer scope)"""
+    if isinstance(node, list):
+        return all(_item_independent(child) for child in node)
+    if not isinstance(node, tuple) or not node:
+        return True
+    if node[0] == "name":
+        return node[1] in _OUTER_NAMES
+    if node[0] == "literal":
+        return True
+    return all(_item_independent(child) for child in node[1:]
+               if isinstance(child, (tuple, list)))
+
+
+def _compare(op: str, left: Any, right: Any) -> bool:
+    if op == "==":
+        return _equals(left, right)
+    if op == "!=":
+        return not _equals(left, right)
+    if left is None or right is None:
+        return False
+    try:
+        if op == "<":
+            return left < right
+        if op == "<=":
+            return left <= right
+        if op == ">":
+            return left > right
+        return left >= right
+    except TypeError:
+        try:
+            left, right = float(left), float(right)
+        except (TypeError, ValueError):
+            return False
+        return _compare(op, left, right)
+
+
+def _arith(op: str, left: Any, right: Any) -> Any:
+    if op == "+" and (isinstance(left, str) or isinstance(right, str)):
+        return _text(left) + _text(right)
+    left = left or 0
+    right = right or 0
+    if op == "+":
+        return left + right
+    if op == "-":
+        return left - right
+    if op == "*":
+        return left * right
+    if op == "/":
+        return left / right
+    return left % right
+
+
+def _regex_flags(option: Any) -> int:
+    text = _text(option)
+    return re.IGNORECASE if "(?i)" in text or "ignorecase" in text.lower() else 0
+
+
+def _annotation(obj: Any, name: Any) -> Optional[str]:
+    if not isinstance(obj, dict):
+        return None
+    for annotation in obj.get("annotations", []) or []:
+        if isinstance(annotation, dict) and annotation.get("name") == name:
+            return annotation.get("value")
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Compiler
+# ---------------------------------------------------------------------------
+
+class RuleCompiler:
+    """Compiles AST nodes into closures `fn(ctx, it)`"""
+
+    def __init__(self, regex_factory: Callable[[str, int], "re.Pattern"]):
+        """
+        Args:
+            regex_factory: Returns a compiled pattern (BPAAnalyzer._compile_regex)
+        """
+        self.regex_factory = regex_factory
+
+    def compile(self, expression: str) -> Compiled:
+        """Compile a rule expression; raises BPACompileError if unsupported"""
+        if not expression or not expression.strip():
+            raise BPACompileError("Empty expression")
+        return self.node(parse_expression(expression))
+
+    def node(self, node) -> Compiled:
+        handler = getattr(self, f"_compile_{node[0]}")
+        return handler(*node[1:])
+
+    def _compile_literal(self, value):
+        return lambda ctx, it: value
+
+    def _compile_or(self, nodes):
+        parts = [self.node(n) for n in nodes]
+        return lambda ctx, it: any(part(ctx, it) for part in parts)
+
+    def _compile_and(self, nodes):
+        parts = [self.node(n) for n in nodes]
+        return lambda ctx, it: all(part(ctx, it) for part in parts)
+
+    def _compile_not(self, operand):
+        inner = self.node(operand)
+        return lambda ctx, it: not inner(ctx, it)
+
+    def _compile_compare(self, op, left, right):
+        lhs, rhs = self.node(left), self.node(right)
+        if op == "==":
+            return lambda ctx, it: _equals(lhs(ctx, it), rhs(ctx, it))
+        if op == "!=":
+            return lambda ctx, it: not _equals(lhs(ctx, it), rhs(ctx, it))
+        return lambda ctx, it: _compare(op, lhs(ctx, it), rhs(ctx, it))
+
+    def _compile_arith(self, op, left, right):
+        lhs, rhs = self.node(left), self.node(right)
+        return lambda ctx, it: _arith(op, lhs(ctx, it), rhs(ctx, it))
+
+    def _compile_name(self, name):
+        if name == "it":
+            return lambda ctx, it: it
+        if name in ("current", "outerIt", "obj"):
+            return lambda ctx, it: ctx.get("current", ctx.get("obj"))
+        if name in ("Model", "model"):
+            return lambda ctx, it: ctx.get("model")
+        if name == "table":
+            return lambda ctx, it: ctx.get("table")
+        get = _member_getter(name)
+        return lambda ctx, it: get(ctx, it)
+
+    def _compile_member(self, target, name):
+        base = self.node(target)
+        get = _member_getter(name)
+        if name == "AnyTrue":
+            return lambda ctx, it: any(_truthy_item(v) for v in _as_list(base(ctx, it)))
+        if name == "AnyFalse":
+            return lambda ctx, it: any(not _truthy_item(v) for v in _as_list(base(ctx, it)))
+        return lambda ctx, it: get(ctx, base(ctx, it))
+
+    def _compile_call(self, target, method, args):
+        base = self.node(target)
+
+        # Collection methods taking a lambda predicate
+        if method in ("Any", "All", "Where", "Count") and len(args) <= 1:
+            predicate = self.node(args[0]) if args else None
+            lookup = self._indexed_lookup(base, args[0]) if args and method in ("Any", "Where", "Count") else None
+            if lookup is not None:
+                if method == "Where":
+                    return lookup
+                if method == "Count":
+                    return lambda ctx, it: len(lookup(ctx, it))
+                return lambda ctx, it: len(lookup(ctx, it)) > 0
+            if method == "Count":
+                if predicate is None:
+                    return lambda ctx, it: len(_as_list(base(ctx, it)))
+                return lambda ctx, it: sum(1 for item in _as_list(base(ctx, it)) if predicate(ctx, item))
+            if method == "Where":
+                return lambda ctx, it: [item for item in _as_list(base(ctx, it)) if predicate(ctx, item)]
+            if method == "All":
+                if predicate is None:
+                    raise BPACompileError("All() needs a predicate")
+                return lambda ctx, it: all(predicate(ctx, item) for item in _as_list(base(ctx, it)))
+            if predicate is None:
+                return lambda ctx, it: len(_as_list(base(ctx, it))) > 0
+            return lambda ctx, it: any(predicate(ctx, item) for item in _as_list(base(ctx, it)))
+
+        compiled_args = [self.node(a) for a in args]
+
+        if method in ("ToUpper", "ToLower", "Trim", "TrimStart", "TrimEnd") and not args:
+            transform = {
+                "ToUpper": str.upper, "ToLower": str.lower, "Trim": str.strip,
+                "TrimStart": str.lstrip, "TrimEnd": str.rstrip,
+            }[method]
+            return lambda ctx, it: (lambda v: transform(v) if isinstance(v, str) else v)(base(ctx, it))
+
+        if method in ("Contains", "StartsWith", "EndsWith") and len(args) == 1:
+            arg = compiled_args[0]
+
+            def string_test(ctx, it, _method=method):
+                value = base(ctx, it)
+                needle = arg(ctx, it)
+                if isinstance(value, list):
+                    return _method == "Contains" and needle in value
+                if value is None:
+                    return False
+                value, needle = _text(value), _text(needle)
+                if _method == "Contains":
+                    return needle in value
+                if _method == "StartsWith":
+                    return value.startswith(needle)
+                return value.endswith(needle)
+
+            return string_test
+
+        if method == "Replace" and len(args) == 2:
+            old, new = compiled_args
+            return lambda ctx, it: (lambda v: v.replace(_text(old(ctx, it)), _text(new(ctx, it)))
+                                    if isinstance(v, str) else v)(base(ctx, it))
+
+        if method in ("GetAnnotation", "HasAnnotation") and len(args) == 1:
+            arg = compiled_args[0]
+            if method == "HasAnnotation":
+                return lambda ctx, it: _annotation(base(ctx, it), arg(ctx, it)) is not None
+            return lambda ctx, it: (lambda v: "" if v is None else v)(_annotation(base(ctx, it), arg(ctx, it)))
+
+        raise BPACompileError(f"Unsupported method {method}({len(args)} args)")
+
+    def _indexed_lookup(self, base: Compiled, predicate) -> Optional[Compiled]:
+        """
+        Hash join for `coll.Where(Prop == <outer expr>)`-style predicates.
+
+        Rules such as duplicate-name checks compare every object with every
+        other one; when the predicate is an equality between a property of the
+        item and an expression that does not depend on the item, the
+        collection is grouped by that property once per analysis run (cached
+        on the model index) and each evaluation becomes a dict lookup.
+        """
+        if predicate[0] != "compare" or predicate[1] != "==":
+            return None
+        left, right = predicate[2], predicate[3]
+        if left[0] != "name" and right[0] == "name":
+            left, right = right, left
+        if left[0] != "name" or left[1] in _OUTER_NAMES or left[1] == "it" or not _item_independent(right):
+            return None
+        prop = left[1]
+        get = _member_getter(prop)
+        key_expr = self.node(right)
+        item_pred = self.node(predicate)
+
+        def lookup(ctx, it):
+            collection = _as_list(base(ctx, it))
+            cache = ctx.get("index")
+            if cache is None:
+                return [item for item in collection if item_pred(ctx, item)]
+            groups = cache.setdefault("_rule_lookups", {})
+            entry = groups.get((id(collection), prop))
+            if entry is None or entry[0] is not collection:
+                grouped: Dict[Any, List[Any]] = {}
+                try:
+                    for item in collection:
+                        grouped.setdefault(_lookup_key(get(ctx, item)), []).append(item)
+                except TypeError:  # unhashable property values
+                    grouped = None
+                entry = (collection, grouped)
+                groups[(id(collection), prop)] = entry
+            if entry[1] is None:
+                return [item for item in collection if item_pred(ctx, item)]
+            try:
+                return entry[1].get(_lookup_key(key_expr(ctx, it)), [])
+            except TypeError:
+                return [item for item in collection if item_pred(ctx, item)]
+
+        return lookup
+
+    def _compile_static(self, cls, method, args):
+        compiled_args = [self.node(a) for a in args]
+
+        if cls == "regex" and method in ("IsMatch", "Matches") and len(args) in (2, 3):
+            subject = compiled_args[0]
+            pattern = self._regex(args[1:], compiled_args[1:])
+            if method == "IsMatch":
+                return lambda ctx, it: bool(pattern(ctx, it).search(_text(subject(ctx, it))))
+            # Matches(...) yields the list of matches; .Count is applied by the member node
+            return lambda ctx, it: [m.group(0) for m in pattern(ctx, it).finditer(_text(subject(ctx, it)))]
+
+        if cls == "string" and method in ("IsNullOrWhiteSpace", "IsNullOrEmpty") and len(args) == 1:
+            arg = compiled_args[0]
+            if method == "IsNullOrEmpty":
+                return lambda ctx, it: (lambda v: v is None or _text(v) == "")(arg(ctx, it))
+            return lambda ctx, it: (lambda v: v is None or not _text(v).strip())(arg(ctx, it))
+
+        if cls == "convert" and len(args) == 1:
+            arg = compiled_args[0]
+            if method == "ToInt64":
+                def to_int(ctx, it):
+                    try:
+                        value = arg(ctx, it)
+                        return int(float(value)) if value is not None else 0
+                    except (TypeError, ValueError):
+                        return 0
+                return to_int
+            if method == "ToString":
+                return lambda ctx, it: _text(arg(ctx, it))
+
+        if cls == "math":
+            if method in ("Max", "Min") and len(args) == 2:
+                pick = max if method == "Max" else min
+                a, b = compiled_args
+                return lambda ctx, it: pick(a(ctx, it) or 0, b(ctx, it) or 0)
+            if method == "Abs" and len(args) == 1:
+                arg = compiled_args[0]
+                return lambda ctx, it: abs(arg(ctx, it) or 0)
+
+        raise BPACompileError(f"Unsupported function {cls}.{method}")
+
+    def _regex(self, args, compiled_args) -> Compiled:
+        """Pattern resolver; literal patterns (the usual case) are compiled once"""
+        pattern_node = args[0]
+        option_node = args[1] if len(args) > 1 else ("literal", None)
+        if pattern_node[0] == "literal" and option_node[0] == "literal":
+            text = _text(pattern_node[1])
+            flags = _regex_flags(option_node[1]) | (re.IGNORECASE if "(?i)" in text else 0)
+            compiled = self.regex_factory(text.replace("(?i)", ""), flags)
+            return lambda ctx, it: compiled
+
+        pattern_fn = compiled_args[0]
+        option_fn = compiled_args[1] if len(compiled_args) > 1 else (lambda ctx, it: None)
+
+        def resolve(ctx, it):
+            text = _text(pattern_fn(ctx, it))
+            flags = _regex_flags(option_fn(ctx, it)) | (re.IGNORECASE if "(?i)" in text else 0)
+            return self.regex_factory(text.replace("(?i)", ""), flags)
+
+        return resolve
+
+
+def compile_rule_expression(expression: str, regex_factory: Callable[[str, int], "re.Pattern"]) -> Compiled:
+    """
+    Compile a BPA rule expression into a callable `fn(ctx, it)`
+
+    ctx is the rule context built by BPAAnalyzer (obj, table, model, index,
+    current); it is the object bare names resolve against (normally ctx["obj"]).
+
+    Raises:
+        BPACompileError: Unsupported syntax or function
+    """
+    return RuleCompiler(regex_factory).compile(expression)
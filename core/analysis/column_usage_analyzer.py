@@ -16,7 +16,9 @@ from typing import Dict, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from collections import defaultdict
 
-from core.dax.dax_reference_parser import DaxReferenceIndex, parse_dax_references, normalize_dax_name
+from core.dax.dax_reference_parser import DaxReferenceIndex, normalize_dax_name
+from core.dax.dax_parse_cache import parse_dax_references_cached, flush_dax_parse_cache
+from core.infrastructure.model_catalog import get_model_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +95,8 @@ class ColumnUsageAnalyzer:
         self._ref_index: Optional[DaxReferenceIndex] = None
         self._cached_result: Optional[ColumnUsageResult] = None
         self._cache_valid = False
+        # Model catalog generation the cached result was built from
+        self._catalog_generation: Optional[int] = None
 
     def _ensure_reference_index(self) -> DaxReferenceIndex:
         """Lazily build the reference index for DAX parsing"""
@@ -126,6 +130,13 @@ class ColumnUsageAnalyzer:
         Returns:
             ColumnUsageResult with complete mappings
         """
+        # A reloaded model catalog means the model changed since the cached result
+        catalog = get_model_catalog(self.query_executor)
+        generation = catalog.generation if catalog is not None else None
+        if generation != self._catalog_generation:
+            self.invalidate_cache()
+            self._catalog_generation = generation
+
         # Return cached result if valid
         if self._cache_valid and self._cached_result and not force_refresh:
             logger.debug("Returning cached column usage mapping")
@@ -208,7 +219,7 @@ class ColumnUsageAnalyzer:
             measure_key = _make_display_key(m_table, m_name)
 
             # Parse DAX to find column references
-            refs = parse_dax_references(m_expression, ref_index)
+            refs = parse_dax_references_cached(m_expression, ref_index)
             referenced_columns = refs.get('columns', [])
 
             # Store measure -> columns mapping
@@ -267,6 +278,7 @@ class ColumnUsageAnalyzer:
         # Cache the result
         self._cached_result = result
         self._cache_valid = True
+        flush_dax_parse_cache()
 
         logger.info(f"Column usage mapping complete: {result.total_columns_analyzed} columns, "
                    f"{result.total_measures_analyzed} measures, {result.columns_with_usage} columns used")
@@ -85,6 +85,23 @@ class ToolTimeoutManager:
         'connect_to_powerbi': 15,
     }
     
+    # Registered tool name -> timeout key, for tools whose budget is configured
+    # under their original name. Tools that are not listed (and not configured
+    # under their registered name) have no budget.
+    TOOL_CONFIG_KEYS = {
+        '01_Detect_PBI_Instances': 'detect_powerbi_desktop',
+        '01_Connect_To_Instance': 'connect_to_powerbi',
+        '04_Run_DAX': 'run_dax',
+        '04_Search_Objects': 'search_objects',
+        '04_Search_String': 'search_string',
+        '04_Get_Data_Sources': 'get_data_sources',
+        '04_Get_M_Expressions': 'get_m_expressions',
+        '05_Analyze_Dependencies': 'analyze_measure_dependencies',
+        '06_Full_Analysis': 'full_analysis',
+        '08_Generate_Documentation_Word': 'generate_model_documentation_word',
+        '08_Update_Documentation_Word': 'update_model_documentation_word',
+    }
+
     def __init__(self, custom_timeouts: Optional[Dict[str, int]] = None):
         """
         Initialize timeout manager.
@@ -109,6 +126,19 @@ class ToolTimeoutManager:
         Returns:
             Timeout in seconds
         """
+        timeout = self.get_budget(tool_name)
+        return default if timeout is None else timeout
+
+    def get_budget(self, tool_name: str) -> Optional[int]:
+        """
+        Get the timeout explicitly configured for a tool.
+
+        Args:
+            tool_name: Registered, friendly or canonical tool name
+
+        Returns:
+            Timeout in seconds, or None if the tool has no configured budget
+        """
         # Try exact match first
         timeout = self.timeouts.get(tool_name)
         if timeout is not None:
@@ -122,8 +152,12 @@ class ToolTimeoutManager:
             if timeout is not None:
                 return timeout
         
-        # Return default
-        return default
+        # Try the config key of a registered tool name
+        config_key = self.TOOL_CONFIG_KEYS.get(tool_name)
+        if config_key is not None:
+            return self.timeouts.get(config_key)
+
+        return None
     
     def set_timeout(self, tool_name: str, timeout_seconds: int):
         """Set custom timeout for a tool."""
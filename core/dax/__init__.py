@@ -12,10 +12,12 @@ This module provides advanced DAX context analysis capabilities:
 - Advanced DAX code rewriting
 - Variable optimization scanning
 - Visual context flow diagrams
+- Shared single-pass DAX lexer and syntax tree used by the analyzers
 
 Version: 4.0.0 - Enhanced with industry-standard analysis features
 """
 
+from .dax_ast import DaxAst, DaxNode, parse_dax
 from .context_analyzer import (
     DaxContextAnalyzer,
     ContextTransition,
@@ -40,6 +42,10 @@ from .code_rewriter import (
 from .visual_flow import VisualFlowDiagramGenerator, FlowStep
 
 __all__ = [
+    # Shared syntax tree
+    "DaxAst",
+    "DaxNode",
+    "parse_dax",
     # Core analyzers
     "DaxContextAnalyzer",
     "ContextTransition",
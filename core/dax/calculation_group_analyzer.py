@@ -9,10 +9,11 @@ Provides:
 """
 
 import logging
-import re
 from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 
+from .dax_ast import COLUMN_REF, parse_dax
+
 logger = logging.getLogger(__name__)
 
 
@@ -219,20 +220,19 @@ class CalculationGroupAnalyzer:
         """Detect calculation group references in DAX"""
         detected = []
 
+        # 'GroupName'[ItemName] or GroupName[ItemName], compared case-insensitively
+        references = {
+            (ref.table.lower(), ref.name.strip().lower())
+            for ref in parse_dax(dax).column_refs
+        }
+        if not references:
+            return detected
+
         for group_name, group in self._calc_groups.items():
             # Check if any calculation item from this group is referenced
-            for item in group.items:
-                # Pattern: 'GroupName'[ItemName] or GroupName[ItemName]
-                patterns = [
-                    rf"'{re.escape(group_name)}'\s*\[\s*{re.escape(item)}\s*\]",
-                    rf"\b{re.escape(group_name)}\s*\[\s*{re.escape(item)}\s*\]"
-                ]
-
-                for pattern in patterns:
-                    if re.search(pattern, dax, re.IGNORECASE):
-                        if group not in detected:
-                            detected.append(group)
-                        break
+            table_key = group_name.lower()
+            if any((table_key, item.strip().lower()) in references for item in group.items):
+                detected.append(group)
 
         return detected
 
@@ -313,11 +313,18 @@ class CalculationGroupAnalyzer:
             ))
 
         # Check 2: Calculation group used inside iterator
-        iterator_pattern = r'\b(SUMX|AVERAGEX|FILTER|ADDCOLUMNS)\s*\('
-        if re.search(iterator_pattern, dax, re.IGNORECASE):
+        iterators = parse_dax(dax).find_calls('SUMX', 'AVERAGEX', 'FILTER', 'ADDCOLUMNS')
+        if iterators:
+            tables_in_iterators = {
+                node.table.lower()
+                for call in iterators
+                for node in call.walk()
+                if node.kind == COLUMN_REF
+            }
             for group in groups:
                 # Check if calc group reference is inside iterator
-                # This is a simplified check - would need full parsing for accuracy
+                if group.name.lower() not in tables_in_iterators:
+                    continue
                 issues.append(CalculationGroupIssue(
                     issue_type="calc_group_in_iterator",
                     severity="warning",
@@ -14,6 +14,9 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from . import dax_ast
+from .dax_ast import DaxAst, DaxNode, parse_dax
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,20 +132,20 @@ class CallTreeBuilder:
         try:
             self._node_counter = 0
 
-            # Normalize expression
-            normalized = self._normalize_dax(dax_expression)
+            # Parse once; comments are dropped by the lexer
+            ast = parse_dax(dax_expression)
 
             # Create root node
             root = CallTreeNode(
                 node_id=self._next_id(),
                 node_type=NodeType.ROOT,
-                expression=normalized,
+                expression=ast.code.strip(),
                 start_pos=0,
-                end_pos=len(normalized)
+                end_pos=len(dax_expression)
             )
 
-            # Parse the expression recursively
-            self._parse_expression(normalized, root, 0, len(normalized))
+            # Convert the syntax tree into call tree nodes
+            self._add_nodes(ast, ast.root.children, root)
 
             # Analyze context transitions
             self._analyze_context_transitions(root)
@@ -168,105 +171,44 @@ class CallTreeBuilder:
                 warning_message=f"Parse error: {str(e)}"
             )
 
-    def _normalize_dax(self, dax: str) -> str:
-        """Normalize DAX expression"""
-        # Remove single-line comments
-        dax = re.sub(r"//.*?$", "", dax, flags=re.MULTILINE)
-        # Remove multi-line comments
-        dax = re.sub(r"/\*.*?\*/", "", dax, flags=re.DOTALL)
-        return dax.strip()
-
     def _next_id(self) -> int:
         """Get next node ID"""
         self._node_counter += 1
         return self._node_counter
 
-    def _parse_expression(
-        self,
-        dax: str,
-        parent_node: CallTreeNode,
-        start: int,
-        end: int
-    ) -> None:
+    def _add_nodes(self, ast: DaxAst, elements: List[DaxNode], parent_node: CallTreeNode) -> None:
         """
-        Parse DAX expression recursively
+        Attach call tree nodes for a sequence of syntax tree elements
 
         Args:
-            dax: Full DAX expression
+            ast: Parsed DAX expression
+            elements: Syntax tree nodes (an argument, VAR body or the root sequence)
             parent_node: Parent node to attach children to
-            start: Start position in dax
-            end: End position in dax
         """
-        expr = dax[start:end].strip()
-
-        if not expr:
-            return
-
-        # Check for VAR statements
-        var_pattern = r'\bVAR\s+(\w+)\s*='
-        var_matches = list(re.finditer(var_pattern, expr, re.IGNORECASE))
+        for element in elements:
+            kind = element.kind
 
-        if var_matches:
-            # Parse variables
-            for i, match in enumerate(var_matches):
-                var_name = match.group(1)
-                var_start = match.start()
-
-                # Find end of variable definition (next VAR or RETURN)
-                next_var_pos = var_matches[i + 1].start() if i + 1 < len(var_matches) else -1
-                return_pos = expr.upper().find('RETURN', var_start)
-
-                if next_var_pos != -1 and (return_pos == -1 or next_var_pos < return_pos):
-                    var_end = next_var_pos
-                elif return_pos != -1:
-                    var_end = return_pos
-                else:
-                    var_end = len(expr)
-
-                # Extract variable value (first 50 chars for display)
-                var_value_start = match.end()
-                var_value = expr[var_value_start:var_end].strip()
+            if kind == dax_ast.VAR:
+                var_value = ast.expression[element.children[0].start:element.end].strip() if element.children else ""
                 if len(var_value) > 50:
                     var_value = var_value[:50] + "..."
 
-                # Create variable node
                 var_node = CallTreeNode(
                     node_id=self._next_id(),
                     node_type=NodeType.VARIABLE,
-                    expression=f"VAR {var_name} = {var_value}",
-                    function_name=f"VAR {var_name}",  # Show actual variable name
-                    start_pos=start + var_start,
-                    end_pos=start + var_end
+                    expression=f"VAR {element.name} = {var_value}",
+                    function_name=f"VAR {element.name}",  # Show actual variable name
+                    start_pos=element.start,
+                    end_pos=element.end
                 )
                 parent_node.add_child(var_node)
+                self._add_nodes(ast, element.children, var_node)
 
-                # Parse variable value
-                var_value_start = match.end()
-                self._parse_expression(dax, var_node, start + var_value_start, start + var_end)
+            elif kind == dax_ast.RETURN:
+                self._add_nodes(ast, element.children, parent_node)
 
-            # Parse RETURN statement if present
-            return_match = re.search(r'\bRETURN\s+', expr, re.IGNORECASE)
-            if return_match:
-                return_start = return_match.end()
-                self._parse_expression(dax, parent_node, start + return_start, end)
-
-            return
-
-        # Check for function calls
-        func_pattern = r'\b([A-Z_][A-Z0-9_\.]*)\s*\('
-        func_matches = list(re.finditer(func_pattern, expr, re.IGNORECASE))
-
-        if func_matches:
-            for match in func_matches:
-                func_name = match.group(1).upper()
-                func_start = match.start()
-                func_open_paren = match.end() - 1
-
-                # Find matching closing parenthesis
-                func_end = self._find_matching_paren(expr, func_open_paren)
-
-                if func_end == -1:
-                    continue
+            elif kind == dax_ast.CALL:
+                func_name = element.name.upper()
 
                 # Determine node type
                 if func_name in self.CALCULATE_FUNCTIONS:
@@ -276,96 +218,37 @@ class CallTreeBuilder:
                 else:
                     node_type = NodeType.FUNCTION
 
-                # Create function node
                 func_node = CallTreeNode(
                     node_id=self._next_id(),
                     node_type=node_type,
-                    expression=expr[func_start:func_end + 1],
+                    expression=ast.text(element),
                     function_name=func_name,
-                    start_pos=start + func_start,
-                    end_pos=start + func_end + 1,
+                    start_pos=element.start,
+                    end_pos=element.end,
                     has_context_transition=(func_name in self.CALCULATE_FUNCTIONS),
                     is_iterator=(func_name in self.ITERATOR_FUNCTIONS)
                 )
                 parent_node.add_child(func_node)
 
-                # Parse function arguments
-                args_expr = expr[func_open_paren + 1:func_end]
-                self._parse_function_args(dax, func_node, start + func_open_paren + 1, args_expr)
+                for arg in element.args:
+                    self._add_nodes(ast, arg.children, func_node)
 
-        # Check for measure references
-        measure_pattern = r'\[([^\]]+)\]'
-        measure_matches = list(re.finditer(measure_pattern, expr))
+            elif kind in (dax_ast.PAREN, dax_ast.BRACES):
+                # Grouping is transparent in the call tree
+                for arg in element.args:
+                    self._add_nodes(ast, arg.children, parent_node)
 
-        for match in measure_matches:
-            # Check if this is not a column reference (has table prefix)
-            context_before = expr[max(0, match.start() - 20):match.start()]
-
-            if not re.search(r"(?:'[^']+|\w+)\s*$", context_before):
-                # Likely a measure reference
-                measure_name = match.group(1)
-
-                measure_node = CallTreeNode(
+            elif kind == dax_ast.BRACKET_REF:
+                # Unqualified [Name] - measure reference (implicit CALCULATE)
+                parent_node.add_child(CallTreeNode(
                     node_id=self._next_id(),
                     node_type=NodeType.MEASURE_REF,
-                    expression=f"[{measure_name}]",
-                    function_name=f"[{measure_name}]",  # Show actual measure name
-                    start_pos=start + match.start(),
-                    end_pos=start + match.end(),
-                    has_context_transition=True  # Implicit CALCULATE
-                )
-                parent_node.add_child(measure_node)
-
-    def _parse_function_args(
-        self,
-        dax: str,
-        parent_node: CallTreeNode,
-        start: int,
-        args_expr: str
-    ) -> None:
-        """Parse function arguments"""
-        # Split by commas at the same nesting level
-        args = self._split_by_comma(args_expr)
-
-        for i, arg in enumerate(args):
-            arg_start = args_expr.find(arg)
-            self._parse_expression(dax, parent_node, start + arg_start, start + arg_start + len(arg))
-
-    def _find_matching_paren(self, expr: str, open_pos: int) -> int:
-        """Find matching closing parenthesis"""
-        depth = 1
-        pos = open_pos + 1
-
-        while pos < len(expr) and depth > 0:
-            if expr[pos] == '(':
-                depth += 1
-            elif expr[pos] == ')':
-                depth -= 1
-            pos += 1
-
-        return pos - 1 if depth == 0 else -1
-
-    def _split_by_comma(self, expr: str) -> List[str]:
-        """Split expression by commas at the same nesting level"""
-        parts = []
-        current = []
-        depth = 0
-
-        for char in expr:
-            if char == ',' and depth == 0:
-                parts.append(''.join(current).strip())
-                current = []
-            else:
-                if char == '(':
-                    depth += 1
-                elif char == ')':
-                    depth -= 1
-                current.append(char)
-
-        if current:
-            parts.append(''.join(current).strip())
-
-        return [p for p in parts if p]
+                    expression=f"[{element.name}]",
+                    function_name=f"[{element.name}]",  # Show actual measure name
+                    start_pos=element.start,
+                    end_pos=element.end,
+                    has_context_transition=True
+                ))
 
     def _analyze_context_transitions(self, node: CallTreeNode) -> None:
         """Analyze context transitions in tree"""
@@ -11,9 +11,11 @@ Provides:
 
 import logging
 import re
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 
+from .dax_ast import BRACKET_REF, COLUMN_REF, OPERATOR, RETURN, DaxAst, DaxNode, parse_dax
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,21 +109,15 @@ class DaxCodeRewriter:
         - 'Table'[Column] = column reference, CANNOT be cached outside of row context
         - Writing VAR x = [Column] when [Column] is a column (not measure) causes DAX errors
         """
-        # Find all bracket references
-        bracket_pattern = r'\[([^\]]+)\]'
-        all_refs = re.findall(bracket_pattern, dax)
-
-        if not all_refs:
+        ast = parse_dax(dax)
+        if not ast.bracket_refs:
             return dax
 
         # Count ONLY standalone measure references (no table prefix)
-        # A standalone measure reference is [Something] without 'Table' or Table before it
+        # Table[Column] and 'Table'[Column] parse as column references, not bracket references
         measure_counts = {}
-        for ref in all_refs:
-            # Check if this reference EVER appears as a standalone measure (no table prefix)
-            standalone_count = self._count_standalone_measure_refs(dax, ref)
-            if standalone_count > 0:
-                measure_counts[ref] = standalone_count
+        for ref in ast.bracket_refs:
+            measure_counts[ref.name] = measure_counts.get(ref.name, 0) + 1
 
         # Find measures referenced more than once AS STANDALONE
         repeated_measures = {m: c for m, c in measure_counts.items() if c > 1}
@@ -149,9 +145,11 @@ class DaxCodeRewriter:
         # Construct final code
         if var_lines:
             # Check if already has VAR statements
-            if "VAR" in dax.upper():
+            if ast.has_word("VAR"):
                 # Insert after existing VARs
-                return_pos = new_dax.upper().find("RETURN")
+                return_pos = next(
+                    (node.start for node in parse_dax(new_dax).root.children if node.kind == RETURN), -1
+                )
                 if return_pos != -1:
                     existing_vars = new_dax[:return_pos].strip()
                     return_part = new_dax[return_pos:].strip()
@@ -178,68 +176,16 @@ class DaxCodeRewriter:
 
         return dax
 
-    # DAX keywords that are NOT table names (used to avoid false positives)
-    DAX_KEYWORDS = {
-        'VAR', 'RETURN', 'IF', 'THEN', 'ELSE', 'SWITCH', 'TRUE', 'FALSE',
-        'AND', 'OR', 'NOT', 'IN', 'CALCULATE', 'CALCULATETABLE', 'FILTER',
-        'ALL', 'ALLEXCEPT', 'ALLSELECTED', 'VALUES', 'DISTINCT', 'RELATED',
-        'RELATEDTABLE', 'USERELATIONSHIP', 'CROSSFILTER', 'EARLIER', 'EARLIEST',
-        'SUM', 'SUMX', 'AVERAGE', 'AVERAGEX', 'COUNT', 'COUNTX', 'COUNTROWS',
-        'COUNTA', 'COUNTBLANK', 'MIN', 'MINX', 'MAX', 'MAXX', 'DIVIDE',
-        'SELECTEDVALUE', 'HASONEVALUE', 'ISBLANK', 'ISEMPTY', 'ISINSCOPE',
-        'BLANK', 'ERROR', 'UNICHAR', 'FORMAT', 'CONCATENATE', 'CONCATENATEX',
-        'LEFT', 'RIGHT', 'MID', 'LEN', 'UPPER', 'LOWER', 'TRIM', 'SUBSTITUTE',
-        'YEAR', 'MONTH', 'DAY', 'HOUR', 'MINUTE', 'SECOND', 'DATE', 'TIME',
-        'TODAY', 'NOW', 'EOMONTH', 'DATEADD', 'DATEDIFF', 'CALENDAR', 'CALENDARAUTO',
-        'FIRSTDATE', 'LASTDATE', 'STARTOFMONTH', 'ENDOFMONTH', 'STARTOFQUARTER',
-        'STARTOFYEAR', 'ENDOFYEAR', 'SAMEPERIODLASTYEAR', 'PARALLELPERIOD',
-        'PREVIOUSMONTH', 'PREVIOUSQUARTER', 'PREVIOUSYEAR', 'NEXTMONTH', 'NEXTQUARTER',
-        'GENERATE', 'GENERATEALL', 'GENERATESERIES', 'ROW', 'TOPN', 'SAMPLE',
-        'SUMMARIZE', 'SUMMARIZECOLUMNS', 'GROUPBY', 'ADDCOLUMNS', 'SELECTCOLUMNS',
-        'UNION', 'INTERSECT', 'EXCEPT', 'CROSSJOIN', 'NATURALINNERJOIN', 'NATURALLEFTOUTERJOIN',
-        'TREATAS', 'KEEPFILTERS', 'REMOVEFILTERS', 'LOOKUPVALUE', 'PATH', 'PATHITEM',
-        'RANK', 'RANKX', 'ROWNUMBER', 'PERCENTILEX', 'MEDIANX', 'PRODUCTX',
-        'MAXA', 'MINA', 'AVERAGEA', 'GEOMEAN', 'GEOMEANX', 'STDEV', 'STDEVX',
-        'EVALUATE', 'DEFINE', 'MEASURE', 'ORDER', 'BY', 'ASC', 'DESC', 'START', 'AT'
-    }
-
     def _count_standalone_measure_refs(self, dax: str, ref_name: str) -> int:
         """
         Count how many times a reference appears as a STANDALONE measure.
 
-        A standalone measure reference is [Something] that is NOT preceded by:
-        - A table name like 'Table Name' or TableName
-        - RELATED( or other functions that return column references
-
-        DAX keywords (VAR, RETURN, IF, etc.) are NOT considered table names.
+        A standalone measure reference is [Something] that is NOT prefixed by a
+        table name like 'Table Name' or TableName (those are column references).
 
         Returns count of standalone occurrences.
         """
-        # Pattern for any occurrence of [ref_name]
-        any_ref_pattern = rf"\[\s*{re.escape(ref_name)}\s*\]"
-
-        standalone_count = 0
-
-        for match in re.finditer(any_ref_pattern, dax):
-            start = match.start()
-            prefix = dax[:start].rstrip()
-
-            # Check if preceded by a quoted table name: 'Table Name'
-            if re.search(r"'[^']+'\s*$", prefix):
-                continue  # Column reference
-
-            # Check if preceded by an unquoted identifier
-            unquoted_match = re.search(r"([A-Za-z_]\w*)\s*$", prefix)
-            if unquoted_match:
-                identifier = unquoted_match.group(1).upper()
-                # If it's a DAX keyword, this is a measure reference, not column
-                if identifier not in self.DAX_KEYWORDS:
-                    continue  # Column reference (preceded by table name)
-
-            # This is a standalone measure reference
-            standalone_count += 1
-
-        return standalone_count
+        return sum(1 for ref in parse_dax(dax).bracket_refs if ref.name == ref_name)
 
     def _replace_standalone_measures(self, dax: str, var_mapping: Dict[str, str]) -> str:
         """
@@ -247,64 +193,26 @@ class DaxCodeRewriter:
 
         Does NOT replace table-prefixed column references like 'Table'[Column].
         """
-        result = dax
-
-        for original, var_name in var_mapping.items():
-            # Extract the measure name from [MeasureName]
-            measure_name = original[1:-1]  # Remove [ and ]
-
-            # Only replace standalone references (not table-prefixed)
-            # Use negative lookbehind to ensure no table prefix
-            # This handles: 'Table'[Col] and Table[Col]
-            standalone_pattern = rf"(?<!'[^']*')(?<![A-Za-z_]\w*)(?<!\w)\[\s*{re.escape(measure_name)}\s*\]"
-
-            # Simpler approach: find all occurrences and only replace those without table prefix
-            result = self._replace_standalone_only(result, measure_name, var_name)
-
-        return result
-
-    def _replace_standalone_only(self, dax: str, measure_name: str, var_name: str) -> str:
-        """Replace only standalone [measure_name] occurrences with var_name."""
-        # Find all positions of [measure_name]
-        ref_pattern = rf'\[\s*{re.escape(measure_name)}\s*\]'
+        # Map measure name (without brackets) to variable name
+        replacements = {original[1:-1]: var_name for original, var_name in var_mapping.items()}
 
         result_parts = []
         last_end = 0
-
-        for match in re.finditer(ref_pattern, dax):
-            start = match.start()
-
-            # Check what comes before this match
-            prefix = dax[:start].rstrip()
-
-            # Check if preceded by a quoted table name: 'Table Name'
-            is_quoted_table = bool(re.search(r"'[^']+'\s*$", prefix))
-
-            # Check if preceded by an unquoted identifier (potential table name)
-            is_column = False
-            if is_quoted_table:
-                is_column = True
-            else:
-                unquoted_match = re.search(r"([A-Za-z_]\w*)\s*$", prefix)
-                if unquoted_match:
-                    identifier = unquoted_match.group(1).upper()
-                    # If it's NOT a DAX keyword, it's a table name -> column reference
-                    if identifier not in self.DAX_KEYWORDS:
-                        is_column = True
-
-            if is_column:
-                # Keep original
-                result_parts.append(dax[last_end:match.end()])
-            else:
-                # Replace with variable
-                result_parts.append(dax[last_end:start])
-                result_parts.append(var_name)
-
-            last_end = match.end()
+        for ref in parse_dax(dax).bracket_refs:
+            var_name = replacements.get(ref.name)
+            if var_name is None:
+                continue
+            result_parts.append(dax[last_end:ref.start])
+            result_parts.append(var_name)
+            last_end = ref.end
 
         result_parts.append(dax[last_end:])
         return ''.join(result_parts)
 
+    def _replace_standalone_only(self, dax: str, measure_name: str, var_name: str) -> str:
+        """Replace only standalone [measure_name] occurrences with var_name."""
+        return self._replace_standalone_measures(dax, {f"[{measure_name}]": var_name})
+
     def _is_column_reference(self, dax: str, column_name: str) -> bool:
         """
         Check if a reference is likely a column (has table prefix).
@@ -313,17 +221,17 @@ class DaxCodeRewriter:
         - 'Table Name'[Column]
         - TableName[Column]
         """
-        # Fixed pattern: include closing quote for quoted table names
-        pattern = rf"(?:'[^']+'\s*|\w+\s*)\[\s*{re.escape(column_name)}\s*\]"
-        return bool(re.search(pattern, dax))
+        return any(ref.name == column_name for ref in parse_dax(dax).column_refs)
 
     def _flatten_nested_calculate(self, dax: str) -> str:
         """Flatten nested CALCULATE statements using variables"""
-        # Pattern for nested CALCULATE
-        # This is simplified - full implementation would use proper parsing
-        nested_calc_pattern = r'CALCULATE\s*\(\s*CALCULATE\s*\('
+        # CALCULATE whose expression argument is itself a CALCULATE
+        nested = any(
+            _starts_with_call(call.arg(0), 'CALCULATE')
+            for call in parse_dax(dax).find_calls('CALCULATE')
+        )
 
-        if not re.search(nested_calc_pattern, dax, re.IGNORECASE):
+        if not nested:
             return dax
 
         # For now, add a comment suggesting manual refactoring
@@ -349,44 +257,46 @@ class DaxCodeRewriter:
 
         # Pattern 1: SUMX(FILTER(...)) -> CALCULATE(SUM(...))
         # This is the most common anti-pattern
-        sumx_filter_pattern = r'(SUMX|AVERAGEX|COUNTX|MINX|MAXX)\s*\(\s*FILTER\s*\('
-
-        if re.search(sumx_filter_pattern, dax, re.IGNORECASE):
-            # Try to extract the pattern for transformation
-            # Pattern: SUMX(FILTER(Table, condition), Table[Column])
-            detailed_pattern = r'(SUMX|AVERAGEX)\s*\(\s*FILTER\s*\(\s*([^,]+)\s*,\s*([^)]+)\)\s*,\s*([^)]+)\)'
-
-            match = re.search(detailed_pattern, dax, re.IGNORECASE)
-            if match:
-                iterator_func = match.group(1).upper()
-                table = match.group(2).strip()
-                condition = match.group(3).strip()
-                column_expr = match.group(4).strip()
-
-                # Generate optimized version
-                agg_func = "SUM" if "SUMX" in iterator_func else "AVERAGE"
-                optimized = f"CALCULATE({agg_func}({column_expr}), {condition})"
-
-                # Replace in DAX
-                original_fragment = match.group(0)
-                dax = dax.replace(original_fragment, optimized)
-
-                self.transformations.append(Transformation(
-                    transformation_type="sumx_filter_to_calculate",
-                    original_code=original_fragment,
-                    transformed_code=optimized,
-                    explanation=(
-                        f"Replaced {iterator_func}(FILTER(...)) with CALCULATE({agg_func}(...)). "
-                        "This eliminates row-by-row iteration and leverages the Storage Engine for 5-10x performance improvement."
-                    ),
-                    estimated_improvement="5-10x faster",
-                    confidence="high"
-                ))
+        # Shape: SUMX(FILTER(Table, condition), Table[Column])
+        ast = parse_dax(dax)
+        for call in ast.find_calls('SUMX', 'AVERAGEX'):
+            filter_call = _single_call(call.arg(0), 'FILTER')
+            if filter_call is None or len(call.args) != 2 or len(filter_call.args) != 2:
+                continue
+
+            iterator_func = call.name.upper()
+            condition = ast.text(filter_call.args[1]).strip()
+            column_expr = ast.text(call.args[1]).strip()
+
+            # Generate optimized version
+            agg_func = "SUM" if iterator_func == "SUMX" else "AVERAGE"
+            optimized = f"CALCULATE({agg_func}({column_expr}), {condition})"
+
+            # Replace in DAX
+            original_fragment = ast.text(call)
+            dax = dax[:call.start] + optimized + dax[call.end:]
+
+            self.transformations.append(Transformation(
+                transformation_type="sumx_filter_to_calculate",
+                original_code=original_fragment,
+                transformed_code=optimized,
+                explanation=(
+                    f"Replaced {iterator_func}(FILTER(...)) with CALCULATE({agg_func}(...)). "
+                    "This eliminates row-by-row iteration and leverages the Storage Engine for 5-10x performance improvement."
+                ),
+                estimated_improvement="5-10x faster",
+                confidence="high"
+            ))
+            break
 
         # Pattern 2: FILTER(ALL(...), [Measure] > value) -> warn about measure in filter
-        filter_measure_pattern = r'FILTER\s*\(\s*ALL\s*\([^)]+\)\s*,\s*\[[^\]]+\]\s*[><=]'
+        ast = parse_dax(dax)
+        filter_on_measure = any(
+            _starts_with_call(call.arg(0), 'ALL') and _starts_with_measure_comparison(call.arg(1))
+            for call in ast.find_calls('FILTER')
+        )
 
-        if re.search(filter_measure_pattern, dax, re.IGNORECASE):
+        if filter_on_measure:
             self.transformations.append(Transformation(
                 transformation_type="filter_measure_warning",
                 original_code="FILTER(ALL(Table), [Measure] > 100)",
@@ -404,17 +314,18 @@ class DaxCodeRewriter:
             ))
 
         # Pattern 3: COUNTROWS(FILTER(...)) -> CALCULATE(COUNTROWS(...))
-        countrows_filter_pattern = r'COUNTROWS\s*\(\s*FILTER\s*\(\s*([^,]+)\s*,\s*([^)]+)\)\s*\)'
+        for call in ast.find_calls('COUNTROWS'):
+            filter_call = _single_call(call.arg(0), 'FILTER')
+            if filter_call is None or len(call.args) != 1 or len(filter_call.args) != 2:
+                continue
 
-        match = re.search(countrows_filter_pattern, dax, re.IGNORECASE)
-        if match:
-            table = match.group(1).strip()
-            condition = match.group(2).strip()
+            table = ast.text(filter_call.args[0]).strip()
+            condition = ast.text(filter_call.args[1]).strip()
 
-            original_fragment = match.group(0)
+            original_fragment = ast.text(call)
             optimized = f"CALCULATE(COUNTROWS({table}), {condition})"
 
-            dax = dax.replace(original_fragment, optimized)
+            dax = dax[:call.start] + optimized + dax[call.end:]
 
             self.transformations.append(Transformation(
                 transformation_type="countrows_filter_to_calculate",
@@ -427,19 +338,14 @@ class DaxCodeRewriter:
                 estimated_improvement="5-10x faster",
                 confidence="high"
             ))
+            break
 
         return dax
 
     def _convert_summarize_to_summarizecolumns(self, dax: str) -> str:
         """Convert SUMMARIZE to SUMMARIZECOLUMNS where applicable"""
-        # Pattern for SUMMARIZE
-        summarize_pattern = r'\bSUMMARIZE\s*\('
-
-        if not re.search(summarize_pattern, dax, re.IGNORECASE):
-            return dax
-
         # Find SUMMARIZE calls
-        matches = list(re.finditer(summarize_pattern, dax, re.IGNORECASE))
+        matches = parse_dax(dax).find_calls('SUMMARIZE')
 
         if matches:
             self.transformations.append(Transformation(
@@ -467,10 +373,7 @@ class DaxCodeRewriter:
 
     def _optimize_distinct_values(self, dax: str) -> str:
         """Optimize DISTINCT vs VALUES usage"""
-        # DISTINCT pattern
-        distinct_pattern = r'\bDISTINCT\s*\('
-
-        if not re.search(distinct_pattern, dax, re.IGNORECASE):
+        if not parse_dax(dax).has_call('DISTINCT'):
             return dax
 
         self.transformations.append(Transformation(
@@ -609,17 +512,10 @@ class VariableOptimizationScanner:
         """Scan for repeated measure references"""
         opportunities = []
 
-        # Find all measure references
-        measure_pattern = r'\[([^\]]+)\]'
-        measures = re.findall(measure_pattern, dax)
-
-        # Count occurrences (excluding column references)
+        # Count standalone [Measure] references (column references carry a table prefix)
         measure_counts = {}
-        for measure in measures:
-            # Simple heuristic: if no table prefix, likely a measure
-            context = dax[:dax.find(f"[{measure}]")]
-            if not re.search(r"(?:'[^']+|\w+)\s*$", context):
-                measure_counts[measure] = measure_counts.get(measure, 0) + 1
+        for ref in parse_dax(dax).bracket_refs:
+            measure_counts[ref.name] = measure_counts.get(ref.name, 0) + 1
 
         # Report opportunities for measures used 2+ times
         for measure, count in measure_counts.items():
@@ -641,12 +537,13 @@ class VariableOptimizationScanner:
         opportunities = []
 
         # Look for repeated mathematical expressions
-        # Pattern: anything repeated like "X * Y" appearing multiple times
-        # This is simplified - would need proper expression parsing
-
-        # Example: detect repeated multiplication/division patterns
-        math_pattern = r'\w+\[[\w\s]+\]\s*[*/]\s*\w+\[[\w\s]+\]'
-        math_expressions = re.findall(math_pattern, dax)
+        # Pattern: "Table[A] * Table[B]" (or /) appearing multiple times
+        ast = parse_dax(dax)
+        math_expressions = [
+            ast.expression[left.start:right.end]
+            for left, op, right in _element_triples(ast)
+            if left.kind == COLUMN_REF and op.kind == OPERATOR and op.name in ('*', '/') and right.kind == COLUMN_REF
+        ]
 
         expr_counts = {}
         for expr in math_expressions:
@@ -677,9 +574,9 @@ class VariableOptimizationScanner:
             "SUMMARIZE", "SUMMARIZECOLUMNS", "CROSSJOIN"
         ]
 
+        ast = parse_dax(dax)
         for func in expensive_functions:
-            pattern = rf'\b{func}\s*\('
-            matches = list(re.finditer(pattern, dax, re.IGNORECASE))
+            matches = ast.find_calls(func)
 
             if len(matches) >= 2:
                 # Check if they're identical calls (simplified check)
@@ -717,3 +614,36 @@ class VariableOptimizationScanner:
         )
 
         return "\n".join(parts)
+
+
+def _starts_with_call(arg: Optional[DaxNode], *names: str) -> bool:
+    """True if an argument starts with a call to one of the (upper-case) names."""
+    return arg is not None and arg.first is not None and arg.first.is_call(*names)
+
+
+def _single_call(arg: Optional[DaxNode], name: str) -> Optional[DaxNode]:
+    """The call node if the argument consists of exactly one call to name."""
+    if arg is not None and len(arg.children) == 1 and arg.first.is_call(name):
+        return arg.first
+    return None
+
+
+def _starts_with_measure_comparison(arg: Optional[DaxNode]) -> bool:
+    """True if an argument starts with '[Measure] >', '<' or '='."""
+    if arg is None or len(arg.children) < 2:
+        return False
+    ref, op = arg.children[0], arg.children[1]
+    return ref.kind == BRACKET_REF and op.kind == OPERATOR and op.name[0] in '><='
+
+
+def _element_triples(ast: DaxAst) -> Iterator[Tuple[DaxNode, DaxNode, DaxNode]]:
+    """Consecutive (a, b, c) element triples of every sequence in the tree."""
+    sequences = [ast.root.children]
+    for node in ast.root.walk():
+        if node.args:
+            sequences.extend(arg.children for arg in node.args)
+        elif node.children:
+            sequences.append(node.children)
+    for seq in sequences:
+        for i in range(len(seq) - 2):
+            yield seq[i], seq[i + 1], seq[i + 2]
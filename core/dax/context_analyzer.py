@@ -9,11 +9,12 @@ Detects and explains:
 """
 
 import logging
-import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple, Any
 from enum import Enum
 
+from .dax_ast import BRACKET_REF, COLUMN_REF, IDENTIFIER, TABLE_REF, DaxAst, DaxNode, parse_dax
+
 logger = logging.getLogger(__name__)
 
 
@@ -164,25 +165,25 @@ class DaxContextAnalyzer:
             transitions: List[ContextTransition] = []
             warnings: List[PerformanceWarning] = []
 
-            # Normalize expression (remove comments)
-            normalized = self._normalize_dax(dax_expression)
+            # Parse once (comments and string contents are skipped by the lexer)
+            ast = parse_dax(dax_expression)
 
             # Extract variables
-            self.variables = self._extract_variables(normalized)
+            self.variables = self._extract_variables(ast)
 
             # Detect explicit CALCULATE transitions
-            calc_transitions = self._detect_calculate_transitions(normalized)
+            calc_transitions = self._detect_calculate_transitions(ast)
             transitions.extend(calc_transitions)
 
             # Detect implicit measure call transitions
             measure_transitions = self._detect_implicit_measure_transitions(
-                normalized, reference_index
+                ast, reference_index
             )
             transitions.extend(measure_transitions)
 
             # Detect iterator transitions
             iterator_transitions = self._detect_iterator_transitions(
-                normalized, reference_index
+                ast, reference_index
             )
             transitions.extend(iterator_transitions)
 
@@ -190,7 +191,7 @@ class DaxContextAnalyzer:
             transitions.sort(key=lambda t: t.location)
 
             # Calculate nesting levels
-            self._calculate_nesting_levels(transitions)
+            self._calculate_nesting_levels(transitions, ast)
 
             # Detect performance issues
             warnings.extend(self._detect_performance_issues(transitions))
@@ -233,227 +234,132 @@ class DaxContextAnalyzer:
                 max_nesting_level=0,
             )
 
-    def _normalize_dax(self, dax: str) -> str:
-        """Normalize DAX expression (remove comments, extra whitespace)"""
-        # Remove single-line comments
-        dax = re.sub(r"//.*?$", "", dax, flags=re.MULTILINE)
-
-        # Remove multi-line comments
-        dax = re.sub(r"/\*.*?\*/", "", dax, flags=re.DOTALL)
-
-        return dax
-
-    def _extract_variables(self, dax: str) -> Dict[str, str]:
+    def _extract_variables(self, ast: DaxAst) -> Dict[str, str]:
         """
-        Extract VAR variables from DAX expression
+        Extract VAR variables from the parsed expression
 
         Returns:
             Dict mapping variable names to their definitions (truncated)
         """
         variables = {}
 
-        # Pattern to match VAR declarations: VAR VariableName = expression
-        var_pattern = r'\bVAR\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*'
-
-        for match in re.finditer(var_pattern, dax, re.IGNORECASE):
-            var_name = match.group(1)
-            start_pos = match.end()
-
-            # Extract the variable definition (until next VAR or RETURN)
-            # Look for next VAR or RETURN keyword
-            remaining = dax[start_pos:]
-            next_var = re.search(r'\bVAR\s+', remaining, re.IGNORECASE)
-            next_return = re.search(r'\bRETURN\b', remaining, re.IGNORECASE)
-
-            end_pos = len(remaining)
-            if next_var and next_return:
-                end_pos = min(next_var.start(), next_return.start())
-            elif next_var:
-                end_pos = next_var.start()
-            elif next_return:
-                end_pos = next_return.start()
-
-            definition = remaining[:end_pos].strip()
+        for var in ast.variables:
+            if not var.name:
+                continue
+            definition = ast.expression[var.children[0].start:var.end].strip() if var.children else ""
 
             # Truncate long definitions
             if len(definition) > 100:
                 definition = definition[:100] + "..."
 
-            variables[var_name] = definition
+            variables[var.name] = definition
 
         return variables
 
-    def _detect_calculate_transitions(self, dax: str) -> List[ContextTransition]:
+    def _detect_calculate_transitions(self, ast: DaxAst) -> List[ContextTransition]:
         """Detect explicit CALCULATE/CALCULATETABLE transitions"""
         transitions = []
 
-        for func_name in self.CALCULATE_FUNCTIONS:
-            # Find all occurrences of CALCULATE/CALCULATETABLE
-            pattern = rf"\b{func_name}\s*\("
-
-            for match in re.finditer(pattern, dax, re.IGNORECASE):
-                location = match.start()
-                line, column = self._get_line_column(dax, location)
-
-                # Extract filter arguments from CALCULATE
-                start = match.end()
-                body = self._extract_function_body(dax, start)
-                filter_args = self._extract_filter_arguments(body)
-
-                transition = ContextTransition(
-                    location=location,
-                    line=line,
-                    column=column,
-                    type=TransitionType.EXPLICIT_CALCULATE if func_name == "CALCULATE" else TransitionType.CALCULATETABLE,
-                    function=func_name,
-                    filter_context_after=filter_args,
-                    explanation=f"{func_name} creates a new filter context by transitioning from row context (if any) to filter context. Any existing filter context is modified by the filter arguments.",
-                    performance_impact=PerformanceImpact.LOW,
-                    variables_in_scope=list(self.variables.keys()),
-                )
+        for call in ast.find_calls(*self.CALCULATE_FUNCTIONS):
+            func_name = call.name.upper()
+            line, column = ast.line_column(call.start)
+
+            transition = ContextTransition(
+                location=call.start,
+                line=line,
+                column=column,
+                type=TransitionType.EXPLICIT_CALCULATE if func_name == "CALCULATE" else TransitionType.CALCULATETABLE,
+                function=func_name,
+                filter_context_after=self._extract_filter_arguments(ast, call),
+                explanation=f"{func_name} creates a new filter context by transitioning from row context (if any) to filter context. Any existing filter context is modified by the filter arguments.",
+                performance_impact=PerformanceImpact.LOW,
+                variables_in_scope=list(self.variables.keys()),
+            )
 
-                transitions.append(transition)
+            transitions.append(transition)
 
         return transitions
 
-    def _extract_filter_arguments(self, body: str) -> List[str]:
-        """Extract filter arguments from CALCULATE body"""
-        # Split by comma at the top level (not inside parentheses)
+    def _extract_filter_arguments(self, ast: DaxAst, call: DaxNode) -> List[str]:
+        """Filter arguments of a CALCULATE call (every argument after the expression)"""
         filters = []
-        depth = 0
-        current_arg = ""
-
-        for char in body:
-            if char == '(':
-                depth += 1
-                current_arg += char
-            elif char == ')':
-                depth -= 1
-                current_arg += char
-            elif char == ',' and depth == 0:
-                # Found a top-level comma - this separates arguments
-                arg = current_arg.strip()
-                if arg and not arg.startswith('['):  # Skip the first argument (expression)
-                    # Extract just the filter description (first 50 chars)
-                    filters.append(arg[:50] + "..." if len(arg) > 50 else arg)
-                current_arg = ""
-            else:
-                current_arg += char
-
-        # Add the last argument
-        arg = current_arg.strip()
-        if arg and filters:  # Only add if we already have filters (skip first arg)
-            filters.append(arg[:50] + "..." if len(arg) > 50 else arg)
-
+        for arg in call.args[1:]:
+            text = ast.text(arg).strip()
+            if text:
+                # Extract just the filter description (first 50 chars)
+                filters.append(text[:50] + "..." if len(text) > 50 else text)
         return filters
 
     def _detect_implicit_measure_transitions(
         self,
-        dax: str,
+        ast: DaxAst,
         reference_index: Optional[Dict[str, Any]],
     ) -> List[ContextTransition]:
         """Detect implicit context transitions from measure references"""
         transitions = []
 
-        # Pattern to match measure references: [MeasureName]
-        measure_pattern = r"\[([^\]]+)\]"
-
-        for match in re.finditer(measure_pattern, dax):
-            measure_name = match.group(1)
-            location = match.start()
-            line, column = self._get_line_column(dax, location)
-
-            # Check if this is likely a measure (not a column reference)
-            # Heuristic: measures are typically referenced alone, not with table prefix
-            context_before = dax[max(0, location - 10):location]
-            if "'" not in context_before and "[" not in context_before:
-                # Likely a measure reference
-                transition = ContextTransition(
-                    location=location,
-                    line=line,
-                    column=column,
-                    type=TransitionType.IMPLICIT_MEASURE,
-                    function="MEASURE_REFERENCE",
-                    measure_name=measure_name,
-                    explanation=f"Implicit CALCULATE wrapper around measure [{measure_name}]. If in row context, this causes context transition to filter context.",
-                    performance_impact=PerformanceImpact.LOW,
-                    variables_in_scope=list(self.variables.keys()),
-                )
+        # Unqualified [Name] references - measures are referenced without a table prefix
+        for ref in ast.bracket_refs:
+            measure_name = ref.name
+            line, column = ast.line_column(ref.start)
+
+            transition = ContextTransition(
+                location=ref.start,
+                line=line,
+                column=column,
+                type=TransitionType.IMPLICIT_MEASURE,
+                function="MEASURE_REFERENCE",
+                measure_name=measure_name,
+                explanation=f"Implicit CALCULATE wrapper around measure [{measure_name}]. If in row context, this causes context transition to filter context.",
+                performance_impact=PerformanceImpact.LOW,
+                variables_in_scope=list(self.variables.keys()),
+            )
 
-                transitions.append(transition)
+            transitions.append(transition)
 
         return transitions
 
     def _detect_iterator_transitions(
         self,
-        dax: str,
+        ast: DaxAst,
         reference_index: Optional[Dict[str, Any]],
     ) -> List[ContextTransition]:
         """Detect context transitions in iterator functions"""
         transitions = []
 
-        for func_name in self.ITERATOR_FUNCTIONS:
-            pattern = rf"\b{func_name}\s*\("
-
-            for match in re.finditer(pattern, dax, re.IGNORECASE):
-                location = match.start()
-                line, column = self._get_line_column(dax, location)
-
-                # Check if iterator contains measure references
-                # Extract iterator body (simplified - doesn't handle nested functions perfectly)
-                start = match.end()
-                body = self._extract_function_body(dax, start)
-
-                has_measure_refs = bool(re.search(r"\[[^\]]+\]", body))
-
-                # Extract table name and columns from the first argument
-                table_name, columns = self._extract_table_and_columns(body)
-                row_context_vars = [table_name] if table_name else []
-
-                if has_measure_refs:
-                    transition = ContextTransition(
-                        location=location,
-                        line=line,
-                        column=column,
-                        type=TransitionType.ITERATOR,
-                        function=func_name,
-                        table_name=table_name,
-                        column_names=columns,
-                        row_context_vars=row_context_vars,
-                        explanation=f"{func_name} creates row context{' over ' + table_name if table_name else ''}. Measure references inside the iterator cause context transition in EACH iteration, potentially impacting performance.",
-                        performance_impact=PerformanceImpact.MEDIUM,
-                        variables_in_scope=list(self.variables.keys()),
-                    )
+        for call in ast.find_calls(*self.ITERATOR_FUNCTIONS):
+            # Only iterators that reference measures cause a transition per row
+            if not call.contains_kind(BRACKET_REF):
+                continue
+
+            func_name = call.name.upper()
+            line, column = ast.line_column(call.start)
+
+            # Extract table name and columns from the iterator arguments
+            table_name, columns = self._extract_table_and_columns(call)
+            row_context_vars = [table_name] if table_name else []
+
+            transition = ContextTransition(
+                location=call.start,
+                line=line,
+                column=column,
+                type=TransitionType.ITERATOR,
+                function=func_name,
+                table_name=table_name,
+                column_names=columns,
+                row_context_vars=row_context_vars,
+                explanation=f"{func_name} creates row context{' over ' + table_name if table_name else ''}. Measure references inside the iterator cause context transition in EACH iteration, potentially impacting performance.",
+                performance_impact=PerformanceImpact.MEDIUM,
+                variables_in_scope=list(self.variables.keys()),
+            )
 
-                    transitions.append(transition)
+            transitions.append(transition)
 
         return transitions
 
-    def _extract_table_name(self, body: str) -> Optional[str]:
-        """Extract table name from function body (first argument typically)"""
-        # Try to extract table name - look for patterns like:
-        # - Table[Column] -> Table
-        # - 'Table Name'[Column] -> Table Name
-        # - TableName -> TableName
-
-        # First, try to match table with column: Table[Column] or 'Table'[Column]
-        match = re.search(r"^\s*'?([A-Za-z0-9_\s]+)'?\s*\[", body)
-        if match:
-            return match.group(1).strip()
-
-        # Second, try to match just a table name at the start
-        match = re.search(r"^\s*([A-Za-z][A-Za-z0-9_]*)\s*[,)]", body)
-        if match:
-            table_name = match.group(1).strip()
-            # Exclude DAX functions (they're usually uppercase)
-            if not table_name.isupper():
-                return table_name
-
-        return None
-
-    def _extract_table_and_columns(self, body: str) -> Tuple[Optional[str], List[str]]:
+    def _extract_table_and_columns(self, call: DaxNode) -> Tuple[Optional[str], List[str]]:
         """
-        Extract table name and column names from function body
+        Extract the iterated table and referenced column names from an iterator call
 
         Returns:
             Tuple of (table_name, list of column names)
@@ -461,57 +367,30 @@ class DaxContextAnalyzer:
         table_name = None
         columns = []
 
-        # Pattern to match table and column references:
-        # - Table[Column]
-        # - 'Table Name'[Column]
-        # - [Column] (standalone column in same table)
-
-        # Extract table with column: Table[Column] or 'Table'[Column]
-        table_col_pattern = r"'?([A-Za-z0-9_\s]+)'?\[([A-Za-z0-9_\s]+)\]"
-
-        for match in re.finditer(table_col_pattern, body):
-            potential_table = match.group(1).strip()
-            column = match.group(2).strip()
-
-            # If we haven't found a table yet, this is likely it
-            if table_name is None and not potential_table.isupper():
-                table_name = potential_table
-
-            # Add column to list (avoid duplicates)
-            if column not in columns and not column.isupper():
-                columns.append(column)
-
-        # If still no table name, try to extract from first argument
-        if table_name is None:
-            table_name = self._extract_table_name(body)
+        # Iterated table: a bare table (or variable) as the first argument
+        first_arg = call.arg(0)
+        first = first_arg.first if first_arg is not None else None
+        if first is not None and first.kind in (IDENTIFIER, TABLE_REF) and len(first_arg.children) == 1:
+            table_name = first.name
+
+        for node in call.walk():
+            if node.kind != COLUMN_REF:
+                continue
+            # Otherwise the table of the first Table[Column] reference
+            if table_name is None:
+                table_name = node.table
+            if node.name not in columns:
+                columns.append(node.name)
 
         return table_name, columns
 
-    def _extract_function_body(self, dax: str, start: int) -> str:
-        """Extract function body (simplified parenthesis matching)"""
-        depth = 1
-        end = start
-
-        while end < len(dax) and depth > 0:
-            if dax[end] == "(":
-                depth += 1
-            elif dax[end] == ")":
-                depth -= 1
-            end += 1
-
-        return dax[start:end - 1]
-
-    def _calculate_nesting_levels(self, transitions: List[ContextTransition]) -> None:
-        """Calculate nesting level for each transition"""
-        # Simplified: count CALCULATE nesting by counting open CALCULATEs before each transition
-        for i, transition in enumerate(transitions):
-            # Count CALCULATE functions before this that haven't closed
-            nesting = 0
-            for j in range(i):
-                if transitions[j].type in {TransitionType.EXPLICIT_CALCULATE, TransitionType.CALCULATETABLE}:
-                    nesting += 1
-
-            transition.nested_level = nesting
+    def _calculate_nesting_levels(self, transitions: List[ContextTransition], ast: DaxAst) -> None:
+        """Calculate nesting level for each transition (number of enclosing CALCULATE calls)"""
+        spans = [(c.start, c.end) for c in ast.find_calls(*self.CALCULATE_FUNCTIONS)]
+        for transition in transitions:
+            transition.nested_level = sum(
+                1 for start, end in spans if start < transition.location < end
+            )
 
     def _detect_performance_issues(
         self,
@@ -601,13 +480,6 @@ class DaxContextAnalyzer:
 
         return "\n".join(summary_parts)
 
-    def _get_line_column(self, text: str, position: int) -> Tuple[int, int]:
-        """Get line and column number from character position"""
-        lines = text[:position].split("\n")
-        line = len(lines)
-        column = len(lines[-1]) + 1
-        return line, column
-
     def detect_dax_anti_patterns(self, dax_expression: str) -> Dict[str, Any]:
         """
         Detect common DAX anti-patterns using pattern matching
@@ -663,8 +535,7 @@ class DaxContextAnalyzer:
 
         Returns suggestions to upgrade to SUMMARIZECOLUMNS for better performance
         """
-        summarize_pattern = r'\bSUMMARIZE\s*\('
-        summarize_matches = list(re.finditer(summarize_pattern, dax_expression, re.IGNORECASE))
+        summarize_matches = parse_dax(dax_expression).find_calls('SUMMARIZE')
 
         if not summarize_matches:
             return {
@@ -0,0 +1,471 @@
+"""
+DAX Lexer and Syntax Tree
+
+Single-pass tokenizer and lightweight parser for DAX expressions. parse_dax() produces
+one memoized DaxAst per expression, which the DAX analyzers (context analyzer, call
+tree builder, best practices, code rewriter, calculation group analyzer) walk instead
+of each re-scanning the raw text with their own regexes and parenthesis matching.
+
+The tree models what the analyzers need and nothing more:
+- function calls with their top-level arguments
+- parenthesized groups and table constructors
+- VAR / RETURN blocks
+- 'Table'[Column], Table[Column] and [Name] references, literals and operators
+
+Operator precedence is not resolved: an argument is a flat sequence of nodes.
+Comments and string contents never produce calls or references, and all positions
+are offsets into the original expression.
+
+Trees are shared between callers through the memo cache - treat them as read-only.
+"""
+
+import bisect
+import logging
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenType(Enum):
+    """Lexical token types"""
+    IDENTIFIER = "identifier"  # Function names, unquoted table names, variables
+    KEYWORD = "keyword"  # VAR, RETURN
+    TABLE = "table"  # 'Quoted Table'
+    BRACKET = "bracket"  # [Column] / [Measure]
+    STRING = "string"
+    NUMBER = "number"
+    OPERATOR = "operator"
+    LPAREN = "lparen"
+    RPAREN = "rparen"
+    COMMA = "comma"
+    LBRACE = "lbrace"
+    RBRACE = "rbrace"
+    OTHER = "other"
+
+
+class Token(NamedTuple):
+    type: TokenType
+    text: str
+    start: int
+    end: int
+
+
+# Node kinds
+ROOT = "root"
+CALL = "call"
+ARG = "arg"
+PAREN = "paren"
+BRACES = "braces"
+VAR = "var"
+RETURN = "return"
+COLUMN_REF = "column_ref"  # Table[Column] or 'Table'[Column]
+BRACKET_REF = "bracket_ref"  # [Name] - measure, or column in row context
+TABLE_REF = "table_ref"  # 'Table'
+IDENTIFIER = "identifier"  # Bare identifier: table name or variable
+STRING = "string"
+NUMBER = "number"
+OPERATOR = "operator"
+OTHER = "other"
+
+_KEYWORDS = frozenset({"VAR", "RETURN"})
+_WORD_OPERATORS = frozenset({"IN", "NOT"})
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*  # Leading whitespace is consumed by the next token's match
+    (?:(?P<comment>(?://|--)[^\n]*|/\*.*?(?:\*/|\Z))
+    |(?P<string>"(?:[^"]|"")*"?)
+    |(?P<table>'(?:[^']|'')*'?)
+    |(?P<bracket>\[(?:[^\]]|\]\])*\]?)
+    |(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    |(?P<ident>[^\W\d][\w.]*)
+    |(?P<op><=|>=|<>|==|&&|\|\||[-+*/^&=<>!])
+    |(?P<lparen>\()
+    |(?P<rparen>\))
+    |(?P<comma>,)
+    |(?P<lbrace>\{)
+    |(?P<rbrace>\})
+    |(?P<other>.)
+    |(?P<end>\Z))
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_GROUP_TYPES = {
+    "string": TokenType.STRING,
+    "table": TokenType.TABLE,
+    "bracket": TokenType.BRACKET,
+    "number": TokenType.NUMBER,
+    "op": TokenType.OPERATOR,
+    "lparen": TokenType.LPAREN,
+    "rparen": TokenType.RPAREN,
+    "comma": TokenType.COMMA,
+    "lbrace": TokenType.LBRACE,
+    "rbrace": TokenType.RBRACE,
+    "other": TokenType.OTHER,
+}
+
+
+def tokenize(expression: str) -> Tuple[List[Token], List[Tuple[int, int]]]:
+    """
+    Tokenize a DAX expression in one pass.
+
+    Returns:
+        (tokens, comment_spans) - whitespace and comments are not emitted as tokens
+    """
+    tokens: List[Token] = []
+    comments: List[Tuple[int, int]] = []
+    for match in _TOKEN_RE.finditer(expression):
+        kind = match.lastgroup
+        if kind == "end":
+            break
+        if kind == "comment":
+            comments.append(match.span(kind))
+            continue
+        text = match.group(kind)
+        if kind == "ident":
+            upper = text.upper()
+            if upper in _KEYWORDS:
+                token_type = TokenType.KEYWORD
+            elif upper in _WORD_OPERATORS:
+                token_type = TokenType.OPERATOR
+            else:
+                token_type = TokenType.IDENTIFIER
+        else:
+            token_type = _GROUP_TYPES[kind]
+        tokens.append(Token(token_type, text, match.start(kind), match.end(kind)))
+    return tokens, comments
+
+
+def _unquote_table(text: str) -> str:
+    if len(text) >= 2 and text.endswith("'"):
+        text = text[1:-1]
+    else:
+        text = text[1:]
+    return text.replace("''", "'")
+
+
+def _unbracket(text: str) -> str:
+    if len(text) >= 2 and text.endswith("]"):
+        text = text[1:-1]
+    else:
+        text = text[1:]
+    return text.replace("]]", "]")
+
+
+class DaxNode:
+    """Node of the DAX syntax tree"""
+
+    __slots__ = ("kind", "name", "table", "start", "end", "children", "args")
+
+    def __init__(self, kind: str, start: int, end: int, name: str = "", table: str = ""):
+        self.kind = kind
+        self.name = name  # Function / variable / reference name, or token text for leaves
+        self.table = table  # Table part of a COLUMN_REF
+        self.start = start
+        self.end = end
+        self.children: List["DaxNode"] = []  # ROOT, ARG, VAR, RETURN
+        self.args: List["DaxNode"] = []  # CALL, PAREN, BRACES (each an ARG node)
+
+    def __repr__(self) -> str:
+        label = f"{self.table}[{self.name}]" if self.kind == COLUMN_REF else self.name
+        return f"DaxNode({self.kind}, {label!r}, {self.start}:{self.end})"
+
+    @property
+    def upper_name(self) -> str:
+        return self.name.upper()
+
+    def is_call(self, *names: str) -> bool:
+        """True if this is a call to one of the given (upper-case) function names, or any call."""
+        return self.kind == CALL and (not names or self.name.upper() in names)
+
+    def arg(self, index: int) -> Optional["DaxNode"]:
+        """Argument node by position (None if missing)."""
+        return self.args[index] if 0 <= index < len(self.args) else None
+
+    @property
+    def first(self) -> Optional["DaxNode"]:
+        """First element of an ARG / VAR / RETURN node."""
+        return self.children[0] if self.children else None
+
+    def iter_children(self) -> Iterator["DaxNode"]:
+        """Direct sub-nodes (arguments are flattened into their elements)."""
+        if self.args:
+            for arg in self.args:
+                yield from arg.children
+        else:
+            yield from self.children
+
+    def walk(self) -> Iterator["DaxNode"]:
+        """Pre-order traversal of all descendant nodes (excluding self and ARG wrappers)."""
+        stack = list(reversed(list(self.iter_children())))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node.iter_children())))
+
+    def find_calls(self, *names: str) -> List["DaxNode"]:
+        """Descendant calls, optionally restricted to the given upper-case names."""
+        return [n for n in self.walk() if n.kind == CALL and (not names or n.name.upper() in names)]
+
+    def contains_call(self, *names: str) -> bool:
+        return any(n.kind == CALL and n.name.upper() in names for n in self.walk())
+
+    def contains_kind(self, kind: str) -> bool:
+        return any(n.kind == kind for n in self.walk())
+
+
+class DaxAst:
+    """Parsed DAX expression with indexes for the common analyzer lookups."""
+
+    def __init__(self, expression: str, tokens: List[Token], comments: List[Tuple[int, int]], root: DaxNode):
+        self.expression = expression
+        self.tokens = tokens
+        self.comments = comments
+        self.root = root
+
+        self.calls: List[DaxNode] = []
+        self.variables: List[DaxNode] = []
+        self.column_refs: List[DaxNode] = []
+        self.bracket_refs: List[DaxNode] = []
+        self._calls_by_name: Dict[str, List[DaxNode]] = {}
+        self._line_starts: Optional[List[int]] = None
+        self._code: Optional[str] = None
+
+        for node in root.walk():
+            kind = node.kind
+            if kind == CALL:
+                self.calls.append(node)
+                self._calls_by_name.setdefault(node.name.upper(), []).append(node)
+            elif kind == VAR:
+                self.variables.append(node)
+            elif kind == COLUMN_REF:
+                self.column_refs.append(node)
+            elif kind == BRACKET_REF:
+                self.bracket_refs.append(node)
+
+        self.words: FrozenSet[str] = frozenset(
+            t.text.upper() for t in tokens if t.type in (TokenType.IDENTIFIER, TokenType.KEYWORD)
+        )
+
+    def text(self, node: DaxNode) -> str:
+        """Source text of a node."""
+        return self.expression[node.start:node.end]
+
+    def inner_text(self, node: DaxNode) -> str:
+        """Source text between a call's parentheses."""
+        if node.kind == CALL and node.args:
+            return self.expression[node.args[0].start:node.args[-1].end]
+        if node.kind == CALL:
+            open_pos = self.expression.find("(", node.start)
+            return self.expression[open_pos + 1:max(open_pos + 1, node.end - 1)]
+        return self.text(node)
+
+    def find_calls(self, *names: str) -> List[DaxNode]:
+        """All calls to the given upper-case function names, in source order."""
+        if not names:
+            return list(self.calls)
+        if len(names) == 1:
+            return list(self._calls_by_name.get(names[0], []))
+        found = [c for name in names for c in self._calls_by_name.get(name, [])]
+        found.sort(key=lambda c: c.start)
+        return found
+
+    def has_call(self, *names: str) -> bool:
+        return any(name in self._calls_by_name for name in names)
+
+    def has_word(self, word: str) -> bool:
+        """True if the upper-case identifier/keyword appears outside strings and comments."""
+        return word in self.words
+
+    def operators(self) -> List[Token]:
+        return [t for t in self.tokens if t.type == TokenType.OPERATOR]
+
+    @property
+    def code(self) -> str:
+        """Expression with comments removed."""
+        if self._code is None:
+            if not self.comments:
+                self._code = self.expression
+            else:
+                parts = []
+                pos = 0
+                for start, end in self.comments:
+                    parts.append(self.expression[pos:start])
+                    pos = end
+                parts.append(self.expression[pos:])
+                self._code = "".join(parts)
+        return self._code
+
+    def line_column(self, position: int) -> Tuple[int, int]:
+        """1-based (line, column) of an offset in the expression."""
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer(r"\n", self.expression)]
+        line = bisect.bisect_right(self._line_starts, position)
+        return line, position - self._line_starts[line - 1] + 1
+
+
+class _Parser:
+    """Recursive-descent parser over the token list"""
+
+    def __init__(self, tokens: List[Token], length: int):
+        self.tokens = tokens
+        self.length = length
+        self.pos = 0
+
+    def _peek(self, offset: int = 0) -> Optional[Token]:
+        idx = self.pos + offset
+        return self.tokens[idx] if idx < len(self.tokens) else None
+
+    def parse(self) -> DaxNode:
+        root = DaxNode(ROOT, 0, self.length)
+        while self.pos < len(self.tokens):
+            # Stray closing tokens at top level become OTHER leaves
+            root.children.extend(self._parse_elements(frozenset(), in_var=False))
+            if self.pos < len(self.tokens):
+                tok = self.tokens[self.pos]
+                root.children.append(DaxNode(OTHER, tok.start, tok.end, tok.text))
+                self.pos += 1
+        return root
+
+    def _parse_elements(self, stops: FrozenSet[TokenType], in_var: bool) -> List[DaxNode]:
+        elements: List[DaxNode] = []
+        tokens = self.tokens
+        while self.pos < len(tokens):
+            tok = tokens[self.pos]
+            if tok.type in stops:
+                break
+            if tok.type == TokenType.KEYWORD and in_var:
+                break
+            if tok.type in (TokenType.RPAREN, TokenType.RBRACE, TokenType.COMMA) and not stops:
+                break
+            elements.append(self._parse_element(stops))
+        return elements
+
+    def _parse_group(self, kind: str, name: str, start: int, close: TokenType) -> DaxNode:
+        """Parse comma-separated arguments up to the closing token (already past the opener)."""
+        node = DaxNode(kind, start, start, name)
+        stops = frozenset({TokenType.COMMA, close})
+        while True:
+            arg_start = self._peek().start if self._peek() else self.length
+            elements = self._parse_elements(stops, in_var=False)
+            tok = self._peek()
+            if elements or (tok is not None and tok.type == TokenType.COMMA) or node.args:
+                arg = DaxNode(ARG, elements[0].start if elements else arg_start,
+                              elements[-1].end if elements else arg_start)
+                arg.children = elements
+                node.args.append(arg)
+            if tok is None:
+                node.end = self.length  # Unclosed
+                return node
+            self.pos += 1
+            if tok.type == close:
+                node.end = tok.end
+                return node
+
+    def _parse_element(self, stops: FrozenSet[TokenType]) -> DaxNode:
+        tok = self.tokens[self.pos]
+        nxt = self._peek(1)
+        self.pos += 1
+        ttype = tok.type
+
+        if ttype == TokenType.KEYWORD:
+            if tok.text.upper() == "VAR":
+                name_tok = self._peek()
+                name = ""
+                if name_tok is not None and name_tok.type == TokenType.IDENTIFIER:
+                    name = name_tok.text
+                    self.pos += 1
+                eq = self._peek()
+                if eq is not None and eq.type == TokenType.OPERATOR and eq.text == "=":
+                    self.pos += 1
+                node = DaxNode(VAR, tok.start, tok.end, name)
+                node.children = self._parse_elements(stops, in_var=True)
+            else:
+                node = DaxNode(RETURN, tok.start, tok.end, "RETURN")
+                node.children = self._parse_elements(stops, in_var=False)
+            if node.children:
+                node.end = node.children[-1].end
+            return node
+
+        if ttype == TokenType.IDENTIFIER:
+            if nxt is not None and nxt.type == TokenType.LPAREN:
+                self.pos += 1
+                return self._parse_group(CALL, tok.text, tok.start, TokenType.RPAREN)
+            if nxt is not None and nxt.type == TokenType.BRACKET:
+                self.pos += 1
+                return DaxNode(COLUMN_REF, tok.start, nxt.end, _unbracket(nxt.text), tok.text)
+            return DaxNode(IDENTIFIER, tok.start, tok.end, tok.text)
+
+        if ttype == TokenType.TABLE:
+            if nxt is not None and nxt.type == TokenType.BRACKET:
+                self.pos += 1
+                return DaxNode(COLUMN_REF, tok.start, nxt.end, _unbracket(nxt.text), _unquote_table(tok.text))
+            return DaxNode(TABLE_REF, tok.start, tok.end, _unquote_table(tok.text))
+
+        if ttype == TokenType.BRACKET:
+            return DaxNode(BRACKET_REF, tok.start, tok.end, _unbracket(tok.text))
+
+        if ttype == TokenType.LPAREN:
+            return self._parse_group(PAREN, "", tok.start, TokenType.RPAREN)
+
+        if ttype == TokenType.LBRACE:
+            return self._parse_group(BRACES, "", tok.start, TokenType.RBRACE)
+
+        if ttype == TokenType.STRING:
+            return DaxNode(STRING, tok.start, tok.end, tok.text)
+        if ttype == TokenType.NUMBER:
+            return DaxNode(NUMBER, tok.start, tok.end, tok.text)
+        if ttype == TokenType.OPERATOR:
+            return DaxNode(OPERATOR, tok.start, tok.end, tok.text.upper() if tok.text.isalpha() else tok.text)
+        return DaxNode(OTHER, tok.start, tok.end, tok.text)
+
+
+@lru_cache(maxsize=512)
+def _parse_cached(expression: str) -> DaxAst:
+    tokens, comments = tokenize(expression)
+    try:
+        root = _Parser(tokens, len(expression)).parse()
+    except RecursionError:
+        logger.warning("DAX expression nested too deeply for tree parsing; using flat token list")
+        root = DaxNode(ROOT, 0, len(expression))
+        root.children = [DaxNode(OTHER, t.start, t.end, t.text) for t in tokens]
+    return DaxAst(expression, tokens, comments, root)
+
+
+def parse_dax(expression: Optional[str]) -> DaxAst:
+    """
+    Parse a DAX expression into a shared, memoized DaxAst.
+
+    Args:
+        expression: DAX expression (None is treated as empty)
+
+    Returns:
+        DaxAst - identical expressions return the same (read-only) instance
+    """
+    return _parse_cached(expression if isinstance(expression, str) else "")
+
+
+def clear_parse_cache() -> None:
+    """Drop all memoized trees."""
+    _parse_cached.cache_clear()
+
+
+def get_parse_cache_info() -> Dict[str, int]:
+    info = _parse_cached.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize or 0}
+
+
+__all__ = [
+    "TokenType",
+    "Token",
+    "DaxNode",
+    "DaxAst",
+    "tokenize",
+    "parse_dax",
+    "clear_parse_cache",
+    "get_parse_cache_info",
+]
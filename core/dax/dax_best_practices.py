@@ -24,8 +24,47 @@ from typing import Dict, Any, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
 
+from .dax_ast import BRACKET_REF, COLUMN_REF, IDENTIFIER, NUMBER, OPERATOR, TABLE_REF, DaxNode, parse_dax
+
 logger = logging.getLogger(__name__)
 
+_COMPARISON_OPERATORS = frozenset({'=', '==', '<>', '<', '>', '<=', '>='})
+_NON_DESCRIPTIVE_VAR = re.compile(r'[A-Z]|V\d+')
+
+
+def _outermost(calls: List[DaxNode]) -> List[DaxNode]:
+    """Drop calls nested inside an earlier call of the list (calls are in source order)."""
+    result: List[DaxNode] = []
+    for call in calls:
+        if not result or call.start >= result[-1].end:
+            result.append(call)
+    return result
+
+
+def _first_is_call(arg: Optional[DaxNode], *names: str) -> bool:
+    """True if an argument starts with a call to one of the names."""
+    return arg is not None and arg.first is not None and arg.first.is_call(*names)
+
+
+def _has_comparison(arg: Optional[DaxNode]) -> bool:
+    """True if an argument contains a top-level comparison operator."""
+    return arg is not None and any(el.kind == OPERATOR and el.name in _COMPARISON_OPERATORS for el in arg.children)
+
+
+def _is_zero(node: DaxNode) -> bool:
+    try:
+        return node.kind == NUMBER and float(node.name) == 0
+    except ValueError:
+        return False
+
+
+def _compares_to_zero(elements: List[DaxNode]) -> bool:
+    """True if a sequence of nodes contains '= 0' (or '== 0')."""
+    return any(
+        el.kind == OPERATOR and el.name in ('=', '==') and _is_zero(nxt)
+        for el, nxt in zip(elements, elements[1:])
+    )
+
 
 class IssueSeverity(Enum):
     """Severity levels for DAX issues"""
@@ -188,9 +227,11 @@ class DaxBestPracticesAnalyzer:
     def _check_sumx_filter(self, dax: str) -> List[DaxIssue]:
         """Check for SUMX(FILTER(...)) anti-pattern"""
         issues = []
-        pattern = r'(SUMX|AVERAGEX|MINX|MAXX)\s*\(\s*FILTER\s*\('
+        ast = parse_dax(dax)
 
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        for call in ast.find_calls('SUMX', 'AVERAGEX', 'MINX', 'MAXX'):
+            if not _first_is_call(call.arg(0), 'FILTER'):
+                continue
             self.articles_referenced.add('sqlbi_sumx_filter')
             issues.append(DaxIssue(
                 title="SUMX(FILTER()) Anti-Pattern Detected",
@@ -201,15 +242,15 @@ class DaxBestPracticesAnalyzer:
                 ),
                 severity=IssueSeverity.CRITICAL,
                 category=IssueCategory.PERFORMANCE,
-                code_example_before=f"{match.group(1)}(FILTER(Table, condition), Table[Column])",
-                code_example_after=f"CALCULATE({match.group(1).replace('X', '')}(Table[Column]), condition)",
+                code_example_before=f"{call.name}(FILTER(Table, condition), Table[Column])",
+                code_example_after=f"CALCULATE({call.name.upper().replace('X', '')}(Table[Column]), condition)",
                 estimated_improvement="5-10x faster",
                 article_reference={
                     'title': 'Avoid FILTER as filter argument (Microsoft Learn)',
                     'url': 'https://learn.microsoft.com/en-us/power-bi/guidance/dax-avoid-avoid-filter-as-filter-argument',
                     'source': 'Microsoft Learn'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -217,9 +258,11 @@ class DaxBestPracticesAnalyzer:
     def _check_countrows_filter(self, dax: str) -> List[DaxIssue]:
         """Check for COUNTROWS(FILTER(...)) anti-pattern"""
         issues = []
-        pattern = r'COUNTROWS\s*\(\s*FILTER\s*\('
+        ast = parse_dax(dax)
 
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        for call in ast.find_calls('COUNTROWS'):
+            if not _first_is_call(call.arg(0), 'FILTER'):
+                continue
             self.articles_referenced.add('sqlbi_countrows_filter')
             issues.append(DaxIssue(
                 title="COUNTROWS(FILTER()) Anti-Pattern",
@@ -237,7 +280,7 @@ class DaxBestPracticesAnalyzer:
                     'url': 'https://learn.microsoft.com/en-us/dax/best-practices/dax-countrows',
                     'source': 'Microsoft Learn'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -245,9 +288,11 @@ class DaxBestPracticesAnalyzer:
     def _check_filter_all(self, dax: str) -> List[DaxIssue]:
         """Check for FILTER(ALL(...)) anti-pattern"""
         issues = []
-        pattern = r'FILTER\s*\(\s*(ALL|ALLSELECTED)\s*\('
+        ast = parse_dax(dax)
 
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        for call in ast.find_calls('FILTER'):
+            if not _first_is_call(call.arg(0), 'ALL', 'ALLSELECTED'):
+                continue
             self.articles_referenced.add('sqlbi_filter_all')
             issues.append(DaxIssue(
                 title="FILTER(ALL()) Forces Formula Engine Evaluation",
@@ -257,7 +302,7 @@ class DaxBestPracticesAnalyzer:
                 ),
                 severity=IssueSeverity.HIGH,
                 category=IssueCategory.PERFORMANCE,
-                code_example_before=f"FILTER({match.group(1)}(Table), condition)",
+                code_example_before=f"FILTER({call.arg(0).first.name}(Table), condition)",
                 code_example_after="CALCULATE(VALUES(Table), condition)",
                 estimated_improvement="3-5x faster",
                 article_reference={
@@ -265,7 +310,7 @@ class DaxBestPracticesAnalyzer:
                     'url': 'https://www.daxpatterns.com/dynamic-segmentation/',
                     'source': 'DAX Patterns'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -273,9 +318,10 @@ class DaxBestPracticesAnalyzer:
     def _check_nested_calculate(self, dax: str) -> List[DaxIssue]:
         """Check for nested CALCULATE functions"""
         issues = []
-        pattern = r'CALCULATE\s*\([^)]*CALCULATE\s*\('
+        ast = parse_dax(dax)
+        nesting = [call for call in ast.find_calls('CALCULATE') if call.contains_call('CALCULATE')]
 
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        for call in _outermost(nesting):
             self.articles_referenced.add('sqlbi_context_transition')
             issues.append(DaxIssue(
                 title="Nested CALCULATE Detected",
@@ -293,7 +339,7 @@ class DaxBestPracticesAnalyzer:
                     'title': 'Understanding Context Transition',
                     'url': 'https://www.sqlbi.com/articles/understanding-context-transition/'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -301,9 +347,13 @@ class DaxBestPracticesAnalyzer:
     def _check_related_in_iterator(self, dax: str) -> List[DaxIssue]:
         """Check for RELATED in iterator functions"""
         issues = []
-        pattern = r'(SUMX|AVERAGEX|COUNTX|FILTER)\s*\([^)]*RELATED\s*\('
+        ast = parse_dax(dax)
+        iterators = [
+            call for call in ast.find_calls('SUMX', 'AVERAGEX', 'COUNTX', 'FILTER')
+            if call.contains_call('RELATED')
+        ]
 
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        for call in _outermost(iterators):
             self.articles_referenced.add('sqlbi_related_iterators')
             issues.append(DaxIssue(
                 title="RELATED in Iterator Function",
@@ -320,7 +370,7 @@ class DaxBestPracticesAnalyzer:
                     'title': 'Avoiding RELATED in Iterators',
                     'url': 'https://www.sqlbi.com/articles/avoiding-related-in-iterators/'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -329,9 +379,14 @@ class DaxBestPracticesAnalyzer:
         """Check for manual division with zero checks instead of DIVIDE"""
         issues = []
         # Pattern: IF(denominator = 0, alternate, numerator / denominator)
-        pattern = r'IF\s*\([^=]+\s*=\s*0\s*,\s*[^,]+\s*,\s*[^/]+\s*/\s*[^)]+\)'
-
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        ast = parse_dax(dax)
+
+        for call in ast.find_calls('IF'):
+            condition, result = call.arg(0), call.arg(2)
+            if condition is None or result is None or not _compares_to_zero(condition.children):
+                continue
+            if not any(el.kind == OPERATOR and el.name == '/' for el in result.children):
+                continue
             self.articles_referenced.add('sqlbi_divide')
             issues.append(DaxIssue(
                 title="Manual Division with Zero Check",
@@ -349,7 +404,7 @@ class DaxBestPracticesAnalyzer:
                     'url': 'https://dax.guide/divide/',
                     'source': 'DAX.Guide'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -357,9 +412,11 @@ class DaxBestPracticesAnalyzer:
     def _check_values_in_calculate(self, dax: str) -> List[DaxIssue]:
         """Check for VALUES in CALCULATE filter arguments"""
         issues = []
-        pattern = r'CALCULATE\s*\([^)]*,\s*VALUES\s*\('
+        ast = parse_dax(dax)
 
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        for call in ast.find_calls('CALCULATE'):
+            if not any(_first_is_call(arg, 'VALUES') for arg in call.args[1:]):
+                continue
             self.articles_referenced.add('sqlbi_values_optimize')
             issues.append(DaxIssue(
                 title="VALUES in CALCULATE Filter",
@@ -376,7 +433,7 @@ class DaxBestPracticesAnalyzer:
                     'title': 'Optimizing VALUES Performance',
                     'url': 'https://www.sqlbi.com/articles/optimizing-values-performance/'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -385,9 +442,15 @@ class DaxBestPracticesAnalyzer:
         """Check for measures in FILTER predicates"""
         issues = []
         # Pattern: FILTER with measure reference (using [] notation)
-        pattern = r'FILTER\s*\([^)]*,\s*\[[^\]]+\]\s*[><!=]'
-
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        ast = parse_dax(dax)
+
+        for call in ast.find_calls('FILTER'):
+            predicate = call.arg(1)
+            if predicate is None or len(predicate.children) < 2:
+                continue
+            ref, op = predicate.children[0], predicate.children[1]
+            if ref.kind != BRACKET_REF or op.kind != OPERATOR or op.name[0] not in '><!=':
+                continue
             self.articles_referenced.add('sqlbi_measure_filter')
             issues.append(DaxIssue(
                 title="Measure in FILTER Predicate",
@@ -405,7 +468,7 @@ class DaxBestPracticesAnalyzer:
                     'url': 'https://www.daxpatterns.com/static-segmentation/',
                     'source': 'DAX Patterns'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -414,9 +477,15 @@ class DaxBestPracticesAnalyzer:
         """Check for iterator functions that could be simple aggregations"""
         issues = []
         # Pattern: SUMX(Table, Table[Column]) - direct column reference without calculation
-        pattern = r'(SUMX|AVERAGEX)\s*\(([^,]+),\s*\2\[([^\]]+)\]\s*\)'
-
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        ast = parse_dax(dax)
+
+        for call in ast.find_calls('SUMX', 'AVERAGEX'):
+            if len(call.args) != 2 or len(call.args[0].children) != 1 or len(call.args[1].children) != 1:
+                continue
+            table, column = call.args[0].first, call.args[1].first
+            if table.kind not in (IDENTIFIER, TABLE_REF) or column.kind != COLUMN_REF or column.table != table.name:
+                continue
+            table_text = ast.text(table)
             issues.append(DaxIssue(
                 title="Unnecessary Iterator Function",
                 description=(
@@ -425,10 +494,10 @@ class DaxBestPracticesAnalyzer:
                 ),
                 severity=IssueSeverity.LOW,
                 category=IssueCategory.PERFORMANCE,
-                code_example_before=f"{match.group(1)}({match.group(2)}, {match.group(2)}[{match.group(3)}])",
-                code_example_after=f"{match.group(1).replace('X', '')}({match.group(2)}[{match.group(3)}])",
+                code_example_before=f"{call.name}({table_text}, {table_text}[{column.name}])",
+                code_example_after=f"{call.name.upper().replace('X', '')}({table_text}[{column.name}])",
                 estimated_improvement="Minor performance gain",
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -440,8 +509,9 @@ class DaxBestPracticesAnalyzer:
     def _check_multiple_measure_refs(self, dax: str) -> List[DaxIssue]:
         """Check for multiple measure references without variables"""
         issues = []
-        # Count measure references (words in brackets)
-        measure_refs = re.findall(r'\[[^\]]+\]', dax)
+        # Count measure references (unqualified bracket references)
+        ast = parse_dax(dax)
+        measure_refs = [f"[{ref.name}]" for ref in ast.bracket_refs]
 
         # Check if same measure is referenced multiple times
         measure_counts = {}
@@ -450,7 +520,7 @@ class DaxBestPracticesAnalyzer:
 
         repeated_measures = [m for m, count in measure_counts.items() if count > 2]
 
-        if repeated_measures and 'VAR' not in dax.upper():
+        if repeated_measures and not ast.has_word('VAR'):
             self.articles_referenced.add('sqlbi_variables')
             issues.append(DaxIssue(
                 title="Repeated Measure References Without Variables",
@@ -472,12 +542,13 @@ class DaxBestPracticesAnalyzer:
         issues = []
 
         # Check if VAR is used
-        has_vars = 'VAR' in dax.upper()
-        has_return = 'RETURN' in dax.upper()
+        ast = parse_dax(dax)
+        has_vars = ast.has_word('VAR')
+        has_return = ast.has_word('RETURN')
 
         # Complex expression without variables (heuristic: length > 200 and multiple operations)
         if len(dax) > 200 and not has_vars:
-            operation_count = dax.count('+') + dax.count('-') + dax.count('*') + dax.count('/')
+            operation_count = sum(1 for op in ast.operators() if op.text in ('+', '-', '*', '/'))
             if operation_count > 3:
                 self.articles_referenced.add('sqlbi_variables')
                 issues.append(DaxIssue(
@@ -508,9 +579,10 @@ class DaxBestPracticesAnalyzer:
         issues = []
 
         # Check for IFERROR usage (good practice)
-        has_iferror = 'IFERROR' in dax.upper()
-        has_division = '/' in dax
-        has_divide = 'DIVIDE' in dax.upper()
+        ast = parse_dax(dax)
+        has_iferror = ast.has_call('IFERROR')
+        has_division = any(op.text == '/' for op in ast.operators())
+        has_divide = ast.has_call('DIVIDE')
 
         # Division without DIVIDE or IFERROR
         if has_division and not (has_divide or has_iferror):
@@ -532,8 +604,7 @@ class DaxBestPracticesAnalyzer:
         issues = []
 
         # Check for single-letter variable names (V1, V2, etc.)
-        pattern = r'\bVAR\s+([A-Z]|V\d+)\s*='
-        matches = list(re.finditer(pattern, dax))
+        matches = [var for var in parse_dax(dax).variables if _NON_DESCRIPTIVE_VAR.fullmatch(var.name)]
 
         if matches:
             issues.append(DaxIssue(
@@ -555,7 +626,8 @@ class DaxBestPracticesAnalyzer:
         issues = []
 
         # Check for = 0 comparisons (should consider using ISBLANK)
-        if '= 0' in dax or '=0' in dax:
+        ast = parse_dax(dax)
+        if _compares_to_zero([node for node in ast.root.walk() if node.kind in (OPERATOR, NUMBER)]):
             issues.append(DaxIssue(
                 title="Consider BLANK vs Zero Distinction",
                 description=(
@@ -574,9 +646,14 @@ class DaxBestPracticesAnalyzer:
         issues = []
 
         # Check if CALCULATE uses FILTER with simple conditions
-        pattern = r'CALCULATE\s*\([^)]*,\s*FILTER\s*\([^,]+,\s*[^,]+\s*[<>=!]+\s*[^)]+\)'
-
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        ast = parse_dax(dax)
+
+        for call in ast.find_calls('CALCULATE'):
+            if not any(
+                _first_is_call(arg, 'FILTER') and _has_comparison(arg.first.arg(1))
+                for arg in call.args[1:]
+            ):
+                continue
             self.articles_referenced.add('microsoft_dax_optimization')
             issues.append(DaxIssue(
                 title="FILTER with Simple Boolean in CALCULATE",
@@ -593,7 +670,7 @@ class DaxBestPracticesAnalyzer:
                     'title': 'DAX: Avoid FILTER as filter argument',
                     'url': 'https://learn.microsoft.com/en-us/power-bi/guidance/dax-avoid-avoid-filter-as-filter-argument'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -601,19 +678,17 @@ class DaxBestPracticesAnalyzer:
     def _check_iferror_iserror(self, dax: str) -> List[DaxIssue]:
         """Check for IFERROR/ISERROR usage"""
         issues = []
-        pattern = r'\b(IFERROR|ISERROR)\s*\('
-
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        for call in parse_dax(dax).find_calls('IFERROR', 'ISERROR'):
             self.articles_referenced.add('iferror_iserror')
             issues.append(DaxIssue(
                 title="Avoid IFERROR/ISERROR Functions",
                 description=(
-                    f"{match.group(1)} forces Power BI to enter step-by-step execution for each row, "
+                    f"{call.name} forces Power BI to enter step-by-step execution for each row, "
                     "significantly impacting performance. Use IF with logical tests or built-in error handling instead."
                 ),
                 severity=IssueSeverity.HIGH,
                 category=IssueCategory.PERFORMANCE,
-                code_example_before=f"{match.group(1)}([Value]/[Divisor], 0)",
+                code_example_before=f"{call.name}([Value]/[Divisor], 0)",
                 code_example_after="DIVIDE([Value], [Divisor], 0)  -- or use IF with logical test",
                 estimated_improvement="Avoids step-by-step execution overhead",
                 article_reference={
@@ -621,7 +696,7 @@ class DaxBestPracticesAnalyzer:
                     'url': 'https://learn.microsoft.com/en-us/dax/best-practices/dax-error-functions',
                     'source': 'Microsoft Learn'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -629,9 +704,7 @@ class DaxBestPracticesAnalyzer:
     def _check_addcolumns(self, dax: str) -> List[DaxIssue]:
         """Check for ADDCOLUMNS in measure expressions"""
         issues = []
-        pattern = r'\bADDCOLUMNS\s*\('
-
-        matches = list(re.finditer(pattern, dax, re.IGNORECASE))
+        matches = parse_dax(dax).find_calls('ADDCOLUMNS')
         if matches:
             self.articles_referenced.add('addcolumns_in_measure')
             issues.append(DaxIssue(
@@ -653,9 +726,9 @@ class DaxBestPracticesAnalyzer:
     def _check_if_in_iterator(self, dax: str) -> List[DaxIssue]:
         """Check for IF conditions inside iterator functions"""
         issues = []
-        pattern = r'(SUMX|AVERAGEX|COUNTX|MINX|MAXX)\s*\([^,]+,\s*IF\s*\('
-
-        for match in re.finditer(pattern, dax, re.IGNORECASE):
+        for call in parse_dax(dax).find_calls('SUMX', 'AVERAGEX', 'COUNTX', 'MINX', 'MAXX'):
+            if not _first_is_call(call.arg(1), 'IF'):
+                continue
             issues.append(DaxIssue(
                 title="IF Condition Inside Iterator Function",
                 description=(
@@ -664,15 +737,15 @@ class DaxBestPracticesAnalyzer:
                 ),
                 severity=IssueSeverity.MEDIUM,
                 category=IssueCategory.PERFORMANCE,
-                code_example_before=f"{match.group(1)}(Table, IF(condition, calculation, 0))",
-                code_example_after=f"CALCULATE({match.group(1).replace('X', '')}(Table[Column]), KEEPFILTERS(condition))",
+                code_example_before=f"{call.name}(Table, IF(condition, calculation, 0))",
+                code_example_after=f"CALCULATE({call.name.upper().replace('X', '')}(Table[Column]), KEEPFILTERS(condition))",
                 estimated_improvement="Reduces iteration overhead",
                 article_reference={
                     'title': 'SUMX with IF predicate optimization',
                     'url': 'https://kb.daxoptimizer.com/d/101600',
                     'source': 'DAX Optimizer'
                 },
-                location=f"Position {match.start()}"
+                location=f"Position {call.start}"
             ))
 
         return issues
@@ -800,7 +873,7 @@ class DaxBestPracticesAnalyzer:
                 factors.append("deep_nesting")
 
         # Function count
-        function_count = len(re.findall(r'\b[A-Z]+\s*\(', dax))
+        function_count = len(parse_dax(dax).calls)
         if function_count > 10:
             factors.append("many_functions")
 
@@ -7,6 +7,9 @@ Provides live DAX measure injection and modification capabilities.
 import logging
 from typing import Dict, Any, Optional
 
+from core.infrastructure.adomd_commands import read_scalar
+from core.infrastructure.model_catalog import invalidate_model_catalog
+
 logger = logging.getLogger(__name__)
 
 # Try to load AMO
@@ -196,10 +199,9 @@ class DAXInjector:
             try:
                 db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
                 cmd = AdomdCommand(db_query, self.connection)
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.connection)
+                if value is not None:
+                    db_name = str(value)
             except Exception:
                 db_name = None
 
@@ -286,6 +288,7 @@ class DAXInjector:
 
             # Save changes
             model.SaveChanges()
+            invalidate_model_catalog()
 
             return {
                 "success": True,
@@ -387,10 +390,9 @@ class DAXInjector:
             try:
                 db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
                 cmd = AdomdCommand(db_query, self.connection)
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.connection)
+                if value is not None:
+                    db_name = str(value)
             except Exception:
                 db_name = None
 
@@ -431,6 +433,7 @@ class DAXInjector:
             # Remove measure
             table.Measures.Remove(measure)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Deleted measure '{measure_name}' from table '{table_name}'")
 
@@ -504,10 +507,9 @@ class DAXInjector:
             try:
                 db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
                 cmd = AdomdCommand(db_query, self.connection)
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.connection)
+                if value is not None:
+                    db_name = str(value)
             except Exception:
                 db_name = None
 
@@ -555,6 +557,7 @@ class DAXInjector:
             old_name = measure.Name
             measure.Name = new_name
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Renamed measure '{old_name}' to '{new_name}' in table '{table_name}'")
 
@@ -636,10 +639,9 @@ class DAXInjector:
             try:
                 db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
                 cmd = AdomdCommand(db_query, self.connection)
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.connection)
+                if value is not None:
+                    db_name = str(value)
             except Exception:
                 db_name = None
 
@@ -714,6 +716,7 @@ class DAXInjector:
             src_table.Measures.Remove(measure)
             tgt_table.Measures.Add(new_measure)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Moved measure '{measure_name}' from table '{source_table}' to '{target_table}'")
 
@@ -0,0 +1,325 @@
+"""
+Persistent DAX Parse Cache
+
+On-disk cache of parse_dax_references() results shared by every analyzer and across
+server sessions. Entries are keyed by a SHA-1 of the expression text plus the
+reference-index version (DaxReferenceIndex.version), so reconnecting to an unchanged
+model resolves every expression from disk without re-parsing.
+
+Storage is a single SQLite file next to DependencyCache's cache directory
+(exports/cache/dax_parse_cache.sqlite). A small in-memory LRU sits in front of it,
+writes are batched, and old entries are evicted by age and by entry count.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from core.config.config_manager import config
+from core.dax.dax_reference_parser import DaxReferenceIndex, parse_dax_references
+
+logger = logging.getLogger(__name__)
+
+# Result keys holding (table, name) pairs; JSON turns them into lists, restore tuples on load
+_PAIR_KEYS = ("columns", "measures", "filter_columns")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    expr_hash TEXT NOT NULL,
+    index_version TEXT NOT NULL,
+    enhanced INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (expr_hash, index_version, enhanced)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_parse_cache_last_used ON parse_cache(last_used);
+"""
+
+
+def _default_cache_dir() -> Path:
+    """Same directory DependencyCache uses (exports/cache under the project root)."""
+    return Path(__file__).parent.parent.parent / "exports" / "cache"
+
+
+def _decode(payload: str) -> Dict[str, Any]:
+    result = json.loads(payload)
+    for key in _PAIR_KEYS:
+        if key in result:
+            result[key] = [tuple(pair) for pair in result[key]]
+    return result
+
+
+class DaxParseCache:
+    """Content-hashed, persistent cache of DAX reference parse results."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_age_days: Optional[float] = None,
+        memory_entries: int = 5000,
+        flush_every: int = 500,
+    ):
+        """
+        Initialize the parse cache.
+
+        Args:
+            cache_dir: Directory for the SQLite file. Defaults to exports/cache
+            max_entries: Maximum persisted entries before least-recently-used eviction
+            max_age_days: Entries not used for this many days are evicted on open
+            memory_entries: Size of the in-memory LRU in front of SQLite
+            flush_every: Number of pending writes that triggers a flush to disk
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+        self.db_path = self.cache_dir / "dax_parse_cache.sqlite"
+        self.max_entries = int(max_entries if max_entries is not None
+                               else config.get('performance.dax_parse_cache_max_entries', 100000))
+        self.max_age_days = float(max_age_days if max_age_days is not None
+                                  else config.get('performance.dax_parse_cache_max_age_days', 30))
+        self.memory_entries = memory_entries
+        self.flush_every = flush_every
+
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._memory: "OrderedDict[Tuple[str, str, int], Dict[str, Any]]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str, int], str] = {}
+        self._touched: Set[Tuple[str, str, int]] = set()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite file lazily; any failure disables persistence for this session."""
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._evict(conn)
+        except Exception as e:
+            logger.warning(f"Persistent DAX parse cache unavailable ({self.db_path}): {e}")
+            self._disabled = True
+            self._conn = None
+        return self._conn
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop entries older than max_age_days, then trim to max_entries by last use."""
+        cutoff = time.time() - self.max_age_days * 86400
+        removed = conn.execute("DELETE FROM parse_cache WHERE last_used < ?", (cutoff,)).rowcount
+        count = conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+        if count > self.max_entries:
+            removed += conn.execute(
+                "DELETE FROM parse_cache WHERE (expr_hash, index_version, enhanced) IN "
+                "(SELECT expr_hash, index_version, enhanced FROM parse_cache ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,)
+            ).rowcount
+        conn.commit()
+        if removed:
+            logger.debug(f"Evicted {removed} DAX parse cache entries")
+
+    def _remember(self, key: Tuple[str, str, int], result: Dict[str, Any]) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def parse(
+        self,
+        expression: Optional[str],
+        reference_index: Optional[DaxReferenceIndex] = None,
+        enhanced: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Drop-in replacement for parse_dax_references() that consults the cache first.
+
+        Args:
+            expression: The DAX expression to parse
+            reference_index: Index used to distinguish measures from columns
+            enhanced: Passed through to parse_dax_references
+
+        Returns:
+            Parsed references dictionary (same shape as parse_dax_references)
+        """
+        if not isinstance(expression, str) or not expression.strip():
+            return parse_dax_references(expression, reference_index, enhanced=enhanced)
+
+        ref_index = reference_index or DaxReferenceIndex()
+        key = (hashlib.sha1(expression.encode('utf-8')).hexdigest(), ref_index.version, int(enhanced))
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self._touched.add(key)
+                self.hits += 1
+                return cached
+
+            conn = self._connect()
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT result FROM parse_cache WHERE expr_hash = ? AND index_version = ? AND enhanced = ?",
+                        key
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.debug(f"DAX parse cache read failed: {e}")
+                    row = None
+                if row is not None:
+                    result = _decode(row[0])
+                    self._remember(key, result)
+                    self._touched.add(key)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return result
+
+        # Parse outside the lock - this is the expensive part
+        result = parse_dax_references(expression, ref_index, enhanced=enhanced)
+
+        with self._lock:
+            self.misses += 1
+            self._remember(key, result)
+            if not self._disabled:
+                self._pending[key] = json.dumps(result, separators=(',', ':'))
+                if len(self._pending) >= self.flush_every:
+                    self.flush()
+        return result
+
+    def flush(self) -> int:
+        """Write pending entries and last-used timestamps to disk. Returns entries written."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None or (not self._pending and not self._touched):
+                self._pending.clear()
+                self._touched.clear()
+                return 0
+            now = time.time()
+            written = len(self._pending)
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO parse_cache (expr_hash, index_version, enhanced, result, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(*key, payload, now) for key, payload in self._pending.items()]
+                )
+                touched = [(now, *key) for key in self._touched if key not in self._pending]
+                if touched:
+                    conn.executemany(
+                        "UPDATE parse_cache SET last_used = ? WHERE expr_hash = ? AND index_version = ? AND enhanced = ?",
+                        touched
+                    )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"DAX parse cache write failed: {e}")
+                written = 0
+            self._pending.clear()
+            self._touched.clear()
+            return written
+
+    def clear(self) -> Dict[str, Any]:
+        """Remove all persisted and in-memory entries."""
+        with self._lock:
+            cleared = len(self._memory)
+            self._memory.clear()
+            self._pending.clear()
+            self._touched.clear()
+            conn = self._connect()
+            if conn is not None:
+                try:
+                    cleared = max(cleared, conn.execute("DELETE FROM parse_cache").rowcount)
+                    conn.commit()
+                except sqlite3.Error as e:
+                    return {'success': False, 'error': str(e)}
+            return {'success': True, 'cleared': cleared}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        with self._lock:
+            persisted = 0
+            conn = self._connect()
+            if conn is not None:
+                try:
+                    persisted = conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            total = self.hits + self.misses
+            return {
+                'path': str(self.db_path),
+                'enabled': not self._disabled,
+                'memory_entries': len(self._memory),
+                'persisted_entries': persisted,
+                'pending_writes': len(self._pending),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate_percent': round(self.hits / total * 100, 1) if total else 0,
+                'max_entries': self.max_entries,
+                'max_age_days': self.max_age_days,
+            }
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        with self._lock:
+            self.flush()
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
+
+
+_parse_cache: Optional[DaxParseCache] = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_dax_parse_cache() -> DaxParseCache:
+    """Get the process-wide DAX parse cache."""
+    global _parse_cache
+    if _parse_cache is None:
+        with _parse_cache_lock:
+            if _parse_cache is None:
+                _parse_cache = DaxParseCache()
+                atexit.register(_parse_cache.close)
+    return _parse_cache
+
+
+def parse_dax_references_cached(
+    expression: Optional[str],
+    reference_index: Optional[DaxReferenceIndex] = None,
+    enhanced: bool = False,
+) -> Dict[str, Any]:
+    """
+    parse_dax_references() backed by the shared persistent cache.
+
+    Falls back to plain parsing when performance.persistent_parse_cache is disabled.
+    """
+    if not config.get('performance.persistent_parse_cache', True):
+        return parse_dax_references(expression, reference_index, enhanced=enhanced)
+    return get_dax_parse_cache().parse(expression, reference_index, enhanced=enhanced)
+
+
+def flush_dax_parse_cache() -> int:
+    """Flush pending parse results to disk if the shared cache has been created."""
+    if _parse_cache is None:
+        return 0
+    return _parse_cache.flush()
+
+
+__all__ = [
+    "DaxParseCache",
+    "get_dax_parse_cache",
+    "parse_dax_references_cached",
+    "flush_dax_parse_cache",
+]
@@ -13,6 +13,7 @@ Enhanced in v6.5.0:
 - Added relationship function context for better dependency analysis
 """
 
+import hashlib
 import logging
 import re
 from typing import Dict, List, Set, Tuple, Optional, Any
@@ -20,6 +21,9 @@ from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Bump when parse_dax_references output changes so persisted parse results are invalidated
+PARSER_VERSION = 1
+
 # Core reference patterns
 _QUALIFIED_TOKEN = re.compile(r"'([^']+)'\s*\[([^\]]+)\]")
 _UNQUALIFIED_TOKEN = re.compile(r"(?<!')\[(.+?)\]")
@@ -149,6 +153,7 @@ class DaxReferenceIndex:
 
         # Track relationships for USERELATIONSHIP validation
         self.relationship_pairs: Set[Tuple[str, str, str, str]] = set()  # (from_table, from_col, to_table, to_col)
+        self._version: Optional[str] = None
 
         if measure_rows:
             for row in measure_rows:
@@ -187,6 +192,27 @@ class DaxReferenceIndex:
                         to_table.lower(), to_col.lower()
                     ))
 
+    @property
+    def version(self) -> str:
+        """
+        Content hash of the index.
+
+        Parse results depend on which names resolve to measures vs. columns, so this
+        hash (plus PARSER_VERSION) is part of every persisted parse cache key.
+        """
+        if self._version is None:
+            digest = hashlib.sha1(f"v{PARSER_VERSION}".encode('utf-8'))
+            for key in sorted(self.measure_keys):
+                digest.update(b'\x00m' + key.encode('utf-8'))
+            for key in sorted(self.column_keys):
+                digest.update(b'\x00c' + key.encode('utf-8'))
+            for name in sorted(self.measure_names):
+                digest.update(b'\x00M' + name.encode('utf-8') + '|'.join(sorted(self.measure_names[name])).encode('utf-8'))
+            for name in sorted(self.column_names):
+                digest.update(b'\x00C' + name.encode('utf-8') + '|'.join(sorted(self.column_names[name])).encode('utf-8'))
+            self._version = digest.hexdigest()[:16]
+        return self._version
+
     def is_valid_relationship(self, table1: str, col1: str, table2: str, col2: str) -> bool:
         """Check if a relationship exists between two column references"""
         key1 = (table1.lower(), col1.lower(), table2.lower(), col2.lower())
@@ -10,11 +10,20 @@ Integrates with Power BI DMVs to provide:
 
 import logging
 import re
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field
+
+from core.config.config_manager import config
+from core.infrastructure.model_version import get_current_model_version
 
 logger = logging.getLogger(__name__)
 
+# Table[Column], 'Table'[Column] or the normalized (unquoted) Table Name[Column]
+_COLUMN_REF_PATTERN = re.compile(r"'?([^'\[]+)'?\[([^\]]+)\]")
+
 
 @dataclass
 class ColumnMetrics:
@@ -75,6 +84,66 @@ class CardinalityImpact:
     recommendation: str
 
 
+@dataclass
+class ColumnMetricsCache:
+    """Column metrics and table row counts for one connection, tagged with the model version"""
+    model_version: Optional[str] = None
+    columns: Dict[str, ColumnMetrics] = field(default_factory=dict)
+    row_counts: Dict[str, int] = field(default_factory=dict)
+    unavailable: Dict[str, float] = field(default_factory=dict)  # column -> monotonic time of the failed query
+    dmv_loaded: bool = False
+    dmv_failed: bool = False
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+    def reset(self, model_version: Optional[str]):
+        self.model_version = model_version
+        self.columns.clear()
+        self.row_counts.clear()
+        self.unavailable.clear()
+        self.dmv_loaded = False
+        self.dmv_failed = False
+
+    def recently_failed(self, column: str, retry_s: float) -> bool:
+        """True while a column's last cardinality query failed less than retry_s seconds ago"""
+        failed_at = self.unavailable.get(column)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < retry_s:
+            return True
+        del self.unavailable[column]
+        return False
+
+
+# One cache per query executor (a new connection gets a new executor)
+_metrics_caches: "weakref.WeakKeyDictionary[Any, ColumnMetricsCache]" = weakref.WeakKeyDictionary()
+_metrics_caches_lock = threading.Lock()
+
+
+def get_metrics_cache(query_executor) -> ColumnMetricsCache:
+    """
+    Metrics cache of a connection, cleared when the model version has changed
+
+    The version comes from the same per-connection stamp as the model catalog
+    and is re-read at most every performance.model_version_recheck_s, so a new
+    analyzer costs no query while the stamp is fresh. Unlike the catalog, the
+    data-refresh part of the stamp counts (a refresh changes cardinalities).
+    When the version cannot be read the cache is kept.
+    """
+    with _metrics_caches_lock:
+        cache = _metrics_caches.get(query_executor)
+        if cache is None:
+            cache = ColumnMetricsCache()
+            _metrics_caches[query_executor] = cache
+
+    version = get_current_model_version(query_executor, float(config.get('performance.model_version_recheck_s', 5)))
+    with cache.lock:
+        if version is not None and version != cache.model_version:
+            if cache.columns or cache.row_counts:
+                logger.info(f"Model changed ({cache.model_version} -> {version}), clearing VertiPaq metrics cache")
+            cache.reset(version)
+    return cache
+
+
 class VertiPaqAnalyzer:
     """
     VertiPaq Metrics Analyzer
@@ -96,8 +165,26 @@ class VertiPaqAnalyzer:
             connection_state: Optional connection state for DMV queries
         """
         self.connection_state = connection_state
-        self._column_cache: Dict[str, ColumnMetrics] = {}
-        self._cache_loaded = False
+
+        # Metrics are shared per connection and survive across tool calls;
+        # the shared cache is looked up on first use
+        self._shared_metrics: Optional[ColumnMetricsCache] = None
+        self._dmv_attempted = False
+
+    @property
+    def _metrics(self) -> ColumnMetricsCache:
+        if self._shared_metrics is None:
+            qe = getattr(self.connection_state, 'query_executor', None) if self.connection_state else None
+            self._shared_metrics = get_metrics_cache(qe) if qe is not None else ColumnMetricsCache()
+        return self._shared_metrics
+
+    @property
+    def _column_cache(self) -> Dict[str, ColumnMetrics]:
+        return self._metrics.columns
+
+    @property
+    def _cache_loaded(self) -> bool:
+        return self._metrics.dmv_loaded
 
     def load_column_metrics(self) -> bool:
         """
@@ -106,6 +193,13 @@ class VertiPaqAnalyzer:
         Returns:
             True if successful, False otherwise
         """
+        if self._metrics.dmv_loaded:
+            return True
+        self._dmv_attempted = True
+        if self._metrics.dmv_failed:
+            # Storage DMV unavailable on this connection/model version; don't re-probe
+            return False
+
         try:
             if not self.connection_state or not self.connection_state.is_connected():
                 logger.warning("Not connected - cannot load VertiPaq metrics")
@@ -136,14 +230,16 @@ class VertiPaqAnalyzer:
 
             if not result.get('success'):
                 logger.error(f"DMV query failed: {result.get('error', 'Unknown error')}")
+                self._metrics.dmv_failed = True
                 return False
 
             if not result.get('data'):
                 logger.warning("DMV query returned no data")
+                self._metrics.dmv_failed = True
                 return False
 
             # Process DMV results
-            self._column_cache.clear()
+            metrics_by_name: Dict[str, ColumnMetrics] = {}
             skipped_columns = 0
 
             for row in result['data']:
@@ -174,9 +270,12 @@ class VertiPaqAnalyzer:
                     hierarchy_size_bytes=int(row.get('HierarchySizeBytes', 0))
                 )
 
-                self._column_cache[metrics.full_name] = metrics
+                metrics_by_name[metrics.full_name] = metrics
 
-            self._cache_loaded = True
+            with self._metrics.lock:
+                self._column_cache.clear()
+                self._column_cache.update(metrics_by_name)
+                self._metrics.dmv_loaded = True
             logger.info(f"Loaded metrics for {len(self._column_cache)} columns (skipped {skipped_columns} internal columns)")
             return True
 
@@ -194,8 +293,8 @@ class VertiPaqAnalyzer:
         Returns:
             ColumnMetrics if found, None otherwise
         """
-        # Ensure cache is loaded
-        if not self._cache_loaded:
+        # Ensure cache is loaded (one DMV attempt per analyzer)
+        if not self._cache_loaded and not self._dmv_attempted:
             cache_success = self.load_column_metrics()
             if not cache_success:
                 logger.warning(f"Failed to load DMV cache, will attempt direct calculation for {column_ref}")
@@ -220,18 +319,157 @@ class VertiPaqAnalyzer:
             else:
                 logger.debug(f"Column {normalized} not found. Cache has {len(self._column_cache)} columns")
 
-        # Try to calculate cardinality directly using DAX
+        # Try to calculate cardinality directly using DAX (cached for future use)
         logger.debug(f"Column {normalized} not in cache, attempting fallback calculation")
-        cached = self._calculate_column_cardinality(column_ref)
+        cached = self.compute_column_metrics([column_ref]).get(normalized)
         if cached:
-            # Add to cache for future use
-            self._column_cache[normalized] = cached
             logger.info(f"Successfully calculated metrics for {normalized} using DAX fallback: cardinality={cached.cardinality:,}")
         else:
             logger.warning(f"Could not retrieve metrics for {normalized} from either DMV or DAX calculation")
 
         return cached
 
+    def compute_column_metrics(self, column_refs: List[str]) -> Dict[str, ColumnMetrics]:
+        """
+        Calculate cardinality and table row counts for many columns in batched DAX queries
+
+        Columns that are already cached (DMV or earlier calculation) are not queried
+        again. The rest go out as EVALUATE UNION(ROW(...), ...) queries, one ROW per
+        column, chunked so each query stays under query.max_dax_query_length. A chunk
+        that fails (e.g. one invalid reference) is retried column by column. A column
+        whose query still failed is skipped for performance.vertipaq_failed_column_retry_s.
+
+        Args:
+            column_refs: Column references like "Sales[Amount]" or "'Sales Data'[Amount]"
+
+        Returns:
+            Dictionary of normalized column reference -> ColumnMetrics (cached or calculated)
+        """
+        found: Dict[str, ColumnMetrics] = {}
+        pending: List[Tuple[str, str, str]] = []
+        seen: Set[str] = set()
+        retry_s = float(config.get('performance.vertipaq_failed_column_retry_s', 300))
+
+        for column_ref in column_refs:
+            normalized = self._normalize_column_ref(column_ref)
+            if normalized in seen:
+                continue
+            seen.add(normalized)
+            cached = self._column_cache.get(normalized)
+            if cached:
+                found[normalized] = cached
+                continue
+            with self._metrics.lock:
+                if self._metrics.recently_failed(normalized, retry_s):
+                    continue
+            match = _COLUMN_REF_PATTERN.fullmatch(column_ref.strip())
+            if not match:
+                logger.debug(f"Could not parse column reference: {column_ref}")
+                continue
+            pending.append((normalized, match.group(1), match.group(2)))
+
+        if not pending:
+            return found
+
+        if not self.connection_state or not self.connection_state.is_connected():
+            logger.debug("Cannot calculate cardinality: not connected")
+            return found
+        qe = self.connection_state.query_executor
+        if not qe:
+            logger.debug("Cannot calculate cardinality: no query executor")
+            return found
+
+        max_query_length = config.get('query.max_dax_query_length', 50000)
+        chunks: List[List[Tuple[str, str]]] = [[]]
+        length = 0
+        for normalized, table_name, column_name in pending:
+            row_expr = self._cardinality_row_expression(normalized, table_name, column_name)
+            if chunks[-1] and length + len(row_expr) + 64 > max_query_length:
+                chunks.append([])
+                length = 0
+            chunks[-1].append((normalized, row_expr))
+            length += len(row_expr) + 6
+
+        logger.debug(f"Calculating cardinality for {len(pending)} columns in {len(chunks)} batched queries")
+        parsed = {normalized: (table_name, column_name) for normalized, table_name, column_name in pending}
+        for chunk in chunks:
+            values = self._run_cardinality_query(qe, [row_expr for _, row_expr in chunk])
+            if values is None and len(chunk) > 1:
+                logger.debug(f"Batched cardinality query failed, retrying {len(chunk)} columns one by one")
+                values = {}
+                for normalized, row_expr in chunk:
+                    values.update(self._run_cardinality_query(qe, [row_expr]) or {})
+
+            with self._metrics.lock:
+                for normalized, _ in chunk:
+                    counts = (values or {}).get(normalized)
+                    if counts is None:
+                        self._metrics.unavailable[normalized] = time.monotonic()
+                        continue
+                    cardinality, total_rows = counts
+                    table_name, column_name = parsed[normalized]
+
+                    # Size estimation is approximate without DMV data
+                    metrics = ColumnMetrics(
+                        table_name=table_name,
+                        column_name=column_name,
+                        cardinality=cardinality,
+                        size_bytes=self._estimate_column_size(cardinality, total_rows),
+                        data_type="unknown",  # Can't determine without DMV
+                        encoding="calculated",
+                        dictionary_size_bytes=0,
+                        hierarchy_size_bytes=0
+                    )
+                    self._column_cache[normalized] = metrics
+                    self._metrics.row_counts[table_name] = total_rows
+                    self._metrics.unavailable.pop(normalized, None)
+                    found[normalized] = metrics
+
+        return found
+
+    @staticmethod
+    def _cardinality_row_expression(normalized: str, table_name: str, column_name: str) -> str:
+        """ROW(...) returning one column's distinct count and its table's row count"""
+        table_ref = "'" + table_name.replace("'", "''") + "'"
+        column_ref = f"{table_ref}[{column_name.replace(']', ']]')}]"
+        label = normalized.replace('"', '""')
+        return (f'ROW("Column", "{label}", "Cardinality", COUNTROWS(DISTINCT({column_ref})), '
+                f'"TotalRows", COUNTROWS({table_ref}))')
+
+    def _run_cardinality_query(self, qe, row_expressions: List[str]) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Execute one batch; returns column -> (cardinality, total rows), or None on failure"""
+        if len(row_expressions) == 1:
+            dax_query = f"EVALUATE\n{row_expressions[0]}"
+        else:
+            dax_query = "EVALUATE\nUNION(\n    " + ",\n    ".join(row_expressions) + "\n)"
+
+        try:
+            result = qe.validate_and_execute_dax(dax_query, top_n=0, bypass_cache=True, columnar=True)
+        except Exception as e:
+            logger.warning(f"Error calculating cardinality: {e}")
+            return None
+
+        if not result.get('success') or result.get('result_set') is None:
+            logger.debug(f"Cardinality query failed: {result.get('error', 'Unknown error')}")
+            return None
+
+        result_set = result['result_set']
+        try:
+            names = result_set.column('Column')
+            cardinalities = result_set.column('Cardinality')
+            totals = result_set.column('TotalRows')
+        except KeyError as e:
+            logger.debug(f"Cardinality result missing column: {e}")
+            return None
+
+        values: Dict[str, Tuple[int, int]] = {}
+        for name, cardinality, total in zip(names, cardinalities, totals):
+            try:
+                values[name] = (int(cardinality or 0), int(total or 0))
+            except (TypeError, ValueError):
+                logger.debug(f"Unreadable cardinality for {name}: {cardinality!r}, {total!r}")
+        return values
+
     def analyze_dax_columns(self, dax_expression: str) -> Dict[str, Any]:
         """
         Analyze columns referenced in DAX expression
@@ -266,6 +504,11 @@ class VertiPaqAnalyzer:
                     "note": "No column references found in DAX expression (might be using only measures)"
                 }
 
+            # Calculate metrics missing from the DMV cache in batched queries
+            missing = [ref for ref in column_refs if self._normalize_column_ref(ref) not in self._column_cache]
+            if missing:
+                self.compute_column_metrics(missing)
+
             # Get metrics for each column
             column_analysis = {}
             total_cardinality = 0
@@ -295,7 +538,7 @@ class VertiPaqAnalyzer:
                         "usage_context": usage_context,
                         "performance_impact": impact.performance_impact,
                         "recommendation": impact.recommendation,
-                        "metrics_source": "dmv" if self._cache_loaded else "calculated"
+                        "metrics_source": "calculated" if metrics.encoding == "calculated" else "dmv"
                     }
 
                     total_cardinality += metrics.cardinality
@@ -380,73 +623,7 @@ class VertiPaqAnalyzer:
         Returns:
             ColumnMetrics with calculated cardinality, or None if calculation fails
         """
-        try:
-            if not self.connection_state or not self.connection_state.is_connected():
-                logger.debug("Cannot calculate cardinality: not connected")
-                return None
-
-            qe = self.connection_state.query_executor
-            if not qe:
-                logger.debug("Cannot calculate cardinality: no query executor")
-                return None
-
-            # Parse table and column name - support spaces in names
-            match = re.match(r"(?:'([^']+)'|(\w+))\[([^\]]+)\]", column_ref)
-            if not match:
-                logger.debug(f"Could not parse column reference: {column_ref}")
-                return None
-
-            table_name = match.group(1) or match.group(2)
-            column_name = match.group(3)
-
-            # Build DAX query to calculate cardinality
-            # Use quotes around table name if it contains spaces or special characters
-            table_ref = f"'{table_name}'" if ' ' in table_name or not table_name.isalnum() else table_name
-
-            dax_query = f"""
-            EVALUATE
-            ROW(
-                "Cardinality", COUNTROWS(DISTINCT({column_ref})),
-                "TotalRows", COUNTROWS({table_ref})
-            )
-            """
-
-            logger.debug(f"Executing fallback DAX query for {column_ref}")
-            result = qe.validate_and_execute_dax(dax_query, top_n=1)
-
-            if result.get('success') and result.get('data'):
-                data = result['data']
-                if len(data) > 0:
-                    cardinality = int(data[0].get('Cardinality', 0))
-                    total_rows = int(data[0].get('TotalRows', 0))
-
-                    logger.info(f"Calculated cardinality for {column_ref}: {cardinality:,} (table has {total_rows:,} rows)")
-
-                    # Create metrics object with calculated cardinality
-                    # Note: Size estimation is approximate without DMV data
-                    estimated_size = self._estimate_column_size(cardinality, total_rows)
-
-                    return ColumnMetrics(
-                        table_name=table_name,
-                        column_name=column_name,
-                        cardinality=cardinality,
-                        size_bytes=estimated_size,
-                        data_type="unknown",  # Can't determine without DMV
-                        encoding="calculated",
-                        dictionary_size_bytes=0,
-                        hierarchy_size_bytes=0
-                    )
-                else:
-                    logger.debug(f"DAX query returned no data for {column_ref}")
-            else:
-                error_msg = result.get('error', 'Unknown error')
-                logger.debug(f"Failed to calculate cardinality for {column_ref}: {error_msg}")
-
-            return None
-
-        except Exception as e:
-            logger.warning(f"Error calculating cardinality for {column_ref}: {e}", exc_info=True)
-            return None
+        return self.compute_column_metrics([column_ref]).get(self._normalize_column_ref(column_ref))
 
     def _estimate_column_size(self, cardinality: int, total_rows: int) -> int:
         """
@@ -99,6 +99,8 @@ class DebugOperations:
 
         clean_measure = measure_name.strip('[]')
 
+        # Build every visual's query first, then execute them in one batch
+        planned: List[Tuple[int, str, Dict[str, Any], str]] = []
         for page_name in pages:
             visuals = self.builder.list_visuals(page_name)
 
@@ -111,34 +113,17 @@ class DebugOperations:
                 if clean_measure not in [m.strip('[]') for m in visual_measures]:
                     continue
 
-                # Get filter context and execute
+                # Get filter context
                 try:
                     query_result = self.builder.build_visual_query(
                         page_name=page_name,
                         visual_id=visual['id'],
                         measure_name=measure_name
                     )
-
                     if query_result and query_result.dax_query:
-                        exec_result = self.qe.validate_and_execute_dax(
-                            query_result.dax_query, top_n=1
-                        )
-
-                        value = None
-                        if exec_result.get('success') and exec_result.get('rows'):
-                            row = exec_result['rows'][0]
-                            value = list(row.values())[0] if row else None
-
-                        results.append(ValidationResult(
-                            visual_id=visual['id'],
-                            visual_name=visual.get('friendly_name', visual['id']),
-                            page_name=page_name,
-                            measure_name=clean_measure,
-                            value=value,
-                            execution_time_ms=exec_result.get('execution_time_ms', 0),
-                            success=exec_result.get('success', False),
-                            error=exec_result.get('error')
-                        ))
+                        # Slot filled once the batch has run, to keep the report in visual order
+                        planned.append((len(results), page_name, visual, query_result.dax_query))
+                        results.append(None)
 
                 except Exception as e:
                     results.append(ValidationResult(
@@ -152,6 +137,24 @@ class DebugOperations:
                         error=str(e)
                     ))
 
+        exec_results = self.qe.execute_dax_batch([query for *_, query in planned], top_n=1) if planned else []
+        for (slot, page_name, visual, _), exec_result in zip(planned, exec_results):
+            value = None
+            if exec_result.get('success') and exec_result.get('rows'):
+                row = exec_result['rows'][0]
+                value = list(row.values())[0] if row else None
+
+            results[slot] = ValidationResult(
+                visual_id=visual['id'],
+                visual_name=visual.get('friendly_name', visual['id']),
+                page_name=page_name,
+                measure_name=clean_measure,
+                value=value,
+                execution_time_ms=exec_result.get('execution_time_ms', 0),
+                success=exec_result.get('success', False),
+                error=exec_result.get('error')
+            )
+
         # Analyze for discrepancies
         discrepancies = self._find_discrepancies(results, tolerance)
 
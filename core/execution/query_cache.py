@@ -1,4 +1,5 @@
-"""Query result caching with TTL and LRU eviction."""
+"""Query result caching keyed on normalized queries and invalidated by model version."""
+import threading
 import time
 import logging
 from typing import Any, Dict, Optional, Tuple
@@ -7,15 +8,78 @@ from collections import OrderedDict
 logger = logging.getLogger(__name__)
 
 
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch in '_.'
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonical form of a DAX query for cache keys.
+
+    Comments (--, //, /* */) are dropped and whitespace is collapsed: runs
+    between two word characters become one space, others disappear. String
+    literals ("..."), quoted table names ('...') and bracketed names ([...])
+    are kept verbatim, so queries differing only in layout share a key.
+    """
+    out = []
+    i, n = 0, len(query)
+    pending_space = False
+
+    def emit(token: str) -> None:
+        nonlocal pending_space
+        if pending_space and out and _is_word(out[-1][-1]) and _is_word(token[0]):
+            out.append(' ')
+        pending_space = False
+        out.append(token)
+
+    while i < n:
+        ch = query[i]
+        if ch in '"\'[':
+            close = ']' if ch == '[' else ch
+            j = i + 1
+            while j < n:
+                if query[j] == close:
+                    if j + 1 < n and query[j + 1] == close:  # doubled delimiter escapes itself
+                        j += 2
+                        continue
+                    break
+                j += 1
+            emit(query[i:j + 1])
+            i = j + 1
+        elif query.startswith('--', i) or query.startswith('//', i):
+            end = query.find('\n', i)
+            i = n if end < 0 else end
+            pending_space = True
+        elif query.startswith('/*', i):
+            end = query.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            pending_space = True
+        elif ch.isspace():
+            pending_space = True
+            i += 1
+        else:
+            emit(ch)
+            i += 1
+    return ''.join(out)
+
+
 class QueryCache:
-    """TTL-based LRU cache for query results."""
+    """
+    LRU cache for query results, tagged with the model version.
+
+    Entries stored with a model version stay valid until a lookup presents a
+    different version (a schema change or data refresh), however old they
+    are. When either side's version is unknown (stamp unreadable), entries
+    expire after ttl_seconds. ttl_seconds <= 0 disables the cache.
+    """
 
     def __init__(self, max_items: int = 200, ttl_seconds: int = 300):
         """Initialize query cache.
-        
+
         Args:
             max_items: Maximum number of cache entries
-            ttl_seconds: Time-to-live for cache entries in seconds
+            ttl_seconds: Time-to-live for entries without a model version;
+                0 disables caching
         """
         self.cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
         self.max_items = max_items
@@ -23,25 +87,58 @@ class QueryCache:
         self.hits = 0
         self.misses = 0
         self.bypassed = 0
+        self.invalidated = 0
+        # Version the cached entries were stored under; a different one drops them all
+        self._version: Optional[str] = None
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(query: str, top_n: int = 0, variant: str = '') -> Tuple[str, int]:
+        """Cache key of a query: its normalized text (prefixed by a result variant) and row limit."""
+        normalized = normalize_query(query)
+        return (f"{variant}:{normalized}" if variant else normalized, int(top_n or 0))
+
+    def _check_version(self, version: Optional[str]) -> None:
+        if version is None or version == self._version:
+            return
+        if self._version is not None:
+            stale = [key for key, item in self.cache.items() if item.get('__model_version__') is not None]
+            for key in stale:
+                del self.cache[key]
+            self.invalidated += len(stale)
+            if stale:
+                logger.debug(f"Model version changed, dropped {len(stale)} cached results")
+        self._version = version
+
+    def get(self, key: Tuple[str, int], version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached item; maintains LRU order.
 
-    def get(self, key: Tuple[str, int]) -> Optional[Dict[str, Any]]:
-        """Get cached item if not expired; maintains LRU order."""
-        if self.ttl_seconds <= 0:
+        Args:
+            key: Cache key (see make_key)
+            version: Current model version, None when unknown
+        """
+        if not self.enabled:
             return None
+        with self._lock:
+            return self._get(key, version)
+
+    def _get(self, key: Tuple[str, int], version: Optional[str]) -> Optional[Dict[str, Any]]:
+        self._check_version(version)
         item = self.cache.get(key)
         if not item:
             self.misses += 1
             return None
         ts = item.get('__cached_at__')
-        if ts is None:
-            try:
-                del self.cache[key]
-            except Exception:
-                pass
-            self.misses += 1
-            return None
-        age = time.time() - ts
-        if age > self.ttl_seconds:
+        age = time.time() - ts if ts is not None else None
+        tagged = item.get('__model_version__')
+        if (age is None
+                or (tagged is not None and version is not None and tagged != version)
+                or ((tagged is None or version is None) and age > self.ttl_seconds)):
             try:
                 del self.cache[key]
             except Exception:
@@ -52,35 +149,46 @@ class QueryCache:
         self.cache.move_to_end(key)
         self.hits += 1
         # Return a shallow copy with cache metadata
-        res = dict(item)
-        res.setdefault('cache', {})
-        res['cache'].update({'hit': True, 'age_seconds': round(age, 3)})
+        res = {k: v for k, v in item.items() if k not in ('__cached_at__', '__model_version__')}
+        res['cache'] = dict(res.get('cache') or {}, hit=True, age_seconds=round(age, 3))
         return res
 
-    def set(self, key: Tuple[str, int], value: Dict[str, Any]) -> None:
-        """Store item in cache with current timestamp."""
-        if self.ttl_seconds <= 0:
+    def set(self, key: Tuple[str, int], value: Dict[str, Any], version: Optional[str] = None) -> None:
+        """
+        Store an item with the current timestamp.
+
+        Args:
+            key: Cache key (see make_key)
+            value: Result to cache
+            version: Model version the result was computed at, None when unknown
+        """
+        if not self.enabled:
             return
-        # Add timestamp
         value = dict(value)
         value['__cached_at__'] = time.time()
-        value.setdefault('cache', {})['cached'] = True
-        self.cache[key] = value
-        # Evict oldest if over capacity
-        while len(self.cache) > self.max_items:
-            try:
+        value['__model_version__'] = version
+        value['cache'] = dict(value.get('cache') or {}, cached=True)
+        with self._lock:
+            self._check_version(version)
+            self.cache[key] = value
+            self.cache.move_to_end(key)
+            # Evict oldest if over capacity
+            while len(self.cache) > self.max_items:
                 self.cache.popitem(last=False)
-            except KeyError:
-                break
+
+    def __len__(self) -> int:
+        return len(self.cache)
 
     def flush(self) -> Dict[str, Any]:
         """Clear all cached entries."""
         try:
-            count = len(self.cache)
-            self.cache.clear()
+            with self._lock:
+                count = len(self.cache)
+                self.cache.clear()
             self.hits = 0
             self.misses = 0
             self.bypassed = 0
+            self.invalidated = 0
             return {'success': True, 'cleared': count}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -93,10 +201,12 @@ class QueryCache:
                 'size': len(self.cache),
                 'max_items': self.max_items,
                 'ttl_seconds': self.ttl_seconds,
+                'model_version': self._version,
                 'hits': self.hits,
                 'misses': self.misses,
                 'bypassed': self.bypassed,
-                'enabled': self.ttl_seconds > 0,
+                'invalidated': self.invalidated,
+                'enabled': self.enabled,
             }
         except Exception as e:
             return {'success': False, 'error': str(e)}
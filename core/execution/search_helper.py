@@ -1,6 +1,6 @@
 """Search functionality for measures, columns, and tables."""
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +122,52 @@ class SearchHelper:
             logger.error(f"Error searching objects: {e}")
             return {'success': False, 'error': str(e)}
 
+    # Columns returned per object type by search_objects (as its SELECTCOLUMNS did)
+    OBJECT_COLUMNS = {
+        'tables': ('table', ['Name', 'IsHidden', 'ModifiedTime']),
+        'columns': ('column', ['Name', 'TableID', 'DataType', 'IsHidden', 'Table']),
+        'measures': ('measure', ['Name', 'TableID', 'DataType', 'IsHidden', 'DisplayFolder', 'Table']),
+    }
+
+    @staticmethod
+    def search_measures_indexed(
+        index,
+        search_text: str,
+        search_in_expression: bool = True,
+        search_in_name: bool = True
+    ) -> Dict[str, Any]:
+        """search_measures against a MetadataSearchIndex (no query round trip)."""
+        fields = [f for f, on in (('expression', search_in_expression), ('name', search_in_name)) if on]
+        rows = index.search(search_text, kinds=('measure',), fields=fields or ('name', 'expression'))
+        return {'success': True, 'rows': rows, 'row_count': len(rows), 'source': 'search_index'}
+
+    @staticmethod
+    def search_objects_indexed(
+        index,
+        pattern: str,
+        object_types: List[str],
+        fields: Optional[List[str]] = None,
+        mode: str = 'substring'
+    ) -> Dict[str, Any]:
+        """search_objects against a MetadataSearchIndex (no query round trip)."""
+        results_list = []
+        for object_type in ("tables", "columns", "measures"):
+            if object_type not in object_types:
+                continue
+            kind, columns = SearchHelper.OBJECT_COLUMNS[object_type]
+            for row in index.search(pattern, kinds=(kind,), fields=fields or ('name',), mode=mode):
+                projected = {'type': kind}
+                projected.update((col, row[col]) for col in columns if col in row)
+                results_list.append(projected)
+        return {
+            'success': True,
+            'rows': results_list,
+            'results': results_list,
+            'row_count': len(results_list),
+            'count': len(results_list),
+            'source': 'search_index'
+        }
+
     @staticmethod
     def is_table_expression(query: str) -> bool:
         """Check if query is a table expression."""
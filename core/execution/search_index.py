@@ -0,0 +1,423 @@
+"""
+In-process full-text index over model metadata.
+
+Replaces FILTER(INFO.*(), SEARCH(...)) round trips: names, descriptions,
+display folders and DAX expressions of tables, columns and measures are
+indexed once (from INFO.* rows of a live model, or from TMDL files of a PBIP
+project / hybrid package) and searched locally.
+
+Matching modes:
+- substring: case-insensitive substring with SEARCH()-style * and ? wildcards
+  (the semantics of the DAX queries it replaces); trigram postings narrow the
+  candidates, which are then verified against the text
+- token: every query word appears as a word of the field
+- prefix: every query word is a prefix of a word of the field
+
+Live indexes are kept per query executor and built from its ModelCatalog;
+they are rebuilt whenever the catalog reloads.
+"""
+
+import bisect
+import logging
+import re
+import threading
+import time
+import weakref
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.config.config_manager import config
+from core.infrastructure.model_catalog import get_model_catalog
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('name', 'description', 'display_folder', 'expression')
+MODES = ('substring', 'token', 'prefix')
+
+_WORD = re.compile(r"[0-9A-Za-z]+")
+_CAMEL_PART = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def _words(text: str) -> List[str]:
+    """Lower-cased words of a text, plus the parts of camelCase words"""
+    words = []
+    for word in _WORD.findall(text):
+        lower = word.lower()
+        words.append(lower)
+        parts = _CAMEL_PART.findall(word)
+        if len(parts) > 1:
+            words.extend(part.lower() for part in parts)
+    return words
+
+
+def _field(row: Dict[str, Any], *names: str) -> Any:
+    """Value of the first present column, accepting bracketed INFO keys"""
+    for name in names:
+        if name in row:
+            return row[name]
+        bracketed = f"[{name}]"
+        if bracketed in row:
+            return row[bracketed]
+    return None
+
+
+def _unbracket(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {(k[1:-1] if k.startswith('[') and k.endswith(']') else k): v for k, v in row.items()}
+
+
+class _FieldIndex:
+    """Postings for one field: words, sorted vocabulary and trigrams"""
+
+    __slots__ = ('texts', 'words', 'trigrams', '_vocabulary')
+
+    def __init__(self):
+        self.texts: List[str] = []                  # casefolded text per document
+        self.words: Dict[str, array] = {}           # word -> doc ids (ascending)
+        self.trigrams: Dict[str, array] = {}        # trigram -> doc ids (ascending)
+        self._vocabulary: Optional[List[str]] = None
+
+    def add(self, doc_id: int, text: str) -> None:
+        folded = text.casefold()
+        self.texts.append(folded)
+        for word in set(_words(text)):
+            self.words.setdefault(word, array('I')).append(doc_id)
+        for gram in {folded[i:i + 3] for i in range(len(folded) - 2)}:
+            self.trigrams.setdefault(gram, array('I')).append(doc_id)
+        self._vocabulary = None
+
+    def vocabulary(self) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.words)
+        return self._vocabulary
+
+    def substring(self, needle: str) -> Iterable[int]:
+        """Doc ids whose text contains the (casefolded) needle"""
+        texts = self.texts
+        if len(needle) < 3:
+            return (i for i, text in enumerate(texts) if needle in text)
+        grams = [self.trigrams.get(needle[i:i + 3]) for i in range(len(needle) - 2)]
+        if any(posting is None for posting in grams):
+            return ()
+        rarest = min(grams, key=len)
+        return (i for i in rarest if needle in texts[i])
+
+    def pattern(self, regex: "re.Pattern", literal: str) -> Iterable[int]:
+        """Doc ids matching a wildcard regex; literal is its longest fixed fragment"""
+        candidates = self.substring(literal) if literal else range(len(self.texts))
+        texts = self.texts
+        return (i for i in candidates if regex.search(texts[i]))
+
+    def all_words(self, words: Sequence[str], prefix: bool) -> set:
+        """Doc ids containing every query word (as a word, or a word prefix)"""
+        result: Optional[set] = None
+        vocabulary = self.vocabulary() if prefix else None
+        for word in sorted(set(words), key=len, reverse=True):
+            if prefix:
+                docs: set = set()
+                start = bisect.bisect_left(vocabulary, word)
+                for candidate in vocabulary[start:]:
+                    if not candidate.startswith(word):
+                        break
+                    docs.update(self.words[candidate])
+            else:
+                docs = set(self.words.get(word, ()))
+            result = docs if result is None else result & docs
+            if not result:
+                return set()
+        return result or set()
+
+
+class MetadataSearchIndex:
+    """
+    Inverted index over tables, columns and measures.
+
+    Each document keeps the row it was built from (an INFO.* row with a
+    resolved 'Table', or an equivalent row built from TMDL), so results have
+    the shape the DAX-based search returned.
+    """
+
+    def __init__(self, source: str = ''):
+        """
+        Args:
+            source: Where the metadata came from (reported in stats)
+        """
+        self.source = source
+        self.built_at = time.time()
+        self._kinds: List[str] = []
+        self._rows: List[Dict[str, Any]] = []
+        self._fields = {name: _FieldIndex() for name in FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(
+        self,
+        kind: str,
+        name: Optional[str],
+        row: Dict[str, Any],
+        description: Optional[str] = None,
+        display_folder: Optional[str] = None,
+        expression: Optional[str] = None
+    ) -> int:
+        """
+        Add one object.
+
+        Args:
+            kind: "table" | "column" | "measure"
+            name: Object name
+            row: Row returned for this object by searches
+            description, display_folder, expression: Other searchable text
+
+        Returns:
+            Document id
+        """
+        doc_id = len(self._rows)
+        self._kinds.append(kind)
+        self._rows.append(row)
+        values = (name, description, display_folder, expression)
+        for field_name, value in zip(FIELDS, values):
+            self._fields[field_name].add(doc_id, value if isinstance(value, str) else ('' if value is None else str(value)))
+        return doc_id
+
+    def search(
+        self,
+        text: str,
+        kinds: Optional[Iterable[str]] = None,
+        fields: Iterable[str] = ('name',),
+        mode: str = 'substring',
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find objects whose fields match the text.
+
+        Args:
+            text: Search text
+            kinds: Object kinds to return (default: all)
+            fields: Fields to match in (any of them may match)
+            mode: "substring" (SEARCH() semantics, * and ? wildcards), "token" or "prefix"
+            limit: Maximum number of results
+
+        Returns:
+            Copies of the matching rows, in model order
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown search mode '{mode}'. Valid modes: {', '.join(MODES)}")
+        fields = [f for f in fields if f in self._fields]
+        wanted = set(kinds) if kinds is not None else None
+        text = text or ''
+
+        matches: set = set()
+        if mode == 'substring':
+            folded = text.casefold()
+            if '*' in folded or '?' in folded:
+                literal = max(re.split(r'[*?]+', folded), key=len)
+                regex = re.compile(''.join('.*' if ch == '*' else '.' if ch == '?' else re.escape(ch)
+                                           for ch in folded), re.DOTALL)
+                for field_name in fields:
+                    matches.update(self._fields[field_name].pattern(regex, literal))
+            else:
+                for field_name in fields:
+                    matches.update(self._fields[field_name].substring(folded))
+        else:
+            words = _words(text)
+            if not words:
+                return []
+            for field_name in fields:
+                matches.update(self._fields[field_name].all_words(words, prefix=(mode == 'prefix')))
+
+        results = []
+        for doc_id in sorted(matches):
+            if wanted is not None and self._kinds[doc_id] not in wanted:
+                continue
+            results.append(dict(self._rows[doc_id]))
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for kind in self._kinds:
+            counts[kind] = counts.get(kind, 0) + 1
+        return {
+            'source': self.source,
+            'documents': len(self._rows),
+            'by_type': counts,
+            'words': {name: len(index.words) for name, index in self._fields.items()},
+            'built_at': self.built_at,
+        }
+
+    @classmethod
+    def from_info_rows(
+        cls,
+        tables: List[Dict[str, Any]],
+        columns: List[Dict[str, Any]],
+        measures: List[Dict[str, Any]],
+        source: str = 'INFO'
+    ) -> "MetadataSearchIndex":
+        """
+        Build from INFO.TABLES(), INFO.COLUMNS() and INFO.MEASURES() rows.
+
+        TableIDs are resolved to names from the tables rows, once.
+        """
+        index = cls(source)
+        table_names: Dict[Any, str] = {}
+        for raw in tables:
+            row = _unbracket(raw)
+            name = row.get('Name')
+            if row.get('ID') is not None and name is not None:
+                table_names[row['ID']] = name
+            index.add('table', name, row, description=row.get('Description'))
+
+        def with_table(row: Dict[str, Any]) -> Dict[str, Any]:
+            if 'Table' not in row and 'TableID' in row:
+                table_id = row.get('TableID')
+                row['Table'] = table_names.get(table_id) or ('' if table_id is None else str(table_id))
+            return row
+
+        for raw in columns:
+            row = with_table(_unbracket(raw))
+            if str(row.get('Type')) == '3':  # RowNumber columns
+                continue
+            name = _field(row, 'ExplicitName', 'Name', 'InferredName')
+            row.setdefault('Name', name)
+            index.add('column', name, row, description=row.get('Description'),
+                      display_folder=row.get('DisplayFolder'), expression=row.get('Expression'))
+        for raw in measures:
+            row = with_table(_unbracket(raw))
+            index.add('measure', row.get('Name'), row, description=row.get('Description'),
+                      display_folder=row.get('DisplayFolder'), expression=row.get('Expression'))
+        return index
+
+    @classmethod
+    def from_tmdl(cls, definition_dir: Path) -> "MetadataSearchIndex":
+        """
+        Build from a TMDL definition folder (the one containing tables/).
+
+        Rows use INFO.*-style keys (Name, Table, Expression, DisplayFolder,
+        Description, IsHidden, DataType).
+        """
+        from core.model.tmdl_parser import TMDLParser
+
+        index = cls(str(definition_dir))
+        files = sorted((definition_dir / 'tables').glob('*.tmdl'))
+        expressions = definition_dir / 'expressions.tmdl'
+        if expressions.exists():
+            files.append(expressions)
+        for path in files:
+            parsed = TMDLParser.parse_file(path)
+            if parsed.get('type') == 'table':
+                metadata = parsed.get('metadata', {})
+                table = metadata.get('name') or path.stem
+                index.add('table', table, {'Name': table, 'IsHidden': metadata.get('isHidden', False),
+                                           'Description': metadata.get('description')},
+                          description=metadata.get('description'))
+            elif parsed.get('type') == 'expressions':
+                table = 'Model'
+            else:
+                continue
+            for column in parsed.get('columns', []):
+                index.add('column', column.get('name'), {
+                    'Name': column.get('name'), 'Table': table, 'DataType': column.get('dataType'),
+                    'IsHidden': column.get('isHidden'), 'DisplayFolder': column.get('displayFolder'),
+                    'Description': column.get('description'), 'Expression': column.get('expression'),
+                }, description=column.get('description'), display_folder=column.get('displayFolder'),
+                    expression=column.get('expression'))
+            for measure in parsed.get('measures', []):
+                index.add('measure', measure.get('name'), {
+                    'Name': measure.get('name'), 'Table': table, 'Expression': measure.get('expression'),
+                    'DisplayFolder': measure.get('displayFolder'), 'Description': measure.get('description'),
+                    'FormatString': measure.get('formatString'), 'IsHidden': measure.get('isHidden'),
+                }, description=measure.get('description'), display_folder=measure.get('displayFolder'),
+                    expression=measure.get('expression'))
+        return index
+
+
+# ---------------------------------------------------------------------------
+# Index registries
+# ---------------------------------------------------------------------------
+
+class _LiveEntry:
+    __slots__ = ('index', 'generation')
+
+    def __init__(self, index: MetadataSearchIndex, generation: int):
+        self.index = index
+        self.generation = generation
+
+
+_live_indexes: "weakref.WeakKeyDictionary[Any, _LiveEntry]" = weakref.WeakKeyDictionary()
+_file_indexes: Dict[str, Tuple[Tuple[Any, ...], MetadataSearchIndex]] = {}
+_lock = threading.Lock()
+
+
+def get_live_search_index(query_executor: Any) -> Optional[MetadataSearchIndex]:
+    """
+    Search index for a connected model, built on first use.
+
+    The index is rebuilt when the connection's model catalog has reloaded
+    (model change or invalidation after a write).
+
+    Returns:
+        The index, or None when disabled or the metadata cannot be read
+    """
+    if query_executor is None or not config.get('performance.search_index', True):
+        return None
+    catalog = get_model_catalog(query_executor)
+    if catalog is None:
+        return None
+    with _lock:
+        entry = _live_indexes.get(query_executor)
+        if entry is not None and entry.generation == catalog.generation:
+            return entry.index
+        start = time.perf_counter()
+        index = MetadataSearchIndex.from_info_rows(
+            catalog.rows('TABLES'), catalog.rows('COLUMNS'), catalog.rows('MEASURES'), source='model_catalog'
+        )
+        _live_indexes[query_executor] = _LiveEntry(index, catalog.generation)
+        logger.info(f"Search index built: {len(index)} objects in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return index
+
+
+def invalidate_live_search_index(query_executor: Any) -> None:
+    """Drop the live index so the next search rebuilds it (e.g. after a model edit)"""
+    with _lock:
+        _live_indexes.pop(query_executor, None)
+
+
+def find_tmdl_definition(path: Path) -> Optional[Path]:
+    """
+    Locate the TMDL definition folder under a PBIP project, a .SemanticModel
+    folder, a hybrid analysis package or a definition folder itself.
+    """
+    candidates = [path, path / 'definition', path / 'tmdl', path / 'tmdl' / 'definition']
+    candidates.extend(sorted(path.glob('*.SemanticModel/definition')))
+    for candidate in candidates:
+        if (candidate / 'tables').is_dir():
+            return candidate
+    return None
+
+
+def get_file_search_index(path: str) -> Optional[MetadataSearchIndex]:
+    """
+    Search index for an offline model (PBIP project or hybrid package).
+
+    Cached per folder and rebuilt when any TMDL file is added, removed or
+    modified.
+
+    Returns:
+        The index, or None when no TMDL definition is found under path
+    """
+    definition = find_tmdl_definition(Path(path))
+    if definition is None:
+        return None
+    files = sorted(definition.glob('tables/*.tmdl')) + sorted(definition.glob('expressions.tmdl'))
+    signature = tuple((p.name, p.stat().st_mtime_ns, p.stat().st_size) for p in files)
+    key = str(definition.resolve())
+    with _lock:
+        cached = _file_indexes.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    index = MetadataSearchIndex.from_tmdl(definition)
+    with _lock:
+        _file_indexes[key] = (signature, index)
+    return index
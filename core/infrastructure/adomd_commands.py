@@ -0,0 +1,84 @@
+"""
+Serialized command execution on shared ADOMD connections.
+
+An AdomdConnection runs one command at a time, and an open reader blocks the
+next command until it is closed. Tool calls run on a worker pool, and the query
+executor, CRUD managers, DAX injector and handlers all issue commands on the
+same connection. Every ExecuteReader therefore goes through execute_reader(),
+which holds the connection's lock until the reader is closed.
+"""
+
+import logging
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# One re-entrant lock per connection object. Connections that cannot be weakly
+# referenced fall back to their id(); a reused id only shares a lock.
+_locks: "weakref.WeakKeyDictionary[Any, threading.RLock]" = weakref.WeakKeyDictionary()
+_locks_by_id: Dict[int, threading.RLock] = {}
+_no_connection_lock = threading.RLock()
+_registry_lock = threading.Lock()
+
+
+def connection_lock(connection: Any) -> threading.RLock:
+    """
+    Command lock of an ADOMD connection.
+
+    Args:
+        connection: AdomdConnection (None gets a shared process-wide lock)
+
+    Returns:
+        Re-entrant lock held while a command or its reader is active
+    """
+    if connection is None:
+        return _no_connection_lock
+    with _registry_lock:
+        try:
+            lock = _locks.get(connection)
+            if lock is None:
+                lock = _locks[connection] = threading.RLock()
+        except TypeError:  # not weakly referenceable or not hashable
+            lock = _locks_by_id.setdefault(id(connection), threading.RLock())
+        return lock
+
+
+@contextmanager
+def execute_reader(cmd: Any, connection: Optional[Any] = None) -> Iterator[Any]:
+    """
+    Run cmd.ExecuteReader() under its connection's lock and close the reader on exit.
+
+    Args:
+        cmd: ADOMD command
+        connection: Connection the command runs on (default: cmd.Connection)
+
+    Yields:
+        The open reader
+    """
+    if connection is None:
+        connection = getattr(cmd, 'Connection', None)
+    with connection_lock(connection):
+        reader = cmd.ExecuteReader()
+        try:
+            yield reader
+        finally:
+            try:
+                reader.Close()
+            except Exception:
+                pass
+
+
+def read_scalar(cmd: Any, connection: Optional[Any] = None) -> Optional[Any]:
+    """First column of the first row of a command's result (None when empty)."""
+    with execute_reader(cmd, connection) as reader:
+        return reader.GetValue(0) if reader.Read() else None
+
+
+__all__ = [
+    "connection_lock",
+    "execute_reader",
+    "read_scalar",
+]
@@ -1,8 +1,14 @@
 """
 Enhanced cache manager with size limits and eviction metrics.
 Prevents memory leaks from unbounded cache growth.
+
+Entry sizes are deep estimates (see estimate_size) so max_size_mb is an
+actual byte budget. Eviction bookkeeping is O(1) per operation for all
+three policies: LRU and TTL use the insertion-ordered dict, LFU keeps keys
+in a linked list of frequency buckets.
 """
 
+import sys
 import time
 import hashlib
 import logging
@@ -12,10 +18,74 @@ import threading
 
 logger = logging.getLogger("mcp_powerbi_finvision.cache_manager")
 
+# Containers larger than this are sized from an evenly spaced sample of their items
+SIZE_SAMPLE_ITEMS = 64
+_SIZE_MAX_DEPTH = 8
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, complex, type(None))
+
+
+def estimate_size(value: Any, sample_items: int = SIZE_SAMPLE_ITEMS) -> int:
+    """
+    Approximate deep size of a value in bytes.
+
+    Walks dicts, sequences, sets and object attributes (__dict__/__slots__);
+    objects exposing nbytes (arrays) report that. Containers with more than
+    sample_items items are measured on a sample and extrapolated, so the cost
+    is bounded for results with thousands of rows. Shared objects are counted
+    once within the walk.
+    """
+    seen = set()
+
+    def size_of(obj: Any, depth: int) -> float:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        size = sys.getsizeof(obj, 64)
+        if isinstance(obj, _ATOMIC_TYPES) or depth >= _SIZE_MAX_DEPTH:
+            return size
+        nbytes = getattr(obj, 'nbytes', None)
+        if isinstance(nbytes, int):
+            return size + nbytes
+
+        if isinstance(obj, dict):
+            items = obj.items()
+            count = len(obj)
+            if count > sample_items:
+                step = count / sample_items
+                wanted = {int(i * step) for i in range(sample_items)}
+                items = [item for i, item in enumerate(items) if i in wanted]
+            measured = sum(size_of(k, depth + 1) + size_of(v, depth + 1) for k, v in items)
+            return size + (measured * count / len(items) if items else 0)
+
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            count = len(obj)
+            items = obj if isinstance(obj, (list, tuple)) else list(obj)
+            if count > sample_items:
+                step = count / sample_items
+                items = [items[int(i * step)] for i in range(sample_items)]
+            measured = sum(size_of(item, depth + 1) for item in items)
+            return size + (measured * count / len(items) if items else 0)
+
+        attrs = getattr(obj, '__dict__', None)
+        if isinstance(attrs, dict):
+            size += size_of(attrs, depth + 1)
+        for slot in getattr(type(obj), '__slots__', ()):
+            if isinstance(slot, str) and hasattr(obj, slot):
+                size += size_of(getattr(obj, slot), depth + 1)
+        return size
+
+    try:
+        return int(size_of(value, 0))
+    except Exception:
+        return 1024  # Default estimate
+
 
 class CacheEntry:
     """Represents a cached item with metadata."""
     
+    __slots__ = ('key', 'value', 'created_at', 'expires_at', 'hits', 'last_accessed',
+                 'size_bytes', 'freq_node')
+
     def __init__(self, key: str, value: Any, ttl: float):
         self.key = key
         self.value = value
@@ -23,13 +93,10 @@ class CacheEntry:
         self.expires_at = self.created_at + ttl if ttl > 0 else float('inf')
         self.hits = 0
         self.last_accessed = self.created_at
+        self.freq_node: Optional["_FreqNode"] = None
         
-        # Approximate size (for memory limits)
-        try:
-            import sys
-            self.size_bytes = sys.getsizeof(value)
-        except Exception:
-            self.size_bytes = 1024  # Default estimate
+        # Approximate deep size (for memory limits)
+        self.size_bytes = estimate_size(value)
     
     def is_expired(self) -> bool:
         """Check if entry has expired."""
@@ -46,6 +113,73 @@ class CacheEntry:
         return time.time() - self.created_at
 
 
+class _FreqNode:
+    """Keys sharing one access count; nodes are kept sorted by count in a linked list."""
+
+    __slots__ = ('freq', 'keys', 'prev', 'next')
+
+    def __init__(self, freq: int):
+        self.freq = freq
+        self.keys: "OrderedDict[str, None]" = OrderedDict()
+        self.prev: Optional["_FreqNode"] = None
+        self.next: Optional["_FreqNode"] = None
+
+
+class _LFUIndex:
+    """O(1) least-frequently-used tracking (ties broken by insertion order)."""
+
+    def __init__(self):
+        self.head = _FreqNode(-1)  # sentinel; head.next is the lowest count
+
+    def _insert_after(self, node: _FreqNode, freq: int) -> _FreqNode:
+        new = _FreqNode(freq)
+        new.prev, new.next = node, node.next
+        if node.next is not None:
+            node.next.prev = new
+        node.next = new
+        return new
+
+    def _unlink_if_empty(self, node: _FreqNode) -> None:
+        if node.keys or node is self.head:
+            return
+        node.prev.next = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+
+    def add(self, entry: CacheEntry) -> None:
+        first = self.head.next
+        node = first if first is not None and first.freq == entry.hits else self._insert_after(self.head, entry.hits)
+        node.keys[entry.key] = None
+        entry.freq_node = node
+
+    def touch(self, entry: CacheEntry) -> None:
+        """Move an entry to the bucket of its (already incremented) hit count."""
+        node = entry.freq_node
+        if node is None:
+            return
+        nxt = node.next
+        target = nxt if nxt is not None and nxt.freq == entry.hits else self._insert_after(node, entry.hits)
+        del node.keys[entry.key]
+        target.keys[entry.key] = None
+        entry.freq_node = target
+        self._unlink_if_empty(node)
+
+    def remove(self, entry: CacheEntry) -> None:
+        node = entry.freq_node
+        if node is None:
+            return
+        node.keys.pop(entry.key, None)
+        entry.freq_node = None
+        self._unlink_if_empty(node)
+
+    def victim(self) -> Optional[str]:
+        node = self.head.next
+        return next(iter(node.keys)) if node is not None else None
+
+    def clear(self) -> None:
+        self.head.next = None
+
+
 class EnhancedCacheManager:
     """
     Thread-safe cache with TTL, size limits, and eviction policies.
@@ -66,17 +200,22 @@ class EnhancedCacheManager:
         
         self.default_ttl = float(self.config.get('ttl_seconds', 300))
         self.max_entries = int(self.config.get('max_entries', 1000))
-        self.max_size_bytes = int(self.config.get('max_size_mb', 100)) * 1024 * 1024
+        self.max_size_bytes = int(float(self.config.get('max_size_mb', 100)) * 1024 * 1024)
         self.eviction_policy = self.config.get('eviction_policy', 'lru')
+        if self.eviction_policy not in ('lru', 'lfu', 'ttl'):
+            logger.warning(f"Unknown eviction policy '{self.eviction_policy}', using lru")
+            self.eviction_policy = 'lru'
         
-        # Storage
+        # Storage: insertion order is creation order; LRU also moves entries to the end on access
         self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lfu = _LFUIndex() if self.eviction_policy == 'lfu' else None
         
         # Metrics
         self.hits = 0
         self.misses = 0
         self.evictions = 0
         self.expired_removals = 0
+        self.rejected = 0
         self.current_size_bytes = 0
         
         # Thread safety
@@ -118,9 +257,12 @@ class EnhancedCacheManager:
                 self.cache.move_to_end(key)
             
             self.hits += 1
-            return entry.access(), True
+            value = entry.access()
+            if self._lfu is not None:
+                self._lfu.touch(entry)
+            return value, True
     
-    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
         """
         Store value in cache.
         
@@ -128,25 +270,34 @@ class EnhancedCacheManager:
             key: Cache key
             value: Value to store
             ttl: TTL in seconds (None = use default)
+
+        Returns:
+            False if the value alone exceeds the byte budget and was not cached
         """
+        # Size outside the lock; sampling keeps this bounded for large results
+        ttl = ttl if ttl is not None else self.default_ttl
+        entry = CacheEntry(key, value, ttl)
+
         with self.lock:
-            # Use default TTL if not specified
-            ttl = ttl if ttl is not None else self.default_ttl
-            
             # Remove existing entry if present
             if key in self.cache:
                 self._remove_entry(key)
             
-            # Create new entry
-            entry = CacheEntry(key, value, ttl)
+            if self.max_size_bytes > 0 and entry.size_bytes > self.max_size_bytes:
+                self.rejected += 1
+                logger.debug(f"Not caching {key}: {entry.size_bytes} bytes exceeds the cache budget")
+                return False
             
             # Check if we need to evict
-            while self._should_evict(entry.size_bytes):
+            while self.cache and self._should_evict(entry.size_bytes):
                 self._evict_one()
             
             # Add to cache
             self.cache[key] = entry
             self.current_size_bytes += entry.size_bytes
+            if self._lfu is not None:
+                self._lfu.add(entry)
+            return True
     
     def _should_evict(self, new_entry_size: int) -> bool:
         """Check if eviction needed for new entry."""
@@ -162,21 +313,15 @@ class EnhancedCacheManager:
         return False
     
     def _evict_one(self):
-        """Evict one entry based on policy."""
+        """Evict one entry based on policy (O(1))."""
         if not self.cache:
             return
         
-        if self.eviction_policy == 'lru':
-            # Remove least recently used (first in OrderedDict)
-            key = next(iter(self.cache))
-        elif self.eviction_policy == 'lfu':
-            # Remove least frequently used
-            key = min(self.cache.keys(), key=lambda k: self.cache[k].hits)
-        elif self.eviction_policy == 'ttl':
-            # Remove oldest by creation time
-            key = min(self.cache.keys(), key=lambda k: self.cache[k].created_at)
+        if self._lfu is not None:
+            # Least frequently used, oldest first among equals
+            key = self._lfu.victim()
         else:
-            # Fallback to LRU
+            # lru: least recently used; ttl: oldest by creation time (entries are not reordered)
             key = next(iter(self.cache))
         
         self._remove_entry(key)
@@ -187,11 +332,15 @@ class EnhancedCacheManager:
         entry = self.cache.pop(key, None)
         if entry:
             self.current_size_bytes = max(0, self.current_size_bytes - entry.size_bytes)
+            if self._lfu is not None:
+                self._lfu.remove(entry)
     
     def clear(self):
         """Clear all entries."""
         with self.lock:
             self.cache.clear()
+            if self._lfu is not None:
+                self._lfu.clear()
             self.current_size_bytes = 0
             logger.info("Cache cleared")
     
@@ -231,6 +380,7 @@ class EnhancedCacheManager:
                 'hit_rate': round(hit_rate, 2),
                 'evictions': self.evictions,
                 'expired_removals': self.expired_removals,
+                'rejected_oversize': self.rejected,
                 'avg_entry_age_seconds': round(avg_age, 1),
                 'avg_entry_hits': round(avg_hits, 1),
                 'eviction_policy': self.eviction_policy,
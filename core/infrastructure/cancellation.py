@@ -0,0 +1,117 @@
+"""
+Cooperative cancellation for long-running tool calls.
+
+The dispatcher creates one CancellationToken per tool call from the tool's timeout
+budget and makes it current for the worker thread. Orchestrators and analyzers pick
+it up with current_cancellation_token() and check it between units of work, so an
+expired budget ends the call with the results gathered so far instead of hanging.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OperationCancelled(Exception):
+    """Raised by CancellationToken.check() once the token is cancelled or expired."""
+
+    def __init__(self, reason: str, stage: Optional[str] = None):
+        self.reason = reason
+        self.stage = stage
+        super().__init__(f"{reason} during {stage}" if stage else reason)
+
+
+class CancellationToken:
+    """Deadline plus explicit cancel flag, shared by a tool call and its worker."""
+
+    def __init__(self, timeout: Optional[float] = None, label: str = ""):
+        """
+        Args:
+            timeout: Budget in seconds from now (None or <= 0 for no deadline)
+            label: Tool or operation name, used in messages
+        """
+        self.label = label
+        self.timeout = timeout if timeout and timeout > 0 else None
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + self.timeout if self.timeout else None
+        self._event = threading.Event()
+        self._reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Request cancellation; in-flight work stops at its next check."""
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() was called or the deadline has passed."""
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel(f"timeout after {self.timeout:g}s")
+            return True
+        return False
+
+    @property
+    def timed_out(self) -> bool:
+        return self.cancelled and (self._reason or "").startswith("timeout")
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self._reason if self.cancelled else None
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget (None when unbounded, 0 once cancelled)."""
+        if self.cancelled:
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self, stage: Optional[str] = None) -> None:
+        """Raise OperationCancelled if the token is cancelled or expired."""
+        if self.cancelled:
+            raise OperationCancelled(self._reason or "cancelled", stage)
+
+    def mark_partial(self, result: Dict[str, Any], stage: Optional[str] = None) -> Dict[str, Any]:
+        """Flag a result dict as partial because this token stopped the work."""
+        result['partial'] = True
+        result['timed_out'] = self.timed_out
+        result['cancellation'] = {
+            'reason': self._reason or 'cancelled',
+            'stopped_at': stage,
+            'budget_seconds': self.timeout,
+            'elapsed_seconds': round(self.elapsed(), 2),
+        }
+        logger.warning(f"{self.label or 'Operation'} stopped at {stage or 'checkpoint'}: {self._reason}")
+        return result
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    'cancellation_token', default=None
+)
+
+
+def current_cancellation_token() -> CancellationToken:
+    """Token of the tool call running in this context (an unbounded one outside calls)."""
+    token = _current_token.get()
+    return token if token is not None else CancellationToken()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Make token current for the enclosed block."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
@@ -8,6 +8,8 @@ import logging
 import subprocess
 from typing import Any, Dict, List, Optional
 
+from core.infrastructure.adomd_commands import connection_lock, execute_reader, read_scalar
+
 logger = logging.getLogger(__name__)
 
 # Try to load ADOMD.NET
@@ -265,7 +267,7 @@ class ConnectionManager:
             # Close existing connection if any
             if self.active_connection:
                 try:
-                    self.active_connection.Close()
+                    self._close_when_idle(self.active_connection)
                 except Exception:
                     pass
 
@@ -324,7 +326,7 @@ class ConnectionManager:
             # Close existing connection if any
             if self.active_connection:
                 try:
-                    self.active_connection.Close()
+                    self._close_when_idle(self.active_connection)
                 except Exception:
                     pass
 
@@ -430,10 +432,9 @@ class ConnectionManager:
             if not db_name:
                 cmd = self.active_connection.CreateCommand()
                 cmd.CommandText = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.active_connection)
+                if value is not None:
+                    db_name = str(value)
 
             # Store instance info
             self.active_instance = {
@@ -490,12 +491,9 @@ class ConnectionManager:
                 # Get server info
                 cmd = test_conn.CreateCommand()
                 cmd.CommandText = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
-                reader = cmd.ExecuteReader()
+                value = read_scalar(cmd, test_conn)
 
-                db_name = None
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                db_name = None if value is None else str(value)
                 test_conn.Close()
 
                 return {
@@ -518,10 +516,8 @@ class ConnectionManager:
                 # Test with simple query
                 cmd = self.active_connection.CreateCommand()
                 cmd.CommandText = "EVALUATE { 1 }"
-                reader = cmd.ExecuteReader()
-
-                has_data = reader.Read()
-                reader.Close()
+                with execute_reader(cmd, self.active_connection) as reader:
+                    has_data = reader.Read()
 
                 return {
                     'success': True,
@@ -577,11 +573,17 @@ class ConnectionManager:
         except Exception:
             return False
 
+    @staticmethod
+    def _close_when_idle(connection: Any) -> None:
+        """Close a connection once the command running on it (if any) has finished."""
+        with connection_lock(connection):
+            connection.Close()
+
     def disconnect(self):
         """Disconnect from current instance."""
         if self.active_connection:
             try:
-                self.active_connection.Close()
+                self._close_when_idle(self.active_connection)
                 logger.info("Disconnected from Power BI Desktop")
             except Exception:
                 pass
@@ -619,7 +621,7 @@ class ConnectionManager:
                 # Close existing connection if any
                 if self.active_connection:
                     try:
-                        self.active_connection.Close()
+                        self._close_when_idle(self.active_connection)
                     except Exception:
                         pass
                     self.active_connection = None
@@ -713,7 +715,7 @@ class ConnectionManager:
             # Close existing connection if any
             if self.active_connection:
                 try:
-                    self.active_connection.Close()
+                    self._close_when_idle(self.active_connection)
                 except Exception:
                     pass
 
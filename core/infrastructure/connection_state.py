@@ -7,6 +7,7 @@ Manages connection state and service initialization to avoid repeated initializa
 import logging
 from typing import Any, Dict, Optional, Type, Tuple
 from core.config.config_manager import config
+from core.infrastructure.model_catalog import invalidate_model_catalog
 import threading
 
 logger = logging.getLogger(__name__)
@@ -226,6 +227,8 @@ class ConnectionState:
             self._table_id_by_name = None
             self._table_name_by_id = None
             self._table_mapping_timestamp = None
+            if self.query_executor:
+                invalidate_model_catalog(self.query_executor)
 
             if had_cache:
                 logger.info(f"Table mapping cache invalidated ({table_count} tables)")
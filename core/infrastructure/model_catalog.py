@@ -0,0 +1,247 @@
+"""
+Shared model-metadata catalog.
+
+One ModelCatalog per query executor holds the rows of INFO.TABLES(),
+INFO.COLUMNS(), INFO.MEASURES() and INFO.RELATIONSHIPS(), fetched once and
+indexed by ID and table. execute_info_query, the table/column ID mappings,
+the metadata search index, the hybrid export and the dependency/usage
+analyzers read from it instead of issuing their own INFO queries.
+
+Staleness is detected from the model's schema stamp (see
+core.infrastructure.model_version), re-read at most every
+performance.model_version_recheck_s seconds. Writers that change the model
+(CRUD managers, DAX injector) call invalidate_model_catalog() after
+SaveChanges so the next read reloads.
+"""
+
+import itertools
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+
+from core.config.config_manager import config
+from core.infrastructure.model_version import expire_model_version, get_current_model_version
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FUNCTIONS = ('TABLES', 'COLUMNS', 'MEASURES', 'RELATIONSHIPS')
+
+_generations = itertools.count(1)
+
+
+def _unbracket(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {(k[1:-1] if k.startswith('[') and k.endswith(']') else k): v for k, v in row.items()}
+
+
+def _schema_stamp(version: Optional[str]) -> Optional[str]:
+    """Schema part of a model version (metadata does not change on data refresh)"""
+    return None if version is None else version.split('|', 1)[0]
+
+
+class ModelCatalog:
+    """
+    Metadata rows of one model, normalized the way execute_info_query returns
+    them: unbracketed keys, Table added to columns and measures, From/To
+    table and column names added to relationships.
+    """
+
+    def __init__(
+        self,
+        tables: List[Dict[str, Any]],
+        columns: List[Dict[str, Any]],
+        measures: List[Dict[str, Any]],
+        relationships: List[Dict[str, Any]],
+        version: Optional[str] = None
+    ):
+        """
+        Args:
+            tables, columns, measures, relationships: Raw INFO.* rows
+            version: Schema stamp the rows were read at
+        """
+        self.version = version
+        self.generation = next(_generations)
+        self.loaded_at = time.time()
+
+        self.table_id_by_name: Dict[str, Any] = {}
+        self.table_name_by_id: Dict[Any, str] = {}
+        self.column_name_by_id: Dict[Any, str] = {}
+
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+        self._rows['TABLES'] = [_unbracket(row) for row in tables]
+        for row in self._rows['TABLES']:
+            name, table_id = row.get('Name'), row.get('ID')
+            if name is not None and table_id is not None:
+                self.table_id_by_name[name] = table_id
+                self.table_name_by_id[table_id] = name
+
+        self._rows['COLUMNS'] = [self._with_table(_unbracket(row)) for row in columns]
+        for row in self._rows['COLUMNS']:
+            name = row.get('ExplicitName') or row.get('InferredName') or row.get('Name')
+            if name is not None and row.get('ID') is not None:
+                self.column_name_by_id[row['ID']] = name
+
+        self._rows['MEASURES'] = [self._with_table(_unbracket(row)) for row in measures]
+        self._rows['RELATIONSHIPS'] = [self._with_endpoints(_unbracket(row)) for row in relationships]
+
+        # Column and measure rows per TableID, in model order
+        self._by_table: Dict[str, Dict[Any, List[Dict[str, Any]]]] = {}
+        for function_name in ('COLUMNS', 'MEASURES'):
+            grouped: Dict[Any, List[Dict[str, Any]]] = {}
+            for row in self._rows[function_name]:
+                grouped.setdefault(row.get('TableID'), []).append(row)
+            self._by_table[function_name] = grouped
+
+    def _with_table(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        if 'Table' not in row and 'TableID' in row:
+            table_id = row.get('TableID')
+            row['Table'] = self.table_name_by_id.get(table_id) or ('' if table_id is None else str(table_id))
+        return row
+
+    def _with_endpoints(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        for side in ('From', 'To'):
+            table_id = row.get(f'{side}TableID')
+            if f'{side}Table' not in row and table_id is not None:
+                row[f'{side}Table'] = self.table_name_by_id.get(table_id) or str(table_id)
+            column_id = row.get(f'{side}ColumnID')
+            if f'{side}Column' not in row and column_id is not None:
+                row[f'{side}Column'] = self.column_name_by_id.get(column_id) or str(column_id)
+        return row
+
+    @classmethod
+    def load(cls, query_executor: Any, version: Optional[str] = None) -> "ModelCatalog":
+        """
+        Read the INFO.* rows of a connected model.
+
+        Raises:
+            RuntimeError: If one of the INFO queries fails
+        """
+        rows = []
+        for function_name in CATALOG_FUNCTIONS:
+            result = query_executor.validate_and_execute_dax(f"EVALUATE INFO.{function_name}()", 0, bypass_cache=True)
+            if not result.get('success'):
+                raise RuntimeError(f"INFO.{function_name}() failed: {result.get('error')}")
+            rows.append(result.get('rows', []) or [])
+        return cls(*rows, version=version)
+
+    def rows(self, function_name: str, table_name: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Copies of the rows of one INFO function.
+
+        Args:
+            function_name: TABLES, COLUMNS, MEASURES or RELATIONSHIPS
+            table_name: Only rows of this table (COLUMNS and MEASURES)
+
+        Returns:
+            Row copies, or None when the catalog cannot answer (other function,
+            table filter on TABLES/RELATIONSHIPS)
+        """
+        function_name = function_name.upper()
+        if function_name not in self._rows:
+            return None
+        if table_name is None:
+            source = self._rows[function_name]
+        elif function_name in self._by_table:
+            table_id = self.table_id_by_name.get(table_name)
+            source = self._by_table[function_name].get(table_id, []) if table_id is not None else []
+        else:
+            return None
+        return [dict(row) for row in source]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'generation': self.generation,
+            'version': self.version,
+            'loaded_at': self.loaded_at,
+            'counts': {name.lower(): len(rows) for name, rows in self._rows.items()},
+        }
+
+
+# ---------------------------------------------------------------------------
+# Per-connection registry
+# ---------------------------------------------------------------------------
+
+class _CatalogEntry:
+    __slots__ = ('catalog', 'failed_at', 'lock')
+
+    def __init__(self):
+        self.catalog: Optional[ModelCatalog] = None
+        self.failed_at: Optional[float] = None
+        self.lock = threading.RLock()
+
+
+# One entry per query executor (a new connection gets a new executor)
+_entries: "weakref.WeakKeyDictionary[Any, _CatalogEntry]" = weakref.WeakKeyDictionary()
+_entries_lock = threading.Lock()
+
+
+def get_model_catalog(query_executor: Any) -> Optional[ModelCatalog]:
+    """
+    Current catalog of a connection, loaded on first use.
+
+    The schema stamp is re-read at most every performance.model_version_recheck_s
+    seconds and a changed stamp reloads the catalog. When the stamp cannot be
+    read, a catalog is trusted for performance.cache_ttl_seconds (as long as
+    the query cache kept INFO results before). A failed load is not retried
+    until the recheck interval has passed.
+
+    Returns:
+        The catalog, or None when disabled or the metadata cannot be read
+    """
+    if query_executor is None or not config.get('performance.model_catalog', True):
+        return None
+    recheck = float(config.get('performance.model_version_recheck_s', 5))
+    with _entries_lock:
+        entry = _entries.get(query_executor)
+        if entry is None:
+            entry = _CatalogEntry()
+            _entries[query_executor] = entry
+
+    with entry.lock:
+        now = time.monotonic()
+        catalog = entry.catalog
+        if catalog is None and entry.failed_at is not None and now - entry.failed_at < recheck:
+            return None
+
+        version = _schema_stamp(get_current_model_version(query_executor, recheck))
+        if catalog is not None:
+            trusted = (version == catalog.version if version is not None
+                       else time.time() - catalog.loaded_at < float(config.get('performance.cache_ttl_seconds', 300) or 0))
+            if trusted:
+                return catalog
+            logger.info(f"Model changed ({catalog.version} -> {version}), reloading metadata catalog")
+
+        try:
+            start = time.perf_counter()
+            catalog = ModelCatalog.load(query_executor, version)
+        except Exception as e:
+            logger.warning(f"Model catalog load failed: {e}")
+            entry.catalog, entry.failed_at = None, now
+            return None
+        entry.catalog, entry.failed_at = catalog, None
+        counts = catalog.stats()['counts']
+        logger.info(f"Model catalog loaded in {(time.perf_counter() - start) * 1000:.0f} ms: "
+                    f"{counts['tables']} tables, {counts['columns']} columns, "
+                    f"{counts['measures']} measures, {counts['relationships']} relationships")
+        return catalog
+
+
+def invalidate_model_catalog(query_executor: Any = None) -> None:
+    """
+    Drop cached catalogs so the next read reloads.
+
+    Also expires the connection's model version stamp, which invalidates
+    the query results cached under the previous version.
+
+    Args:
+        query_executor: Connection whose catalog to drop; None drops all of
+            them (for writers that only hold a TOM connection)
+    """
+    expire_model_version(query_executor)
+    with _entries_lock:
+        entries = [_entries.get(query_executor)] if query_executor is not None else list(_entries.values())
+    for entry in entries:
+        if entry is not None:
+            with entry.lock:
+                entry.catalog, entry.failed_at = None, None
@@ -0,0 +1,111 @@
+"""
+Model version stamps for cache invalidation.
+
+Caches that outlive a single tool call (VertiPaq metrics, query results,
+the model catalog, ...) compare the model's last schema and data update
+times before trusting their contents. The stamps come from
+$SYSTEM.MDSCHEMA_CUBES, a single-row-per-cube DMV that is cheap compared with
+the statistics it guards.
+
+All callers read the stamp through get_current_model_version, which keeps
+one stamp per connection and re-reads it at most every
+performance.model_version_recheck_s seconds; writers call
+expire_model_version after saving so the next read sees their change.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+from core.config.config_manager import config
+
+logger = logging.getLogger(__name__)
+
+MODEL_VERSION_QUERY = "SELECT [CUBE_NAME], [LAST_SCHEMA_UPDATE], [LAST_DATA_UPDATE] FROM $SYSTEM.MDSCHEMA_CUBES"
+
+
+def _read_model_version(query_executor: Any) -> Optional[str]:
+    """
+    Current model version stamp ("<last schema update>|<last data update>").
+
+    Args:
+        query_executor: Executor with execute_dmv_query()
+
+    Returns:
+        Version string, or None when the stamps cannot be read
+    """
+    if query_executor is None or not hasattr(query_executor, 'execute_dmv_query'):
+        return None
+    try:
+        result = query_executor.execute_dmv_query(MODEL_VERSION_QUERY)
+    except Exception as e:
+        logger.debug(f"Model version query failed: {e}")
+        return None
+    rows = (result.get('data') or []) if result.get('success') else []
+    if not rows:
+        return None
+
+    def latest(key: str) -> str:
+        return max((str(row.get(key)) for row in rows if row.get(key) is not None), default='')
+
+    return f"{latest('LAST_SCHEMA_UPDATE')}|{latest('LAST_DATA_UPDATE')}"
+
+
+# Last stamp read per query executor: (version, monotonic read time). Executors
+# that cannot be weakly referenced fall back to their id().
+_stamps: "weakref.WeakKeyDictionary[Any, Tuple[Optional[str], float]]" = weakref.WeakKeyDictionary()
+_stamps_by_id: Dict[int, Tuple[Optional[str], float]] = {}
+_stamps_lock = threading.Lock()
+
+
+def get_current_model_version(query_executor: Any, max_age_s: Optional[float] = None) -> Optional[str]:
+    """
+    Model version stamp, re-read at most every max_age_s seconds.
+
+    Args:
+        query_executor: Executor with execute_dmv_query()
+        max_age_s: Maximum age of a previously read stamp
+            (default: performance.model_version_recheck_s)
+
+    Returns:
+        Version string, or None when the stamps cannot be read
+    """
+    if query_executor is None:
+        return None
+    if max_age_s is None:
+        max_age_s = float(config.get('performance.model_version_recheck_s', 5))
+    try:
+        with _stamps_lock:
+            stamps, key = _stamps, query_executor
+            cached = stamps.get(key)
+    except TypeError:  # executor that cannot be weakly referenced
+        with _stamps_lock:
+            stamps, key = _stamps_by_id, id(query_executor)
+            cached = stamps.get(key)
+    if cached is not None and time.monotonic() - cached[1] < max_age_s:
+        return cached[0]
+    version = _read_model_version(query_executor)
+    with _stamps_lock:
+        stamps[key] = (version, time.monotonic())
+    return version
+
+
+def expire_model_version(query_executor: Any = None) -> None:
+    """
+    Forget the stamp read for a connection so the next read goes to the model.
+
+    Args:
+        query_executor: Connection whose stamp to forget; None forgets all of
+            them (for writers that only hold a TOM connection)
+    """
+    with _stamps_lock:
+        if query_executor is None:
+            _stamps.clear()
+            _stamps_by_id.clear()
+            return
+        try:
+            _stamps.pop(query_executor, None)
+        except TypeError:
+            _stamps_by_id.pop(id(query_executor), None)
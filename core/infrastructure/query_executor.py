@@ -14,14 +14,35 @@ Based on fabric-toolbox best practices.
 import time
 import logging
 from typing import Any, Dict, List, Optional, Tuple
-from collections import OrderedDict
+from core.dax.dax_ast import TokenType, tokenize
 from core.dax.dax_validator import DaxValidator
 from core.config.config_manager import config
 from core.validation.constants import QueryLimits
+from core.infrastructure.adomd_commands import execute_reader, read_scalar
 from core.infrastructure.limits_manager import get_limits
+from core.infrastructure.result_set import ColumnarResult, legacy_rows, read_columns
+from core.execution.query_cache import QueryCache, normalize_query
+from core.execution.search_helper import SearchHelper
+from core.execution.search_index import get_live_search_index, invalidate_live_search_index
+from core.infrastructure.model_catalog import CATALOG_FUNCTIONS, get_model_catalog, invalidate_model_catalog
+from core.infrastructure.model_version import get_current_model_version
 
 logger = logging.getLogger(__name__)
 
+
+def _statement_keywords(query: str) -> List[str]:
+    """DEFINE/EVALUATE keywords that start statements (outside parentheses, strings, names and comments)."""
+    keywords = []
+    depth = 0
+    for token in tokenize(query)[0]:
+        if token.type == TokenType.LPAREN:
+            depth += 1
+        elif token.type == TokenType.RPAREN:
+            depth = max(0, depth - 1)
+        elif depth == 0 and token.type == TokenType.IDENTIFIER and token.text.upper() in ('DEFINE', 'EVALUATE'):
+            keywords.append(token.text.upper())
+    return keywords
+
 # DMV Column Type Constants (INFO.COLUMNS()[Type] field)
 # These are numeric values, not text
 COLUMN_TYPE_DATA = 1        # Regular data column from source
@@ -99,10 +120,11 @@ class OptimizedQueryExecutor:
         """
         self._initial_connection = connection  # Keep initial reference for backward compatibility
         self._connection_manager = None  # Will hold reference to ConnectionManager for dynamic connection
-        # Simple TTL-based LRU cache for query results
-        self.query_cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
-        self.max_cache_items = getattr(QueryLimits, 'TELEMETRY_BUFFER_SIZE', 200)  # align with central limits where practical
-        self.cache_ttl_seconds = max(0, int(config.get('performance.cache_ttl_seconds', 300) or 0))
+        # LRU cache for query results, invalidated by model version (TTL only when the version is unknown)
+        self.query_cache = QueryCache(
+            max_items=getattr(QueryLimits, 'TELEMETRY_BUFFER_SIZE', 200),  # align with central limits where practical
+            ttl_seconds=max(0, int(config.get('performance.cache_ttl_seconds', 300) or 0))
+        )
         self._table_cache = None
         # Deprecated: Local table mapping cache (use connection_state shared cache instead)
         self._table_id_by_name: Optional[Dict[str, Any]] = None
@@ -117,12 +139,13 @@ class OptimizedQueryExecutor:
             self.command_timeout_seconds = 60
         # Optional history logger callback: callable(dict)
         self._history_logger = None
-        # Cache stats
-        self.cache_hits = 0
-        self.cache_misses = 0
-        self.cache_bypass = 0
         # DAX profiling support (lazy load)
         self._dax_profiler = None
+        # Builds commands for DAX queries: AdomdCommand(query, connection) by default,
+        # swappable so a fake ADOMD command/reader can drive the executor
+        self._command_factory = AdomdCommand if ADOMD_AVAILABLE else None
+        # ADOMD connections do not support concurrent commands; tool calls run on a
+        # worker pool, so every reader goes through execute_reader() (per-connection lock)
         # Connection health caching (OPTIMIZATION: avoid expensive CLR interop calls)
         self._last_connection_check = 0
         self._connection_healthy = False
@@ -241,35 +264,31 @@ class OptimizedQueryExecutor:
             logger.debug("Query executor linked to connection manager for dynamic connection retrieval")
         logger.debug("Query executor linked to connection state for shared table mapping cache")
 
+    def execute_reader(self, cmd: Any):
+        """
+        Context manager running cmd.ExecuteReader() on the current connection.
+
+        Holds the connection's command lock until the reader is closed, so tool
+        calls on the worker pool never interleave commands on one connection.
+        """
+        return execute_reader(cmd, self.connection)
+
     # --------------------
     # AMO/TOM helper methods
     # --------------------
     def _get_database_name(self) -> Optional[str]:
         """Resolve the current database name via ADOMD catalogs DMV."""
-        reader = None
         try:
             if not AdomdCommand:
                 return None
             # Get current connection (will be fresh from ConnectionManager)
             current_conn = self.connection
             db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
-            cmd = AdomdCommand(db_query, current_conn)
-            reader = cmd.ExecuteReader()
-            db_name = None
-            if reader.Read():
-                db_name = str(reader.GetValue(0))
-            reader.Close()
-            return db_name
+            db_name = read_scalar(AdomdCommand(db_query, current_conn), current_conn)
+            return None if db_name is None else str(db_name)
         except Exception as e:
             logger.debug(f"_get_database_name failed: {e}")
             return None
-        finally:
-            # Ensure reader is always closed, even on exception
-            if reader is not None:
-                try:
-                    reader.Close()
-                except Exception:
-                    pass
 
     def _connect_amo_server_db(self):
         """Return (server, database) using AMO/TOM or (None, None) if unavailable."""
@@ -626,52 +645,18 @@ class OptimizedQueryExecutor:
             # FIX: Set to None instead of {} to allow retry on next call
             self._table_id_by_name, self._table_name_by_id = None, None
 
-    def _cache_get(self, key: Tuple[str, int]) -> Optional[Dict[str, Any]]:
-        """Get cached item if not expired; maintains LRU order."""
-        if self.cache_ttl_seconds <= 0:
-            return None
-        item = self.query_cache.get(key)
-        if not item:
-            return None
-        ts = item.get('__cached_at__')
-        if ts is None:
-            # Invalid cache record; drop it
-            try:
-                del self.query_cache[key]
-            except Exception:
-                pass
-            return None
-        age = time.time() - ts
-        if age > self.cache_ttl_seconds:
-            # Expired
-            try:
-                del self.query_cache[key]
-            except Exception:
-                pass
-            return None
-        # Refresh LRU order
-        self.query_cache.move_to_end(key)
-        # Return a shallow copy with cache metadata
-        res = dict(item)
-        res.setdefault('cache', {})
-        res['cache'].update({'hit': True, 'age_seconds': round(age, 3)})
-        return res
+    @property
+    def cache_ttl_seconds(self) -> int:
+        """TTL of cached results whose model version is unknown (0 disables the cache)."""
+        return self.query_cache.ttl_seconds
+
+    @cache_ttl_seconds.setter
+    def cache_ttl_seconds(self, value: int) -> None:
+        self.query_cache.ttl_seconds = max(0, int(value or 0))
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Return cache statistics and configuration."""
-        try:
-            return {
-                'success': True,
-                'size': len(self.query_cache),
-                'max_items': self.max_cache_items,
-                'ttl_seconds': self.cache_ttl_seconds,
-                'hits': self.cache_hits,
-                'misses': self.cache_misses,
-                'bypassed': self.cache_bypass,
-                'enabled': self.cache_ttl_seconds > 0,
-            }
-        except Exception as e:
-            return {'success': False, 'error': str(e)}
+        return self.query_cache.get_stats()
 
     def _get_table_id_from_name(self, table_name: str) -> Optional[int]:
         """
@@ -684,6 +669,9 @@ class OptimizedQueryExecutor:
             Numeric table ID or None if not found
         """
         try:
+            catalog = get_model_catalog(self)
+            if catalog is not None:
+                return catalog.table_id_by_name.get(table_name)
             self._ensure_table_mappings()
             return (self._table_id_by_name or {}).get(table_name)
         except Exception as e:
@@ -693,6 +681,9 @@ class OptimizedQueryExecutor:
     def _get_table_name_from_id(self, table_id: Any) -> Optional[str]:
         """Map numeric/guid TableID back to human-readable table name."""
         try:
+            catalog = get_model_catalog(self)
+            if catalog is not None:
+                return catalog.table_name_by_id.get(table_id)
             self._ensure_table_mappings()
             return (self._table_name_by_id or {}).get(table_id)
         except Exception:
@@ -729,6 +720,9 @@ class OptimizedQueryExecutor:
     def _get_column_name_from_id(self, column_id: Any) -> Optional[str]:
         """Map numeric/guid ColumnID back to human-readable column name."""
         try:
+            catalog = get_model_catalog(self)
+            if catalog is not None:
+                return catalog.column_name_by_id.get(column_id)
             self._ensure_column_mappings()
             return (self._column_name_by_id or {}).get(column_id)
         except Exception:
@@ -844,28 +838,28 @@ class OptimizedQueryExecutor:
                 return {}
 
             # Execute batched query
-            result = self.validate_and_execute_dax(dax_query, top_n=0, bypass_cache=True)
+            result = self.validate_and_execute_dax(dax_query, top_n=0, bypass_cache=True, columnar=True)
 
             if not result.get('success'):
                 error_msg = result.get('error', 'Unknown error')
                 logger.warning(f"Batched row count query failed: {error_msg}")
                 return {}
 
-            # Parse results into table → count mapping
-            rows = result.get('rows', [])
+            # Parse results into table → count mapping (columns match with or without brackets)
+            result_set = result['result_set']
             row_counts = {}
+            try:
+                names = result_set.column('Table')
+                counts = result_set.column('Count')
+            except KeyError as e:
+                logger.warning(f"Batched row count result missing column: {e}")
+                return {}
 
-            for row in rows:
-                # Extract table name and count from result row
-                # Try different possible column name formats
-                table_name = (row.get('[Table]') or row.get('Table') or
-                            row.get('[Table_Name]') or row.get('Table_Name'))
-                count_value = (row.get('[Count]') or row.get('Count') or
-                              row.get('[RowCount]') or row.get('RowCount'))
-
-                if table_name and count_value is not None:
+            for table_name, count_value in zip(names, counts):
+                if table_name:
                     try:
-                        row_counts[table_name] = int(count_value)
+                        # COUNTROWS of an empty table is blank
+                        row_counts[table_name] = int(count_value or 0)
                     except (ValueError, TypeError):
                         row_counts[table_name] = 0
                         logger.warning(f"Could not convert count for table '{table_name}': {count_value}")
@@ -974,25 +968,13 @@ class OptimizedQueryExecutor:
             logger.error(f"Error fetching row counts via DAX: {e}", exc_info=True)
             return {}
 
-    def _cache_set(self, key: Tuple[str, int], value: Dict[str, Any]) -> None:
-        """Insert item into cache and enforce size limit."""
-        if self.cache_ttl_seconds <= 0:
-            return
-        try:
-            cached = dict(value)
-            cached['__cached_at__'] = time.time()
-            self.query_cache[key] = cached
-            self.query_cache.move_to_end(key)
-            if len(self.query_cache) > self.max_cache_items:
-                self.query_cache.popitem(last=False)
-        except Exception:
-            pass
-
     def flush_cache(self) -> Dict[str, Any]:
-        """Clear the in-memory query cache and return stats."""
+        """Clear the in-memory query cache (and the metadata catalog and search index) and return stats."""
         try:
             size_before = len(self.query_cache)
-            self.query_cache.clear()
+            self.query_cache.flush()
+            invalidate_model_catalog(self)
+            invalidate_live_search_index(self)
             return {'success': True, 'cleared_items': size_before, 'cache_enabled': self.cache_ttl_seconds > 0}
         except Exception as e:
             logger.error(f"Error flushing cache: {e}")
@@ -1065,6 +1047,9 @@ class OptimizedQueryExecutor:
             Query result dictionary with Table column instead of TableID
         """
         try:
+            # Unfiltered (or table-scoped) TABLES/COLUMNS/MEASURES/RELATIONSHIPS come from the shared catalog
+            catalog_eligible = not filter_expr and function_name.upper() in CATALOG_FUNCTIONS
+
             # If table_name is provided, look up the numeric TableID and build filter
             if table_name:
                 table_id = self._get_table_id_from_name(table_name)
@@ -1095,6 +1080,21 @@ class OptimizedQueryExecutor:
                     # Use high default to ensure all measures/columns are fetched
                     top_n = config.get('query.default_info_limit', 10000)
 
+            if catalog_eligible:
+                catalog = get_model_catalog(self)
+                rows = catalog.rows(function_name, table_name) if catalog is not None else None
+                if rows is not None:
+                    if exclude_columns:
+                        rows = [{k: v for k, v in row.items() if k not in exclude_columns} for row in rows]
+                    rows = rows[:max(int(top_n), 0)]
+                    return {
+                        'success': True,
+                        'columns': list(rows[0].keys()) if rows else [],
+                        'rows': rows,
+                        'row_count': len(rows),
+                        'source': 'model_catalog'
+                    }
+
 # Prefer plain INFO.* for broad compatibility; optionally attempt selective projection
             inner = f"INFO.{function_name}()"
             # Apply TOPN limit to prevent token overflow
@@ -1299,6 +1299,10 @@ class OptimizedQueryExecutor:
             Search results dictionary
         """
         try:
+            index = get_live_search_index(self)
+            if index is not None:
+                return SearchHelper.search_measures_indexed(index, search_text, search_in_expression, search_in_name)
+
             escaped_text = self._escape_dax_string(search_text)
             conditions = []
 
@@ -1335,6 +1339,10 @@ class OptimizedQueryExecutor:
             Search results dictionary
         """
         try:
+            index = get_live_search_index(self)
+            if index is not None:
+                return SearchHelper.search_objects_indexed(index, pattern, object_types)
+
             search_text = pattern.replace('*', '').replace('?', '')
             escaped_text = self._escape_dax_string(search_text)
             results_list = []
@@ -1680,8 +1688,8 @@ class OptimizedQueryExecutor:
         Returns:
             Prepared query string
         """
-        # Auto-add EVALUATE if needed
-        if not query.strip().upper().startswith('EVALUATE'):
+        # Auto-add EVALUATE if needed (leading comments do not count as the query start)
+        if not normalize_query(query).upper().startswith('EVALUATE'):
             if self._is_table_expression(query):
                 query = f"EVALUATE TOPN({top_n}, {query})" if top_n > 0 else f"EVALUATE {query}"
             else:
@@ -1689,7 +1697,8 @@ class OptimizedQueryExecutor:
         return query
 
     def _check_dax_cache(self, cache_key: Tuple[str, int], original_query: str,
-                         query: str, top_n: int, bypass_cache: bool) -> Optional[Dict[str, Any]]:
+                         query: str, top_n: int, bypass_cache: bool,
+                         model_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Check cache for existing query results.
 
@@ -1699,24 +1708,18 @@ class OptimizedQueryExecutor:
             query: Prepared query
             top_n: Row limit
             bypass_cache: Whether to bypass cache
+            model_version: Current model version (None when unknown)
 
         Returns:
             Cached result if found, None otherwise
         """
         if bypass_cache:
-            try:
-                self.cache_bypass += 1
-            except Exception:
-                pass
+            self.query_cache.bypassed += 1
             return None
 
-        cached = self._cache_get(cache_key)
+        cached = self.query_cache.get(cache_key, model_version)
         if cached is not None:
-            # Count hit and emit history event
-            try:
-                self.cache_hits += 1
-            except Exception:
-                pass
+            # Emit history event
             try:
                 if callable(self._history_logger):
                     self._history_logger({
@@ -1728,73 +1731,75 @@ class OptimizedQueryExecutor:
                         'execution_time_ms': 0,
                         'cached': True,
                         'columns': cached.get('columns'),
-                        'sample_rows': cached.get('rows', [])[: min(5, len(cached.get('rows', [])))],
+                        'sample_rows': (
+                            cached['result_set'].head(5) if 'result_set' in cached
+                            else cached.get('rows', [])[:5]
+                        ),
                     })
             except Exception:
                 pass
             return cached
-        else:
-            # Cache miss
-            try:
-                self.cache_misses += 1
-            except Exception:
-                pass
-            return None
+        return None
+
+    def set_command_factory(self, factory: Any) -> None:
+        """
+        Replace the DAX command factory.
+
+        Args:
+            factory: Callable (query, connection) -> command with ExecuteReader()
+                and an optional CommandTimeout attribute
+        """
+        self._command_factory = factory
 
-    def _execute_dax_reader(self, cmd: Any) -> Tuple[List[str], List[Dict[str, Any]], float]:
+    def _execute_dax_reader(self, cmd: Any) -> Tuple[List[str], List[List[Any]], float]:
         """
-        Execute ADOMD command and read results.
+        Execute ADOMD command and read results column by column.
 
         Args:
             cmd: ADOMD command to execute
 
         Returns:
-            Tuple of (columns, rows, execution_time_ms)
+            Tuple of (columns, raw column arrays, execution_time_ms)
         """
         start_time = time.time()
-        reader = None
-        try:
-            reader = cmd.ExecuteReader()
-
-            # Get columns
-            columns = [reader.GetName(i) for i in range(reader.FieldCount)]
-            rows: List[Dict[str, Any]] = []
-
-            # Read rows with proper error handling
+        with self.execute_reader(cmd) as reader:
             max_rows = getattr(QueryLimits, 'SAFETY_MAX_ROWS', 10000)
-            row_count = 0
+            columns, data = read_columns(reader, max_rows)
+        execution_time = (time.time() - start_time) * 1000
+        return columns, data, execution_time
 
-            while reader.Read() and row_count < max_rows:
-                row: Dict[str, Any] = {}
-                for i, col in enumerate(columns):
-                    try:
-                        val = reader.GetValue(i)
-                        if val is None:
-                            row[col] = None
-                        elif hasattr(val, 'isoformat'):  # DateTime
-                            row[col] = val.isoformat()
-                        else:
-                            row[col] = str(val)
-                    except Exception as col_error:
-                        logger.warning(f"Error reading column {col}: {col_error}")
-                        row[col] = "<read_error>"
-
-                rows.append(row)
-                row_count += 1
-
-            reader.Close()
-            execution_time = (time.time() - start_time) * 1000
-            return columns, rows, execution_time
+    def _build_dax_result(self, query: str, columns: List[str], data: List[List[Any]],
+                          execution_time: float, columnar: bool) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Result dictionary of a successful query.
 
-        finally:
-            # Ensure reader is always closed, even on exception
-            if reader is not None:
-                try:
-                    reader.Close()
-                except Exception:
-                    pass
+        Returns:
+            Tuple of (result, sample rows for the history log)
+        """
+        max_rows = getattr(QueryLimits, 'SAFETY_MAX_ROWS', 10000)
+        row_count = len(data[0]) if data else 0
+        result: Dict[str, Any] = {
+            'success': True,
+            'columns': columns,
+            'row_count': row_count,
+            'execution_time_ms': round(execution_time, 2),
+            'truncated': row_count >= max_rows,
+            'query': query
+        }
+        if columnar:
+            result_set = ColumnarResult.from_raw(columns, data)
+            result['format'] = 'columnar'
+            result['schema'] = result_set.schema
+            result['result_set'] = result_set
+            sample_rows = result_set.head(5)
+        else:
+            rows = legacy_rows(columns, data)
+            result['rows'] = rows
+            sample_rows = rows[:5]
+        return result, sample_rows
 
-    def validate_and_execute_dax(self, query: str, top_n: int = 0, bypass_cache: bool = False) -> Dict[str, Any]:
+    def validate_and_execute_dax(self, query: str, top_n: int = 0, bypass_cache: bool = False,
+                                 columnar: bool = False) -> Dict[str, Any]:
         """
         Validate and execute DAX query with comprehensive error handling.
 
@@ -1802,14 +1807,16 @@ class OptimizedQueryExecutor:
             query: DAX query to execute
             top_n: Optional row limit
             bypass_cache: Whether to bypass query cache
+            columnar: Return typed column arrays ('result_set', a ColumnarResult with
+                a column schema) instead of 'rows' of stringified values
 
         Returns:
             Query result dictionary with success status, data, and metadata
         """
         original_query = query
         try:
-            # Ensure ADOMD is available
-            if not ADOMD_AVAILABLE:
+            # Ensure ADOMD (or a substitute command factory) is available
+            if self._command_factory is None:
                 return {
                     'success': False,
                     'error': 'ADOMD.NET not available; cannot execute DAX',
@@ -1824,9 +1831,14 @@ class OptimizedQueryExecutor:
             # Prepare query (auto-add EVALUATE)
             query = self._prepare_dax_query(query, top_n)
 
-            # Check cache
-            cache_key = (query, int(top_n or 0))
-            cached_result = self._check_dax_cache(cache_key, original_query, query, top_n, bypass_cache)
+            # Check cache (keyed on the normalized query; the two result formats are cached separately).
+            # Entries are tagged with the model version read before execution, so a write or refresh
+            # invalidates them; the stamp itself is re-read at most every model_version_recheck_s.
+            cache_key = QueryCache.make_key(query, top_n, 'columnar' if columnar else '')
+            model_version = (get_current_model_version(self)
+                             if not bypass_cache and self.query_cache.enabled else None)
+            cached_result = self._check_dax_cache(cache_key, original_query, query, top_n, bypass_cache,
+                                                  model_version)
             if cached_result is not None:
                 return cached_result
 
@@ -1847,7 +1859,7 @@ class OptimizedQueryExecutor:
                 }
 
             # Execute query (connection errors will be caught in except block)
-            cmd = AdomdCommand(query, current_conn)  # type: ignore
+            cmd = self._command_factory(query, current_conn)
 
             # Apply command timeout if supported
             try:
@@ -1857,23 +1869,15 @@ class OptimizedQueryExecutor:
                 pass
 
             # Read results
-            columns, rows, execution_time = self._execute_dax_reader(cmd)
+            columns, data, execution_time = self._execute_dax_reader(cmd)
 
             # Build result
-            max_rows = getattr(QueryLimits, 'SAFETY_MAX_ROWS', 10000)
-            result: Dict[str, Any] = {
-                'success': True,
-                'columns': columns,
-                'rows': rows,
-                'row_count': len(rows),
-                'execution_time_ms': round(execution_time, 2),
-                'truncated': len(rows) >= max_rows,
-                'query': query
-            }
+            result, sample_rows = self._build_dax_result(query, columns, data, execution_time, columnar)
+            row_count = result['row_count']
 
             # Store in cache
             if not bypass_cache:
-                self._cache_set(cache_key, result)
+                self.query_cache.set(cache_key, result, model_version)
                 result.setdefault('cache', {})
                 result['cache'].update({'hit': False, 'ttl_seconds': self.cache_ttl_seconds})
 
@@ -1885,11 +1889,11 @@ class OptimizedQueryExecutor:
                         'final_query': query,
                         'top_n': int(top_n or 0),
                         'success': True,
-                        'row_count': len(rows),
+                        'row_count': row_count,
                         'execution_time_ms': round(execution_time, 2),
                         'cached': False,
                         'columns': columns,
-                        'sample_rows': rows[: min(5, len(rows))],
+                        'sample_rows': sample_rows,
                     })
             except Exception:
                 pass
@@ -1944,6 +1948,132 @@ class OptimizedQueryExecutor:
                 pass
             return result
 
+    def execute_dax_batch(self, queries: List[str], top_n: int = 0, bypass_cache: bool = False,
+                          columnar: bool = False) -> List[Dict[str, Any]]:
+        """
+        Execute several DAX queries, sending compatible ones in one command.
+
+        All queries are validated and looked up in the cache first. The rest
+        that consist of exactly one EVALUATE statement (and so produce exactly
+        one result set) are sent in groups of up to
+        performance.dax_batch_max_queries as one multi-EVALUATE command, and
+        the result sets are read back in order. A group whose command fails,
+        or returns a different number of result sets, is re-run query by
+        query, so every query still gets its own result or error. Queries with
+        a DEFINE block or several EVALUATE statements run on their own.
+
+        Args:
+            queries: DAX queries
+            top_n: Optional row limit applied to each query
+            bypass_cache: Whether to bypass the query cache
+            columnar: Return columnar results (see validate_and_execute_dax)
+
+        Returns:
+            One result per query, in input order, shaped like validate_and_execute_dax
+            results. Batched ones carry 'batch_size'; their execution_time_ms is the
+            time until their result set was read, after the previous one.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        if self._command_factory is None or len(queries) < 2 or not config.get('performance.dax_batching', True):
+            return [self.validate_and_execute_dax(q, top_n, bypass_cache, columnar) for q in queries]
+
+        model_version = (get_current_model_version(self)
+                         if not bypass_cache and self.query_cache.enabled else None)
+        variant = 'columnar' if columnar else ''
+        pending: List[Tuple[int, str, Tuple[str, int]]] = []
+        for i, original in enumerate(queries):
+            validation_error = self._validate_dax_syntax(original)
+            if validation_error:
+                results[i] = validation_error
+                continue
+            query = self._prepare_dax_query(original, top_n)
+            cache_key = QueryCache.make_key(query, top_n, variant)
+            cached = self._check_dax_cache(cache_key, original, query, top_n, bypass_cache, model_version)
+            if cached is not None:
+                results[i] = cached
+            elif _statement_keywords(query) != ['EVALUATE']:
+                results[i] = self.validate_and_execute_dax(original, top_n, bypass_cache, columnar)
+            else:
+                pending.append((i, query, cache_key))
+
+        group_size = max(1, int(config.get('performance.dax_batch_max_queries', 20) or 1))
+        for start in range(0, len(pending), group_size):
+            group = pending[start:start + group_size]
+            if len(group) == 1:
+                i = group[0][0]
+                results[i] = self.validate_and_execute_dax(queries[i], top_n, bypass_cache, columnar)
+                continue
+            try:
+                result_sets = self._execute_dax_batch_command([query for _, query, _ in group])
+            except Exception as e:
+                logger.debug(f"Batch of {len(group)} DAX queries failed, running them one by one: {e}")
+                for i, _, _ in group:
+                    results[i] = self.validate_and_execute_dax(queries[i], top_n, bypass_cache, columnar)
+                    results[i]['batch_fallback'] = True
+                continue
+
+            for (i, query, cache_key), (columns, data, execution_time) in zip(group, result_sets):
+                result, sample_rows = self._build_dax_result(query, columns, data, execution_time, columnar)
+                if not bypass_cache:
+                    self.query_cache.set(cache_key, result, model_version)
+                    result.setdefault('cache', {})
+                    result['cache'].update({'hit': False, 'ttl_seconds': self.cache_ttl_seconds})
+                result['batch_size'] = len(group)
+                try:
+                    if callable(self._history_logger):
+                        self._history_logger({
+                            'query': queries[i],
+                            'final_query': query,
+                            'top_n': int(top_n or 0),
+                            'success': True,
+                            'row_count': result['row_count'],
+                            'execution_time_ms': result['execution_time_ms'],
+                            'cached': False,
+                            'columns': columns,
+                            'sample_rows': sample_rows,
+                        })
+                except Exception:
+                    pass
+                results[i] = result
+        return results
+
+    def _execute_dax_batch_command(self, queries: List[str]) -> List[Tuple[List[str], List[List[Any]], float]]:
+        """
+        Run prepared EVALUATE queries as one command and read one result set per query.
+
+        Returns:
+            (columns, raw column arrays, execution_time_ms) per query; each time runs
+            from the end of the previous result set (the first includes execution start)
+
+        Raises:
+            RuntimeError: If the connection is missing or the number of result sets
+                differs from the number of queries
+        """
+        current_conn = self.connection
+        if not current_conn:
+            raise RuntimeError('No active connection available')
+        cmd = self._command_factory("\n".join(queries), current_conn)
+        try:
+            if hasattr(cmd, 'CommandTimeout'):
+                setattr(cmd, 'CommandTimeout', int(self.command_timeout_seconds))
+        except Exception:
+            pass
+
+        max_rows = getattr(QueryLimits, 'SAFETY_MAX_ROWS', 10000)
+        result_sets: List[Tuple[List[str], List[List[Any]], float]] = []
+        mark = time.perf_counter()
+        with execute_reader(cmd, current_conn) as reader:
+            for position in range(len(queries)):
+                if position and not reader.NextResult():
+                    raise RuntimeError(f"Expected {len(queries)} result sets, got {position}")
+                columns, data = read_columns(reader, max_rows)
+                now = time.perf_counter()
+                result_sets.append((columns, data, (now - mark) * 1000))
+                mark = now
+            if reader.NextResult():
+                raise RuntimeError(f"Expected {len(queries)} result sets, got more")
+        return result_sets
+
     def execute_dmv_query(self, dmv_query: str) -> Dict[str, Any]:
         """
         Execute DMV (Dynamic Management Views) query against $SYSTEM schema.
@@ -1984,39 +2114,38 @@ class OptimizedQueryExecutor:
             start_time = time.time()
 
             cmd = AdomdCommand(query, self.connection)
-            reader = cmd.ExecuteReader()
-
-            # Get column names
-            columns = []
-            for i in range(reader.FieldCount):
-                columns.append(reader.GetName(i))
-
-            # Read all rows
-            rows = []
-            while reader.Read():
-                row_dict = {}
-                for i, col_name in enumerate(columns):
-                    value = reader.GetValue(i)
-                    # Convert to Python types
-                    if value is None:
-                        row_dict[col_name] = None
-                    else:
-                        # Handle different .NET types
-                        value_str = str(value)
-                        try:
-                            # Try to convert numeric values
-                            if value_str.isdigit():
-                                row_dict[col_name] = int(value_str)
-                            elif '.' in value_str and value_str.replace('.', '').replace('-', '').isdigit():
-                                row_dict[col_name] = float(value_str)
-                            else:
+            with self.execute_reader(cmd) as reader:
+
+                # Get column names
+                columns = []
+                for i in range(reader.FieldCount):
+                    columns.append(reader.GetName(i))
+
+                # Read all rows
+                rows = []
+                while reader.Read():
+                    row_dict = {}
+                    for i, col_name in enumerate(columns):
+                        value = reader.GetValue(i)
+                        # Convert to Python types
+                        if value is None:
+                            row_dict[col_name] = None
+                        else:
+                            # Handle different .NET types
+                            value_str = str(value)
+                            try:
+                                # Try to convert numeric values
+                                if value_str.isdigit():
+                                    row_dict[col_name] = int(value_str)
+                                elif '.' in value_str and value_str.replace('.', '').replace('-', '').isdigit():
+                                    row_dict[col_name] = float(value_str)
+                                else:
+                                    row_dict[col_name] = value_str
+                            except:
                                 row_dict[col_name] = value_str
-                        except:
-                            row_dict[col_name] = value_str
 
-                rows.append(row_dict)
+                    rows.append(row_dict)
 
-            reader.Close()
             execution_time = (time.time() - start_time) * 1000  # Convert to ms
 
             logger.info(f"DMV query executed: {len(rows)} rows in {execution_time:.2f}ms")
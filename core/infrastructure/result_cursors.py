@@ -0,0 +1,330 @@
+"""
+Server-side result cursors for paginated tool results.
+
+When a paginated list has rows beyond the first page, the remaining rows
+are kept in a cursor and the continuation token names it. Follow-up pages
+are read from the cursor instead of re-running the tool (see
+server.middleware.continue_from_cursor, called by the dispatcher).
+
+Small remainders stay in memory. Large ones, or any remainder that would
+take the in-memory total past performance.result_cursor_memory_mb, are
+spilled to a temp file in a compact row format: one JSON line per row,
+a positional array when the row has the cursor's columns (in order) and
+{"v": row} otherwise. Every _CHECKPOINT_ROWS rows the byte offset is
+recorded, so a page is read by seeking, not by scanning from the start.
+
+Cursors expire after performance.result_cursor_ttl_s without access, are
+closed when their last page has been served, and the least recently used
+ones are dropped beyond performance.result_cursor_max.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config.config_manager import config
+from core.infrastructure.cache_manager import estimate_size
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINT_ROWS = 256
+
+
+class _Cursor:
+    __slots__ = ('cursor_id', 'owner', 'list_key', 'envelope', 'page_size', 'base', 'total',
+                 'rows', 'path', 'columns', 'checkpoints', 'memory_bytes', 'disk_bytes',
+                 'last_access', 'read_pos')
+
+    def __init__(self, cursor_id: str, owner: str, list_key: str, envelope: Dict[str, Any],
+                 page_size: int, base: int, total: int):
+        self.cursor_id = cursor_id
+        self.owner = owner
+        self.list_key = list_key
+        self.envelope = envelope
+        self.page_size = page_size
+        self.base = base      # absolute offset of the first stored row
+        self.total = total    # length of the original list
+        self.rows: Optional[List[Any]] = None
+        self.path: Optional[str] = None
+        self.columns: Optional[List[str]] = None
+        self.checkpoints: List[int] = []
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.last_access = time.monotonic()
+        # (row index, byte offset) after the last page read, for sequential paging
+        self.read_pos: Tuple[int, int] = (0, 0)
+
+
+class ResultCursorStore:
+    """Memory-capped, TTL-expired store of paginated result remainders."""
+
+    def __init__(self, max_memory_mb: Optional[float] = None, ttl_seconds: Optional[float] = None,
+                 spill_kb: Optional[float] = None, max_cursors: Optional[int] = None):
+        """
+        Args:
+            max_memory_mb: Memory for rows kept in memory (others are spilled)
+            ttl_seconds: Idle time after which a cursor is dropped
+            spill_kb: Remainders larger than this always go to disk
+            max_cursors: Open cursors kept (least recently used dropped first)
+        """
+        self.max_memory_bytes = int(float(max_memory_mb if max_memory_mb is not None
+                                          else config.get('performance.result_cursor_memory_mb', 32)) * 1024 * 1024)
+        self.ttl_seconds = float(ttl_seconds if ttl_seconds is not None
+                                 else config.get('performance.result_cursor_ttl_s', 600))
+        self.spill_bytes = int(float(spill_kb if spill_kb is not None
+                                     else config.get('performance.result_cursor_spill_kb', 256)) * 1024)
+        self.max_cursors = int(max_cursors if max_cursors is not None
+                               else config.get('performance.result_cursor_max', 64))
+
+        self._cursors: "OrderedDict[str, _Cursor]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._dir: Optional[str] = None
+        self._ids = itertools.count(1)
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.opened = 0
+        self.spilled = 0
+        self.pages_served = 0
+        self.expired = 0
+        self.evicted = 0
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def open(self, rows: List[Any], envelope: Dict[str, Any], owner: str, list_key: str,
+             page_size: int, base: int, total: int) -> Optional[str]:
+        """
+        Keep the rows after the first page and return the cursor id.
+
+        Args:
+            rows: Remaining rows (starting at absolute offset base)
+            envelope: The rest of the first page's result, repeated on every page
+            owner: Tool the cursor belongs to
+            list_key: Result key the rows belong under
+            page_size: Page size of the first call (default for later pages)
+            base: Absolute offset of rows[0]
+            total: Length of the full list
+
+        Returns:
+            Cursor id, or None if the rows could not be stored
+        """
+        cursor_id = f"{next(self._ids):x}{uuid.uuid4().hex[:12]}"
+        cursor = _Cursor(cursor_id, owner, list_key, envelope, page_size, base, total)
+        size = estimate_size(rows) + estimate_size(envelope)
+        with self._lock:
+            self._expire()
+            spill = size > self.spill_bytes or self.memory_bytes + size > self.max_memory_bytes
+        try:
+            if spill:
+                self._spill(cursor, rows)
+                cursor.memory_bytes = estimate_size(envelope) + 8 * len(cursor.checkpoints)
+            else:
+                cursor.rows = list(rows)
+                cursor.memory_bytes = size
+        except Exception as e:
+            logger.warning(f"Could not store result cursor: {e}")
+            self._delete_file(cursor)
+            return None
+
+        with self._lock:
+            self._cursors[cursor_id] = cursor
+            self.memory_bytes += cursor.memory_bytes
+            self.disk_bytes += cursor.disk_bytes
+            self.opened += 1
+            self.spilled += bool(spill)
+            while len(self._cursors) > max(1, self.max_cursors):
+                self._drop(next(iter(self._cursors)))
+                self.evicted += 1
+        return cursor_id
+
+    def _spill_dir(self) -> str:
+        if self._dir is None:
+            self._dir = tempfile.mkdtemp(prefix="pbixray_cursors_")
+        return self._dir
+
+    def _spill(self, cursor: _Cursor, rows: List[Any]) -> None:
+        first = rows[0] if rows else None
+        columns = list(first) if isinstance(first, dict) else None
+        with self._lock:
+            directory = self._spill_dir()
+        path = os.path.join(directory, f"{cursor.cursor_id}.jsonl")
+        position = 0
+        checkpoints = []
+        with open(path, 'wb') as f:
+            for i, row in enumerate(rows):
+                if i % _CHECKPOINT_ROWS == 0:
+                    checkpoints.append(position)
+                if columns is not None and isinstance(row, dict) and list(row) == columns:
+                    record = [row[c] for c in columns]
+                else:
+                    record = {'v': row}
+                line = (json.dumps(record, default=str, separators=(',', ':')) + '\n').encode('utf-8')
+                f.write(line)
+                position += len(line)
+        cursor.path = path
+        cursor.columns = columns
+        cursor.checkpoints = checkpoints
+        cursor.disk_bytes = position
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def read_page(self, cursor_id: str, offset: int, page_size: Optional[int] = None,
+                  owner: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        One page of a cursor.
+
+        Args:
+            cursor_id: Id returned by open()
+            offset: Absolute offset of the first row of the page
+            page_size: Rows per page (None: the first call's page size)
+            owner: Tool asking; a cursor of another tool is not served
+
+        Returns:
+            {'cursor': ..., 'rows': [...], 'next_offset': int or None}, or None if
+            the cursor is unknown, expired, owned by another tool or the offset
+            is outside it
+        """
+        with self._lock:
+            self._expire()
+            cursor = self._cursors.get(cursor_id)
+            if cursor is None or (owner is not None and cursor.owner != owner):
+                return None
+            if offset < cursor.base or offset > cursor.total:
+                return None
+            cursor.last_access = time.monotonic()
+            self._cursors.move_to_end(cursor_id)
+
+        size = int(page_size or cursor.page_size)
+        start = offset - cursor.base
+        count = min(size, cursor.total - offset)
+        try:
+            rows = cursor.rows[start:start + count] if cursor.rows is not None else self._read_file(cursor, start, count)
+        except Exception as e:
+            logger.warning(f"Result cursor {cursor_id} unreadable: {e}")
+            self.close(cursor_id)
+            return None
+
+        end = offset + len(rows)
+        next_offset = end if end < cursor.total else None
+        with self._lock:
+            self.pages_served += 1
+            if next_offset is None:
+                self._drop(cursor_id)
+        return {'cursor': cursor, 'rows': rows, 'next_offset': next_offset}
+
+    def _read_file(self, cursor: _Cursor, start: int, count: int) -> List[Any]:
+        if count <= 0:
+            return []
+        read_index, read_offset = cursor.read_pos
+        if read_index != start or read_offset == 0:
+            checkpoint = min(start // _CHECKPOINT_ROWS, len(cursor.checkpoints) - 1)
+            read_index, read_offset = checkpoint * _CHECKPOINT_ROWS, cursor.checkpoints[checkpoint]
+        rows: List[Any] = []
+        columns = cursor.columns
+        with open(cursor.path, 'rb') as f:
+            f.seek(read_offset)
+            for _ in range(start - read_index):
+                f.readline()
+            for _ in range(count):
+                line = f.readline()
+                if not line:
+                    break
+                record = json.loads(line)
+                rows.append(dict(zip(columns, record)) if isinstance(record, list) else record['v'])
+            cursor.read_pos = (start + len(rows), f.tell())
+        return rows
+
+    # ------------------------------------------------------------------
+    # Lifetime
+    # ------------------------------------------------------------------
+
+    def close(self, cursor_id: str) -> None:
+        with self._lock:
+            self._drop(cursor_id)
+
+    def _drop(self, cursor_id: str) -> None:
+        cursor = self._cursors.pop(cursor_id, None)
+        if cursor is None:
+            return
+        self.memory_bytes -= cursor.memory_bytes
+        self.disk_bytes -= cursor.disk_bytes
+        cursor.rows = None
+        self._delete_file(cursor)
+
+    @staticmethod
+    def _delete_file(cursor: _Cursor) -> None:
+        if cursor.path:
+            try:
+                os.remove(cursor.path)
+            except OSError:
+                pass
+            cursor.path = None
+
+    def _expire(self) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        cutoff = time.monotonic() - self.ttl_seconds
+        # Ordered by last access: stop at the first live cursor
+        while self._cursors:
+            cursor_id, cursor = next(iter(self._cursors.items()))
+            if cursor.last_access >= cutoff:
+                break
+            self._drop(cursor_id)
+            self.expired += 1
+
+    def clear(self) -> None:
+        """Drop every cursor and the spill directory."""
+        with self._lock:
+            for cursor_id in list(self._cursors):
+                self._drop(cursor_id)
+            if self._dir is not None:
+                shutil.rmtree(self._dir, ignore_errors=True)
+                self._dir = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire()
+            spilled_open = sum(1 for c in self._cursors.values() if c.path)
+            return {
+                'open_cursors': len(self._cursors),
+                'in_memory': len(self._cursors) - spilled_open,
+                'spilled': spilled_open,
+                'memory_mb': round(self.memory_bytes / 1024 / 1024, 2),
+                'max_memory_mb': round(self.max_memory_bytes / 1024 / 1024, 2),
+                'disk_mb': round(self.disk_bytes / 1024 / 1024, 2),
+                'opened': self.opened,
+                'opened_spilled': self.spilled,
+                'pages_served': self.pages_served,
+                'expired': self.expired,
+                'evicted': self.evicted,
+                'ttl_seconds': self.ttl_seconds,
+            }
+
+
+_store: Optional[ResultCursorStore] = None
+_store_lock = threading.Lock()
+
+
+def get_result_cursor_store() -> Optional[ResultCursorStore]:
+    """Process-wide cursor store, or None when performance.result_cursors is disabled."""
+    global _store
+    if not config.get('performance.result_cursors', True):
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ResultCursorStore()
+                atexit.register(_store.clear)
+    return _store
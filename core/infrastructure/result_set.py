@@ -0,0 +1,203 @@
+"""
+Columnar result sets for DAX queries.
+
+The query executor reads ADOMD results column by column into ColumnarResult:
+one typed list per column plus a schema. Row dicts are only built when a caller
+asks for them (to_rows), and the legacy stringified rows format is produced from
+the same column arrays.
+
+The reader is anything with the ADOMD data reader surface (FieldCount, GetName,
+Read, GetValue, Close), so a pure-Python fake can stand in for ADOMD.NET.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+READ_ERROR = "<read_error>"
+
+_NATIVE_TYPES = (bool, int, float, str)
+
+
+def read_columns(reader: Any, max_rows: int) -> Tuple[List[str], List[List[Any]]]:
+    """
+    Drain an ADOMD-style reader into raw per-column value lists.
+
+    Args:
+        reader: Object exposing FieldCount, GetName(i), Read() and GetValue(i)
+        max_rows: Stop after this many rows
+
+    Returns:
+        Tuple of (column names, raw column arrays)
+    """
+    field_count = reader.FieldCount
+    columns = [reader.GetName(i) for i in range(field_count)]
+    data: List[List[Any]] = [[] for _ in range(field_count)]
+    appends = [column.append for column in data]
+    get_value = reader.GetValue
+    row_count = 0
+
+    while row_count < max_rows and reader.Read():
+        for i, append in enumerate(appends):
+            try:
+                append(get_value(i))
+            except Exception as col_error:
+                logger.warning(f"Error reading column {columns[i]}: {col_error}")
+                append(READ_ERROR)
+        row_count += 1
+
+    return columns, data
+
+
+def _decimal_to_float(value: Any) -> Any:
+    try:
+        return float(str(value))
+    except ValueError:
+        return str(value)
+
+
+def _describe(sample: Any) -> Tuple[str, Optional[Callable[[Any], Any]]]:
+    """Schema type name and converter (None if already native) for a column's first value."""
+    if isinstance(sample, bool):
+        return 'boolean', None
+    if isinstance(sample, int):
+        return 'int64', None
+    if isinstance(sample, float):
+        return 'double', None
+    if isinstance(sample, str):
+        return 'string', None
+    if hasattr(sample, 'isoformat'):
+        return 'datetime', lambda v: v.isoformat()
+    type_name = type(sample).__name__
+    if type_name == 'Decimal':
+        return 'decimal', _decimal_to_float
+    if type_name == 'DateTime' and hasattr(sample, 'ToString'):
+        return 'datetime', lambda v: v.ToString('o')
+    return type_name.lower(), str
+
+
+def _convert_column(values: List[Any], converter: Callable[[Any], Any]) -> List[Any]:
+    converted = []
+    append = converted.append
+    for value in values:
+        if value is None or type(value) in _NATIVE_TYPES:
+            append(value)
+            continue
+        try:
+            append(converter(value))
+        except Exception:
+            append(str(value))
+    return converted
+
+
+def _legacy_cell(value: Any) -> Any:
+    """Row-format value: None, ISO string for datetimes, str() for everything else."""
+    if value is None or type(value) is str:
+        return value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+class ColumnarResult:
+    """Typed column arrays with a schema; row dicts are materialized on demand."""
+
+    __slots__ = ('columns', 'schema', 'data', 'row_count', '_rows', '_positions')
+
+    def __init__(self, columns: List[str], schema: List[Dict[str, str]], data: List[List[Any]]):
+        self.columns = columns
+        self.schema = schema
+        self.data = data
+        self.row_count = len(data[0]) if data else 0
+        self._rows: Optional[List[Dict[str, Any]]] = None
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_raw(cls, columns: List[str], raw: List[List[Any]]) -> "ColumnarResult":
+        """Build typed columns from raw reader values (see read_columns)."""
+        schema: List[Dict[str, str]] = []
+        data: List[List[Any]] = []
+        for name, values in zip(columns, raw):
+            sample = next((v for v in values if v is not None and v is not READ_ERROR), None)
+            if sample is None:
+                schema.append({'name': name, 'type': 'null'})
+                data.append(values)
+                continue
+            type_name, converter = _describe(sample)
+            schema.append({'name': name, 'type': type_name})
+            data.append(values if converter is None else _convert_column(values, converter))
+        return cls(columns, schema, data)
+
+    @classmethod
+    def from_reader(cls, reader: Any, max_rows: int) -> "ColumnarResult":
+        return cls.from_raw(*read_columns(reader, max_rows))
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def index_of(self, name: str) -> int:
+        """
+        Position of a column, accepting the bare name for ADOMD's bracketed
+        and table-qualified names ('Count' matches '[Count]' and 'T[Count]').
+        """
+        if self._positions is None:
+            positions: Dict[str, int] = {}
+            for i, column in enumerate(self.columns):
+                positions.setdefault(column, i)
+                if column.endswith(']') and '[' in column:
+                    positions.setdefault(column[column.rindex('[') + 1:-1], i)
+            self._positions = positions
+        try:
+            return self._positions[name]
+        except KeyError:
+            if name.startswith('[') and name.endswith(']') and name[1:-1] in self._positions:
+                return self._positions[name[1:-1]]
+            raise KeyError(f"Column not in result: {name}") from None
+
+    def column(self, name: str) -> List[Any]:
+        """Typed values of one column."""
+        return self.data[self.index_of(name)]
+
+    def value(self, row: int, name: str, default: Any = None) -> Any:
+        try:
+            return self.data[self.index_of(name)][row]
+        except (KeyError, IndexError):
+            return default
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        columns = self.columns
+        for values in zip(*self.data):
+            yield dict(zip(columns, values))
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Typed row dicts (built once, then reused)."""
+        if self._rows is None:
+            self._rows = list(self.iter_rows())
+        return self._rows
+
+    def head(self, count: int) -> List[Dict[str, Any]]:
+        """First rows as dicts without materializing the rest."""
+        columns = self.columns
+        return [dict(zip(columns, values)) for values in zip(*(col[:count] for col in self.data))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form."""
+        return {'columns': self.columns, 'schema': self.schema, 'data': self.data, 'row_count': self.row_count}
+
+
+def legacy_rows(columns: List[str], raw: Sequence[List[Any]]) -> List[Dict[str, Any]]:
+    """Row dicts in the historical format: every non-null value stringified, dates as ISO."""
+    converted = [
+        values if all(v is None or type(v) is str for v in values) else [_legacy_cell(v) for v in values]
+        for values in raw
+    ]
+    return [dict(zip(columns, values)) for values in zip(*converted)]
+
+
+def result_rows(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Row dicts of a query result in either format."""
+    result_set = result.get('result_set')
+    if isinstance(result_set, ColumnarResult):
+        return result_set.to_rows()
+    return result.get('rows') or []
@@ -7,9 +7,13 @@ import logging
 import time
 from typing import Dict, List, Set, Tuple, Optional, Any
 from core.config.config_manager import config
+from core.infrastructure.model_catalog import get_model_catalog
+from core.infrastructure.model_version import get_current_model_version
 
 # Import from dedicated parser module (breaks circular dependency)
-from core.dax.dax_reference_parser import DaxReferenceIndex, parse_dax_references
+from core.dax.dax_reference_parser import DaxReferenceIndex
+from core.dax.dax_parse_cache import parse_dax_references_cached, flush_dax_parse_cache, get_dax_parse_cache
+from core.model.dependency_graph import DependencyGraph
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +34,30 @@ class DependencyAnalyzer:
         # Cache statistics
         self._cache_hits = 0
         self._cache_misses = 0
-    
+
+        # One-pass dependency graph (forward + reverse adjacency), shares the parse cache TTL
+        # and is rebuilt as soon as the model changes (see _model_stamp)
+        self._dep_graph: Optional[DependencyGraph] = None
+        self._dep_graph_built_at = 0.0
+        self._dep_graph_stamp: Any = None
+
+    def _model_stamp(self) -> Any:
+        """
+        Identifies the model state the graph was built from: the metadata
+        catalog generation (a new catalog is loaded after every CRUD write and
+        schema change), or the schema stamp when the catalog is disabled.
+        None when neither can be read.
+        """
+        try:
+            catalog = get_model_catalog(self.query_executor)
+            if catalog is not None:
+                return ('catalog', catalog.generation)
+            version = get_current_model_version(self.query_executor)
+        except Exception as e:
+            logger.debug(f"Model stamp unavailable: {e}")
+            return None
+        return None if version is None else ('schema', version.split('|', 1)[0])
+
     def _ensure_reference_index(self):
         """Lazily build the reference index"""
         if self._ref_index is not None:
@@ -74,10 +101,10 @@ class DependencyAnalyzer:
                 del self._parse_cache[cache_key]
                 del self._parse_cache_timestamps[cache_key]
 
-        # Cache miss - parse the DAX
+        # Cache miss - resolve through the shared persistent parse cache
         self._cache_misses += 1
         ref_index = self._ensure_reference_index()
-        refs = parse_dax_references(expression, ref_index)
+        refs = parse_dax_references_cached(expression, ref_index)
 
         # Store in cache with timestamp
         self._parse_cache[cache_key] = refs
@@ -86,6 +113,46 @@ class DependencyAnalyzer:
         logger.debug(f"DAX parse cache miss for {measure_name} (cache size: {len(self._parse_cache)})")
         return refs
 
+    def build_dependency_graph(self, measure_rows: Optional[List[Dict[str, Any]]] = None) -> DependencyGraph:
+        """
+        Build (and cache) the model-wide dependency graph in a single pass.
+
+        Every measure expression is parsed once (through the parse cache) and both
+        forward and reverse adjacency maps are built together.
+
+        Args:
+            measure_rows: Optional pre-fetched INFO.MEASURES rows; fetched if omitted
+
+        Returns:
+            DependencyGraph for the current model
+        """
+        if measure_rows is None:
+            measures_result = self.query_executor.execute_info_query("MEASURES")
+            if not measures_result.get('success'):
+                raise RuntimeError(measures_result.get('error') or 'MEASURES query failed')
+            measure_rows = measures_result.get('rows', [])
+
+        stamp = self._model_stamp()
+        if stamp != self._dep_graph_stamp and self._dep_graph_stamp is not None:
+            # Measures or columns changed: references must be resolved against the new model
+            self._ref_index = None
+            self._parse_cache.clear()
+            self._parse_cache_timestamps.clear()
+        start = time.time()
+        self._dep_graph = DependencyGraph.build(measure_rows, self._parse_dax_cached)
+        flush_dax_parse_cache()
+        self._dep_graph_built_at = time.time()
+        self._dep_graph_stamp = stamp
+        logger.debug(f"Dependency graph built for {len(self._dep_graph)} measures in {self._dep_graph_built_at - start:.2f}s")
+        return self._dep_graph
+
+    def get_dependency_graph(self) -> DependencyGraph:
+        """Return the cached dependency graph, rebuilding it when the model changed or the cache TTL has expired."""
+        if (self._dep_graph is None or time.time() - self._dep_graph_built_at > self._cache_ttl
+                or self._model_stamp() != self._dep_graph_stamp):
+            return self.build_dependency_graph()
+        return self._dep_graph
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring performance."""
         total_requests = self._cache_hits + self._cache_misses
@@ -98,7 +165,9 @@ class DependencyAnalyzer:
             'cache_misses': self._cache_misses,
             'total_requests': total_requests,
             'hit_rate_percent': round(hit_rate, 1),
-            'ttl_seconds': self._cache_ttl
+            'ttl_seconds': self._cache_ttl,
+            'graph_measures': len(self._dep_graph) if self._dep_graph is not None else 0,
+            'persistent_parse_cache': get_dax_parse_cache().get_stats()
         }
 
     def clear_cache(self) -> Dict[str, Any]:
@@ -107,6 +176,8 @@ class DependencyAnalyzer:
         self._parse_cache.clear()
         self._parse_cache_timestamps.clear()
         self._ref_index = None  # Force rebuild of reference index
+        self._dep_graph = None
+        self._dep_graph_stamp = None
         logger.info(f"Cleared DAX parse cache ({cache_size} entries) and reference index")
 
         return {
@@ -162,33 +233,15 @@ class DependencyAnalyzer:
     
     def find_measure_usage(self, table: str, measure: str) -> Dict:
         """Find where a measure is used by other measures"""
-        measures_result = self.query_executor.execute_info_query("MEASURES")
-        if not measures_result.get('success'):
-            return {'success': False, 'error': measures_result.get('error')}
-
-        all_measures = measures_result.get('rows', [])
-        usage_list = []
-
-        for m in all_measures:
-            m_table = m.get('Table', '')
-            m_name = m.get('Name', '')
-            if m_table == table and m_name == measure:
-                continue
-
-            expression = m.get('Expression', '')
-
-            # Use cached parsing (PERFORMANCE IMPROVEMENT)
-            measure_key = f"{m_table}[{m_name}]"
-            refs = self._parse_dax_cached(measure_key, expression)
+        try:
+            graph = self.get_dependency_graph()
+        except RuntimeError as e:
+            return {'success': False, 'error': str(e)}
 
-            for ref_table, ref_name in refs.get('measures', []):
-                if (ref_table == table or ref_table == '') and ref_name == measure:
-                    usage_list.append({
-                        'table': m_table,
-                        'measure': m_name,
-                        'display_folder': m.get('DisplayFolder', '') or ''
-                    })
-                    break
+        usage_list = [
+            {'table': m['table'], 'measure': m['name'], 'display_folder': m['display_folder']}
+            for m in graph.get_measure_users(table, measure)
+        ]
 
         return {
             'success': True,
@@ -199,6 +252,11 @@ class DependencyAnalyzer:
     
     def build_dependency_tree(self, table: str, measure: str, max_depth: int = 5) -> Dict:
         """Build a full dependency tree for a measure"""
+        try:
+            graph = self.get_dependency_graph()
+        except RuntimeError:
+            graph = None
+
         def recurse(tbl, msr, depth, visited):
             if depth > max_depth:
                 return {'table': tbl, 'measure': msr, 'max_depth_reached': True}
@@ -208,13 +266,20 @@ class DependencyAnalyzer:
                 return {'table': tbl, 'measure': msr, 'circular': True}
 
             visited.add(key)
-            deps_result = self.analyze_measure_dependencies(tbl, msr)
-
-            if not deps_result.get('success'):
-                return {'table': tbl, 'measure': msr, 'error': deps_result.get('error')}
+            node = graph.get_measure(tbl, msr) if graph is not None else None
+            if node is not None:
+                expression = node['expression']
+                referenced_measures = graph.get_references(tbl, msr).get('measures', [])
+            else:
+                # Not in the graph (e.g. created since it was built) - query directly
+                deps_result = self.analyze_measure_dependencies(tbl, msr)
+                if not deps_result.get('success'):
+                    return {'table': tbl, 'measure': msr, 'error': deps_result.get('error')}
+                expression = deps_result.get('expression', '')
+                referenced_measures = deps_result.get('referenced_measures', [])
 
             children = []
-            for dep_table, dep_name in deps_result.get('referenced_measures', []):
+            for dep_table, dep_name in referenced_measures:
                 if dep_table:
                     child = recurse(dep_table, dep_name, depth + 1, visited.copy())
                     children.append(child)
@@ -222,7 +287,7 @@ class DependencyAnalyzer:
             return {
                 'table': tbl,
                 'measure': msr,
-                'expression': deps_result.get('expression', ''),
+                'expression': expression,
                 'dependencies': children,
                 'depth': depth
             }
@@ -306,7 +371,8 @@ class DependencyAnalyzer:
             direct_dependents = usage_result.get('used_by', [])
             direct_count = len(direct_dependents)
 
-            # Calculate transitive dependents (recursive depth search)
+            # Calculate transitive dependents (depth-limited walk over the reverse graph)
+            graph = self.get_dependency_graph()
             all_dependents = set()
             visited = set()
 
@@ -318,12 +384,9 @@ class DependencyAnalyzer:
                     return
                 visited.add(key)
 
-                usage = self.find_measure_usage(t, m)
-                if usage.get('success'):
-                    for dep in usage.get('used_by', []):
-                        dep_key = f"{dep['table']}[{dep['measure']}]"
-                        all_dependents.add(dep_key)
-                        find_transitive_dependents(dep['table'], dep['measure'], current_depth + 1)
+                for dep in graph.get_measure_users(t, m):
+                    all_dependents.add(f"{dep['table']}[{dep['name']}]")
+                    find_transitive_dependents(dep['table'], dep['name'], current_depth + 1)
 
             # Start recursive search
             find_transitive_dependents(table, measure, 0)
@@ -1002,11 +1065,12 @@ class DependencyAnalyzer:
             top_hubs = [{'measure': k, 'dependents': v} for k, v in sorted_hubs[:10] if v > 0]
 
             # Find orphans (measures with no dependents and no dependencies)
+            graph = self.get_dependency_graph()
             orphans = []
             for m in measure_list:
                 key = m['key']
-                deps = self.analyze_measure_dependencies(m['table'], m['name'])
-                has_dependencies = bool(deps.get('referenced_measures', []))
+                refs = graph.get_references(m['table'], m['name']) or {}
+                has_dependencies = bool(refs.get('measures', []))
                 has_dependents = hub_scores.get(key, 0) > 0
                 if not has_dependencies and not has_dependents:
                     orphans.append(m)
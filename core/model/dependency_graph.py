@@ -0,0 +1,130 @@
+"""
+Measure dependency graph for Power BI models.
+
+Parses every measure expression exactly once and builds forward and reverse
+adjacency maps in a single pass:
+- measure -> referenced measures / columns (forward)
+- measure -> measures that reference it (reverse)
+- column  -> measures that reference it (reverse)
+
+Downstream lookups (find_measure_usage, impact scores, dependency trees) become
+O(degree) dictionary lookups instead of re-scanning every measure in the model.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (table, name) as it appears in parsed DAX references
+RefKey = Tuple[str, str]
+
+
+class DependencyGraph:
+    """Forward and reverse dependency adjacency maps for all measures in a model."""
+
+    def __init__(self) -> None:
+        # Measure rows in model order: {'table', 'name', 'expression', 'display_folder'}
+        self.measures: List[Dict[str, str]] = []
+        self._measure_index: Dict[RefKey, int] = {}
+        self._name_to_table: Dict[str, str] = {}
+
+        # Forward adjacency (indexed by measure position)
+        self._refs: List[Dict[str, Any]] = []
+
+        # Reverse adjacency: reference key -> positions of measures using it (ascending)
+        self._measure_users: Dict[RefKey, List[int]] = {}
+        self._column_users: Dict[RefKey, List[int]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        measure_rows: Iterable[Dict[str, Any]],
+        parse_fn: Callable[[str, str], Dict[str, Any]],
+    ) -> "DependencyGraph":
+        """
+        Build the graph from INFO.MEASURES rows in one pass.
+
+        Args:
+            measure_rows: Measure rows with 'Table', 'Name', 'Expression' (bracketed keys also accepted)
+            parse_fn: Callable (measure_key, expression) -> parsed references dict
+
+        Returns:
+            Populated DependencyGraph
+        """
+        graph = cls()
+        for row in measure_rows or []:
+            table = row.get('Table', '') or row.get('[Table]', '') or ''
+            name = row.get('Name', '') or row.get('[Name]', '') or ''
+            if not table or not name or (table, name) in graph._measure_index:
+                continue
+
+            expression = row.get('Expression', '') or row.get('[Expression]', '') or ''
+            idx = len(graph.measures)
+            graph.measures.append({
+                'table': table,
+                'name': name,
+                'expression': expression,
+                'display_folder': row.get('DisplayFolder', '') or row.get('[DisplayFolder]', '') or '',
+            })
+            graph._measure_index[(table, name)] = idx
+            graph._name_to_table.setdefault(' '.join(name.lower().split()), table)
+
+            refs = parse_fn(f"{table}[{name}]", expression)
+            graph._refs.append(refs)
+
+            for ref in set(map(tuple, refs.get('measures', []))):
+                graph._measure_users.setdefault(ref, []).append(idx)
+            for ref in set(map(tuple, refs.get('columns', []))):
+                graph._column_users.setdefault(ref, []).append(idx)
+
+        logger.debug(
+            f"Built dependency graph: {len(graph.measures)} measures, "
+            f"{sum(len(v) for v in graph._measure_users.values())} measure edges, "
+            f"{sum(len(v) for v in graph._column_users.values())} column edges"
+        )
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.measures)
+
+    def has_measure(self, table: str, name: str) -> bool:
+        return (table, name) in self._measure_index
+
+    def get_measure(self, table: str, name: str) -> Optional[Dict[str, str]]:
+        idx = self._measure_index.get((table, name))
+        return self.measures[idx] if idx is not None else None
+
+    def get_references(self, table: str, name: str) -> Optional[Dict[str, Any]]:
+        """Parsed references of a measure (forward edges), or None if unknown."""
+        idx = self._measure_index.get((table, name))
+        return self._refs[idx] if idx is not None else None
+
+    def resolve_measure_table(self, name: str) -> str:
+        """Home table of a measure by (normalized) name, or '' if unknown."""
+        return self._name_to_table.get(' '.join((name or '').lower().split()), '')
+
+    def get_measure_users(self, table: str, name: str) -> List[Dict[str, str]]:
+        """
+        Measures that reference table[name], in model order, excluding the measure itself.
+
+        Unqualified references (empty table) to the same name also count, matching
+        how DAX resolves [Measure] references.
+        """
+        qualified = self._measure_users.get((table, name), [])
+        unqualified = self._measure_users.get(('', name), []) if table else []
+        self_idx = self._measure_index.get((table, name))
+        return [self.measures[i] for i in _merge_positions(qualified, unqualified) if i != self_idx]
+
+    def get_column_users(self, table: str, column: str) -> List[Dict[str, str]]:
+        """Measures that reference the column table[column], in model order."""
+        return [self.measures[i] for i in self._column_users.get((table, column), [])]
+
+
+def _merge_positions(a: List[int], b: List[int]) -> List[int]:
+    """Merge two ascending position lists into one ascending list without duplicates."""
+    if not b:
+        return a
+    if not a:
+        return b
+    return sorted(set(a).union(b))
@@ -18,7 +18,13 @@ from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 import os
 
+from core.config.config_manager import config
+from core.infrastructure.adomd_commands import read_scalar
+from core.infrastructure.cancellation import current_cancellation_token
+from core.infrastructure.model_catalog import get_model_catalog
+from .object_index import INDEX_FILE_NAME, build_object_index
 from .pbip_reader import PBIPReader
+from .sample_data_extractor import SampleDataExtractor
 from .hybrid_structures import *
 from core.utilities.json_utils import dumps_json, HAS_ORJSON
 from core.pbip.pbip_dependency_engine import PbipDependencyEngine
@@ -157,16 +163,12 @@ class HybridAnalyzer:
                     logger.info(f"Step 2/3: Querying for actual database GUID...")
                     cmd = temp_conn.CreateCommand()
                     cmd.CommandText = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
-                    reader = cmd.ExecuteReader()
-
-                    actual_database = None
-                    if reader.Read():
-                        actual_database = reader[0]
+                    actual_database = read_scalar(cmd, temp_conn)
+                    if actual_database:
                         logger.info(f"  ✓ Found database GUID: {actual_database}")
                     else:
                         logger.warning(f"  ✗ No database found in catalog query")
 
-                    reader.Close()
                     temp_conn.Close()
                     logger.info(f"  ✓ Temporary connection closed")
 
@@ -226,6 +228,15 @@ class HybridAnalyzer:
 
         logger.info("  - Fetching all metadata from live model (consolidated queries)...")
 
+        # Shared per-connection catalog (already loaded if another tool read the metadata)
+        catalog = get_model_catalog(self.query_executor)
+        if catalog is not None:
+            for key in ("tables", "columns", "measures", "relationships"):
+                if self._metadata_cache[key] is None:
+                    self._metadata_cache[key] = catalog.rows(key.upper())
+                    logger.info(f"    ✓ Cached {len(self._metadata_cache[key])} {key} (model catalog)")
+            return
+
         # Fetch tables
         if self._metadata_cache["tables"] is None:
             tables_result = self.query_executor.validate_and_execute_dax("EVALUATE INFO.TABLES()", top_n=0, bypass_cache=True)
@@ -282,6 +293,7 @@ class HybridAnalyzer:
             Export result dictionary
         """
         start_time = time.time()
+        token = current_cancellation_token()
 
         # Progress reporting helper
         def report_progress(step: str, progress: float, message: str = ""):
@@ -388,6 +400,12 @@ class HybridAnalyzer:
             "measures"
         )
 
+        # Name -> file/byte range index so HybridReader can seek to single definitions
+        try:
+            self._write_json(self.analysis_dir / INDEX_FILE_NAME, build_object_index(tmdl_path))
+        except Exception as e:
+            logger.warning(f"  - Object index not written: {e}")
+
         # Generate comprehensive dependency analysis using PbipDependencyEngine
         report_progress("dependencies", 0.55, "Running dependency analysis")
         logger.info("  - Running comprehensive dependency analysis...")
@@ -433,6 +451,9 @@ class HybridAnalyzer:
                 sample_compression
             )
 
+        # Sample extraction stops early when the tool's budget expires
+        stopped_at = "sample_data" if self.has_connection and token.cancelled else None
+
         report_progress("finalizing", 0.95, "Finalizing export")
 
         export_time = time.time() - start_time
@@ -461,7 +482,7 @@ class HybridAnalyzer:
                 connection_status["server"] = self.server
                 connection_status["database"] = self.database[:60] + "..." if len(self.database or "") > 60 else self.database
 
-        return {
+        result = {
             "success": True,
             "output_path": str(self.output_dir),
             "connection_status": connection_status,
@@ -504,6 +525,9 @@ class HybridAnalyzer:
                 "tmdl_strategy": tmdl_result["strategy"]
             }
         }
+        if stopped_at:
+            token.mark_partial(result, stopped_at)
+        return result
 
     def _generate_metadata(
         self,
@@ -1547,7 +1571,7 @@ class HybridAnalyzer:
         compression: str
     ) -> int:
         """
-        Extract sample data for tables with file size management
+        Extract sample data for tables (concurrent queries, streamed parquet parts)
 
         Args:
             tables: List of table names
@@ -1555,7 +1579,7 @@ class HybridAnalyzer:
             compression: Compression algorithm
 
         Returns:
-            Number of parquet files created
+            Number of tables written to parquet
         """
         if not self.query_executor:
             logger.warning("✗ No query executor available - skipping sample data extraction")
@@ -1563,133 +1587,37 @@ class HybridAnalyzer:
             return 0
 
         try:
-            import polars as pl
+            import polars as pl  # noqa: F401
         except ImportError:
             logger.warning("✗ Polars library not available - skipping sample data extraction")
             logger.warning("  Install polars with: pip install polars")
             return 0
 
-        parquet_count = 0
-        skipped_tables = {
-            "measures_only": [],
-            "empty": [],
-            "failed": [],
-            "too_large": []
-        }
-        logger.info(f"Extracting sample data for {len(tables)} tables (max {sample_rows} rows per table)...")
-
-        for idx, table in enumerate(tables, 1):
-            try:
-                # Escape single quotes in table and column names
-                escaped_table = table.replace("'", "''")
-
-                # Get physical columns (exclude calculated columns) to avoid calculated column errors
-                physical_columns = self._get_physical_columns(table)
-
-                # Build DAX query
-                if physical_columns:
-                    # Use SELECTCOLUMNS with only physical columns to avoid calculated column errors
-                    # Limit to first 50 columns to avoid query length issues
-                    columns_to_query = physical_columns[:50]
-                    column_selects = ", ".join([f'"{col}", [{col}]' for col in columns_to_query])
-                    dax_query = f"EVALUATE SELECTCOLUMNS('{escaped_table}', {column_selects})"
-                else:
-                    # Fallback to simple EVALUATE (for tables where we couldn't get column info)
-                    dax_query = f"EVALUATE '{escaped_table}'"
-
-                # Execute query
-                result = self.query_executor.validate_and_execute_dax(dax_query, top_n=sample_rows, bypass_cache=True)
-
-                if not result.get('success'):
-                    error_msg = result.get('error', '')
-
-                    # Check if it's a measures-only table (no columns)
-                    if 'cannot be used in computations because it does not have any columns' in error_msg:
-                        logger.debug(f"  [{idx}/{len(tables)}] - Skipping '{table}' (measures-only table)")
-                        skipped_tables["measures_only"].append(table)
-                        continue
-
-                    # If SELECTCOLUMNS failed, try simple EVALUATE as fallback
-                    if physical_columns and ('SELECTCOLUMNS' in error_msg or 'syntax' in error_msg.lower()):
-                        logger.debug(f"  [{idx}/{len(tables)}] - SELECTCOLUMNS failed, trying simple EVALUATE...")
-                        dax_query = f"EVALUATE '{escaped_table}'"
-                        result = self.query_executor.validate_and_execute_dax(dax_query, top_n=sample_rows, bypass_cache=True)
-
-                    # If calculated column error, exclude calculated columns and query only physical columns
-                    if not result.get('success') and 'calculated column' in error_msg:
-                        logger.info(f"  [{idx}/{len(tables)}] - Calculated column error in '{table}', retrying with physical columns only...")
-
-                        # Get physical columns (if not already retrieved)
-                        if not physical_columns:
-                            physical_columns = self._get_physical_columns(table)
-
-                        if physical_columns:
-                            # Build SELECTCOLUMNS with ONLY physical columns (no calculated columns)
-                            # Limit to first 100 columns to avoid query too long
-                            columns_to_query = physical_columns[:100]
-                            column_selects = ", ".join([f'"{col}", [{col}]' for col in columns_to_query])
-                            dax_query = f"EVALUATE SELECTCOLUMNS('{escaped_table}', {column_selects})"
-                            result = self.query_executor.validate_and_execute_dax(dax_query, top_n=sample_rows, bypass_cache=True)
-
-                            # If SELECTCOLUMNS still fails, try with fewer rows
-                            if not result.get('success'):
-                                logger.info(f"  [{idx}/{len(tables)}] - Still failing, retrying with 100 rows...")
-                                result = self.query_executor.validate_and_execute_dax(dax_query, top_n=100, bypass_cache=True)
-                        else:
-                            logger.warning(f"  [{idx}/{len(tables)}] - Could not determine physical columns for '{table}'")
-
-                    if not result.get('success'):
-                        logger.warning(f"  [{idx}/{len(tables)}] ✗ Failed to extract from '{table}': {result.get('error')}")
-                        skipped_tables["failed"].append(f"{table}: {result.get('error', 'Unknown error')[:100]}")
-                        continue
-
-                rows = result.get('rows', [])
-                if not rows:
-                    logger.debug(f"  [{idx}/{len(tables)}] - Table '{table}' is empty")
-                    skipped_tables["empty"].append(table)
-                    continue
-
-                # Convert to polars DataFrame (scan all rows for schema inference)
-                df = pl.DataFrame(rows, infer_schema_length=None)
-
-                # Write to parquet file (with file size checking)
-                parquet_path = self.sample_data_dir / f"{table}.parquet"
-                df.write_parquet(
-                    parquet_path,
-                    compression=compression,
-                    use_pyarrow=False  # Use polars native writer (faster)
-                )
-
-                # Check file size and split if too large
-                file_size = parquet_path.stat().st_size
-                max_size = 50 * 1024 * 1024  # 50 MB limit for parquet files
-
-                if file_size > max_size:
-                    logger.info(f"  [{idx}/{len(tables)}] Table '{table}' is too large ({file_size / 1024 / 1024:.1f}MB), splitting...")
-                    try:
-                        self._split_large_parquet(table, df, parquet_path, max_size, compression)
-                        parquet_count += 1  # Count split files as successful
-                    except Exception as split_error:
-                        logger.warning(f"  [{idx}/{len(tables)}] ✗ Failed to split '{table}': {split_error}")
-                        skipped_tables["too_large"].append(f"{table}: {file_size / 1024 / 1024:.1f}MB")
-                        # Remove the original large file
-                        if parquet_path.exists():
-                            parquet_path.unlink()
-                else:
-                    parquet_count += 1
-                    logger.debug(f"  [{idx}/{len(tables)}] ✓ Extracted '{table}' ({len(rows)} rows, {file_size / 1024:.1f}KB)")
-
-                if idx % 10 == 0:
-                    logger.info(f"  Progress: {idx}/{len(tables)} tables processed, {parquet_count} files created")
-
-            except Exception as e:
-                logger.warning(f"  [{idx}/{len(tables)}] ✗ Error extracting from '{table}': {e}")
-                skipped_tables["failed"].append(f"{table}: {str(e)[:100]}")
-                continue
+        workers = int(config.get('performance.sample_data_workers', 4) or 1)
+        part_mb = float(config.get('performance.sample_data_part_mb', 50) or 50)
+        logger.info(f"Extracting sample data for {len(tables)} tables "
+                    f"(max {sample_rows} rows per table, {workers} concurrent queries)...")
+
+        extractor = SampleDataExtractor(
+            self.query_executor,
+            self.sample_data_dir,
+            physical_columns=self._get_physical_columns,
+            workers=workers,
+            compression=compression,
+            max_part_bytes=int(part_mb * 1024 * 1024)
+        )
+        outcome = extractor.extract(tables, sample_rows)
+        written = outcome["written"]
+        skipped_tables = outcome["skipped"]
 
         # Summary report
+        parquet_count = len(written)
+        multipart = [table for table, paths in written.items() if len(paths) > 1]
         logger.info(f"✓ Sample data extraction complete:")
-        logger.info(f"  - Successfully extracted: {parquet_count} parquet files")
+        logger.info(f"  - Successfully extracted: {parquet_count} tables "
+                    f"({sum(len(paths) for paths in written.values())} parquet files)")
+        if multipart:
+            logger.info(f"  - Split into parts: {len(multipart)} tables")
         total_skipped = sum(len(v) for v in skipped_tables.values())
         logger.info(f"  - Skipped tables: {total_skipped}")
 
@@ -1703,66 +1631,12 @@ class HybridAnalyzer:
                 logger.info(f"      - {failure}")
             if len(skipped_tables["failed"]) > 5:
                 logger.info(f"      ... and {len(skipped_tables['failed']) - 5} more")
-        if skipped_tables["too_large"]:
-            logger.info(f"    • Too large: {len(skipped_tables['too_large'])} tables")
-            for large in skipped_tables["too_large"]:
-                logger.info(f"      - {large}")
+        if skipped_tables["not_reached"]:
+            logger.info(f"    • Not reached: {len(skipped_tables['not_reached'])} tables")
 
         logger.info(f"  - Total tables: {len(tables)}")
         return parquet_count
 
-    def _split_large_parquet(
-        self,
-        table_name: str,
-        df,
-        original_path: Path,
-        max_size: int,
-        compression: str
-    ):
-        """
-        Split large parquet file into multiple smaller files
-
-        Args:
-            table_name: Table name
-            df: Polars DataFrame
-            original_path: Path to original (large) parquet file
-            max_size: Maximum file size in bytes
-            compression: Compression algorithm
-        """
-        import polars as pl
-
-        # Get file size before removing it
-        file_size = original_path.stat().st_size if original_path.exists() else max_size
-
-        # Remove original large file
-        if original_path.exists():
-            original_path.unlink()
-
-        # Calculate rows per chunk (estimate)
-        total_rows = len(df)
-        estimated_rows_per_chunk = max(100, int((max_size / file_size) * total_rows * 0.8))  # 80% safety margin
-
-        logger.info(f"    Splitting {total_rows} rows into chunks of ~{estimated_rows_per_chunk} rows")
-
-        # Split into chunks
-        chunk_num = 0
-        for start_idx in range(0, total_rows, estimated_rows_per_chunk):
-            end_idx = min(start_idx + estimated_rows_per_chunk, total_rows)
-            chunk_df = df[start_idx:end_idx]
-
-            chunk_path = self.sample_data_dir / f"{table_name}_part{chunk_num}.parquet"
-            chunk_df.write_parquet(
-                chunk_path,
-                compression=compression,
-                use_pyarrow=False
-            )
-
-            chunk_size = chunk_path.stat().st_size
-            logger.info(f"    Created {chunk_path.name} ({chunk_size / 1024:.1f}KB, {len(chunk_df)} rows)")
-            chunk_num += 1
-
-        logger.info(f"    ✓ Split into {chunk_num} files")
-
     def _write_json(self, path: Path, data: Dict[str, Any]):
         """Write JSON file using orjson if available"""
         # Use centralized JSON utility with orjson optimization
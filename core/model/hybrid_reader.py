@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import asdict
 
+from core.model.object_index import INDEX_FILE_NAME, ObjectIndex
 from core.model.tmdl_parser import TMDLParser
 from core.utilities.json_utils import load_json
 
@@ -415,16 +416,88 @@ class HybridReader:
 
         return sorted(list(table_names))
 
-    def read_sample_data(self, table_name: str, max_rows: int = 100) -> Optional[Dict[str, Any]]:
+    def _sample_data_files(self, table_name: str) -> List[Path]:
+        """Parquet file(s) for a table: the single file, or its parts in part order"""
+        parquet_path = self.sample_data_dir / f"{table_name}.parquet"
+        if parquet_path.exists():
+            return [parquet_path]
+
+        def part_number(path: Path) -> int:
+            suffix = path.stem.rsplit("_part", 1)[-1]
+            return int(suffix) if suffix.isdigit() else -1
+
+        parts = [p for p in self.sample_data_dir.glob(f"{table_name}_part*.parquet") if part_number(p) >= 0]
+        return sorted(parts, key=part_number)
+
+    @staticmethod
+    def _sample_filter_expression(pl, filters: List[Dict[str, Any]], columns: List[str]):
+        """
+        Combine simple predicates into one polars expression (AND)
+
+        Each filter is {"column": name, "op": op, "value": value} with op one of
+        ==, !=, >, >=, <, <=, in, not_in, contains, is_null, not_null.
+        """
+        expression = None
+        for item in filters:
+            column = item.get("column")
+            op = item.get("op", "==")
+            value = item.get("value")
+            if column not in columns:
+                raise ValueError(f"Unknown filter column '{column}'. Available: {', '.join(columns)}")
+            col = pl.col(column)
+            if op in ("==", "="):
+                predicate = col == value
+            elif op == "!=":
+                predicate = col != value
+            elif op == ">":
+                predicate = col > value
+            elif op == ">=":
+                predicate = col >= value
+            elif op == "<":
+                predicate = col < value
+            elif op == "<=":
+                predicate = col <= value
+            elif op in ("in", "not_in"):
+                values = value if isinstance(value, list) else [value]
+                predicate = col.is_in(values) if op == "in" else ~col.is_in(values)
+            elif op == "contains":
+                predicate = col.cast(pl.Utf8).str.contains(str(value), literal=True)
+            elif op == "is_null":
+                predicate = col.is_null()
+            elif op == "not_null":
+                predicate = col.is_not_null()
+            else:
+                raise ValueError(f"Unsupported filter op '{op}'")
+            expression = predicate if expression is None else expression & predicate
+        return expression
+
+    def read_sample_data(
+        self,
+        table_name: str,
+        max_rows: int = 100,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Read sample data for table (parquet file or multi-part parquet files)
 
+        The parts are scanned lazily: only the projected columns and the first
+        max_rows matching rows are read, and the row count comes from parquet
+        metadata.
+
         Args:
             table_name: Table name
             max_rows: Maximum rows to return (default: 100)
+            columns: Optional column projection (default: all columns)
+            filters: Optional predicates, ANDed ({"column", "op", "value"}; see
+                _sample_filter_expression for the supported ops)
 
         Returns:
             Sample data as dictionary or None if not available
+
+        Raises:
+            ValueError: Unknown column, unsupported filter op, or a filter/projection
+                polars rejects (e.g. comparing a column with a value of another type)
         """
         if not self.sample_data_dir.exists():
             return None
@@ -435,47 +508,48 @@ class HybridReader:
             logger.warning("Polars not available, cannot read sample data")
             return None
 
-        # Check for single file first
-        parquet_path = self.sample_data_dir / f"{table_name}.parquet"
-        if parquet_path.exists():
-            try:
-                df = pl.read_parquet(parquet_path)
-                return {
-                    "columns": df.columns,
-                    "row_count": len(df),
-                    "data": df.to_dicts()[:max_rows],
-                    "is_multipart": False
-                }
-            except Exception as e:
-                logger.error(f"Error reading sample data for {table_name}: {e}")
-                return None
+        files = self._sample_data_files(table_name)
+        if not files:
+            return None
 
-        # Check for multi-part files (table_name_part0.parquet, table_name_part1.parquet, etc.)
-        part_files = sorted(self.sample_data_dir.glob(f"{table_name}_part*.parquet"))
-        if not part_files:
+        try:
+            logger.debug(f"Scanning {len(files)} parquet file(s) for table '{table_name}'")
+            lazy = pl.scan_parquet([str(f) for f in files])
+            all_columns = lazy.collect_schema().names()
+            # Parquet footers hold the row count; no data pages are read
+            row_count = lazy.select(pl.len()).collect().item()
+        except OSError as e:
+            logger.error(f"Error reading sample data for {table_name}: {e}")
             return None
 
+        if filters:
+            lazy = lazy.filter(self._sample_filter_expression(pl, filters, all_columns))
+        if columns:
+            missing = [c for c in columns if c not in all_columns]
+            if missing:
+                raise ValueError(f"Unknown columns {missing}. Available: {', '.join(all_columns)}")
+            lazy = lazy.select(columns)
+
         try:
-            # Read and concatenate all parts
-            logger.debug(f"Reading {len(part_files)} parts for table '{table_name}'")
-            dfs = []
-            for part_file in part_files:
-                df_part = pl.read_parquet(part_file)
-                dfs.append(df_part)
-
-            # Concatenate all parts
-            df = pl.concat(dfs)
-
-            return {
-                "columns": df.columns,
-                "row_count": len(df),
-                "data": df.to_dicts()[:max_rows],
-                "is_multipart": True,
-                "part_count": len(part_files)
-            }
-        except Exception as e:
-            logger.error(f"Error reading multi-part sample data for {table_name}: {e}")
+            df = lazy.head(max(0, max_rows)).collect()
+        except OSError as e:
+            logger.error(f"Error reading sample data for {table_name}: {e}")
             return None
+        except pl.exceptions.PolarsError as e:
+            raise ValueError(f"Invalid sample data query for {table_name}: {e}") from e
+
+        result = {
+            "columns": df.columns,
+            "row_count": row_count,
+            "returned_rows": df.height,
+            "data": df.to_dicts(),
+            "is_multipart": len(files) > 1 or files[0].stem != table_name
+        }
+        if result["is_multipart"]:
+            result["part_count"] = len(files)
+        if filters:
+            result["filters"] = filters
+        return result
 
     def find_objects(
         self,
@@ -876,6 +950,41 @@ class HybridReader:
             logger.error(f"Error parsing relationships from TMDL: {e}")
             return []
 
+    def _object_index(self) -> Optional[ObjectIndex]:
+        """
+        Object index written at export, or None for legacy packages and for packages
+        whose TMDL files changed since export (lookups then scan the TMDL files)
+        """
+        if "object_index" not in self._cache:
+            index = None
+            if self.format_type == "hybrid_analysis" and self.tmdl_dir.exists():
+                index = ObjectIndex.load(self.analysis_dir / INDEX_FILE_NAME, self.tmdl_dir)
+                if index is not None and not index.is_fresh():
+                    index = None
+            self._cache["object_index"] = index
+        return self._cache["object_index"]
+
+    def _match_indexed_measures(self, index: ObjectIndex, name: str, use_pattern: bool) -> List[List[Any]]:
+        """Index entries for an exact (case-insensitive) name or a regex over all names"""
+        if not use_pattern:
+            return index.lookup("measure", name)
+        import re
+        pattern = re.compile(name, re.IGNORECASE)
+        return [entry for entry in index.names("measure") if pattern.search(entry[0])]
+
+    def _read_indexed_measure(self, index: ObjectIndex, entry: List[Any]) -> Optional[Dict[str, Any]]:
+        """Parse one measure from its indexed byte range"""
+        try:
+            measure = TMDLParser.parse_measure(index.read(entry), entry[0])
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Error reading indexed measure '{entry[0]}': {e}")
+            return None
+        if measure is not None:
+            table_file = index.table_file(entry)
+            if table_file is not None:
+                measure["table"] = table_file
+        return measure
+
     def get_measure_from_tmdl(self, measure_name: str, use_pattern: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get a specific measure definition from TMDL files
@@ -896,6 +1005,19 @@ class HybridReader:
             logger.debug(f"TMDL directory not found: {self.tmdl_dir}")
             return None
 
+        # Seek straight to the definition when the package has an object index
+        index = self._object_index()
+        if index is not None:
+            entries = self._match_indexed_measures(index, measure_name, use_pattern)
+            if not entries:
+                logger.warning(f"Measure '{measure_name}' not found in object index")
+                return None
+            measure_def = self._read_indexed_measure(index, entries[0])
+            if measure_def:
+                logger.info(f"Found measure '{measure_def['name']}' via object index")
+                return measure_def
+            logger.debug(f"Indexed definition of '{entries[0][0]}' unreadable, scanning TMDL files")
+
         # Try both direct path and definition/ subfolder for expressions.tmdl
         expr_paths = [
             self.tmdl_dir / "expressions.tmdl",
@@ -976,6 +1098,18 @@ class HybridReader:
             logger.debug(f"TMDL directory not found: {self.tmdl_dir}")
             return []
 
+        index = self._object_index()
+        if index is not None:
+            # Match against the index's name list; only matching definitions are read
+            matching_measures = []
+            for entry in self._match_indexed_measures(index, pattern, use_pattern=True):
+                measure = self._read_indexed_measure(index, entry)
+                if measure:
+                    measure.setdefault("table", "Model")
+                    matching_measures.append(measure)
+            logger.info(f"Found {len(matching_measures)} measures matching pattern '{pattern}' via object index")
+            return matching_measures
+
         matching_measures = []
         import re
         regex_pattern = re.compile(pattern, re.IGNORECASE)
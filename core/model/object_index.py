@@ -0,0 +1,203 @@
+"""
+Object Index - Name to location index for TMDL objects in an analysis package
+
+HybridAnalyzer.export writes analysis/object_index.json, mapping every table,
+column and measure to the TMDL file that declares it plus the byte offset and
+length of its definition. HybridReader uses it to read one definition with a
+single seek instead of parsing every table file, and to run name pattern
+searches against the name lists.
+
+Format (compact, lists instead of objects):
+    {
+        "version": 1,
+        "files": [["tables/Sales.tmdl", size, mtime_ns], ...],
+        "tables": [[name, file, offset, length], ...],
+        "columns": [[name, table, file, offset, length], ...],
+        "measures": [[name, table, file, offset, length], ...]
+    }
+
+`file` is an index into "files"; `table` is None for expressions.tmdl measures.
+File size and mtime are recorded so a package whose TMDL changed after export
+(symlink strategy) is detected and the reader falls back to scanning.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.tmdl.tmdl_stream import iter_tmdl_events
+from core.utilities.json_utils import load_json
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_FILE_NAME = "object_index.json"
+
+_INDEXED_KINDS = {"table": "tables", "column": "columns", "measure": "measures"}
+
+
+def _tmdl_sources(tmdl_dir: Path) -> List[Path]:
+    """expressions.tmdl and table files, from the first layout that has them."""
+    for base in (tmdl_dir, tmdl_dir / "definition"):
+        tables_dir = base / "tables"
+        expressions = base / "expressions.tmdl"
+        if tables_dir.is_dir() or expressions.is_file():
+            files = [expressions] if expressions.is_file() else []
+            if tables_dir.is_dir():
+                files.extend(sorted(tables_dir.glob("*.tmdl")))
+            return files
+    return []
+
+
+def _line_offsets(data: bytes) -> List[int]:
+    """Byte offset of the start of each line, plus the end of the data."""
+    offsets = [0]
+    position = data.find(b"\n")
+    while position != -1:
+        offsets.append(position + 1)
+        position = data.find(b"\n", position + 1)
+    if offsets[-1] != len(data):
+        offsets.append(len(data))
+    return offsets
+
+
+def build_object_index(tmdl_dir: Path) -> Dict[str, Any]:
+    """
+    Index the tables, columns and measures of an exported TMDL folder.
+
+    Args:
+        tmdl_dir: The package's tmdl/ folder (direct or definition/ layout)
+
+    Returns:
+        Index dict in the format described in the module docstring
+    """
+    tmdl_dir = Path(tmdl_dir)
+    index: Dict[str, Any] = {"version": INDEX_VERSION, "files": [], "tables": [], "columns": [], "measures": []}
+
+    for path in _tmdl_sources(tmdl_dir):
+        try:
+            data = path.read_bytes()
+            stat = path.stat()
+        except OSError as e:
+            logger.warning(f"Skipping {path} in object index: {e}")
+            continue
+
+        file_id = len(index["files"])
+        index["files"].append([path.relative_to(tmdl_dir).as_posix(), stat.st_size, stat.st_mtime_ns])
+        text = data.decode("utf-8")
+        lines = text.splitlines()
+        # str.splitlines also splits on \r and a few Unicode separators; byte offsets
+        # must follow the file's real lines, so only index files where they agree
+        offsets = _line_offsets(data)
+        if len(offsets) - 1 != len(lines):
+            logger.debug(f"Irregular line endings in {path.name}; not indexed")
+            continue
+
+        table_name = None
+        for event, node in iter_tmdl_events(lines):
+            if event == "start" and node.kind == "table":
+                table_name = node.name
+            if event != "end" or node.kind not in _INDEXED_KINDS or not node.name:
+                continue
+            # Include the /// description lines above the declaration
+            first = node.line
+            while first > 1 and lines[first - 2].lstrip().startswith("///"):
+                first -= 1
+            start = offsets[first - 1]
+            length = offsets[max(node.end_line, node.line)] - start
+            if node.kind == "table":
+                index["tables"].append([node.name, file_id, start, length])
+            else:
+                index[_INDEXED_KINDS[node.kind]].append([node.name, table_name, file_id, start, length])
+
+    logger.info(
+        f"Object index: {len(index['tables'])} tables, {len(index['columns'])} columns, "
+        f"{len(index['measures'])} measures in {len(index['files'])} files"
+    )
+    return index
+
+
+class ObjectIndex:
+    """Read side of object_index.json."""
+
+    def __init__(self, data: Dict[str, Any], tmdl_dir: Path):
+        self.tmdl_dir = Path(tmdl_dir)
+        self.files: List[List[Any]] = data.get("files", [])
+        self.tables: List[List[Any]] = data.get("tables", [])
+        self.columns: List[List[Any]] = data.get("columns", [])
+        self.measures: List[List[Any]] = data.get("measures", [])
+        self._by_name: Dict[str, Dict[str, List[List[Any]]]] = {}
+        self._fresh: Optional[bool] = None
+
+    @classmethod
+    def load(cls, index_path: Path, tmdl_dir: Path) -> Optional["ObjectIndex"]:
+        """Load an index file; None when absent (legacy package) or unreadable."""
+        if not index_path.exists():
+            return None
+        try:
+            data = load_json(index_path)
+        except Exception as e:
+            logger.warning(f"Could not read object index {index_path}: {e}")
+            return None
+        if data.get("version") != INDEX_VERSION:
+            logger.info(f"Ignoring object index version {data.get('version')}")
+            return None
+        return cls(data, tmdl_dir)
+
+    def is_fresh(self) -> bool:
+        """True while the indexed TMDL files are unchanged since export (checked once)."""
+        if self._fresh is None:
+            self._fresh = self._check_fresh()
+        return self._fresh
+
+    def _check_fresh(self) -> bool:
+        indexed = set()
+        for relative, size, mtime_ns in self.files:
+            path = self.tmdl_dir / relative
+            indexed.add(path)
+            try:
+                stat = path.stat()
+            except OSError:
+                return False
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                logger.info(f"Object index is stale ({relative} changed since export)")
+                return False
+        if set(_tmdl_sources(self.tmdl_dir)) - indexed:
+            logger.info("Object index is stale (TMDL files added since export)")
+            return False
+        return True
+
+    def _entries(self, kind: str) -> List[List[Any]]:
+        return {"table": self.tables, "column": self.columns, "measure": self.measures}[kind]
+
+    def lookup(self, kind: str, name: str) -> List[List[Any]]:
+        """Entries of a kind with a name, compared case-insensitively."""
+        if kind not in self._by_name:
+            by_name: Dict[str, List[List[Any]]] = {}
+            for entry in self._entries(kind):
+                by_name.setdefault(entry[0].lower(), []).append(entry)
+            self._by_name[kind] = by_name
+        return self._by_name[kind].get(name.lower(), [])
+
+    def names(self, kind: str) -> List[List[Any]]:
+        """All entries of a kind, for pattern searches over names."""
+        return self._entries(kind)
+
+    def read(self, entry: List[Any]) -> str:
+        """The TMDL text of an entry's definition."""
+        file_id, offset, length = entry[-3:]
+        with open(self.tmdl_dir / self.files[file_id][0], "rb") as f:
+            f.seek(offset)
+            return f.read(length).decode("utf-8")
+
+    def table_file(self, entry: List[Any]) -> Optional[str]:
+        """Stem of the entry's file when it is a table file (None for expressions.tmdl)."""
+        path = Path(self.files[entry[-3]][0])
+        return path.stem if path.parent.name == "tables" else None
+
+
+__all__ = [
+    "INDEX_FILE_NAME",
+    "ObjectIndex",
+    "build_object_index",
+]
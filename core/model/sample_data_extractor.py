@@ -0,0 +1,309 @@
+"""
+Sample Data Extractor - Concurrent, streaming export of table samples to parquet
+
+HybridAnalyzer delegates sample data extraction here. A bounded number of
+table queries run concurrently on a thread pool while the calling thread
+writes finished results: each result's typed column arrays are fed into polars
+in row batches sized by cell count (so a wide table gets shorter batches), and
+the batches go to a rolling writer that starts a new part file whenever the
+buffered data reaches the part budget. Nothing is written and then re-split.
+
+Memory is bounded by the in-flight query results (at most `workers`) plus one
+part's worth of buffered frames.
+
+Output layout (read back by HybridReader.read_sample_data):
+    sample_data/<table>.parquet               when the sample fits in one part
+    sample_data/<table>_part<N>.parquet       otherwise, N = 0, 1, ...
+"""
+
+import logging
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.infrastructure.cancellation import current_cancellation_token
+
+logger = logging.getLogger(__name__)
+
+# Default budget for one parquet part (in-memory size of its frames)
+DEFAULT_PART_BYTES = 50 * 1024 * 1024
+
+# Cells (rows x columns) handed to polars per batch
+DEFAULT_BATCH_CELLS = 200_000
+
+# ColumnarResult schema type -> polars dtype name; anything else is stored as text
+_POLARS_TYPES = {
+    "boolean": "Boolean",
+    "int64": "Int64",
+    "double": "Float64",
+    "decimal": "Float64",
+}
+
+
+def _polars_dtypes(pl, schema: List[Dict[str, str]]) -> List[Any]:
+    return [getattr(pl, _POLARS_TYPES.get(entry.get("type"), "Utf8")) for entry in schema]
+
+
+def _stringify(values: List[Any]) -> List[Any]:
+    return [v if v is None or type(v) is str else str(v) for v in values]
+
+
+def iter_frames(pl, result_set, batch_cells: int = DEFAULT_BATCH_CELLS) -> Iterator[Any]:
+    """
+    Yield polars DataFrames over a ColumnarResult, a bounded number of cells each
+
+    Every batch gets the same dtypes (taken from the result schema), so the
+    frames concatenate and the parts of one table share a schema. Values that
+    do not fit the column type (e.g. read errors) become nulls.
+    """
+    columns = result_set.columns
+    if not columns:
+        return
+    dtypes = _polars_dtypes(pl, result_set.schema)
+    batch_rows = max(1, batch_cells // len(columns))
+    for start in range(0, result_set.row_count, batch_rows):
+        end = start + batch_rows
+        series = []
+        for name, dtype, values in zip(columns, dtypes, result_set.data):
+            chunk = values[start:end]
+            if dtype == pl.Utf8:
+                chunk = _stringify(chunk)
+            series.append(pl.Series(name, chunk, dtype=dtype, strict=False))
+        yield pl.DataFrame(series)
+
+
+def _part_number(path: Path, table_name: str) -> Optional[int]:
+    match = re.fullmatch(re.escape(table_name) + r"_part(\d+)", path.stem)
+    return int(match.group(1)) if match else None
+
+
+class RollingParquetWriter:
+    """Write one table's frames to parquet, rolling over to a new part at the size budget"""
+
+    def __init__(
+        self,
+        directory: Path,
+        table_name: str,
+        compression: str = "snappy",
+        max_part_bytes: int = DEFAULT_PART_BYTES
+    ):
+        self.directory = Path(directory)
+        self.table_name = table_name
+        self.compression = compression
+        self.max_part_bytes = max_part_bytes
+        self.paths: List[Path] = []
+        self.row_count = 0
+        self._pending: List[Any] = []
+        self._pending_bytes = 0
+        self._remove_stale_files()
+
+    def _remove_stale_files(self):
+        """Drop files of a previous export so the reader never mixes layouts"""
+        single = self.directory / f"{self.table_name}.parquet"
+        if single.exists():
+            single.unlink()
+        for path in self.directory.glob(f"{self.table_name}_part*.parquet"):
+            if _part_number(path, self.table_name) is not None:
+                path.unlink()
+
+    def write(self, frame) -> None:
+        """Buffer a frame; the buffered part is flushed first if the frame would overflow it"""
+        size = frame.estimated_size()
+        if self._pending and self._pending_bytes + size > self.max_part_bytes:
+            self._flush(final=False)
+        self._pending.append(frame)
+        self._pending_bytes += size
+        self.row_count += frame.height
+
+    def close(self) -> List[Path]:
+        """Flush what is left and return the files written"""
+        if self._pending:
+            self._flush(final=True)
+        return self.paths
+
+    def _flush(self, final: bool):
+        import polars as pl
+
+        frame = self._pending[0] if len(self._pending) == 1 else pl.concat(self._pending, rechunk=True)
+        self._pending = []
+        self._pending_bytes = 0
+
+        # Only a table that never rolled over keeps the plain file name
+        if final and not self.paths:
+            path = self.directory / f"{self.table_name}.parquet"
+        else:
+            path = self.directory / f"{self.table_name}_part{len(self.paths)}.parquet"
+
+        frame.write_parquet(path, compression=self.compression, use_pyarrow=False)
+        self.paths.append(path)
+
+
+class SampleDataExtractor:
+    """Query table samples concurrently and stream them to parquet files"""
+
+    def __init__(
+        self,
+        query_executor,
+        output_dir: Path,
+        physical_columns: Optional[Callable[[str], List[str]]] = None,
+        workers: int = 4,
+        compression: str = "snappy",
+        max_part_bytes: int = DEFAULT_PART_BYTES,
+        batch_cells: int = DEFAULT_BATCH_CELLS
+    ):
+        """
+        Initialize extractor
+
+        Args:
+            query_executor: Object with validate_and_execute_dax(query, top_n, bypass_cache, columnar)
+            output_dir: sample_data directory
+            physical_columns: Returns a table's non-calculated columns ([] when unknown)
+            workers: Maximum table queries in flight
+            compression: Parquet compression algorithm
+            max_part_bytes: Size budget of one parquet part
+            batch_cells: Cells per polars batch
+        """
+        self.query_executor = query_executor
+        self.output_dir = Path(output_dir)
+        self.physical_columns = physical_columns or (lambda table: [])
+        self.workers = max(1, int(workers or 1))
+        self.compression = compression
+        self.max_part_bytes = max_part_bytes
+        self.batch_cells = batch_cells
+
+    def _execute(self, dax_query: str, top_n: int) -> Dict[str, Any]:
+        return self.query_executor.validate_and_execute_dax(dax_query, top_n=top_n, bypass_cache=True, columnar=True)
+
+    def query_table(self, table: str, sample_rows: int) -> Tuple[str, Any]:
+        """
+        Run the sample query for one table, with the fallbacks for failing queries
+
+        Returns:
+            ("ok", ColumnarResult), ("measures_only", None), ("empty", None)
+            or ("failed", error message)
+        """
+        escaped_table = table.replace("'", "''")
+
+        # Get physical columns (exclude calculated columns) to avoid calculated column errors
+        physical_columns = self.physical_columns(table)
+
+        if physical_columns:
+            # Use SELECTCOLUMNS with only physical columns to avoid calculated column errors
+            # Limit to first 50 columns to avoid query length issues
+            column_selects = ", ".join([f'"{col}", [{col}]' for col in physical_columns[:50]])
+            dax_query = f"EVALUATE SELECTCOLUMNS('{escaped_table}', {column_selects})"
+        else:
+            # Fallback to simple EVALUATE (for tables where we couldn't get column info)
+            dax_query = f"EVALUATE '{escaped_table}'"
+
+        result = self._execute(dax_query, sample_rows)
+
+        if not result.get('success'):
+            error_msg = result.get('error', '')
+
+            # Measures-only table (no columns)
+            if 'cannot be used in computations because it does not have any columns' in error_msg:
+                return "measures_only", None
+
+            # If SELECTCOLUMNS failed, try simple EVALUATE as fallback
+            if physical_columns and ('SELECTCOLUMNS' in error_msg or 'syntax' in error_msg.lower()):
+                logger.debug(f"  '{table}': SELECTCOLUMNS failed, trying simple EVALUATE...")
+                result = self._execute(f"EVALUATE '{escaped_table}'", sample_rows)
+
+            # If calculated column error, query only physical columns
+            if not result.get('success') and 'calculated column' in error_msg:
+                logger.info(f"  Calculated column error in '{table}', retrying with physical columns only...")
+                if physical_columns:
+                    # Limit to first 100 columns to avoid query too long
+                    column_selects = ", ".join([f'"{col}", [{col}]' for col in physical_columns[:100]])
+                    dax_query = f"EVALUATE SELECTCOLUMNS('{escaped_table}', {column_selects})"
+                    result = self._execute(dax_query, sample_rows)
+
+                    # If SELECTCOLUMNS still fails, try with fewer rows
+                    if not result.get('success'):
+                        logger.info(f"  '{table}': still failing, retrying with 100 rows...")
+                        result = self._execute(dax_query, 100)
+                else:
+                    logger.warning(f"  Could not determine physical columns for '{table}'")
+
+            if not result.get('success'):
+                return "failed", result.get('error', 'Unknown error')
+
+        result_set = result.get('result_set')
+        if result_set is None or result_set.row_count == 0 or not result_set.columns:
+            return "empty", None
+        return "ok", result_set
+
+    def write_table(self, table: str, result_set) -> List[Path]:
+        """Stream one table's result to parquet part(s)"""
+        import polars as pl
+
+        writer = RollingParquetWriter(self.output_dir, table, self.compression, self.max_part_bytes)
+        for frame in iter_frames(pl, result_set, self.batch_cells):
+            writer.write(frame)
+        return writer.close()
+
+    def extract(self, tables: List[str], sample_rows: int) -> Dict[str, Any]:
+        """
+        Extract samples for all tables
+
+        Queries are submitted in table order, at most `workers` at a time, and
+        written as they complete. Once the current cancellation token expires no
+        new queries are started; queries already in flight are still written.
+
+        Returns:
+            Dictionary with 'written' ({table: [paths]}) and 'skipped' (reason -> list)
+        """
+        skipped: Dict[str, List[str]] = {
+            "measures_only": [],
+            "empty": [],
+            "failed": [],
+            "not_reached": []
+        }
+        written: Dict[str, List[Path]] = {}
+        token = current_cancellation_token()
+        total = len(tables)
+        processed = 0
+        next_index = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sample-data") as pool:
+            in_flight: Dict[Any, str] = {}
+            while next_index < total or in_flight:
+                while next_index < total and len(in_flight) < self.workers:
+                    if token.cancelled:
+                        skipped["not_reached"] = tables[next_index:]
+                        logger.warning(f"  Budget expired after {next_index}/{total} tables queried; skipping the rest")
+                        next_index = total
+                        break
+                    table = tables[next_index]
+                    next_index += 1
+                    in_flight[pool.submit(self.query_table, table, sample_rows)] = table
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table = in_flight.pop(future)
+                    processed += 1
+                    try:
+                        status, payload = future.result()
+                        if status == "ok":
+                            paths = self.write_table(table, payload)
+                            written[table] = paths
+                            logger.debug(f"  [{processed}/{total}] ✓ Extracted '{table}' "
+                                         f"({payload.row_count} rows, {len(paths)} file(s))")
+                        elif status == "failed":
+                            logger.warning(f"  [{processed}/{total}] ✗ Failed to extract from '{table}': {payload}")
+                            skipped["failed"].append(f"{table}: {str(payload)[:100]}")
+                        else:
+                            logger.debug(f"  [{processed}/{total}] - Skipping '{table}' ({status})")
+                            skipped[status].append(table)
+                    except Exception as e:
+                        logger.warning(f"  [{processed}/{total}] ✗ Error extracting from '{table}': {e}")
+                        skipped["failed"].append(f"{table}: {str(e)[:100]}")
+
+                    if processed % 10 == 0:
+                        logger.info(f"  Progress: {processed}/{total} tables processed, {len(written)} tables written")
+
+        return {"written": written, "skipped": skipped}
@@ -7,19 +7,62 @@ Extracts:
 - Relationship details
 - Calculation groups
 - Table metadata
+
+Parsing is done by the streaming parser in core.tmdl.tmdl_stream; this class keeps
+the camelCase dict format HybridReader and HybridAnalyzer consume.
 """
 
-import re
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+from core.tmdl.tmdl_stream import TmdlNode, find_object, parse_tmdl_text
+
 logger = logging.getLogger(__name__)
 
 
 class TMDLParser:
     """Parser for TMDL (Tabular Model Definition Language) files"""
 
+    @staticmethod
+    def _measure_dict(node: TmdlNode) -> Dict[str, Any]:
+        return {
+            "name": node.name,
+            "expression": node.expression or "",
+            "formatString": node.text("formatString"),
+            "description": node.text("description", node.description),
+            "displayFolder": node.text("displayFolder"),
+            "isHidden": node.flag("isHidden")
+        }
+
+    @staticmethod
+    def _column_dict(node: TmdlNode) -> Dict[str, Any]:
+        return {
+            "name": node.name,
+            "dataType": node.text("dataType"),
+            "sourceColumn": node.text("sourceColumn"),
+            "formatString": node.text("formatString"),
+            "isHidden": node.flag("isHidden"),
+            "isKey": node.flag("isKey"),
+            "summarizeBy": node.text("summarizeBy"),
+            "description": node.text("description", node.description),
+            "displayFolder": node.text("displayFolder"),
+            "expression": node.expression
+        }
+
+    @staticmethod
+    def _table_nodes(document: TmdlNode, kind: str) -> List[TmdlNode]:
+        """Objects of a kind declared on the table (or at top level in expressions.tmdl)."""
+        table = document.first("table")
+        return list((table or document).iter_children(kind))
+
+    @staticmethod
+    def _mentions(tmdl_content: str, name: str) -> bool:
+        """Cheap pre-check: a file that never mentions the name cannot declare it."""
+        content = tmdl_content.lower()
+        name = name.lower()
+        return name in content or name.replace("'", "''") in content
+
     @staticmethod
     def parse_measure(tmdl_content: str, measure_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -32,59 +75,16 @@ class TMDLParser:
         Returns:
             Measure definition dict or None if not found
         """
-        # Pattern to match measure definition
-        pattern = rf"measure\s+(?:'|`)?{re.escape(measure_name)}(?:'|`)?\s*="
-
-        match = re.search(pattern, tmdl_content, re.IGNORECASE | re.MULTILINE)
-        if not match:
+        if not TMDLParser._mentions(tmdl_content, measure_name):
             return None
-
-        start_pos = match.start()
-        expr_start = tmdl_content.find('=', start_pos) + 1
-
-        # Find the end of the measure
-        next_measure = re.search(r'\n\s*measure\s+', tmdl_content[expr_start:], re.MULTILINE)
-        next_section = re.search(r'\n\s*(column|hierarchy|partition|annotation)', tmdl_content[expr_start:], re.MULTILINE)
-
-        if next_measure and next_section:
-            end_pos = expr_start + min(next_measure.start(), next_section.start())
-        elif next_measure:
-            end_pos = expr_start + next_measure.start()
-        elif next_section:
-            end_pos = expr_start + next_section.start()
-        else:
-            end_pos = len(tmdl_content)
-
-        expression = tmdl_content[expr_start:end_pos].strip()
-        measure_block = tmdl_content[start_pos:end_pos]
-
-        # Extract properties
-        format_match = re.search(r'formatString:\s*"([^"]*)"', measure_block)
-        desc_match = re.search(r'description:\s*"([^"]*)"', measure_block)
-        folder_match = re.search(r'displayFolder:\s*"([^"]*)"', measure_block)
-        hidden_match = re.search(r'isHidden:\s*(true|false)', measure_block)
-
-        return {
-            "name": measure_name,
-            "expression": expression,
-            "formatString": format_match.group(1) if format_match else None,
-            "description": desc_match.group(1) if desc_match else None,
-            "displayFolder": folder_match.group(1) if folder_match else None,
-            "isHidden": hidden_match.group(1) == 'true' if hidden_match else False
-        }
+        found = find_object(tmdl_content.splitlines(), "measure", measure_name)
+        return TMDLParser._measure_dict(found[0]) if found else None
 
     @staticmethod
     def parse_all_measures(tmdl_content: str) -> List[Dict[str, Any]]:
         """Parse all measures from TMDL content"""
-        measures = []
-        measure_pattern = r"measure\s+(?:'([^']+)'|`([^`]+)`|(\S+))\s*="
-        matches = re.finditer(measure_pattern, tmdl_content, re.MULTILINE)
-
-        for match in matches:
-            measure_name = match.group(1) or match.group(2) or match.group(3)
-            measure_def = TMDLParser.parse_measure(tmdl_content, measure_name)
-            if measure_def:
-                measures.append(measure_def)
+        document = parse_tmdl_text(tmdl_content)
+        measures = [TMDLParser._measure_dict(node) for node in TMDLParser._table_nodes(document, "measure")]
 
         logger.info(f"Parsed {len(measures)} measures from TMDL")
         return measures
@@ -92,129 +92,62 @@ class TMDLParser:
     @staticmethod
     def parse_column(tmdl_content: str, column_name: str) -> Optional[Dict[str, Any]]:
         """Parse a specific column from TMDL content"""
-        pattern = rf"column\s+(?:'|`)?{re.escape(column_name)}(?:'|`)?"
-        match = re.search(pattern, tmdl_content, re.IGNORECASE | re.MULTILINE)
-        if not match:
+        if not TMDLParser._mentions(tmdl_content, column_name):
             return None
-
-        start_pos = match.start()
-        next_item = re.search(r'\n\s*(column|measure|hierarchy|partition)', tmdl_content[start_pos+1:], re.MULTILINE)
-        end_pos = start_pos + next_item.start() if next_item else len(tmdl_content)
-        column_block = tmdl_content[start_pos:end_pos]
-
-        # Extract properties
-        dtype_match = re.search(r'dataType:\s*(\w+)', column_block)
-        source_match = re.search(r'sourceColumn:\s*"([^"]*)"', column_block)
-        format_match = re.search(r'formatString:\s*"([^"]*)"', column_block)
-        hidden_match = re.search(r'isHidden:\s*(true|false)', column_block)
-        key_match = re.search(r'isKey:\s*(true|false)', column_block)
-        summarize_match = re.search(r'summarizeBy:\s*(\w+)', column_block)
-        desc_match = re.search(r'description:\s*"([^"]*)"', column_block)
-        folder_match = re.search(r'displayFolder:\s*"([^"]*)"', column_block)
-
-        return {
-            "name": column_name,
-            "dataType": dtype_match.group(1) if dtype_match else None,
-            "sourceColumn": source_match.group(1) if source_match else None,
-            "formatString": format_match.group(1) if format_match else None,
-            "isHidden": hidden_match.group(1) == 'true' if hidden_match else False,
-            "isKey": key_match.group(1) == 'true' if key_match else False,
-            "summarizeBy": summarize_match.group(1) if summarize_match else None,
-            "description": desc_match.group(1) if desc_match else None,
-            "displayFolder": folder_match.group(1) if folder_match else None
-        }
+        found = find_object(tmdl_content.splitlines(), "column", column_name)
+        return TMDLParser._column_dict(found[0]) if found else None
 
     @staticmethod
     def parse_all_columns(tmdl_content: str) -> List[Dict[str, Any]]:
         """Parse all columns from TMDL content"""
-        columns = []
-        column_pattern = r"column\s+(?:'([^']+)'|`([^`]+)`|(\S+))"
-        matches = re.finditer(column_pattern, tmdl_content, re.MULTILINE)
-
-        for match in matches:
-            column_name = match.group(1) or match.group(2) or match.group(3)
-            column_def = TMDLParser.parse_column(tmdl_content, column_name)
-            if column_def:
-                columns.append(column_def)
+        document = parse_tmdl_text(tmdl_content)
+        columns = [TMDLParser._column_dict(node) for node in TMDLParser._table_nodes(document, "column")]
 
         logger.info(f"Parsed {len(columns)} columns from TMDL")
         return columns
 
+    @staticmethod
+    def _split_column_reference(reference: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Split a relationship column reference into (table, column).
+
+        Supports TableName.ColumnName, TableName.'Column Name', 'Table Name'.ColumnName
+        and TableName[ColumnName].
+        """
+        if not reference:
+            return None, None
+        # Try bracket format first: TableName[ColumnName]
+        if '[' in reference:
+            table, column = reference.split('[', 1)
+            return table.strip("' \""), column.rstrip(']').strip("' \"")
+        # Quoted column: split at the dot that opens the column name
+        if reference.endswith("'") and ".'" in reference:
+            dot_idx = reference.rfind(".'")
+        else:
+            dot_idx = reference.rfind('.')
+        if dot_idx > 0:
+            return reference[:dot_idx].strip("' \""), reference[dot_idx + 1:].strip("' \"")
+        return None, None
+
     @staticmethod
     def parse_relationships(tmdl_content: str) -> List[Dict[str, Any]]:
         """Parse relationships from relationships.tmdl content"""
         relationships = []
-        # Fixed: Use [\w-]+ instead of \w+ to capture hashes with dashes
-        rel_pattern = r"relationship\s+([\w-]+)\s*\n(.*?)(?=\n\s*relationship|\Z)"
-        matches = re.finditer(rel_pattern, tmdl_content, re.DOTALL | re.MULTILINE)
-
-        for match in matches:
-            rel_hash = match.group(1)
-            rel_block = match.group(2)
-
-            # Updated regex to handle TableName.'Column Name' format correctly
-            # Pattern: capture everything after fromColumn: until end of line
-            from_match = re.search(r"fromColumn:\s*(.+?)$", rel_block, re.MULTILINE)
-            to_match = re.search(r"toColumn:\s*(.+?)$", rel_block, re.MULTILINE)
-            from_card_match = re.search(r"fromCardinality:\s*(\w+)", rel_block)
-            to_card_match = re.search(r"toCardinality:\s*(\w+)", rel_block)
-            cross_filter_match = re.search(r"crossFilteringBehavior:\s*(\w+)", rel_block)
-            active_match = re.search(r"isActive:\s*(true|false)", rel_block)
-            security_match = re.search(r"securityFilteringBehavior:\s*(\w+)", rel_block)
-
-            from_column = from_match.group(1).strip() if from_match else None
-            to_column = to_match.group(1).strip() if to_match else None
-
-            # Extract table names - support multiple formats:
-            # - TableName.ColumnName
-            # - TableName.'Column Name'  (quoted column)
-            # - 'Table Name'.ColumnName  (quoted table)
-            # - TableName[ColumnName]  (bracket notation)
-            from_table, from_col = None, None
-            if from_column:
-                # Try bracket format first: TableName[ColumnName]
-                if '[' in from_column:
-                    parts = from_column.split('[', 1)
-                    if len(parts) == 2:
-                        from_table = parts[0].strip("' \"")
-                        from_col = parts[1].rstrip(']').strip("' \"")
-                # Try dot format: TableName.ColumnName or TableName.'Column Name'
-                elif '.' in from_column:
-                    # Find the last dot that's not inside quotes
-                    # Simple approach: split on dot and handle quotes
-                    dot_idx = from_column.rfind('.')
-                    if dot_idx > 0:
-                        from_table = from_column[:dot_idx].strip("' \"")
-                        from_col = from_column[dot_idx+1:].strip("' \"")
-
-            to_table, to_col = None, None
-            if to_column:
-                # Try bracket format first: TableName[ColumnName]
-                if '[' in to_column:
-                    parts = to_column.split('[', 1)
-                    if len(parts) == 2:
-                        to_table = parts[0].strip("' \"")
-                        to_col = parts[1].rstrip(']').strip("' \"")
-                # Try dot format: TableName.ColumnName or TableName.'Column Name'
-                elif '.' in to_column:
-                    # Find the last dot that's not inside quotes
-                    # Simple approach: split on dot and handle quotes
-                    dot_idx = to_column.rfind('.')
-                    if dot_idx > 0:
-                        to_table = to_column[:dot_idx].strip("' \"")
-                        to_col = to_column[dot_idx+1:].strip("' \"")
-
-            # Map fromCardinality and toCardinality to standard cardinality field
-            from_card = from_card_match.group(1) if from_card_match else "many"
-            to_card = to_card_match.group(1) if to_card_match else "one"
-
-            # Standard cardinality mapping
-            cardinality_map = {
-                ("one", "one"): "OneToOne",
-                ("one", "many"): "OneToMany",
-                ("many", "one"): "ManyToOne",
-                ("many", "many"): "ManyToMany"
-            }
+
+        # Standard cardinality mapping
+        cardinality_map = {
+            ("one", "one"): "OneToOne",
+            ("one", "many"): "OneToMany",
+            ("many", "one"): "ManyToOne",
+            ("many", "many"): "ManyToMany"
+        }
+
+        for node in parse_tmdl_text(tmdl_content).iter_children("relationship"):
+            from_table, from_col = TMDLParser._split_column_reference(node.properties.get("fromColumn"))
+            to_table, to_col = TMDLParser._split_column_reference(node.properties.get("toColumn"))
+
+            from_card = node.text("fromCardinality") or "many"
+            to_card = node.text("toCardinality") or "one"
             cardinality = cardinality_map.get((from_card.lower(), to_card.lower()), "ManyToOne")
 
             # Generate a meaningful name from table and column names
@@ -222,7 +155,7 @@ class TMDLParser:
 
             relationships.append({
                 "name": name,  # Add name field (generated from relationship details)
-                "hash": rel_hash,  # Keep hash for reference
+                "hash": node.name,  # Keep hash for reference
                 "fromTable": from_table,
                 "fromColumn": from_col,
                 "toTable": to_table,
@@ -230,61 +163,53 @@ class TMDLParser:
                 "fromCardinality": from_card,  # Keep original for reference
                 "toCardinality": to_card,  # Keep original for reference
                 "cardinality": cardinality,  # Add standard cardinality field
-                "crossFilteringBehavior": cross_filter_match.group(1) if cross_filter_match else "OneDirection",
-                "isActive": active_match.group(1) == 'true' if active_match else True,
-                "securityFilteringBehavior": security_match.group(1) if security_match else "OneDirection"
+                "crossFilteringBehavior": node.text("crossFilteringBehavior") or "OneDirection",
+                "isActive": node.flag("isActive", True),
+                "securityFilteringBehavior": node.text("securityFilteringBehavior") or "OneDirection"
             })
 
         logger.info(f"Parsed {len(relationships)} relationships from TMDL")
         return relationships
 
+    @staticmethod
+    def _table_metadata(document: TmdlNode) -> Dict[str, Any]:
+        metadata: Dict[str, Any] = {}
+        table = document.first("table")
+        if table is not None:
+            metadata["name"] = table.name
+            description = table.text("description", table.description)
+            if description is not None:
+                metadata["description"] = description
+            if "isHidden" in table.properties:
+                metadata["isHidden"] = table.flag("isHidden")
+
+        metadata["hasPartition"] = table is not None and table.first("partition") is not None
+        metadata["columnCount"] = len(TMDLParser._table_nodes(document, "column"))
+        metadata["measureCount"] = len(TMDLParser._table_nodes(document, "measure"))
+        return metadata
+
     @staticmethod
     def parse_table_metadata(tmdl_content: str) -> Dict[str, Any]:
         """Parse table-level metadata from table TMDL content"""
-        metadata = {}
+        return TMDLParser._table_metadata(parse_tmdl_text(tmdl_content))
 
-        table_match = re.search(r"table\s+(?:'([^']+)'|`([^`]+)`|(\S+))", tmdl_content)
-        if table_match:
-            metadata["name"] = table_match.group(1) or table_match.group(2) or table_match.group(3)
-
-        desc_match = re.search(r'description:\s*"([^"]*)"', tmdl_content)
-        if desc_match:
-            metadata["description"] = desc_match.group(1)
-
-        hidden_match = re.search(r'isHidden:\s*(true|false)', tmdl_content)
-        if hidden_match:
-            metadata["isHidden"] = hidden_match.group(1) == 'true'
-
-        has_partition = re.search(r'\bpartition\s+', tmdl_content) is not None
-        metadata["hasPartition"] = has_partition
-
-        columns = TMDLParser.parse_all_columns(tmdl_content)
-        measures = TMDLParser.parse_all_measures(tmdl_content)
-
-        metadata["columnCount"] = len(columns)
-        metadata["measureCount"] = len(measures)
+    @staticmethod
+    def _calculation_group(document: TmdlNode) -> Optional[Dict[str, Any]]:
+        table = document.first("table")
+        if table is None or table.first("calculationGroup") is None:
+            return None
 
-        return metadata
+        calc_items = [
+            {"name": item.name, "expression": item.expression or ""}
+            for group in table.iter_children("calculationGroup")
+            for item in group.iter_children("calculationItem")
+        ]
+        return {"name": table.name, "calculationItems": calc_items}
 
     @staticmethod
     def parse_calculation_group(tmdl_content: str) -> Optional[Dict[str, Any]]:
         """Parse calculation group from TMDL content"""
-        calc_group_match = re.search(r"table\s+(?:'([^']+)'|`([^`]+)`|(\S+))", tmdl_content)
-        if not calc_group_match or 'calculationGroup' not in tmdl_content:
-            return None
-
-        table_name = calc_group_match.group(1) or calc_group_match.group(2) or calc_group_match.group(3)
-        calc_items = []
-
-        calc_item_pattern = r"calculationItem\s+(?:'([^']+)'|`([^`]+)`|(\S+))\s*=\s*(.*?)(?=\n\s*calculationItem|\Z)"
-        matches = re.finditer(calc_item_pattern, tmdl_content, re.DOTALL | re.MULTILINE)
-
-        for match in matches:
-            item_name = match.group(1) or match.group(2) or match.group(3)
-            expression = match.group(4).strip()
-            calc_items.append({"name": item_name, "expression": expression})
-
-        return {"name": table_name, "calculationItems": calc_items}
+        return TMDLParser._calculation_group(parse_tmdl_text(tmdl_content))
 
     @staticmethod
     def parse_file(file_path: Path) -> Dict[str, Any]:
@@ -302,11 +227,13 @@ class TMDLParser:
                 result["type"] = "expressions"
                 result["measures"] = TMDLParser.parse_all_measures(content)
             elif file_path.parent.name == "tables":
+                # One pass over the file feeds every section
+                document = parse_tmdl_text(content)
                 result["type"] = "table"
-                result["metadata"] = TMDLParser.parse_table_metadata(content)
-                result["columns"] = TMDLParser.parse_all_columns(content)
-                result["measures"] = TMDLParser.parse_all_measures(content)
-                calc_group = TMDLParser.parse_calculation_group(content)
+                result["metadata"] = TMDLParser._table_metadata(document)
+                result["columns"] = [TMDLParser._column_dict(n) for n in TMDLParser._table_nodes(document, "column")]
+                result["measures"] = [TMDLParser._measure_dict(n) for n in TMDLParser._table_nodes(document, "measure")]
+                calc_group = TMDLParser._calculation_group(document)
                 if calc_group:
                     result["calculationGroup"] = calc_group
             else:
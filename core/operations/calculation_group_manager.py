@@ -6,6 +6,9 @@ Manage calculation groups and calculation items
 import logging
 from typing import Dict, Any, List, Optional
 
+from core.infrastructure.adomd_commands import execute_reader
+from core.infrastructure.model_catalog import invalidate_model_catalog
+
 logger = logging.getLogger(__name__)
 
 AMO_AVAILABLE = True  # Determined lazily per-connection
@@ -74,15 +77,13 @@ class CalculationGroupManager:
 
             # Execute the query to get calculation group tables
             cmd = Adomd.AdomdCommand(tables_query, self.connection)
-            reader = cmd.ExecuteReader()
-
             cg_tables = []
-            while reader.Read():
-                cg_tables.append({
-                    'table_name': str(reader[0]) if reader[0] is not None else '',
-                    'description': str(reader[1]) if reader[1] is not None else None
-                })
-            reader.Close()
+            with execute_reader(cmd, self.connection) as reader:
+                while reader.Read():
+                    cg_tables.append({
+                        'table_name': str(reader[0]) if reader[0] is not None else '',
+                        'description': str(reader[1]) if reader[1] is not None else None
+                    })
 
             # For each calculation group table, get its items
             for cg_table in cg_tables:
@@ -99,20 +100,18 @@ class CalculationGroupManager:
                     """
 
                     cmd_items = Adomd.AdomdCommand(items_query, self.connection)
-                    reader_items = cmd_items.ExecuteReader()
-
                     items = []
                     ordinal = 0
-                    while reader_items.Read():
-                        item_name = str(reader_items[0]) if reader_items[0] is not None else ''
-                        items.append({
-                            'name': item_name,
-                            'expression': None,  # Not available via DAX query
-                            'ordinal': ordinal,
-                            'format_string_expression': None
-                        })
-                        ordinal += 1
-                    reader_items.Close()
+                    with execute_reader(cmd_items, self.connection) as reader_items:
+                        while reader_items.Read():
+                            item_name = str(reader_items[0]) if reader_items[0] is not None else ''
+                            items.append({
+                                'name': item_name,
+                                'expression': None,  # Not available via DAX query
+                                'ordinal': ordinal,
+                                'format_string_expression': None
+                            })
+                            ordinal += 1
 
                     calc_groups.append({
                         'name': table_name,
@@ -345,6 +344,7 @@ class CalculationGroupManager:
             # Save changes - this will validate the complete structure
             try:
                 model.SaveChanges()
+                invalidate_model_catalog()
                 logger.info(f"Created calculation group '{name}' with {len(items)} items")
             except Exception as save_error:
                 # Provide helpful error message about common issues
@@ -410,6 +410,7 @@ class CalculationGroupManager:
             # Remove table (which contains calculation group)
             model.Tables.Remove(table)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Deleted calculation group '{name}'")
 
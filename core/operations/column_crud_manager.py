@@ -6,6 +6,9 @@ Provides comprehensive column management: get, create, update, delete, rename
 import logging
 from typing import Dict, Any, Optional
 
+from core.infrastructure.adomd_commands import read_scalar
+from core.infrastructure.model_catalog import invalidate_model_catalog
+
 logger = logging.getLogger(__name__)
 
 AMO_AVAILABLE = False
@@ -94,10 +97,9 @@ class ColumnCRUDManager:
             try:
                 db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
                 cmd = AdomdCommand(db_query, self.connection)
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.connection)
+                if value is not None:
+                    db_name = str(value)
             except Exception:
                 db_name = None
 
@@ -334,6 +336,7 @@ class ColumnCRUDManager:
             # Add column to table
             table.Columns.Add(column)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Created {column_type} column '{column_name}' in table '{table_name}'")
 
@@ -478,6 +481,7 @@ class ColumnCRUDManager:
                 updates.append("name")
 
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Updated column '{column_name}' in table '{table_name}': {', '.join(updates)}")
 
@@ -561,6 +565,7 @@ class ColumnCRUDManager:
             # Remove column
             table.Columns.Remove(column)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Deleted column '{column_name}' from table '{table_name}'")
 
@@ -6,6 +6,9 @@ Provides measure rename and move operations
 import logging
 from typing import Dict, Any, Optional
 
+from core.infrastructure.adomd_commands import read_scalar
+from core.infrastructure.model_catalog import invalidate_model_catalog
+
 logger = logging.getLogger(__name__)
 
 AMO_AVAILABLE = False
@@ -86,10 +89,9 @@ class MeasureCRUDManager:
             try:
                 db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
                 cmd = AdomdCommand(db_query, self.connection)
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.connection)
+                if value is not None:
+                    db_name = str(value)
             except Exception:
                 db_name = None
 
@@ -178,6 +180,7 @@ class MeasureCRUDManager:
             old_name = measure.Name
             measure.Name = new_name
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Renamed measure '{old_name}' to '{new_name}' in table '{table_name}'")
 
@@ -299,6 +302,7 @@ class MeasureCRUDManager:
 
             tgt_table.Measures.Add(new_measure)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Moved measure '{measure_name}' from '{source_table}' to '{target_table}'")
 
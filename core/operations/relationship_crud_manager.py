@@ -6,6 +6,9 @@ Provides comprehensive relationship management: create, update, delete, activate
 import logging
 from typing import Dict, Any, Optional
 
+from core.infrastructure.adomd_commands import read_scalar
+from core.infrastructure.model_catalog import invalidate_model_catalog
+
 logger = logging.getLogger(__name__)
 
 AMO_AVAILABLE = False
@@ -91,10 +94,9 @@ class RelationshipCRUDManager:
             try:
                 db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
                 cmd = AdomdCommand(db_query, self.connection)
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.connection)
+                if value is not None:
+                    db_name = str(value)
             except Exception:
                 db_name = None
 
@@ -257,6 +259,7 @@ class RelationshipCRUDManager:
             # Add to model
             model.Relationships.Add(relationship)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Created relationship from {from_table}[{from_column}] to {to_table}[{to_column}]")
 
@@ -371,6 +374,7 @@ class RelationshipCRUDManager:
                 updates.append("name")
 
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Updated relationship '{relationship_name}': {', '.join(updates)}")
 
@@ -443,6 +447,7 @@ class RelationshipCRUDManager:
             # Remove relationship
             model.Relationships.Remove(relationship)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Deleted relationship '{relationship_name}'")
 
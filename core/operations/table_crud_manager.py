@@ -6,6 +6,9 @@ Provides comprehensive table management: create, update, delete, rename, refresh
 import logging
 from typing import Dict, Any, Optional
 
+from core.infrastructure.adomd_commands import read_scalar
+from core.infrastructure.model_catalog import invalidate_model_catalog
+
 logger = logging.getLogger(__name__)
 
 AMO_AVAILABLE = False
@@ -87,10 +90,9 @@ class TableCRUDManager:
             try:
                 db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
                 cmd = AdomdCommand(db_query, self.connection)
-                reader = cmd.ExecuteReader()
-                if reader.Read():
-                    db_name = str(reader.GetValue(0))
-                reader.Close()
+                value = read_scalar(cmd, self.connection)
+                if value is not None:
+                    db_name = str(value)
             except Exception:
                 db_name = None
 
@@ -200,6 +202,7 @@ class TableCRUDManager:
 
             model.Tables.Add(table)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Created table '{table_name}'")
 
@@ -321,6 +324,7 @@ class TableCRUDManager:
                 updates.append("name")
 
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Updated table '{table_name}': {', '.join(updates)}")
 
@@ -393,6 +397,7 @@ class TableCRUDManager:
             # Remove table
             model.Tables.Remove(table)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Deleted table '{table_name}'")
 
@@ -482,6 +487,7 @@ class TableCRUDManager:
             from Microsoft.AnalysisServices.Tabular import RefreshType
             table.RequestRefresh(RefreshType.Full)
             model.SaveChanges()
+            invalidate_model_catalog()
 
             logger.info(f"Requested refresh for table '{table_name}'")
 
@@ -274,10 +274,13 @@ class AgentPolicy:
         connection_state,
         mode: str = "all",
         bpa_profile: str = "balanced",
-        max_seconds: Optional[int] = None
+        max_seconds: Optional[int] = None,
+        incremental_bpa: bool = False
     ) -> Dict[str, Any]:
         """Delegate to AnalysisOrchestrator."""
-        return self.analysis_orch.analyze_best_practices_unified(connection_state, mode, bpa_profile, max_seconds)
+        return self.analysis_orch.analyze_best_practices_unified(
+            connection_state, mode, bpa_profile, max_seconds, incremental_bpa=incremental_bpa
+        )
 
     def analyze_performance_unified(
         self,
@@ -441,13 +444,20 @@ class AgentPolicy:
             return self.rate_limiter.get_status()
         return {'success': True, 'rate_limiting': 'disabled'}
 
-    def wrap_response_with_limits_info(self, result: Dict[str, Any], tool_name: str) -> Dict[str, Any]:
+    def wrap_response_with_limits_info(
+        self,
+        result: Dict[str, Any],
+        tool_name: str,
+        estimated_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Wrap response with limits information including token usage estimation.
 
         Args:
             result: The tool result dictionary
             tool_name: Name of the tool being executed
+            estimated_tokens: Token estimate from an encode the caller already did
+                (the result is serialized here otherwise)
 
         Returns:
             Result dictionary with added _limits_info metadata
@@ -456,9 +466,9 @@ class AgentPolicy:
             return result
 
         # Estimate token usage
-        import json
-        result_text = json.dumps(result)
-        estimated_tokens = self.limits_manager.token.estimate_tokens(result_text)
+        if estimated_tokens is None:
+            import json
+            estimated_tokens = self.limits_manager.token.estimate_tokens(json.dumps(result))
         max_tokens = self.limits_manager.token.max_result_tokens
         percentage = f"{(estimated_tokens / max_tokens * 100):.1f}%"
 
@@ -2,6 +2,7 @@
 import logging
 import time
 from typing import Any, Dict, List, Optional
+from core.infrastructure.cancellation import CancellationToken
 from .base_orchestrator import BaseOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -44,8 +45,8 @@ class AnalysisOrchestrator(BaseOrchestrator):
                     issues.append({'type': 'naming', 'severity': 'low', 'object': f"Measure:{name}", 'description': 'Very short measure name'})
         return {'success': True, 'issues': issues, 'total_issues': len(issues)}
 
-    def analyze_queries_batch(self, connection_state, queries: List[str], runs: Optional[int] = 3, clear_cache: bool = True, include_event_counts: bool = False) -> Dict[str, Any]:
-        """Run performance analysis on multiple queries in batch."""
+    def analyze_queries_batch(self, connection_state, queries: List[str], runs: Optional[int] = 3, clear_cache: bool = True, include_event_counts: bool = False, token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """Run performance analysis on multiple queries in batch; partial if the budget expires."""
         from core.validation.error_handler import ErrorHandler
 
         if not connection_state.is_connected():
@@ -55,20 +56,33 @@ class AnalysisOrchestrator(BaseOrchestrator):
         if not executor:
             return ErrorHandler.handle_manager_unavailable('query_executor')
         r = self._get_default_perf_runs(runs)
+        token = self._cancel_token(token)
+        queries = queries or []
         results: List[Dict[str, Any]] = []
-        for q in queries or []:
-            if perf:
-                results.append(perf.analyze_query(executor, q, r, bool(clear_cache), include_event_counts))
-            else:
-                # basic timing fallback
-                start = time.time()
-                res = executor.validate_and_execute_dax(q, 0)
-                ms = (time.time() - start) * 1000
-                results.append({'success': res.get('success', False), 'query': q, 'summary': {'avg_execution_ms': round(ms, 2), 'note': 'analyzer unavailable'}})
+        if not perf:
+            # basic timing fallback: no per-query traces to isolate, so send the queries in batches
+            group_size = max(1, int(self.config.get('performance.dax_batch_max_queries', 20) or 1))
+            for start in range(0, len(queries), group_size):
+                if token.cancelled:
+                    return token.mark_partial(
+                        {'success': True, 'runs': r, 'items': results, 'skipped_queries': len(queries) - len(results)},
+                        f"query {len(results) + 1}/{len(queries)}"
+                    )
+                group = queries[start:start + group_size]
+                for q, res in zip(group, executor.execute_dax_batch(group, 0)):
+                    results.append({'success': res.get('success', False), 'query': q, 'summary': {'avg_execution_ms': res.get('execution_time_ms', 0), 'note': 'analyzer unavailable'}})
+            return {'success': True, 'runs': r, 'items': results}
+        for q in queries:
+            if token.cancelled:
+                return token.mark_partial(
+                    {'success': True, 'runs': r, 'items': results, 'skipped_queries': len(queries) - len(results)},
+                    f"query {len(results) + 1}/{len(queries)}"
+                )
+            results.append(perf.analyze_query(executor, q, r, bool(clear_cache), include_event_counts))
         return {'success': True, 'runs': r, 'items': results}
 
-    def profile_columns(self, connection_state, table: str, columns: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Profile columns in a table with min/max/distinct/nulls stats."""
+    def profile_columns(self, connection_state, table: str, columns: Optional[List[str]] = None, token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """Profile columns in a table with min/max/distinct/nulls stats; partial if the budget expires."""
         from core.validation.error_handler import ErrorHandler
 
         if not connection_state.is_connected():
@@ -84,8 +98,16 @@ class AnalysisOrchestrator(BaseOrchestrator):
             if not info.get('success'):
                 return info
             cols = [c.get('Name') for c in info.get('rows', []) if c.get('Name')]
+        token = self._cancel_token(token)
+        cols = cols[:200]  # safety cap
         results: List[Dict[str, Any]] = []
-        for col in cols[:200]:  # safety cap
+        for col in cols:
+            if token.cancelled:
+                return token.mark_partial(
+                    {'success': True, 'table': table, 'columns': len(results), 'results': results,
+                     'skipped_columns': cols[len(results):]},
+                    f"column {len(results) + 1}/{len(cols)}"
+                )
             q = (
                 f"EVALUATE ROW(\"Min\", MIN('{table}'[{col}]), "
                 f"\"Max\", MAX('{table}'[{col}]), "
@@ -197,14 +219,24 @@ class AnalysisOrchestrator(BaseOrchestrator):
         connection_state,
         mode: str = "all",
         bpa_profile: str = "balanced",
-        max_seconds: Optional[int] = None
+        max_seconds: Optional[int] = None,
+        token: Optional[CancellationToken] = None,
+        incremental_bpa: bool = False
     ) -> Dict[str, Any]:
-        """Unified best practices analysis combining BPA and M query practices."""
+        """
+        Unified best practices analysis combining BPA and M query practices.
+
+        With incremental_bpa, BPA reuses outcomes for model objects unchanged
+        since the previous incremental run on this connection.
+        """
         from core.validation.error_handler import ErrorHandler
 
         if not connection_state.is_connected():
             return ErrorHandler.handle_not_connected()
 
+        token = self._cancel_token(token)
+        stopped_at: Optional[str] = None
+
         mode = (mode or "all").lower()
         results: Dict[str, Any] = {
             'success': True,
@@ -236,17 +268,19 @@ class AnalysisOrchestrator(BaseOrchestrator):
                             tmsl_json = tmsl_result.get('tmsl')
                             if bpa_profile == "fast":
                                 cfg = {
-                                    'max_seconds': max_seconds or 10,
+                                    'max_seconds': self._within_budget(token, max_seconds or 10),
                                     'per_rule_max_ms': 100,
-                                    'severity_at_least': 'WARNING'
+                                    'severity_at_least': 'WARNING',
+                                    'incremental': incremental_bpa
                                 }
                                 violations = bpa_analyzer.analyze_model_fast(tmsl_json, cfg)
                             elif bpa_profile == "deep":
-                                violations = bpa_analyzer.analyze_model(tmsl_json)
+                                violations = bpa_analyzer.analyze_model(tmsl_json, incremental=incremental_bpa)
                             else:  # balanced
                                 cfg = {
-                                    'max_seconds': max_seconds or 20,
-                                    'per_rule_max_ms': 150
+                                    'max_seconds': self._within_budget(token, max_seconds or 20),
+                                    'per_rule_max_ms': 150,
+                                    'incremental': incremental_bpa
                                 }
                                 violations = bpa_analyzer.analyze_model_fast(tmsl_json, cfg)
 
@@ -257,6 +291,8 @@ class AnalysisOrchestrator(BaseOrchestrator):
                                 'summary': bpa_analyzer.get_violations_summary(),
                                 'notes': bpa_analyzer.get_run_notes()
                             }
+                            if incremental_bpa:
+                                results['analyses']['bpa']['incremental'] = bpa_analyzer.get_incremental_stats()
                 except Exception as e:
                     results['analyses']['bpa'] = {
                         'success': False,
@@ -273,7 +309,9 @@ class AnalysisOrchestrator(BaseOrchestrator):
                 }
 
         # Run M query practices scan if requested
-        if mode in ("all", "m_queries"):
+        if mode in ("all", "m_queries") and token.cancelled:
+            stopped_at = 'm_practices'
+        elif mode in ("all", "m_queries"):
             try:
                 from core.analysis.m_practices import scan_m_practices
                 m_result = scan_m_practices(connection_state.query_executor)
@@ -294,6 +332,8 @@ class AnalysisOrchestrator(BaseOrchestrator):
         results['total_issues'] = total_issues
         results['summary'] = f'Found {total_issues} total issues across {len(results["analyses"])} analyses'
 
+        if stopped_at:
+            token.mark_partial(results, stopped_at)
         return results
 
     def analyze_performance_unified(
@@ -342,7 +382,7 @@ class AnalysisOrchestrator(BaseOrchestrator):
             return runs
         return self.config.get("performance.default_runs", 3) or 3
 
-    def full_analysis(self, connection_state, summary_only: bool = False) -> Dict[str, Any]:
+    def full_analysis(self, connection_state, summary_only: bool = False, token: Optional[CancellationToken] = None) -> Dict[str, Any]:
         """
         Comprehensive model analysis.
         Alias that delegates to the appropriate analysis methods.
@@ -357,6 +397,7 @@ class AnalysisOrchestrator(BaseOrchestrator):
             'summary_only': summary_only,
             'analyses': {}
         }
+        token = self._cancel_token(token)
 
         # Get basic best practices validation
         try:
@@ -368,6 +409,9 @@ class AnalysisOrchestrator(BaseOrchestrator):
                 'error': f'Best practices analysis failed: {str(e)}'
             }
 
+        if token.cancelled:
+            return token.mark_partial(results, 'relationships')
+
         # Get relationship overview
         try:
             rel_result = self.relationship_overview(connection_state)
@@ -380,8 +424,10 @@ class AnalysisOrchestrator(BaseOrchestrator):
 
         # If not summary_only, run more detailed analysis
         if not summary_only:
+            if token.cancelled:
+                return token.mark_partial(results, 'bpa_unified')
             try:
-                bpa_result = self.analyze_best_practices_unified(connection_state, mode="all")
+                bpa_result = self.analyze_best_practices_unified(connection_state, mode="all", token=token)
                 results['analyses']['bpa_unified'] = bpa_result
             except Exception as e:
                 results['analyses']['bpa_unified'] = {
@@ -399,11 +445,17 @@ class AnalysisOrchestrator(BaseOrchestrator):
         include_bpa: bool = True,
         include_performance: bool = True,
         include_integrity: bool = True,
-        max_seconds: Optional[int] = None
+        max_seconds: Optional[int] = None,
+        token: Optional[CancellationToken] = None,
+        incremental_bpa: bool = False
     ) -> Dict[str, Any]:
         """
         Unified comprehensive model analysis combining best practices, performance, and integrity checks.
 
+        Stages run in order and check the cancellation token in between; once the
+        tool's budget expires the remaining stages are skipped and the result is
+        flagged partial.
+
         Args:
             connection_state: Current connection state
             scope: Analysis scope - "all", "best_practices", "performance", "integrity"
@@ -412,6 +464,8 @@ class AnalysisOrchestrator(BaseOrchestrator):
             include_performance: Whether to run performance analysis
             include_integrity: Whether to run integrity validation
             max_seconds: Maximum execution time (optional)
+            token: Cancellation token (defaults to the current tool call's)
+            incremental_bpa: Re-evaluate BPA only for objects changed since the last incremental run
 
         Returns:
             Comprehensive analysis results with all requested analyses
@@ -437,8 +491,17 @@ class AnalysisOrchestrator(BaseOrchestrator):
         run_perf = scope in ("all", "performance") and include_performance
         run_integrity = scope in ("all", "integrity") and include_integrity
 
+        token = self._cancel_token(token)
+        stopped_at: Optional[str] = None
+
+        def _proceed(stage: str) -> bool:
+            nonlocal stopped_at
+            if stopped_at is None and token.cancelled:
+                stopped_at = stage
+            return stopped_at is None
+
         # 1. Model Integrity Validation
-        if run_integrity:
+        if run_integrity and _proceed('integrity'):
             try:
                 validator = connection_state.model_validator
                 if validator:
@@ -457,7 +520,7 @@ class AnalysisOrchestrator(BaseOrchestrator):
                 }
 
         # 2. Best Practice Analyzer (BPA)
-        if run_bp and include_bpa:
+        if run_bp and include_bpa and _proceed('bpa'):
             try:
                 bpa_analyzer = connection_state.bpa_analyzer
                 query_executor = connection_state.query_executor
@@ -472,17 +535,19 @@ class AnalysisOrchestrator(BaseOrchestrator):
                         # Configure BPA based on depth
                         if depth == "fast":
                             cfg = {
-                                'max_seconds': max_seconds or 10,
+                                'max_seconds': self._within_budget(token, max_seconds or 10),
                                 'per_rule_max_ms': 100,
-                                'severity_at_least': 'WARNING'
+                                'severity_at_least': 'WARNING',
+                                'incremental': incremental_bpa
                             }
                             violations = bpa_analyzer.analyze_model_fast(tmsl_json, cfg)
                         elif depth == "deep":
-                            violations = bpa_analyzer.analyze_model(tmsl_json)
+                            violations = bpa_analyzer.analyze_model(tmsl_json, incremental=incremental_bpa)
                         else:  # balanced
                             cfg = {
-                                'max_seconds': max_seconds or 20,
-                                'per_rule_max_ms': 150
+                                'max_seconds': self._within_budget(token, max_seconds or 20),
+                                'per_rule_max_ms': 150,
+                                'incremental': incremental_bpa
                             }
                             violations = bpa_analyzer.analyze_model_fast(tmsl_json, cfg)
 
@@ -493,6 +558,8 @@ class AnalysisOrchestrator(BaseOrchestrator):
                             'summary': bpa_analyzer.get_violations_summary(),
                             'notes': bpa_analyzer.get_run_notes()
                         }
+                        if incremental_bpa:
+                            results['analyses']['bpa']['incremental'] = bpa_analyzer.get_incremental_stats()
                     else:
                         results['analyses']['bpa'] = {
                             'success': False,
@@ -514,7 +581,7 @@ class AnalysisOrchestrator(BaseOrchestrator):
                 }
 
         # 3. M Query Practices
-        if run_bp:
+        if run_bp and _proceed('m_practices'):
             try:
                 from core.analysis.m_practices import scan_m_practices
                 query_executor = connection_state.query_executor
@@ -535,7 +602,7 @@ class AnalysisOrchestrator(BaseOrchestrator):
                 }
 
         # 4. Performance Analysis (Cardinality)
-        if run_perf:
+        if run_perf and _proceed('performance'):
             try:
                 performance_optimizer = connection_state.performance_optimizer
 
@@ -555,21 +622,22 @@ class AnalysisOrchestrator(BaseOrchestrator):
                 }
 
         # 5. Relationship Overview (always included for context)
-        try:
-            query_executor = connection_state.query_executor
-            if query_executor:
-                rels = query_executor.execute_info_query('RELATIONSHIPS')
+        if _proceed('relationships'):
+            try:
+                query_executor = connection_state.query_executor
+                if query_executor:
+                    rels = query_executor.execute_info_query('RELATIONSHIPS')
+                    results['analyses']['relationships'] = {
+                        'success': bool(rels.get('success')),
+                        'count': len(rels.get('rows', [])),
+                        'relationships': rels.get('rows', [])
+                    }
+            except Exception as e:
+                logger.error(f"Relationship overview failed: {e}")
                 results['analyses']['relationships'] = {
-                    'success': bool(rels.get('success')),
-                    'count': len(rels.get('rows', [])),
-                    'relationships': rels.get('rows', [])
+                    'success': False,
+                    'error': f'Relationship overview failed: {str(e)}'
                 }
-        except Exception as e:
-            logger.error(f"Relationship overview failed: {e}")
-            results['analyses']['relationships'] = {
-                'success': False,
-                'error': f'Relationship overview failed: {str(e)}'
-            }
 
         # Calculate execution time
         results['execution_time_seconds'] = round(time.time() - results['start_time'], 2)
@@ -604,6 +672,8 @@ class AnalysisOrchestrator(BaseOrchestrator):
             'recommendation': self._get_recommendation(total_issues, results['analyses'])
         }
 
+        if stopped_at:
+            token.mark_partial(results, stopped_at)
         return results
 
     def _get_recommendation(self, total_issues: int, analyses: Dict[str, Any]) -> str:
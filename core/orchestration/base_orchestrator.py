@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, Optional
 
+from core.infrastructure.cancellation import CancellationToken, current_cancellation_token
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,3 +43,15 @@ class BaseOrchestrator:
             from core.validation.error_handler import ErrorHandler
             return ErrorHandler.handle_manager_unavailable(manager_name)
         return None
+
+    def _cancel_token(self, token: Optional[CancellationToken] = None) -> CancellationToken:
+        """Token to check in long loops: the given one, else the current tool call's."""
+        return token if token is not None else current_cancellation_token()
+
+    @staticmethod
+    def _within_budget(token: CancellationToken, seconds: Optional[float]) -> Optional[float]:
+        """Cap an analyzer's own time limit by what is left of the call's budget."""
+        remaining = token.remaining()
+        if remaining is None:
+            return seconds
+        return max(1.0, min(seconds, remaining)) if seconds else max(1.0, remaining)
@@ -30,10 +30,13 @@ class CacheOrchestrator(BaseOrchestrator):
                     perf._clear_cache(executor)
             except Exception:
                 pass
-        for q in queries or []:
-            times = []
-            ok = True
-            for _ in range(r):
+        queries = list(queries or [])
+        # First run of every query in one batched round trip; repeat runs time the warmed cache
+        first_runs = executor.execute_dax_batch(queries, 0, bypass_cache=False)
+        for q, first in zip(queries, first_runs):
+            times = [float(first.get('execution_time_ms') or 0)]
+            ok = bool(first.get('success'))
+            for _ in range(r - 1):
                 start = time.time()
                 res = executor.validate_and_execute_dax(q, 0, bypass_cache=False)
                 ok = ok and bool(res.get('success'))
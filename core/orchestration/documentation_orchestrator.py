@@ -1,6 +1,7 @@
 """Documentation generation orchestration."""
 import logging
 from typing import Any, Dict, List, Optional
+from core.infrastructure.cancellation import CancellationToken
 from .base_orchestrator import BaseOrchestrator
 from core.utilities.type_conversions import safe_bool
 
@@ -9,7 +10,7 @@ logger = logging.getLogger(__name__)
 class DocumentationOrchestrator(BaseOrchestrator):
     """Handles documentation generation workflows."""
 
-    def generate_docs_safe(self, connection_state) -> Dict[str, Any]:
+    def generate_docs_safe(self, connection_state, token: Optional[CancellationToken] = None) -> Dict[str, Any]:
         """Generate documentation, preferring safe/lightweight operations for large models."""
         from core.validation.error_handler import ErrorHandler
 
@@ -23,8 +24,11 @@ class DocumentationOrchestrator(BaseOrchestrator):
             return ErrorHandler.handle_manager_unavailable('query_executor')
 
         # Use get_model_summary first to get scale hints
+        token = self._cancel_token(token)
         summary = exporter.get_model_summary(executor)
         notes: List[str] = []
+        if token.cancelled:
+            return token.mark_partial({'success': False, 'error': 'Budget expired after model summary', 'summary': summary}, 'generate_documentation')
         if not summary.get("success"):
             notes.append("Model summary unavailable; proceeding to basic documentation")
             return exporter.generate_documentation(executor)
@@ -359,19 +363,24 @@ class DocumentationOrchestrator(BaseOrchestrator):
                 'notes': graph_notes
             }
 
-    def auto_document(self, connection_manager, connection_state, profile: str = 'light', include_lineage: bool = False) -> Dict[str, Any]:
-        """Automated documentation generation workflow."""
+    def auto_document(self, connection_manager, connection_state, profile: str = 'light', include_lineage: bool = False, token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """Automated documentation generation workflow; stops between phases once the budget expires."""
         from core.orchestration.connection_orchestrator import ConnectionOrchestrator
 
+        token = self._cancel_token(token)
         actions: List[Dict[str, Any]] = []
         conn_orch = ConnectionOrchestrator(self.config)
         ensured = conn_orch.ensure_connected(connection_manager, connection_state)
         actions.append({'action': 'ensure_connected', 'result': ensured})
         if not ensured.get('success'):
             return {'success': False, 'phase': 'ensure_connected', 'actions': actions, 'final': ensured}
+        if token.cancelled:
+            return token.mark_partial({'success': False, 'phase': 'summarize_model_safely', 'actions': actions, 'final': ensured}, 'summarize_model_safely')
         summary = conn_orch.summarize_model_safely(connection_state)
         actions.append({'action': 'summarize_model_safely', 'result': summary})
-        docs = self.generate_docs_safe(connection_state)
+        if token.cancelled:
+            return token.mark_partial({'success': False, 'phase': 'generate_docs_safe', 'actions': actions, 'final': summary}, 'generate_docs_safe')
+        docs = self.generate_docs_safe(connection_state, token=token)
         actions.append({'action': 'generate_docs_safe', 'result': docs})
         return {'success': docs.get('success', False), 'actions': actions, 'final': docs}
 
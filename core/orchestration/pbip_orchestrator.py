@@ -2,6 +2,7 @@
 import logging
 import os
 from typing import Any, Dict, Optional, List
+from core.infrastructure.cancellation import CancellationToken, OperationCancelled
 from .base_orchestrator import BaseOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -15,9 +16,16 @@ class PbipOrchestrator(BaseOrchestrator):
         output_path: str = "exports/pbip_analysis",
         exclude_folders: Optional[List[str]] = None,
         bpa_rules_path: Optional[str] = "config/bpa_rules_comprehensive.json",
-        enable_enhanced: bool = True
+        enable_enhanced: bool = True,
+        token: Optional[CancellationToken] = None
     ) -> Dict[str, Any]:
-        """Perform comprehensive PBIP repository analysis with enhanced features."""
+        """Perform comprehensive PBIP repository analysis with enhanced features.
+
+        Parsing steps are required; if the budget expires before the enhanced
+        analysis it is skipped (or cut short) and the report is built from what
+        was gathered, flagged partial.
+        """
+        token = self._cancel_token(token)
         try:
             from core.pbip.pbip_project_scanner import PbipProjectScanner
             from core.pbip.pbip_model_analyzer import TmdlModelAnalyzer
@@ -55,6 +63,7 @@ class PbipOrchestrator(BaseOrchestrator):
 
             analyzer = TmdlModelAnalyzer()
             model_data = analyzer.analyze_model(model_folder)
+            token.check("report_analysis")
 
             # Step 3: Analyze report (if available)
             report_data = None
@@ -66,15 +75,21 @@ class PbipOrchestrator(BaseOrchestrator):
                     report_data = report_analyzer.analyze_report(report_folder)
 
             # Step 4: Dependency analysis
+            token.check("dependency_analysis")
             dep_engine = PbipDependencyEngine(model_data, report_data)
             dependencies = dep_engine.analyze_all_dependencies()
 
             # Step 5: Enhanced analysis (if enabled)
             enhanced_results = None
-            if enable_enhanced:
+            stopped_at = None
+            if enable_enhanced and token.cancelled:
+                stopped_at = "enhanced_analysis"
+            elif enable_enhanced:
                 logger.info("Running enhanced analysis...")
                 enhanced_analyzer = EnhancedPbipAnalyzer(model_data, report_data, dependencies)
                 enhanced_results = enhanced_analyzer.run_full_analysis(bpa_rules_path)
+                if enhanced_results.get("partial"):
+                    stopped_at = enhanced_results["cancellation"]["stopped_at"]
 
                 logger.info(
                     f"Enhanced analysis complete: "
@@ -129,8 +144,17 @@ class PbipOrchestrator(BaseOrchestrator):
                     summary["enhanced_statistics"]["bpa_errors"] = bpa_summary.get("by_severity", {}).get("ERROR", 0)
                     summary["enhanced_statistics"]["bpa_warnings"] = bpa_summary.get("by_severity", {}).get("WARNING", 0)
 
+            if stopped_at:
+                token.mark_partial(summary, stopped_at)
             return summary
 
+        except OperationCancelled as e:
+            return token.mark_partial({
+                "success": False,
+                "error": f"PBIP analysis stopped before {e.stage}: {e.reason}",
+                "error_type": "timeout"
+            }, e.stage)
+
         except Exception as e:
             logger.error(f"PBIP analysis failed: {e}", exc_info=True)
             return {
@@ -11,7 +11,8 @@ from typing import Dict, List, Set, Tuple, Optional, Any
 
 # Import existing DAX parser
 try:
-    from core.dax.dax_reference_parser import DaxReferenceIndex, parse_dax_references
+    from core.dax.dax_reference_parser import DaxReferenceIndex
+    from core.dax.dax_parse_cache import parse_dax_references_cached, flush_dax_parse_cache
     DAX_PARSER_AVAILABLE = True
 except ImportError:
     DAX_PARSER_AVAILABLE = False
@@ -88,6 +89,8 @@ class PbipDependencyEngine:
         # Analyze model dependencies
         self._analyze_measure_dependencies()
         self._analyze_column_usage()
+        if DAX_PARSER_AVAILABLE:
+            flush_dax_parse_cache()
         self._analyze_field_parameters()
         self._build_reverse_indices()
 
@@ -170,7 +173,7 @@ class PbipDependencyEngine:
                     continue
 
                 # Parse DAX expression
-                refs = parse_dax_references(expression, self.reference_index)
+                refs = parse_dax_references_cached(expression, self.reference_index)
 
                 # Extract measure dependencies
                 measure_deps = []
@@ -223,7 +226,7 @@ class PbipDependencyEngine:
                 column_key = f"{table_name}[{column_name}]"
 
                 # Parse expression
-                refs = parse_dax_references(expression, self.reference_index)
+                refs = parse_dax_references_cached(expression, self.reference_index)
 
                 # Track column-to-column dependencies
                 for ref_table, ref_column in refs.get("columns", []):
@@ -19,6 +19,8 @@ from collections import defaultdict, Counter
 from pathlib import Path
 from datetime import datetime
 
+from core.infrastructure.cancellation import current_cancellation_token
+
 logger = logging.getLogger(__name__)
 
 
@@ -1073,6 +1075,9 @@ class EnhancedPbipAnalyzer:
         """
         Run complete enhanced analysis.
 
+        Stops between analyses once the current tool call's budget expires and
+        returns what was gathered, flagged partial.
+
         Args:
             bpa_rules_path: Optional path to BPA rules JSON file
 
@@ -1086,32 +1091,51 @@ class EnhancedPbipAnalyzer:
             "model_name": self.model.get("name", "Unknown"),
             "analyses": {}
         }
+        token = current_cancellation_token()
 
         # 1. Column Lineage & Impact Analysis
         self.logger.info("Analyzing column lineage...")
         results["analyses"]["column_lineage"] = self.lineage_analyzer.analyze_column_lineage()
 
+        if token.cancelled:
+            return token.mark_partial(results, "data_types")
+
         # 2. Data Type & Cardinality Analysis
         self.logger.info("Analyzing data types and cardinality...")
         results["analyses"]["data_types"] = self.type_analyzer.analyze_data_types()
         results["analyses"]["cardinality"] = self.type_analyzer.analyze_cardinality()
 
+        if token.cancelled:
+            return token.mark_partial(results, "relationships")
+
         # 3. Relationship Quality Metrics
         self.logger.info("Analyzing relationship quality...")
         results["analyses"]["relationships"] = self.relationship_analyzer.analyze_relationships()
 
+        if token.cancelled:
+            return token.mark_partial(results, "dax_quality")
+
         # 4. DAX Code Quality Metrics
         self.logger.info("Analyzing DAX code quality...")
         results["analyses"]["dax_quality"] = self.dax_analyzer.analyze_dax_quality()
 
+        if token.cancelled:
+            return token.mark_partial(results, "naming_conventions")
+
         # 5. Naming Convention Validation
         self.logger.info("Validating naming conventions...")
         results["analyses"]["naming_conventions"] = self.naming_validator.validate_naming_conventions()
 
+        if token.cancelled:
+            return token.mark_partial(results, "perspectives")
+
         # 6. Perspective Analysis
         self.logger.info("Analyzing perspectives...")
         results["analyses"]["perspectives"] = self.perspective_analyzer.analyze_perspectives()
 
+        if token.cancelled:
+            return token.mark_partial(results, "bpa")
+
         # 7. BPA Analysis (if rules provided)
         if bpa_rules_path:
             self.logger.info("Running Best Practice Analyzer...")
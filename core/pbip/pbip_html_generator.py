@@ -3,18 +3,112 @@ PBIP HTML Generator (Vue 3 Version) - Generates interactive HTML dashboard for P
 
 This module creates a comprehensive, interactive HTML dashboard with Vue 3,
 D3.js visualizations, searchable tables, and dependency graphs.
+
+The document is streamed to disk. The analysis data is not inlined as one
+JavaScript literal: it is written section by section (core, tables, measures,
+pages, visuals, dependencies, enhanced) as JSON, optionally gzip-compressed and
+base64-encoded, either embedded in inert <script type="application/json">
+blocks or as sidecar scripts next to the HTML. The page decodes the sections
+after it has rendered, so neither the generator nor the browser holds the
+whole payload as one string.
 """
 
+import base64
 import html
 import json
 import logging
 import os
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, TextIO, Tuple
 
 logger = logging.getLogger(__name__)
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# Characters of JSON text gathered before each write/compress call
+_WRITE_BATCH_CHARS = 1 << 16
+
+
+def _iter_json(value: Any, depth: int = 3) -> Iterator[str]:
+    """
+    JSON text of value in pieces.
+
+    Dicts and lists down to depth are emitted item by item; anything deeper is
+    encoded whole, so memory is bounded by the largest such item rather than
+    by the whole value.
+    """
+    if depth > 0 and isinstance(value, dict):
+        yield '{'
+        for i, (key, item) in enumerate(value.items()):
+            if not isinstance(key, str):
+                key = _JSON_ENCODER.encode(key)
+            yield (',' if i else '') + _JSON_ENCODER.encode(key) + ':'
+            yield from _iter_json(item, depth - 1)
+        yield '}'
+    elif depth > 0 and isinstance(value, (list, tuple)):
+        yield '['
+        for i, item in enumerate(value):
+            if i:
+                yield ','
+            yield from _iter_json(item, depth - 1)
+        yield ']'
+    else:
+        yield _JSON_ENCODER.encode(value)
+
+
+class _Base64Writer:
+    """Binary sink that base64-encodes into a text stream, keeping 3-byte alignment between writes."""
+
+    def __init__(self, out: TextIO):
+        self._out = out
+        self._pending = b''
+
+    def write(self, data: bytes) -> None:
+        data = self._pending + data
+        aligned = len(data) - len(data) % 3
+        if aligned:
+            self._out.write(base64.b64encode(data[:aligned]).decode('ascii'))
+        self._pending = data[aligned:]
+
+    def close(self) -> None:
+        if self._pending:
+            self._out.write(base64.b64encode(self._pending).decode('ascii'))
+            self._pending = b''
+
+
+def _write_json_payload(out: TextIO, value: Any, compress: bool) -> None:
+    """
+    Stream value to out as JSON text, or as base64 of its gzip when compress is set.
+
+    Uncompressed text has every '<' escaped (it can only occur inside JSON
+    strings) so it is safe inside a <script> element.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits 31: gzip container
+    sink = _Base64Writer(out) if compress else None
+    batch: List[str] = []
+    size = 0
+
+    def flush_batch():
+        text = ''.join(batch)
+        if compressor:
+            sink.write(compressor.compress(text.encode('utf-8')))
+        else:
+            out.write(text.replace('<', '\\u003c'))
+        batch.clear()
+
+    for piece in _iter_json(value):
+        batch.append(piece)
+        size += len(piece)
+        if size >= _WRITE_BATCH_CHARS:
+            flush_batch()
+            size = 0
+    flush_batch()
+    if compressor:
+        sink.write(compressor.flush())
+        sink.close()
+
 
 class PbipHtmlGenerator:
     """Generates interactive HTML dashboard for PBIP analysis using Vue 3."""
@@ -30,7 +124,9 @@ class PbipHtmlGenerator:
         dependencies: Dict[str, Any],
         output_path: str,
         repository_name: str = "PBIP Repository",
-        enhanced_results: Optional[Dict[str, Any]] = None
+        enhanced_results: Optional[Dict[str, Any]] = None,
+        data_mode: str = "inline",
+        compress_data: bool = True
     ) -> str:
         """
         Generate comprehensive HTML report.
@@ -42,13 +138,21 @@ class PbipHtmlGenerator:
             output_path: Output directory path
             repository_name: Name of the repository
             enhanced_results: Optional enhanced analysis results (BPA, perspectives, etc.)
+            data_mode: 'inline' embeds the data sections in the HTML file;
+                'external' writes them as scripts to a <report>_data folder next to it
+            compress_data: Store each data section gzip-compressed and base64-encoded
+                (decoded in the browser with DecompressionStream)
 
         Returns:
             Path to generated HTML file
 
         Raises:
+            ValueError: If data_mode is unknown
             IOError: If unable to write output file
         """
+        if data_mode not in ("inline", "external"):
+            raise ValueError(f"Unknown data_mode '{data_mode}' (expected 'inline' or 'external')")
+
         # Convert to absolute path for MCP compatibility
         abs_output_path = os.path.abspath(output_path)
         self.logger.info(f"Generating Vue 3 HTML report to {abs_output_path}")
@@ -56,8 +160,7 @@ class PbipHtmlGenerator:
         # Create output directory
         os.makedirs(abs_output_path, exist_ok=True)
 
-        # Generate HTML content
-        html_content = self._build_html_document(
+        sections = self._split_data_sections(
             model_data,
             report_data,
             dependencies,
@@ -66,7 +169,6 @@ class PbipHtmlGenerator:
         )
 
         # Generate filename from repository name and timestamp
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Clean repository name for filename
@@ -78,8 +180,17 @@ class PbipHtmlGenerator:
         html_file = os.path.join(abs_output_path, filename)
 
         try:
+            data_dir_name = None
+            if data_mode == "external":
+                data_dir_name = f"{Path(filename).stem}_data"
+                data_dir = os.path.join(abs_output_path, data_dir_name)
+                os.makedirs(data_dir, exist_ok=True)
+                for name, value in sections:
+                    with open(os.path.join(data_dir, f"{name}.js"), 'w', encoding='utf-8') as f:
+                        self._write_data_script(f, name, value, compress_data)
+
             with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                self._write_html_document(f, sections, repository_name, compress_data, data_dir_name)
 
             self.logger.info(f"Vue 3 HTML report generated: {html_file}")
             return html_file
@@ -88,32 +199,80 @@ class PbipHtmlGenerator:
             self.logger.error(f"Failed to write HTML report: {e}")
             raise IOError(f"Failed to write HTML report: {e}")
 
-    def _build_html_document(
+    def _split_data_sections(
         self,
         model_data: Dict,
         report_data: Optional[Dict],
         dependencies: Dict,
         repo_name: str,
         enhanced_results: Optional[Dict] = None
-    ) -> str:
-        """Build complete HTML document with Vue 3."""
-        # Prepare data for JavaScript
-        data_json = {
-            "model": model_data,
-            "report": report_data,
-            "dependencies": dependencies,
-            "enhanced": enhanced_results,
+    ) -> List[Tuple[str, Any]]:
+        """
+        Split the dashboard data into separately loaded sections.
+
+        Measures are detached from their tables and visuals from their pages
+        (as lists parallel to tables/pages); PbipData.loadReport() in the page
+        puts them back. Only shallow copies are made.
+        """
+        model_data = model_data or {}
+        tables = model_data.get("tables") or []
+        pages = (report_data or {}).get("pages") or []
+
+        core = {
+            "model": {k: v for k, v in model_data.items() if k != "tables"},
+            "report": {k: v for k, v in report_data.items() if k != "pages"} if report_data is not None else None,
             "generated": datetime.now().isoformat(),
             "repository_name": repo_name
         }
-
-        # Serialize to JSON string
-        data_json_str = json.dumps(data_json, indent=2, ensure_ascii=False)
-
-        # Build complete HTML
-        html_content = self._get_vue3_template(data_json_str, repo_name)
-
-        return html_content
+        return [
+            ("core", core),
+            ("tables", [{k: v for k, v in t.items() if k != "measures"} for t in tables]),
+            ("measures", [t.get("measures") or [] for t in tables]),
+            ("pages", [{k: v for k, v in p.items() if k != "visuals"} for p in pages]),
+            ("visuals", [p.get("visuals") or [] for p in pages]),
+            ("dependencies", dependencies or {}),
+            ("enhanced", enhanced_results),
+        ]
+
+    def _write_html_document(
+        self,
+        out: TextIO,
+        sections: List[Tuple[str, Any]],
+        repo_name: str,
+        compress: bool,
+        data_dir_name: Optional[str] = None
+    ) -> None:
+        """Stream the complete HTML document; data sections are embedded unless data_dir_name is set."""
+        escaped_repo_name = html.escape(repo_name)
+        encoding = "gzip-base64" if compress else "json"
+
+        out.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n')
+        out.write(self._get_head_section(escaped_repo_name))
+        out.write('\n')
+        out.write(self._get_styles())
+        out.write('\n</head>\n')
+        out.write('<div id="pbip-loading" class="data-loading">Loading analysis data&hellip;</div>\n')
+        out.write(self._get_body_content())
+        out.write('\n')
+        if data_dir_name is None:
+            for name, value in sections:
+                out.write(f'    <script type="application/json" id="pbip-data-{name}" data-encoding="{encoding}">')
+                _write_json_payload(out, value, compress)
+                out.write('</script>\n')
+        out.write(self._get_data_loader_script(f"{data_dir_name}/" if data_dir_name else None))
+        out.write(self._get_vue_app_script())
+        out.write('\n</html>')
+
+    def _write_data_script(self, out: TextIO, name: str, value: Any, compress: bool) -> None:
+        """Write one data section as a sidecar script that registers itself with PbipData."""
+        if compress:
+            out.write(f'PbipData.register("{name}", "gzip-base64", "')
+            _write_json_payload(out, value, True)
+            out.write('");\n')
+        else:
+            out.write(f'PbipData.register("{name}", "json", ')
+            _write_json_payload(out, value, False)
+            out.write(');\n')
 
 
     def _get_head_section(self, escaped_repo_name: str) -> str:
@@ -2843,6 +3002,14 @@ class PbipHtmlGenerator:
             display: none !important;
         }}
 
+        /* Shown while the data sections are decoded, removed once the app mounts */
+        .data-loading {{
+            padding: 48px;
+            text-align: center;
+            font-family: 'DM Sans', sans-serif;
+            color: #78716c;
+        }}
+
         /* Command Palette */
         .command-palette {{
             position: fixed;
@@ -6062,14 +6229,105 @@ class PbipHtmlGenerator:
     </div>
 """
 
-    def _get_vue_app_script(self, data_json_str: str) -> str:
+    def _get_data_loader_script(self, data_base: Optional[str]) -> str:
+        """
+        Get the script that loads the data sections.
+
+        Args:
+            data_base: Relative URL prefix of the sidecar data scripts, or None
+                when the sections are embedded in the document
+        """
+        source_json = json.dumps({"base": data_base}).replace('<', '\\u003c')
+        return f"""    <script>
+        const pbipDataSource = {source_json};
+
+        // Data sections are inert <script type="application/json"> blocks, or sidecar
+        // scripts (pbipDataSource.base) that call PbipData.register() when loaded.
+        const PbipData = {{
+            _registered: {{}},
+            _loads: {{}},
+
+            register(name, encoding, payload) {{
+                this._registered[name] = {{ encoding, payload }};
+            }},
+
+            load(name) {{
+                if (!this._loads[name]) {{
+                    this._loads[name] = this._read(name).then(section => this._decode(section.encoding, section.payload));
+                }}
+                return this._loads[name];
+            }},
+
+            _read(name) {{
+                if (!pbipDataSource.base) {{
+                    const el = document.getElementById('pbip-data-' + name);
+                    if (!el) return Promise.reject(new Error('Missing data section: ' + name));
+                    const section = {{ encoding: el.dataset.encoding, payload: el.textContent }};
+                    el.remove();
+                    return Promise.resolve(section);
+                }}
+                return new Promise((resolve, reject) => {{
+                    const script = document.createElement('script');
+                    script.src = pbipDataSource.base + name + '.js';
+                    script.onload = () => {{
+                        const section = this._registered[name];
+                        delete this._registered[name];
+                        script.remove();
+                        section ? resolve(section) : reject(new Error('Data file did not register: ' + script.src));
+                    }};
+                    script.onerror = () => reject(new Error('Could not load ' + script.src));
+                    document.head.appendChild(script);
+                }});
+            }},
+
+            async _decode(encoding, payload) {{
+                if (encoding === 'json') {{
+                    return typeof payload === 'string' ? JSON.parse(payload) : payload;
+                }}
+                if (encoding !== 'gzip-base64') {{
+                    throw new Error('Unknown data encoding: ' + encoding);
+                }}
+                if (typeof DecompressionStream === 'undefined') {{
+                    throw new Error('this browser cannot decompress the report data; regenerate it without compression');
+                }}
+                const binary = atob(payload);
+                const bytes = new Uint8Array(binary.length);
+                for (let i = 0; i < binary.length; i++) {{
+                    bytes[i] = binary.charCodeAt(i);
+                }}
+                const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+                return JSON.parse(await new Response(stream).text());
+            }},
+
+            // Sections the dashboard needs before it mounts; 'enhanced' is loaded on demand
+            async loadReport() {{
+                const [core, tables, measures, pages, visuals, dependencies] = await Promise.all(
+                    ['core', 'tables', 'measures', 'pages', 'visuals', 'dependencies'].map(name => this.load(name))
+                );
+                tables.forEach((table, i) => {{ table.measures = measures[i] || []; }});
+                pages.forEach((page, i) => {{ page.visuals = visuals[i] || []; }});
+                return {{
+                    model: Object.assign(core.model || {{}}, {{ tables }}),
+                    report: core.report ? Object.assign(core.report, {{ pages }}) : null,
+                    dependencies: dependencies || {{}},
+                    enhanced: null,
+                    generated: core.generated,
+                    repository_name: core.repository_name
+                }};
+            }}
+        }};
+    </script>
+"""
+
+    def _get_vue_app_script(self) -> str:
         """Get Vue 3 app script."""
         return f"""    <script>
         const {{ createApp }} = Vue;
 
-        const pbipData = {data_json_str};
+        // Assembled from the data sections before the app mounts
+        let pbipData = null;
 
-        createApp({{
+        const pbipApp = {{
             data() {{
                 return {{
                     modelData: pbipData.model || {{}},
@@ -7198,6 +7456,12 @@ class PbipHtmlGenerator:
             }},
 
             watch: {{
+                activeTab(newTab) {{
+                    if (['best-practices', 'data-quality', 'perspectives'].includes(newTab)) {{
+                        this.loadEnhancedData();
+                    }}
+                }},
+
                 relationshipGraphLayout(newLayout) {{
                     if (newLayout !== 'list') {{
                         this.$nextTick(() => {{
@@ -7248,14 +7512,26 @@ class PbipHtmlGenerator:
                     a.click();
                 }},
 
+                loadEnhancedData() {{
+                    if (!this._enhancedLoad) {{
+                        this._enhancedLoad = PbipData.load('enhanced').then(enhanced => {{
+                            pbipData.enhanced = enhanced;
+                            this.enhancedData = enhanced;
+                        }}).catch(error => console.error('Could not load enhanced analysis data:', error));
+                    }}
+                    return this._enhancedLoad;
+                }},
+
                 exportToJSON() {{
-                    const dataStr = JSON.stringify(pbipData, null, 2);
-                    const blob = new Blob([dataStr], {{ type: 'application/json' }});
-                    const url = URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = 'pbip_full_export.json';
-                    a.click();
+                    this.loadEnhancedData().then(() => {{
+                        const dataStr = JSON.stringify(pbipData, null, 2);
+                        const blob = new Blob([dataStr], {{ type: 'application/json' }});
+                        const url = URL.createObjectURL(blob);
+                        const a = document.createElement('a');
+                        a.href = url;
+                        a.download = 'pbip_full_export.json';
+                        a.click();
+                    }});
                 }},
 
                 // Relationship Graph Rendering Methods
@@ -8908,6 +9184,9 @@ class PbipHtmlGenerator:
                     }});
                 }}
 
+                // Enhanced analysis only feeds its own tabs; decode it once the page is idle
+                (window.requestIdleCallback || (callback => setTimeout(callback, 200)))(() => this.loadEnhancedData());
+
                 // Keyboard shortcuts
                 document.addEventListener('keydown', (e) => {{
                     // Cmd/Ctrl + K for command palette
@@ -8930,20 +9209,18 @@ class PbipHtmlGenerator:
                         document.querySelector('input[placeholder*="Search"]')?.focus();
                     }}
                 }});
-            }}}}).mount('#app');
+            }}}};
+
+        PbipData.loadReport().then(data => {{
+            pbipData = data;
+            createApp(pbipApp).mount('#app');
+            document.getElementById('pbip-loading')?.remove();
+        }}).catch(error => {{
+            console.error(error);
+            const loading = document.getElementById('pbip-loading');
+            if (loading) {{
+                loading.textContent = 'Could not load the report data: ' + error.message;
+            }}
+        }});
     </script>
 """
-
-    def _get_vue3_template(self, data_json_str: str, repo_name: str) -> str:
-        """Get the complete Vue 3 HTML template."""
-        escaped_repo_name = html.escape(repo_name)
-
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-{self._get_head_section(escaped_repo_name)}
-{self._get_styles()}
-</head>
-{self._get_body_content()}
-{self._get_vue_app_script(data_json_str)}
-</html>"""
@@ -11,6 +11,9 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
+from core.tmdl.parallel_parse import ParallelParseSettings, map_in_processes
+from core.tmdl.tmdl_stream import TmdlNode, parse_tmdl_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +53,11 @@ class TmdlParser:
 
     def _parse_content(self, content: str) -> Dict[str, Any]:
         """
-        Parse TMDL content using indentation-based parsing.
+        Parse TMDL content into nested dictionaries.
+
+        Objects become {"_type", "_name", <properties>, <child type>: [...]} dicts,
+        grouped under their parent by type; expressions are stored under
+        "expression" (or the property name for "key = ..." expressions).
 
         Args:
             content: TMDL file content
@@ -58,227 +65,44 @@ class TmdlParser:
         Returns:
             Parsed structure
         """
-        lines = content.split('\n')
-        root = {}
-        stack = [(root, -1)]  # (current_dict, indent_level)
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Skip empty lines
-            if not line.strip():
-                i += 1
-                continue
-
-            indent = self._get_indent_level(line)
-            content_line = line.strip()
-
-            # Pop stack until we find the right parent level
-            while stack and stack[-1][1] >= indent:
-                stack.pop()
-
-            current_parent, _ = stack[-1]
-
-            # Check for object declarations (table, column, measure, relationship, etc.)
-            if self._is_object_declaration(content_line):
-                # First extract inline expression if present (before _parse_object_declaration modifies it)
-                inline_expression = None
-                has_equals = '=' in content_line
-
-                if has_equals:
-                    # Split on first '=' to separate declaration from expression
-                    # e.g., "measure Period = SELECTEDVALUE(...)" -> ["measure Period ", " SELECTEDVALUE(...)"]
-                    parts = content_line.split('=', 1)
-                    if len(parts) == 2 and parts[1].strip():
-                        potential_expr = parts[1].strip()
-                        # Check if it ends with '=' (indicating multi-line) or has content
-                        if not potential_expr.endswith('='):
-                            inline_expression = potential_expr
-
-                obj_type, obj_name = self._parse_object_declaration(content_line)
-                new_obj = {"_type": obj_type, "_name": obj_name}
-
-                # Handle multi-line expressions for measures/columns with '='
-                # But DON'T advance i - let the normal loop process properties that follow
-                if has_equals and (obj_type == 'measure' or obj_type == 'column'):
-                    expr_lines = [inline_expression] if inline_expression else []
-                    peek_idx = i + 1
-
-                    while peek_idx < len(lines):
-                        peek_line = lines[peek_idx]
-                        peek_indent = self._get_indent_level(peek_line)
-                        peek_stripped = peek_line.strip()
-
-                        # Skip completely empty lines but continue checking
-                        if not peek_stripped:
-                            # If line has more indentation than declaration, include it as blank line
-                            if peek_indent > indent:
-                                expr_lines.append(peek_line.rstrip())
-                                peek_idx += 1
-                                continue
-                            else:
-                                # Empty line at same or less indent means end of expression
-                                break
-
-                        # Check if this is a property line (displayFolder:, formatString:, etc.)
-                        # Properties come AFTER the expression
-                        if ':' in peek_stripped and peek_indent == indent + 1:
-                            # This is a property, stop collecting expression
-                            break
-
-                        # If next line is indented more than parent level (indent + 1), it's part of the expression
-                        if peek_indent > indent + 1:
-                            expr_lines.append(peek_line.rstrip())
-                            peek_idx += 1
-                        # If next line is at child level (indent + 1) but not a property, include it
-                        elif peek_indent == indent + 1 and not self._is_new_property(peek_stripped):
-                            expr_lines.append(peek_line.rstrip())
-                            peek_idx += 1
-                        else:
-                            break
-
-                    # Set expression if we found any lines
-                    if expr_lines:
-                        new_obj["expression"] = '\n'.join(expr_lines)
-                    # DON'T advance i here - let the loop process properties
-
-                # Add to parent
-                if obj_type not in current_parent:
-                    current_parent[obj_type] = []
-                current_parent[obj_type].append(new_obj)
-
-                stack.append((new_obj, indent))
-
-            # Check for multi-line expressions
-            elif '=' in content_line and not content_line.startswith('annotation'):
-                key, value, is_multiline = self._parse_property_line(content_line)
-
-                if is_multiline:
-                    # Collect multi-line content
-                    expr_lines = [value] if value else []
-                    i += 1
-
-                    while i < len(lines):
-                        next_line = lines[i]
-                        next_indent = self._get_indent_level(next_line)
-
-                        # Check if we're still in the expression
-                        if next_indent > indent or (
-                            next_indent == indent and
-                            not self._is_new_property(next_line.strip())
-                        ):
-                            expr_lines.append(next_line.rstrip())
-                            i += 1
-                        else:
-                            break
-
-                    current_parent[key] = '\n'.join(expr_lines)
-                    i -= 1  # Back up one line for outer loop
-                else:
-                    current_parent[key] = value
-
-            # Simple property (key: value)
-            elif ':' in content_line and not content_line.startswith('annotation'):
-                key, value = self._parse_simple_property(content_line)
-                current_parent[key] = value
-
-            i += 1
-
-        return root
-
-    def _get_indent_level(self, line: str) -> int:
-        """Get indentation level (number of tabs)."""
-        count = 0
-        for char in line:
-            if char == '\t':
-                count += 1
-            elif char != ' ':
-                break
-        return count
-
-    def _is_object_declaration(self, line: str) -> bool:
-        """Check if line is an object declaration."""
-        patterns = [
-            r'^table\s+',
-            r'^column\s+',
-            r'^measure\s+',
-            r'^relationship\s+',
-            r'^partition\s+',
-            r'^annotation\s+',
-            r'^role\s+',
-            r'^culture\s+',
-        ]
-        return any(re.match(pattern, line) for pattern in patterns)
-
-    def _parse_object_declaration(self, line: str) -> Tuple[str, str]:
-        """
-        Parse object declaration line.
+        return self._node_to_dict(parse_tmdl_text(content))
+
+    def _node_to_dict(self, node: TmdlNode) -> Dict[str, Any]:
+        """Convert a stream parser node (and its children) to the nested dict format."""
+        obj: Dict[str, Any] = {} if node.kind == "document" else {"_type": node.kind, "_name": node.name or ""}
+        obj.update(node.properties)
+        if node.expression is not None:
+            obj["expression"] = node.expression
+        elif node.kind == "annotation" and node.value is not None:
+            obj["value"] = node.value
+        obj.update(node.expressions)
+        if node.description and "description" not in obj:
+            obj["description"] = node.description
+        for child in node.children:
+            obj.setdefault(child.kind, []).append(self._node_to_dict(child))
+        return obj
 
-        Returns:
-            Tuple of (object_type, object_name)
-        """
-        match = re.match(r"^(\w+)\s+(.+)$", line)
-        if match:
-            obj_type = match.group(1)
-            obj_name = match.group(2).strip()
-
-            # For measure/column declarations, split on '=' and take only the name part
-            if '=' in obj_name:
-                obj_name = obj_name.split('=')[0].strip()
 
-            # Remove quotes
-            obj_name = obj_name.strip("'\"")
-            return obj_type, obj_name
-        return "unknown", line
+class TmdlModelAnalyzer:
+    """Analyzes TMDL files and builds semantic model object graph."""
 
-    def _parse_property_line(
+    def __init__(
         self,
-        line: str
-    ) -> Tuple[str, Optional[str], bool]:
+        parallel: Optional[bool] = None,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ):
         """
-        Parse a property line with '=' assignment.
+        Initialize the model analyzer.
 
-        Returns:
-            Tuple of (key, value, is_multiline)
+        Args:
+            parallel: Parse table files in a process pool (None = tmdl.parallel_parse)
+            workers: Worker processes for parallel parsing (None = tmdl.parse_workers)
+            chunk_size: Table files per worker task (None = tmdl.parse_chunk_size)
         """
-        parts = line.split('=', 1)
-        if len(parts) == 2:
-            key = parts[0].strip()
-            value = parts[1].strip()
-
-            # Check if this is a multi-line expression (no value on same line)
-            is_multiline = not value or value == ""
-
-            return key, value if value else None, is_multiline
-
-        return line, None, False
-
-    def _parse_simple_property(self, line: str) -> Tuple[str, str]:
-        """Parse simple property (key: value)."""
-        parts = line.split(':', 1)
-        if len(parts) == 2:
-            key = parts[0].strip()
-            value = parts[1].strip()
-            return key, value
-        return line, ""
-
-    def _is_new_property(self, line: str) -> bool:
-        """Check if line starts a new property."""
-        return (
-            self._is_object_declaration(line) or
-            (':' in line and not line.startswith(' ')) or
-            ('=' in line and not line.startswith(' '))
-        )
-
-
-class TmdlModelAnalyzer:
-    """Analyzes TMDL files and builds semantic model object graph."""
-
-    def __init__(self):
-        """Initialize the model analyzer."""
         self.logger = logger
         self.parser = TmdlParser()
+        self.parallel = ParallelParseSettings.resolve(parallel, workers, chunk_size)
 
     def analyze_model(self, model_folder: str) -> Dict[str, Any]:
         """
@@ -366,97 +190,66 @@ class TmdlModelAnalyzer:
         return result
 
     def _parse_database(self, file_path: str) -> Dict[str, Any]:
-        """Parse database.tmdl file."""
+        """Parse database.tmdl file into its properties (e.g. {"compatibilityLevel": "1567"})."""
         try:
             content = self.parser.parse_tmdl(file_path)
-            return content
+            return self._object_properties(content, "database")
         except Exception as e:
             self.logger.warning(f"Failed to parse database.tmdl: {e}")
             return {}
 
     def _parse_model(self, file_path: str) -> Dict[str, Any]:
-        """Parse model.tmdl file."""
+        """Parse model.tmdl file into its properties and annotations."""
         try:
             content = self.parser.parse_tmdl(file_path)
-            return content
+            return self._object_properties(content, "model")
         except Exception as e:
             self.logger.warning(f"Failed to parse model.tmdl: {e}")
             return {}
 
+    @staticmethod
+    def _object_properties(content: Dict[str, Any], obj_type: str) -> Dict[str, Any]:
+        """
+        Flat property dict of the top-level object of a file.
+
+        Child objects (ref, queryGroup, ...) are dropped except annotations,
+        which stay as a list under "annotation".
+        """
+        objects = content.get(obj_type) or [{}]
+        return {
+            key: value for key, value in objects[0].items()
+            if not key.startswith('_') and (key == "annotation" or not isinstance(value, list))
+        }
+
+    @staticmethod
+    def _flatten_table_permissions(role: Dict[str, Any]) -> Dict[str, Any]:
+        """Store each tablePermission filter as a "tablePermission <table>" expression property."""
+        for permission in role.pop("tablePermission", []):
+            name = permission.get("_name", "")
+            if not re.fullmatch(r"\w+", name):
+                name = "'" + name.replace("'", "''") + "'"
+            role[f"tablePermission {name}"] = permission.get("expression", "")
+        return role
+
     def _parse_expressions(self, file_path: str) -> List[Dict[str, Any]]:
         """Parse expressions.tmdl file (M expressions)."""
         try:
-            # Read file directly since the parser doesn't group expressions properly
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                document = parse_tmdl_text(f.read())
 
             expressions = []
-            lines = content.split('\n')
-
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-
-                # Look for expression declarations: "expression <name> ="
-                if line.startswith('expression ') and '=' in line:
-                    # Extract expression name
-                    name_part = line[len('expression '):].split('=')[0].strip()
-
-                    # Check if expression is on same line (single-line expression like parameters)
-                    after_equals = line.split('=', 1)[1].strip()
-                    expression_text = ""
-
-                    if after_equals and not after_equals.endswith('='):
-                        # Single-line expression (e.g., parameter)
-                        # Remove metadata like 'meta [...]' from the expression
-                        if ' meta ' in after_equals:
-                            expression_text = after_equals.split(' meta ')[0].strip()
-                        else:
-                            expression_text = after_equals
-                        i += 1
-                    else:
-                        # Multi-line expression - collect indented lines
-                        expression_lines = []
-                        i += 1
-
-                        # Find the indentation level of the first expression line
-                        while i < len(lines) and not lines[i].strip():
-                            i += 1  # Skip empty lines
-
-                        if i < len(lines):
-                            first_line = lines[i]
-                            indent_level = len(first_line) - len(first_line.lstrip())
-
-                            # Collect all indented lines
-                            while i < len(lines):
-                                curr_line = lines[i]
-                                curr_indent = len(curr_line) - len(curr_line.lstrip())
-                                curr_stripped = curr_line.strip()
-
-                                # Stop if we hit a non-indented line that's not empty
-                                if curr_stripped and curr_indent < indent_level:
-                                    break
-
-                                # Stop if we hit metadata or another expression
-                                if curr_stripped.startswith(('lineageTag:', 'queryGroup:', 'annotation ', 'expression ')):
-                                    break
-
-                                if curr_stripped:  # Only add non-empty lines
-                                    expression_lines.append(curr_line.rstrip())
-
-                                i += 1
-
-                        # Join expression lines
-                        expression_text = '\n'.join(expression_lines).strip()
-
-                    if expression_text:
-                        expressions.append({
-                            "name": name_part,
-                            "expression": expression_text,
-                            "kind": "m"
-                        })
-                else:
-                    i += 1
+            for node in document.iter_children('expression'):
+                expression_text = node.expression or ""
+                # Single-line parameters carry metadata: "value" meta [IsParameterQuery=true, ...]
+                if '\n' not in expression_text and ' meta ' in expression_text:
+                    expression_text = expression_text.split(' meta ')[0].strip()
+
+                if expression_text:
+                    expressions.append({
+                        "name": node.name or "",
+                        "expression": expression_text,
+                        "kind": "m"
+                    })
 
             return expressions
         except Exception as e:
@@ -527,12 +320,19 @@ class TmdlModelAnalyzer:
         tables = []
 
         try:
-            for filename in os.listdir(tables_path):
-                if filename.endswith('.tmdl'):
-                    file_path = os.path.join(tables_path, filename)
-                    table = self._parse_table_file(file_path)
-                    if table:
-                        tables.append(table)
+            file_paths = [
+                os.path.join(tables_path, filename)
+                for filename in os.listdir(tables_path)
+                if filename.endswith('.tmdl')
+            ]
+
+            parsed = None
+            if self.parallel.use_pool(len(file_paths)):
+                parsed = map_in_processes(_parse_table_chunk, file_paths, self.parallel)
+            if parsed is None:
+                parsed = [self._parse_table_file(file_path) for file_path in file_paths]
+
+            tables = [table for table in parsed if table]
 
         except Exception as e:
             self.logger.error(f"Error parsing tables: {e}")
@@ -652,6 +452,8 @@ class TmdlModelAnalyzer:
                 if filename.endswith('.tmdl'):
                     file_path = os.path.join(roles_path, filename)
                     role_data = self.parser.parse_tmdl(file_path)
+                    for role in role_data.get("role", []):
+                        self._flatten_table_permissions(role)
                     if role_data:
                         roles.append(role_data)
         except Exception as e:
@@ -674,3 +476,9 @@ class TmdlModelAnalyzer:
         except Exception as e:
             self.logger.warning(f"Error parsing cultures: {e}")
         return cultures
+
+
+def _parse_table_chunk(file_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Process-pool worker: parse a chunk of table files, one result per path."""
+    analyzer = TmdlModelAnalyzer(parallel=False)
+    return [analyzer._parse_table_file(file_path) for file_path in file_paths]
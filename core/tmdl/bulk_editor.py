@@ -16,6 +16,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any
 
+from .tmdl_parse_cache import get_tmdl_parse_cache, invalidate_tmdl_file
 from .validator import TmdlValidator, ValidationResult
 
 logger = logging.getLogger(__name__)
@@ -158,7 +159,7 @@ class TmdlBulkEditor:
     ) -> None:
         """Find pattern in a single file"""
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = self._read_text(file_path)
             lines = content.split("\n")
 
             in_target_section = target == "all"
@@ -351,7 +352,7 @@ class TmdlBulkEditor:
 
             # Write changes if not dry run and modifications were made
             if not dry_run and changes["modified"]:
-                file_path.write_text("\n".join(new_lines), encoding="utf-8")
+                self._write_text(file_path, "\n".join(new_lines))
 
         except Exception as e:
             logger.error(f"Error replacing in file {file_path}: {e}", exc_info=True)
@@ -502,7 +503,7 @@ class TmdlBulkEditor:
                 result.files_modified += 1
 
                 if not dry_run:
-                    table_file.write_text(new_content, encoding="utf-8")
+                    self._write_text(table_file, new_content)
 
                 result.details.append({
                     "object": f"{table_name}[{old_name}]",
@@ -551,7 +552,7 @@ class TmdlBulkEditor:
                 result.files_modified += 1
 
                 if not dry_run:
-                    table_file.write_text(new_content, encoding="utf-8")
+                    self._write_text(table_file, new_content)
 
                 result.details.append({
                     "object": f"{table_name}[{old_name}]",
@@ -587,8 +588,9 @@ class TmdlBulkEditor:
             new_content = re.sub(table_pattern, rf"\1{new_name}\2", content)
 
             if not dry_run:
-                new_file.write_text(new_content, encoding="utf-8")
+                self._write_text(new_file, new_content)
                 old_file.unlink()
+                invalidate_tmdl_file(old_file)
 
             result.objects_renamed += 1
             result.files_modified += 1
@@ -628,13 +630,25 @@ class TmdlBulkEditor:
                     updates += count
 
                     if not dry_run:
-                        table_file.write_text(new_content, encoding="utf-8")
+                        self._write_text(table_file, new_content)
 
         except Exception as e:
             logger.error(f"Error updating measure references: {e}", exc_info=True)
 
         return updates
 
+    def _read_text(self, file_path: Path) -> str:
+        """File text, served from the shared TMDL parse cache when the file is unchanged"""
+        cache = get_tmdl_parse_cache()
+        if cache is None:
+            return file_path.read_text(encoding="utf-8")
+        return cache.content(file_path)
+
+    def _write_text(self, file_path: Path, content: str) -> None:
+        """Write a TMDL file and drop its stale parse cache entry"""
+        file_path.write_text(content, encoding="utf-8")
+        invalidate_tmdl_file(file_path)
+
     def _create_backup(self, path: Path) -> Path:
         """Create timestamped backup of TMDL folder"""
         try:
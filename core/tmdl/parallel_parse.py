@@ -0,0 +1,128 @@
+"""
+Process-pool TMDL parsing
+
+Table parsing is CPU-bound Python, so threads do not speed it up. This module fans
+chunks of table files out to a shared ProcessPoolExecutor and returns the per-file
+results in input order, so callers merge them exactly as their sequential loop would.
+
+The mode is opt-in (tmdl.parallel_parse) and only used once a folder has at least
+tmdl.parallel_parse_min_files tables; smaller folders parse faster in-process. Any
+pool failure (spawn error, broken pool, unpicklable result) falls back to the
+sequential path.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence
+
+from core.config.config_manager import config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParallelParseSettings:
+    """Process-pool parsing options, resolved from arguments and tmdl.* config."""
+    enabled: bool
+    workers: int
+    chunk_size: int
+    min_files: int
+
+    @classmethod
+    def resolve(
+        cls,
+        parallel: Optional[bool] = None,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> "ParallelParseSettings":
+        """
+        Args:
+            parallel: Force the mode on or off (None = tmdl.parallel_parse)
+            workers: Worker processes (None or 0 = tmdl.parse_workers, then CPU count)
+            chunk_size: Table files per task (None = tmdl.parse_chunk_size)
+        """
+        enabled = bool(config.get('tmdl.parallel_parse', False) if parallel is None else parallel)
+        workers = workers or int(config.get('tmdl.parse_workers', 0) or 0) or (os.cpu_count() or 1)
+        chunk_size = chunk_size or int(config.get('tmdl.parse_chunk_size', 25) or 25)
+        min_files = int(config.get('tmdl.parallel_parse_min_files', 64))
+        return cls(enabled, max(1, workers), max(1, chunk_size), max(0, min_files))
+
+    def use_pool(self, file_count: int) -> bool:
+        return self.enabled and file_count >= max(self.min_files, 2)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Shared pool, recreated when the requested worker count changes."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool() -> None:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the shared parse workers (also registered at exit)."""
+    _discard_pool()
+
+
+atexit.register(shutdown_parse_pool)
+
+
+def map_in_processes(
+    worker: Callable[[List[Any]], List[Any]],
+    items: Sequence[Any],
+    settings: ParallelParseSettings,
+) -> Optional[List[Any]]:
+    """
+    Run worker over consecutive chunks of items in the shared process pool.
+
+    Args:
+        worker: Module-level (picklable) function mapping a chunk to one result per item
+        items: Picklable work items, e.g. file paths or (content, file name) pairs
+        settings: Worker count and chunk size
+
+    Returns:
+        Results in the order of items, or None if the pool failed and the caller
+        should parse sequentially
+    """
+    chunks = [list(items[i:i + settings.chunk_size]) for i in range(0, len(items), settings.chunk_size)]
+    try:
+        pool = _get_pool(settings.workers)
+        results: List[Any] = []
+        for chunk_results in pool.map(worker, chunks):
+            results.extend(chunk_results)
+    except Exception as e:
+        logger.warning(f"Process-pool TMDL parsing failed, parsing sequentially: {e}")
+        _discard_pool()
+        return None
+
+    logger.debug(f"Parsed {len(items)} files in {len(chunks)} chunks on {settings.workers} processes")
+    return results
+
+
+__all__ = [
+    "ParallelParseSettings",
+    "map_in_processes",
+    "shutdown_parse_pool",
+]
@@ -0,0 +1,250 @@
+"""
+TMDL Parse Cache
+
+Process-wide cache of TMDL file contents and their parsed objects, shared by
+TmdlParser, TmdlValidator and TmdlBulkEditor.
+
+Each file entry records the file's mtime, size and SHA-1 next to its text and
+the objects parsed from it (one slot per parser "kind"). A lookup re-stats the
+file: unchanged stat returns the cached parse, a changed stat re-reads the file
+and only re-parses when the hash differs. Re-parsing a 300-table project after
+a one-table edit therefore reads and parses a single file.
+
+Cached objects are shared between callers: treat them as read-only.
+TmdlParser freezes its parses (see freeze()) so a caller cannot change them
+for everyone else, and keeps one model dict per definition folder that is
+updated in place with the re-parsed files.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from core.config.config_manager import config
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is a shared cached parse and cannot be modified; "
+                    f"use copy.deepcopy() for a private copy")
+
+
+class ReadOnlyDict(dict):
+    """dict that refuses changes; copies (copy/deepcopy/pickle) are plain dicts."""
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class ReadOnlyList(list):
+    """list that refuses changes; copies (copy/deepcopy/pickle) are plain lists."""
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Read-only view of a parsed object: dicts and lists are frozen recursively."""
+    kind = type(value)  # exact types: already frozen containers are returned as they are
+    if kind is dict:
+        return ReadOnlyDict({key: freeze(item) if type(item) in _MUTABLE else item for key, item in value.items()})
+    if kind is list:
+        return ReadOnlyList([freeze(item) if type(item) in _MUTABLE else item for item in value])
+    return value
+
+
+_MUTABLE = (dict, list)
+
+
+@dataclass
+class TmdlFileEntry:
+    """Fingerprint, text and parsed objects of one TMDL file."""
+    mtime_ns: int
+    size: int
+    digest: str
+    content: str
+    parsed: Dict[str, Any] = field(default_factory=dict)
+
+
+class TmdlParseCache:
+    """Stat- and hash-validated cache of TMDL file parses."""
+
+    def __init__(self, max_files: Optional[int] = None):
+        """
+        Initialize the parse cache.
+
+        Args:
+            max_files: Maximum cached files before least-recently-used eviction
+        """
+        self.max_files = int(max_files if max_files is not None
+                             else config.get('tmdl.parse_cache_max_files', 20000))
+        self._lock = threading.RLock()
+        self._files: "OrderedDict[str, TmdlFileEntry]" = OrderedDict()
+        self._models: Dict[str, Dict[str, Any]] = {}
+
+        self.hits = 0
+        self.unchanged_rereads = 0
+        self.reads = 0
+        self.parses = 0
+
+    @staticmethod
+    def _key(path: PathLike) -> str:
+        return str(Path(path).resolve())
+
+    def entry(self, path: PathLike) -> TmdlFileEntry:
+        """
+        Current entry for a file, re-reading it only if its mtime or size changed.
+
+        Raises:
+            OSError: If the file cannot be read (a missing file is dropped from the cache)
+        """
+        key = self._key(path)
+        try:
+            stat = Path(key).stat()
+        except OSError:
+            self.invalidate(key)
+            raise
+
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self._files.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        raw = Path(key).read_bytes()
+        digest = hashlib.sha1(raw).hexdigest()
+
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None and entry.digest == digest:
+                # Touched or rewritten with identical content: keep the parses
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                self._files.move_to_end(key)
+                self.unchanged_rereads += 1
+                return entry
+
+            entry = TmdlFileEntry(stat.st_mtime_ns, stat.st_size, digest, raw.decode('utf-8'))
+            self._files[key] = entry
+            self._files.move_to_end(key)
+            self.reads += 1
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+            return entry
+
+    def content(self, path: PathLike) -> str:
+        """Text of a TMDL file."""
+        return self.entry(path).content
+
+    def parsed(self, path: PathLike, kind: str, parse: Callable[[str], Any]) -> Any:
+        """
+        Parsed object of a TMDL file, computing it only when the file content changed.
+
+        Args:
+            path: TMDL file
+            kind: Parser identifier; each kind keeps its own result per file
+            parse: Function from file text to the parsed object
+        """
+        entry = self.entry(path)
+        with self._lock:
+            if kind in entry.parsed:
+                return entry.parsed[kind]
+        value = parse(entry.content)
+        with self._lock:
+            entry.parsed[kind] = value
+            self.parses += 1
+        return value
+
+    def model(self, definition_path: PathLike) -> Dict[str, Any]:
+        """Persistent model dict for a definition folder, updated in place by TmdlParser."""
+        key = self._key(definition_path)
+        with self._lock:
+            return self._models.setdefault(key, {})
+
+    def store(self, entry: TmdlFileEntry, kind: str, value: Any) -> None:
+        """Attach a result parsed elsewhere (e.g. in a worker process) from entry.content."""
+        with self._lock:
+            entry.parsed[kind] = value
+            self.parses += 1
+
+    def invalidate(self, path: Optional[PathLike] = None) -> int:
+        """
+        Drop cached entries for a file, or for every file under a folder.
+
+        Args:
+            path: File or folder (None clears the whole cache)
+
+        Returns:
+            Number of file entries removed
+        """
+        with self._lock:
+            if path is None:
+                removed = len(self._files)
+                self._files.clear()
+                self._models.clear()
+                return removed
+            key = self._key(path)
+            prefix = key.rstrip(os.sep) + os.sep
+            doomed = [k for k in self._files if k == key or k.startswith(prefix)]
+            for k in doomed:
+                del self._files[k]
+            for k in [k for k in self._models if k == key or k.startswith(prefix)]:
+                del self._models[k]
+            return len(doomed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'files': len(self._files),
+                'max_files': self.max_files,
+                'hits': self.hits,
+                'unchanged_rereads': self.unchanged_rereads,
+                'reads': self.reads,
+                'parses': self.parses,
+                'models': len(self._models),
+            }
+
+
+_tmdl_parse_cache: Optional[TmdlParseCache] = None
+_tmdl_parse_cache_lock = threading.Lock()
+
+
+def get_tmdl_parse_cache() -> Optional[TmdlParseCache]:
+    """Get the process-wide TMDL parse cache (None when tmdl.parse_cache is disabled)."""
+    global _tmdl_parse_cache
+    if not config.get('tmdl.parse_cache', True):
+        return None
+    if _tmdl_parse_cache is None:
+        with _tmdl_parse_cache_lock:
+            if _tmdl_parse_cache is None:
+                _tmdl_parse_cache = TmdlParseCache()
+    return _tmdl_parse_cache
+
+
+def invalidate_tmdl_file(path: PathLike) -> None:
+    """Forget a file (or folder) after writing it, if the shared cache exists."""
+    if _tmdl_parse_cache is not None:
+        _tmdl_parse_cache.invalidate(path)
+
+
+__all__ = [
+    "ReadOnlyDict",
+    "ReadOnlyList",
+    "TmdlFileEntry",
+    "TmdlParseCache",
+    "freeze",
+    "get_tmdl_parse_cache",
+    "invalidate_tmdl_file",
+]
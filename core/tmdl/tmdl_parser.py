@@ -2,14 +2,18 @@
 TMDL Parser Module
 
 Parses TMDL (Tabular Model Definition Language) files into structured Python objects
-for analysis, comparison, and manipulation.
+for analysis, comparison, and manipulation. Text is parsed by the streaming parser in
+core.tmdl.tmdl_stream; this module maps its nodes onto the model dict format.
 """
 
 import logging
 import os
-import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from core.tmdl.parallel_parse import ParallelParseSettings, map_in_processes
+from core.tmdl.tmdl_parse_cache import ReadOnlyDict, freeze, get_tmdl_parse_cache
+from core.tmdl.tmdl_stream import TmdlNode, parse_tmdl_text, typed_value, unquote
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +26,30 @@ class TmdlParser:
     into structured Python dictionaries for analysis and comparison.
     """
 
-    def __init__(self, tmdl_path: str):
+    def __init__(
+        self,
+        tmdl_path: str,
+        use_cache: bool = True,
+        parallel: Optional[bool] = None,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
         """
         Initialize TMDL parser.
 
         Args:
             tmdl_path: Path to the root TMDL export (contains definition/ folder)
+            use_cache: Reuse parses of unchanged files from the shared TMDL parse cache.
+                The returned model is then read-only (it shares the cached objects);
+                pass False for a private copy that can be modified.
+            parallel: Parse table files in a process pool (None = tmdl.parallel_parse)
+            workers: Worker processes for parallel parsing (None = tmdl.parse_workers)
+            chunk_size: Table files per worker task (None = tmdl.parse_chunk_size)
         """
         self.tmdl_path = Path(tmdl_path)
         self.definition_path = self.tmdl_path / "definition"
+        self._cache = get_tmdl_parse_cache() if use_cache else None
+        self._parallel = ParallelParseSettings.resolve(parallel, workers, chunk_size)
 
         if not self.definition_path.exists():
             raise FileNotFoundError(
@@ -43,6 +62,12 @@ class TmdlParser:
         """
         Parse the complete TMDL model structure.
 
+        With the parse cache enabled, only files changed since the previous call
+        are re-parsed, and the cached model for this folder is updated in place
+        with them. The caller gets a read-only snapshot of that model: unchanged
+        tables are the same (frozen) objects as in earlier snapshots, and later
+        parses do not change a snapshot already handed out.
+
         Returns:
             Dictionary containing all model components:
             {
@@ -58,7 +83,7 @@ class TmdlParser:
         """
         logger.info("Parsing full TMDL model")
 
-        model_data = {
+        parsed = {
             "database": self._parse_database(),
             "model": self._parse_model(),
             "tables": self._parse_tables(),
@@ -68,6 +93,12 @@ class TmdlParser:
             "expressions": self._parse_expressions(),
             "datasources": self._parse_datasources()
         }
+        if self._cache is None:
+            model_data = parsed
+        else:
+            model = self._cache.model(self.definition_path)
+            model.update(freeze(parsed))  # only the new top-level lists; cached parses are frozen already
+            model_data = ReadOnlyDict(model)
 
         logger.info(
             f"Parsed model: {len(model_data['tables'])} tables, "
@@ -76,6 +107,24 @@ class TmdlParser:
 
         return model_data
 
+    def _read_parsed(self, file_path: Path, kind: str, parse: Callable[[str], Any]) -> Any:
+        """Parse a file through the shared cache (re-parsed only when its content changed)."""
+        if self._cache is None:
+            return parse(file_path.read_text(encoding='utf-8'))
+        # Frozen once per parse: the cached object is shared with every later caller
+        return self._cache.parsed(file_path, kind, lambda content: freeze(parse(content)))
+
+    @staticmethod
+    def _with_source_file(obj: Optional[Dict[str, Any]], file_name: str) -> Optional[Dict[str, Any]]:
+        if obj:
+            obj['_source_file'] = file_name
+        return obj
+
+    def _read_text(self, file_path: Path) -> str:
+        if self._cache is None:
+            return file_path.read_text(encoding='utf-8')
+        return self._cache.content(file_path)
+
     def _parse_database(self) -> Optional[Dict[str, Any]]:
         """Parse database.tmdl file."""
         db_file = self.definition_path / "database.tmdl"
@@ -83,8 +132,7 @@ class TmdlParser:
             logger.warning("database.tmdl not found")
             return None
 
-        content = db_file.read_text(encoding='utf-8')
-        return self._parse_tmdl_content(content, "database")
+        return self._read_parsed(db_file, "database", lambda content: self._parse_tmdl_content(content, "database"))
 
     def _parse_model(self) -> Optional[Dict[str, Any]]:
         """Parse model.tmdl file."""
@@ -93,8 +141,7 @@ class TmdlParser:
             logger.warning("model.tmdl not found")
             return None
 
-        content = model_file.read_text(encoding='utf-8')
-        return self._parse_tmdl_content(content, "model")
+        return self._read_parsed(model_file, "model", lambda content: self._parse_tmdl_content(content, "model"))
 
     def _parse_tables(self) -> List[Dict[str, Any]]:
         """Parse all table .tmdl files."""
@@ -103,13 +150,20 @@ class TmdlParser:
             logger.warning("tables/ directory not found")
             return []
 
+        table_files = list(tables_dir.glob("*.tmdl"))
+        parsed_in_pool = self._parse_tables_in_processes(table_files)
+
         tables = []
-        for table_file in tables_dir.glob("*.tmdl"):
+        for table_file in table_files:
             try:
-                content = table_file.read_text(encoding='utf-8')
-                table_data = self._parse_table_content(content)
+                if parsed_in_pool is not None and table_file in parsed_in_pool:
+                    table_data = parsed_in_pool[table_file]
+                else:
+                    table_data = self._read_parsed(
+                        table_file, "table",
+                        lambda content: self._with_source_file(self._parse_table_content(content), table_file.name)
+                    )
                 if table_data:
-                    table_data['_source_file'] = table_file.name
                     tables.append(table_data)
             except Exception as e:
                 logger.error(f"Error parsing table {table_file.name}: {e}")
@@ -117,153 +171,133 @@ class TmdlParser:
         logger.debug(f"Parsed {len(tables)} tables")
         return tables
 
-    def _parse_table_content(self, content: str) -> Optional[Dict[str, Any]]:
+    def _parse_tables_in_processes(
+        self, table_files: List[Path]
+    ) -> Optional[Dict[Path, Optional[Dict[str, Any]]]]:
         """
-        Parse table TMDL content.
+        Parse the table files that need it in the process pool.
 
-        Extracts table name, columns, measures, hierarchies, and partitions.
+        Files are read here (through the cache, so unchanged tables are skipped) and
+        only their text goes to the workers. Returns None when the sequential path
+        should run instead: mode disabled, too few files to parse, or pool failure.
         """
-        lines = content.split('\n')
-        if not lines:
+        if not self._parallel.use_pool(len(table_files)):
             return None
 
-        # Find the table definition line, skipping leading comments
-        table_line_idx = 0
-        table_match = None
-        for idx, line in enumerate(lines):
-            stripped = line.strip()
-            # Skip empty lines and comments
-            if not stripped or stripped.startswith('///'):
-                continue
-            # Try to match the table definition
-            table_match = re.match(r'^table\s+["\']?([^"\']+)["\']?', stripped)
-            if table_match:
-                table_line_idx = idx
-                break
+        pending = []
+        for table_file in table_files:
+            try:
+                if self._cache is None:
+                    pending.append((table_file, None, table_file.read_text(encoding='utf-8')))
+                    continue
+                entry = self._cache.entry(table_file)
+                if "table" not in entry.parsed:
+                    pending.append((table_file, entry, entry.content))
+            except Exception:
+                continue  # unreadable files are reported by the sequential loop
+
+        if not self._parallel.use_pool(len(pending)):
+            return None
 
-        if not table_match:
+        results = map_in_processes(
+            _parse_table_chunk, [(content, table_file.name) for table_file, _, content in pending], self._parallel
+        )
+        if results is None:
             return None
 
-        table_name = table_match.group(1)
+        parsed: Dict[Path, Optional[Dict[str, Any]]] = {}
+        for (table_file, entry, _), (table_data, error) in zip(pending, results):
+            if error is not None:
+                logger.error(f"Error parsing table {table_file.name}: {error}")
+                parsed[table_file] = None
+                continue
+            if entry is not None:
+                table_data = freeze(table_data)
+                self._cache.store(entry, "table", table_data)
+            parsed[table_file] = table_data
+        return parsed
+
+    def _parse_table_content(self, content: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse table TMDL content.
+
+        Extracts table name, columns, measures, hierarchies, and partitions.
+        """
+        table = parse_tmdl_text(content).first('table')
+        if table is None or not table.name:
+            return None
 
         table_data = {
-            "name": table_name,
-            "columns": [],
-            "measures": [],
-            "hierarchies": [],
-            "partitions": [],
+            "name": table.name,
+            "columns": [self._column_from_node(node) for node in table.iter_children('column')],
+            "measures": [self._measure_from_node(node) for node in table.iter_children('measure')],
+            "hierarchies": [self._hierarchy_from_node(node) for node in table.iter_children('hierarchy')],
+            "partitions": [self._partition_from_node(node) for node in table.iter_children('partition')],
             "calculation_items": [],
             "properties": {},
             "is_calculation_group": False,
             "is_hidden": False,
             "description": None,
-            "annotations": []
+            "annotations": self._annotations_from_node(table)
         }
+        self._apply_properties(table, table_data, {'description': 'description'}, {'isHidden': 'is_hidden'})
 
-        # Parse indented structure (start after the table definition line)
-        i = table_line_idx + 1
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith('///'):
-                i += 1
-                continue
-
-            # Check for calculation group
-            if line.startswith('calculationGroup'):
-                table_data['is_calculation_group'] = True
-                i += 1
-                continue
-
-            # Parse columns
-            if line.startswith('column '):
-                column, next_i = self._parse_column(lines, i)
-                if column:
-                    table_data['columns'].append(column)
-                i = next_i
-                continue
-
-            # Parse measures
-            if line.startswith('measure '):
-                measure, next_i = self._parse_measure(lines, i)
-                if measure:
-                    table_data['measures'].append(measure)
-                i = next_i
-                continue
-
-            # Parse hierarchies
-            if line.startswith('hierarchy '):
-                hierarchy, next_i = self._parse_hierarchy(lines, i)
-                if hierarchy:
-                    table_data['hierarchies'].append(hierarchy)
-                i = next_i
-                continue
-
-            # Parse partitions
-            if line.startswith('partition '):
-                partition, next_i = self._parse_partition(lines, i)
-                if partition:
-                    table_data['partitions'].append(partition)
-                i = next_i
-                continue
-
-            # Parse calculation items (for calculation groups)
-            if line.startswith('calculationItem '):
-                calc_item, next_i = self._parse_calculation_item(lines, i)
-                if calc_item:
-                    if 'calculation_items' not in table_data:
-                        table_data['calculation_items'] = []
-                    table_data['calculation_items'].append(calc_item)
-                i = next_i
-                continue
-
-            # Handle boolean flags (isHidden without value means true)
-            if line == 'isHidden':
-                table_data['is_hidden'] = True
-                i += 1
-                continue
-
-            # Parse properties (lineageTag, isHidden, etc.)
-            if ':' in line and not line.startswith(' '):
-                key, value = self._parse_property_line(line)
-                if key == 'isHidden':
-                    table_data['is_hidden'] = value if isinstance(value, bool) else str(value).lower() == 'true'
-                elif key == 'description':
-                    table_data['description'] = value
-                elif key:
-                    table_data['properties'][key] = value
-
-            # Parse annotations
-            if line.startswith('annotation '):
-                annot, annot_end = self._parse_annotation(lines, i)
-                if annot:
-                    table_data['annotations'].append(annot)
-                i = annot_end
-                continue
-
-            i += 1
+        # Calculation items live under calculationGroup; older exports put them on the table
+        for group in table.iter_children('calculationGroup'):
+            table_data['is_calculation_group'] = True
+            table_data['calculation_items'].extend(
+                self._calculation_item_from_node(node) for node in group.iter_children('calculationItem')
+            )
+        table_data['calculation_items'].extend(
+            self._calculation_item_from_node(node) for node in table.iter_children('calculationItem')
+        )
 
         return table_data
 
-    def _parse_column(self, lines: List[str], start_index: int) -> tuple[Optional[Dict[str, Any]], int]:
-        """Parse a column definition."""
-        line = lines[start_index].strip()
-
-        # Extract column name: "column 'Name'" or "column Name"
-        col_match = re.match(r'^column\s+["\']?([^"\'=]+)["\']?\s*(=)?', line)
-        if not col_match:
-            return None, start_index + 1
-
-        column_name = col_match.group(1).strip()
-        is_calculated = col_match.group(2) == '='
-
+    @staticmethod
+    def _apply_properties(
+        node: TmdlNode,
+        target: Dict[str, Any],
+        fields: Dict[str, str],
+        flags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Copy node properties into an object dict: known fields, flags, then 'properties'."""
+        flags = flags or {}
+        for key, value in node.properties.items():
+            if key in flags:
+                target[flags[key]] = node.flag(key)
+            elif key in fields:
+                target[fields[key]] = typed_value(value)
+            else:
+                target['properties'][key] = typed_value(value)
+        if node.description and target.get('description') is None and 'description' in fields.values():
+            target['description'] = node.description
+
+    _COLUMN_FIELDS = {
+        'dataType': 'data_type',
+        'sourceColumn': 'source_column',
+        'description': 'description',
+        'displayFolder': 'display_folder',
+        'formatString': 'format_string',
+        'dataCategory': 'data_category',
+        'summarizeBy': 'summarize_by',
+        'sortByColumn': 'sort_by_column',
+    }
+    _MEASURE_FIELDS = {
+        'formatString': 'format_string',
+        'displayFolder': 'display_folder',
+        'description': 'description',
+        'dataCategory': 'data_category',
+    }
+
+    def _column_from_node(self, node: TmdlNode) -> Dict[str, Any]:
+        """Column dict from a column node."""
         column = {
-            "name": column_name,
-            "is_calculated": is_calculated,
+            "name": node.name,
+            "is_calculated": node.value is not None,
             "data_type": None,
             "source_column": None,
-            "expression": None,
+            "expression": node.expression,
             "description": None,
             "display_folder": None,
             "format_string": None,
@@ -272,482 +306,81 @@ class TmdlParser:
             "sort_by_column": None,
             "is_key": False,
             "is_hidden": False,
-            "annotations": [],
+            "annotations": self._annotations_from_node(node),
             "properties": {}
         }
+        self._apply_properties(node, column, self._COLUMN_FIELDS, {'isKey': 'is_key', 'isHidden': 'is_hidden'})
+        return column
 
-        # If calculated column, extract DAX expression
-        if is_calculated:
-            expression, next_i = self._extract_expression(lines, start_index)
-            column['expression'] = expression
-            start_index = next_i
-
-        # Parse column properties
-        i = start_index + 1
-        while i < len(lines):
-            line = lines[i].strip()
-
-            if not line or line.startswith('///'):
-                i += 1
-                continue
-
-            # Check if we've reached the next object
-            if not line.startswith((' ', '\t')) or any(
-                line.startswith(kw) for kw in ['column ', 'measure ', 'hierarchy ', 'partition ', 'calculationItem ']
-            ):
-                break
-
-            # Parse property
-            if ':' in line:
-                key, value = self._parse_property_line(line)
-                if key == 'dataType':
-                    column['data_type'] = value
-                elif key == 'sourceColumn':
-                    column['source_column'] = value
-                elif key == 'description':
-                    column['description'] = value
-                elif key == 'displayFolder':
-                    column['display_folder'] = value
-                elif key == 'formatString':
-                    column['format_string'] = value
-                elif key == 'dataCategory':
-                    column['data_category'] = value
-                elif key == 'summarizeBy':
-                    column['summarize_by'] = value
-                elif key == 'sortByColumn':
-                    column['sort_by_column'] = value
-                elif key == 'isKey':
-                    column['is_key'] = value if isinstance(value, bool) else str(value).lower() == 'true'
-                elif key == 'isHidden':
-                    column['is_hidden'] = value if isinstance(value, bool) else str(value).lower() == 'true'
-                elif key:
-                    column['properties'][key] = value
-
-            # Parse annotations
-            elif line.startswith('annotation '):
-                annot, annot_end = self._parse_annotation(lines, i)
-                if annot:
-                    column['annotations'].append(annot)
-                i = annot_end
-                continue
-
-            i += 1
-
-        return column, i
-
-    def _parse_measure(self, lines: List[str], start_index: int) -> tuple[Optional[Dict[str, Any]], int]:
-        """Parse a measure definition."""
-        line = lines[start_index].strip()
-
-        # Extract measure name: "measure 'Name' =" or "measure Name ="
-        # Try quoted name first, then unquoted
-        measure_match = re.match(r'^measure\s+["\']([^"\']+)["\']\s*=', line)
-        if not measure_match:
-            # Try unquoted name (name can contain spaces if followed by =)
-            measure_match = re.match(r'^measure\s+([^=]+?)\s*=', line)
-        if not measure_match:
-            return None, start_index + 1
-
-        measure_name = measure_match.group(1).strip()
-
+    def _measure_from_node(self, node: TmdlNode) -> Dict[str, Any]:
+        """Measure dict from a measure node."""
         measure = {
-            "name": measure_name,
-            "expression": None,
+            "name": node.name,
+            "expression": node.expression,
             "format_string": None,
             "display_folder": None,
             "description": None,
             "is_hidden": False,
             "data_category": None,
-            "annotations": [],
+            "annotations": self._annotations_from_node(node),
             "properties": {}
         }
+        self._apply_properties(node, measure, self._MEASURE_FIELDS, {'isHidden': 'is_hidden'})
+        for key, expression in node.expressions.items():
+            measure['properties'][key] = expression
+        return measure
 
-        # Extract DAX expression
-        expression, next_i = self._extract_expression(lines, start_index)
-        measure['expression'] = expression
-
-        # Parse measure properties
-        i = next_i
-        while i < len(lines):
-            line = lines[i].strip()
-
-            if not line or line.startswith('///'):
-                i += 1
-                continue
-
-            # Check if we've reached the next object
-            if not line.startswith((' ', '\t')) or any(
-                line.startswith(kw) for kw in ['column ', 'measure ', 'hierarchy ', 'partition ', 'calculationItem ']
-            ):
-                break
-
-            # Parse property
-            if ':' in line:
-                key, value = self._parse_property_line(line)
-                if key == 'formatString':
-                    measure['format_string'] = value
-                elif key == 'displayFolder':
-                    measure['display_folder'] = value
-                elif key == 'description':
-                    measure['description'] = value
-                elif key == 'isHidden':
-                    measure['is_hidden'] = value if isinstance(value, bool) else str(value).lower() == 'true'
-                elif key == 'dataCategory':
-                    measure['data_category'] = value
-                elif key:
-                    measure['properties'][key] = value
-
-            # Parse annotations
-            elif line.startswith('annotation '):
-                annot, annot_end = self._parse_annotation(lines, i)
-                if annot:
-                    measure['annotations'].append(annot)
-                i = annot_end
-                continue
-
-            i += 1
-
-        return measure, i
-
-    def _parse_hierarchy(self, lines: List[str], start_index: int) -> tuple[Optional[Dict[str, Any]], int]:
-        """Parse a hierarchy definition."""
-        line = lines[start_index].strip()
-
-        # Extract hierarchy name
-        hier_match = re.match(r'^hierarchy\s+["\']?([^"\']+)["\']?', line)
-        if not hier_match:
-            return None, start_index + 1
-
-        hierarchy_name = hier_match.group(1)
-
+    def _hierarchy_from_node(self, node: TmdlNode) -> Dict[str, Any]:
+        """Hierarchy dict from a hierarchy node."""
         hierarchy = {
-            "name": hierarchy_name,
-            "levels": [],
+            "name": node.name,
+            "levels": [
+                {
+                    "name": level.name,
+                    "column": typed_value(level.properties.get('column')),
+                    "ordinal": typed_value(level.properties.get('ordinal'))
+                }
+                for level in node.iter_children('level')
+            ],
             "properties": {}
         }
+        self._apply_properties(node, hierarchy, {})
+        return hierarchy
 
-        # Parse hierarchy levels
-        i = start_index + 1
-        while i < len(lines):
-            line = lines[i].strip()
-
-            if not line or line.startswith('///'):
-                i += 1
-                continue
-
-            # Check if we've reached the next object
-            if not line.startswith((' ', '\t')) or any(
-                line.startswith(kw) for kw in ['column ', 'measure ', 'hierarchy ', 'partition ']
-            ):
-                break
-
-            # Parse level
-            if line.startswith('level '):
-                level_match = re.match(r'^level\s+(.+)', line)
-                if level_match:
-                    level_name = level_match.group(1)
-                    level = {"name": level_name, "column": None, "ordinal": None}
-
-                    # Parse level properties
-                    j = i + 1
-                    while j < len(lines) and lines[j].strip().startswith((' ', '\t')):
-                        prop_line = lines[j].strip()
-                        if ':' in prop_line:
-                            key, value = self._parse_property_line(prop_line)
-                            if key == 'column':
-                                level['column'] = value
-                            elif key == 'ordinal':
-                                level['ordinal'] = value
-                        j += 1
-
-                    hierarchy['levels'].append(level)
-                    i = j
-                    continue
-
-            # Parse property
-            if ':' in line:
-                key, value = self._parse_property_line(line)
-                if key:
-                    hierarchy['properties'][key] = value
-
-            i += 1
-
-        return hierarchy, i
-
-    def _parse_partition(self, lines: List[str], start_index: int) -> tuple[Optional[Dict[str, Any]], int]:
-        """Parse a partition definition."""
-        line = lines[start_index].strip()
-
-        # Extract partition name and type: "partition Name = m" or "partition Name = expression"
-        partition_match = re.match(r'^partition\s+([^\s=]+)\s*=\s*(\w+)', line)
-        if not partition_match:
-            return None, start_index + 1
-
-        partition_name = partition_match.group(1)
-        partition_type = partition_match.group(2)  # 'm' or 'expression'
-
+    def _partition_from_node(self, node: TmdlNode) -> Dict[str, Any]:
+        """Partition dict from a partition node ("partition Name = m")."""
+        partition_type = node.value.split()[0] if node.value else None
         partition = {
-            "name": partition_name,
+            "name": node.name,
             "type": partition_type,
             "mode": None,
-            "source": None,
+            "source": node.expressions.get('source'),
             "properties": {}
         }
+        self._apply_properties(node, partition, {'mode': 'mode'})
+        return partition
 
-        # Extract source expression
-        source, next_i = self._extract_expression(lines, start_index, keyword='source')
-
-        # If no explicit source keyword, try to extract from next lines
-        if not source:
-            i = start_index + 1
-            if i < len(lines) and '=' in lines[i]:
-                source, next_i = self._extract_expression(lines, i)
-            else:
-                next_i = start_index + 1
-
-        partition['source'] = source
-
-        # Parse partition properties
-        i = next_i
-        while i < len(lines):
-            line = lines[i].strip()
-
-            if not line or line.startswith('///'):
-                i += 1
-                continue
-
-            # Check if we've reached the next object
-            if not line.startswith((' ', '\t')) or any(
-                line.startswith(kw) for kw in ['column ', 'measure ', 'hierarchy ', 'partition ', 'calculationItem ']
-            ):
-                break
-
-            # Parse property
-            if ':' in line:
-                key, value = self._parse_property_line(line)
-                if key == 'mode':
-                    partition['mode'] = value
-                elif key:
-                    partition['properties'][key] = value
-
-            i += 1
-
-        return partition, i
-
-    def _parse_calculation_item(self, lines: List[str], start_index: int) -> tuple[Optional[Dict[str, Any]], int]:
-        """Parse a calculation item (for calculation groups)."""
-        line = lines[start_index].strip()
-
-        # Extract calculation item name: "calculationItem Name ="
-        item_match = re.match(r'^calculationItem\s+["\']?([^"\'=]+)["\']?\s*=', line)
-        if not item_match:
-            return None, start_index + 1
-
-        item_name = item_match.group(1)
-
+    def _calculation_item_from_node(self, node: TmdlNode) -> Dict[str, Any]:
+        """Calculation item dict from a calculationItem node."""
         calc_item = {
-            "name": item_name,
-            "expression": None,
+            "name": node.name,
+            "expression": node.expression,
             "ordinal": None,
-            "format_string_definition": None,
+            "format_string_definition": node.expressions.get('formatStringDefinition'),
             "description": None,
-            "annotations": [],
+            "annotations": self._annotations_from_node(node),
             "properties": {}
         }
+        self._apply_properties(node, calc_item, {'ordinal': 'ordinal', 'description': 'description'})
+        return calc_item
 
-        # Extract DAX expression
-        expression, next_i = self._extract_expression(lines, start_index)
-        calc_item['expression'] = expression
-
-        # Parse properties
-        i = next_i
-        while i < len(lines):
-            line = lines[i].strip()
-
-            if not line or line.startswith('///'):
-                i += 1
-                continue
-
-            # Check if we've reached the next object
-            if not line.startswith((' ', '\t')) or any(
-                line.startswith(kw) for kw in ['column ', 'calculationItem ', 'measure ']
-            ):
-                break
-
-            # Parse property
-            if ':' in line:
-                key, value = self._parse_property_line(line)
-                if key == 'ordinal':
-                    calc_item['ordinal'] = value
-                elif key == 'description':
-                    calc_item['description'] = value
-                elif key:
-                    calc_item['properties'][key] = value
-            elif line.startswith('formatStringDefinition'):
-                # Format string definition can be multi-line expression
-                expr, expr_end = self._extract_expression(lines, i, keyword='formatStringDefinition')
-                calc_item['format_string_definition'] = expr
-                i = expr_end
-                continue
-            elif line.startswith('annotation '):
-                annot, annot_end = self._parse_annotation(lines, i)
-                if annot:
-                    calc_item['annotations'].append(annot)
-                i = annot_end
-                continue
-
-            i += 1
-
-        return calc_item, i
-
-    def _extract_expression(
-        self,
-        lines: List[str],
-        start_index: int,
-        keyword: Optional[str] = None
-    ) -> tuple[Optional[str], int]:
-        """
-        Extract a multi-line DAX or M expression.
-
-        Args:
-            lines: All lines of the file
-            start_index: Index to start extraction
-            keyword: Optional keyword to look for (e.g., 'source', 'formatStringDefinition')
-
-        Returns:
-            Tuple of (expression_text, next_line_index)
-        """
-        expression_lines = []
-        i = start_index
-
-        # Check if expression starts on the same line
-        line = lines[i].strip()
-
-        if keyword:
-            # Look for "keyword =" pattern
-            if keyword in line and '=' in line:
-                # Extract everything after '='
-                parts = line.split('=', 1)
-                if len(parts) > 1:
-                    expr_start = parts[1].strip()
-                    if expr_start:
-                        expression_lines.append(expr_start)
-                i += 1
-        else:
-            # Expression starts after '=' on current line
-            if '=' in line:
-                parts = line.split('=', 1)
-                if len(parts) > 1:
-                    expr_start = parts[1].strip()
-                    if expr_start:
-                        expression_lines.append(expr_start)
-                i += 1
-
-        # Continue reading indented lines as part of expression
-        base_indent = None
-        while i < len(lines):
-            line = lines[i]
-
-            # Calculate indentation
-            stripped = line.lstrip()
-            if not stripped or stripped.startswith('///'):
-                i += 1
-                continue
-
-            indent = len(line) - len(stripped)
-
-            # Set base indent from first non-empty line
-            if base_indent is None and stripped:
-                base_indent = indent
-
-            # If line has less indentation, we've reached the end of expression
-            if base_indent is not None and indent < base_indent and stripped:
-                # Check if this is a property line (contains ':')
-                if ':' in stripped and not any(kw in stripped for kw in ['CALCULATE(', 'VAR ', 'RETURN', 'let', 'in']):
-                    break
-                # Check if it's a new object
-                if any(stripped.startswith(kw) for kw in ['column ', 'measure ', 'hierarchy ', 'partition ', 'calculationItem ']):
-                    break
-
-            # Add line to expression
-            expression_lines.append(stripped)
-            i += 1
-
-            # Stop if we hit an unindented line that looks like a property
-            if not stripped.startswith((' ', '\t')) and ':' in stripped:
-                break
-
-        # Join and clean up expression
-        if expression_lines:
-            expression = '\n'.join(expression_lines).strip()
-            return expression, i
-
-        return None, i
-
-    def _parse_property_line(self, line: str) -> tuple[Optional[str], Optional[Any]]:
-        """
-        Parse a property line: "key: value"
-
-        Returns:
-            Tuple of (key, value)
-        """
-        if ':' not in line:
-            return None, None
-
-        parts = line.split(':', 1)
-        key = parts[0].strip()
-        value = parts[1].strip() if len(parts) > 1 else None
-
-        # Try to parse value as appropriate type
-        if value:
-            # Remove quotes if present
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            elif value.startswith("'") and value.endswith("'"):
-                value = value[1:-1]
-
-            # Try to parse as number
-            try:
-                if '.' in value:
-                    value = float(value)
-                else:
-                    value = int(value)
-            except ValueError:
-                pass  # Keep as string
-
-        return key, value
-
-    def _parse_annotation(self, lines: List[str], start_index: int) -> tuple[Optional[Dict[str, Any]], int]:
-        """
-        Parse an annotation definition.
-
-        Format: annotation Name = "value" or annotation Name = value
-
-        Returns:
-            Tuple of (annotation_dict, next_line_index)
-        """
-        line = lines[start_index].strip()
-
-        # Extract annotation: "annotation Name = value"
-        annot_match = re.match(r'^annotation\s+([^\s=]+)\s*=\s*(.+)', line)
-        if not annot_match:
-            return None, start_index + 1
-
-        annot_name = annot_match.group(1)
-        annot_value = annot_match.group(2).strip()
-
-        # Remove quotes if present
-        if annot_value.startswith('"') and annot_value.endswith('"'):
-            annot_value = annot_value[1:-1]
-        elif annot_value.startswith("'") and annot_value.endswith("'"):
-            annot_value = annot_value[1:-1]
-
-        annotation = {
-            "name": annot_name,
-            "value": annot_value
-        }
-
-        return annotation, start_index + 1
+    @staticmethod
+    def _annotations_from_node(node: TmdlNode) -> List[Dict[str, Any]]:
+        """Annotations declared directly on a node: "annotation Name = value"."""
+        return [
+            {"name": annotation.name, "value": unquote(annotation.value or "")}
+            for annotation in node.iter_children('annotation')
+        ]
 
     def _parse_relationships(self) -> List[Dict[str, Any]]:
         """Parse relationships.tmdl file."""
@@ -756,85 +389,38 @@ class TmdlParser:
             logger.debug("relationships.tmdl not found")
             return []
 
-        content = rel_file.read_text(encoding='utf-8')
-        relationships = []
-
-        lines = content.split('\n')
-        i = 0
-
-        while i < len(lines):
-            line = lines[i].strip()
+        return self._read_parsed(rel_file, "relationships", self._parse_relationships_content)
 
-            if not line or line.startswith('///'):
-                i += 1
-                continue
-
-            # Parse relationship: "relationship guid"
-            if line.startswith('relationship '):
-                rel_match = re.match(r'^relationship\s+(.+)', line)
-                if rel_match:
-                    rel_id = rel_match.group(1)
-                    relationship = {
-                        "id": rel_id,
-                        "from_column": None,
-                        "from_cardinality": None,
-                        "to_column": None,
-                        "to_cardinality": None,
-                        "is_active": True,
-                        "cross_filtering_behavior": None,
-                        "security_filtering_behavior": None,
-                        "rely_on_referential_integrity": False,
-                        "annotations": [],
-                        "properties": {}
-                    }
-
-                    # Parse relationship properties
-                    i += 1
-                    while i < len(lines):
-                        prop_line = lines[i].strip()
-
-                        if not prop_line or prop_line.startswith('///'):
-                            i += 1
-                            continue
-
-                        # Check if we've reached the next relationship
-                        if prop_line.startswith('relationship '):
-                            break
-
-                        # Parse property
-                        if ':' in prop_line:
-                            key, value = self._parse_property_line(prop_line)
-                            if key == 'fromColumn':
-                                relationship['from_column'] = value
-                            elif key == 'fromCardinality':
-                                relationship['from_cardinality'] = value
-                            elif key == 'toColumn':
-                                relationship['to_column'] = value
-                            elif key == 'toCardinality':
-                                relationship['to_cardinality'] = value
-                            elif key == 'crossFilteringBehavior':
-                                relationship['cross_filtering_behavior'] = value
-                            elif key == 'securityFilteringBehavior':
-                                relationship['security_filtering_behavior'] = value
-                            elif key == 'relyOnReferentialIntegrity':
-                                relationship['rely_on_referential_integrity'] = value if isinstance(value, bool) else str(value).lower() == 'true'
-                            elif key == 'isActive':
-                                relationship['is_active'] = value if isinstance(value, bool) else True
-                            elif key:
-                                relationship['properties'][key] = value
-                        elif prop_line.startswith('annotation '):
-                            annot, annot_end = self._parse_annotation(lines, i)
-                            if annot:
-                                relationship['annotations'].append(annot)
-                            i = annot_end
-                            continue
-
-                        i += 1
-
-                    relationships.append(relationship)
-                    continue
-
-            i += 1
+    def _parse_relationships_content(self, content: str) -> List[Dict[str, Any]]:
+        """Parse the relationship definitions in relationships.tmdl content."""
+        relationships = []
+        for node in parse_tmdl_text(content).iter_children('relationship'):
+            relationship = {
+                "id": node.name,
+                "from_column": None,
+                "from_cardinality": None,
+                "to_column": None,
+                "to_cardinality": None,
+                "is_active": True,
+                "cross_filtering_behavior": None,
+                "security_filtering_behavior": None,
+                "rely_on_referential_integrity": False,
+                "annotations": self._annotations_from_node(node),
+                "properties": {}
+            }
+            self._apply_properties(
+                node, relationship,
+                {
+                    'fromColumn': 'from_column',
+                    'fromCardinality': 'from_cardinality',
+                    'toColumn': 'to_column',
+                    'toCardinality': 'to_cardinality',
+                    'crossFilteringBehavior': 'cross_filtering_behavior',
+                    'securityFilteringBehavior': 'security_filtering_behavior',
+                },
+                {'isActive': 'is_active', 'relyOnReferentialIntegrity': 'rely_on_referential_integrity'}
+            )
+            relationships.append(relationship)
 
         logger.debug(f"Parsed {len(relationships)} relationships")
         return relationships
@@ -849,10 +435,11 @@ class TmdlParser:
         roles = []
         for role_file in roles_dir.glob("*.tmdl"):
             try:
-                content = role_file.read_text(encoding='utf-8')
-                role_data = self._parse_tmdl_content(content, "role")
+                role_data = self._read_parsed(
+                    role_file, "role",
+                    lambda content: self._with_source_file(self._parse_tmdl_content(content, "role"), role_file.name)
+                )
                 if role_data:
-                    role_data['_source_file'] = role_file.name
                     roles.append(role_data)
             except Exception as e:
                 logger.error(f"Error parsing role {role_file.name}: {e}")
@@ -870,10 +457,13 @@ class TmdlParser:
         perspectives = []
         for persp_file in perspectives_dir.glob("*.tmdl"):
             try:
-                content = persp_file.read_text(encoding='utf-8')
-                persp_data = self._parse_tmdl_content(content, "perspective")
+                persp_data = self._read_parsed(
+                    persp_file, "perspective",
+                    lambda content: self._with_source_file(
+                        self._parse_tmdl_content(content, "perspective"), persp_file.name
+                    )
+                )
                 if persp_data:
-                    persp_data['_source_file'] = persp_file.name
                     perspectives.append(persp_data)
             except Exception as e:
                 logger.error(f"Error parsing perspective {persp_file.name}: {e}")
@@ -888,7 +478,7 @@ class TmdlParser:
             logger.debug("expressions.tmdl not found")
             return []
 
-        content = expr_file.read_text(encoding='utf-8')
+        content = self._read_text(expr_file)
         # TODO: Implement detailed expression parsing if needed
         return [{"content": content}]
 
@@ -899,7 +489,7 @@ class TmdlParser:
             logger.debug("datasources.tmdl not found")
             return []
 
-        content = ds_file.read_text(encoding='utf-8')
+        content = self._read_text(ds_file)
         # TODO: Implement detailed datasource parsing if needed
         return [{"content": content}]
 
@@ -914,25 +504,33 @@ class TmdlParser:
         Returns:
             Parsed object dictionary
         """
-        lines = content.split('\n')
-        if not lines:
+        node = parse_tmdl_text(content).first(object_type)
+        if node is None or not node.name:
             return None
 
-        # Extract object name from first line
-        obj_match = re.match(rf'^{object_type}\s+["\']?([^"\']+)["\']?', lines[0].strip())
-        if not obj_match:
-            return None
-
-        obj_name = obj_match.group(1)
-
-        obj_data = {
+        return {
             "type": object_type,
-            "name": obj_name,
-            "properties": {},
+            "name": node.name,
+            "properties": {key: typed_value(value) for key, value in node.properties.items()},
             "content": content
         }
 
-        return obj_data
+
+def _parse_table_chunk(items: List[Tuple[str, str]]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Process-pool worker: parse (content, file name) pairs of table files.
+
+    Returns one (table_data, error) pair per item, in order.
+    """
+    parser = TmdlParser.__new__(TmdlParser)  # content parsing needs no definition folder
+    parser._cache = None
+    results = []
+    for content, file_name in items:
+        try:
+            results.append((parser._with_source_file(parser._parse_table_content(content), file_name), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
 
 
 def parse_tmdl_model(tmdl_path: str) -> Dict[str, Any]:
@@ -0,0 +1,365 @@
+"""
+Streaming TMDL Parser
+
+One line-oriented, single-pass parser for TMDL text. It is the engine behind every
+TMDL reader in the server:
+
+- core.tmdl.tmdl_parser.TmdlParser (full model dicts for analysis and diff)
+- core.model.tmdl_parser.TMDLParser (measure / column / relationship lookups)
+- core.pbip.pbip_model_analyzer.TmdlParser (generic nested dicts for PBIP analysis)
+
+Each of those is a thin adapter that converts TmdlNode objects into its own
+historical output format.
+
+The grammar follows the TMDL layout rules:
+- object declarations: ``<keyword> <name>[ = <value>]`` (table, column, measure, ...)
+- properties: ``key: value``; bare flags such as ``isHidden`` mean true
+- property expressions: ``key = <expression>`` (source, formatStringDefinition, ...)
+- multi-line expressions continue on lines indented deeper than the owner's
+  properties, or inside ``` fences
+- ``///`` lines are descriptions of the declaration that follows
+
+iter_tmdl_events() yields ("start", node) when a declaration is read and
+("end", node) once its properties, expression and children are complete, so a
+lookup can stop at the first match without reading the rest of the file.
+"""
+
+import logging
+import re
+import textwrap
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+OBJECT_KEYWORDS = frozenset({
+    "database", "model", "table", "column", "measure", "hierarchy", "level",
+    "partition", "calculationGroup", "calculationItem", "annotation",
+    "extendedProperty", "changedProperty", "relationship", "role", "member",
+    "tablePermission", "columnPermission", "perspective", "perspectiveTable",
+    "perspectiveColumn", "perspectiveMeasure", "perspectiveHierarchy", "culture",
+    "linguisticMetadata", "expression", "dataSource", "ref", "queryGroup", "variation",
+})
+
+# Declarations whose "= value" is a short kind marker, not an expression (partition X = m)
+_KIND_VALUE_KEYWORDS = frozenset({"partition"})
+
+_PROPERTY_RE = re.compile(r"([A-Za-z_]\w*)\s*:(.*)")
+_ASSIGNMENT_RE = re.compile(r"([A-Za-z_]\w*)\s*=(.*)")
+_SINGLE_QUOTED_RE = re.compile(r"'((?:[^']|'')*)'")
+_DOUBLE_QUOTED_RE = re.compile(r'"((?:[^"]|"")*)"')
+_FENCE = "```"
+
+
+@dataclass
+class TmdlNode:
+    """One TMDL object: declaration, properties, expressions and child objects."""
+    kind: str
+    name: Optional[str]
+    line: int
+    depth: int
+    end_line: int = 0
+    value: Optional[str] = None
+    expression: Optional[str] = None
+    description: Optional[str] = None
+    properties: Dict[str, Any] = field(default_factory=dict)
+    expressions: Dict[str, str] = field(default_factory=dict)
+    children: List["TmdlNode"] = field(default_factory=list)
+
+    def iter_children(self, kind: Optional[str] = None) -> Iterator["TmdlNode"]:
+        for child in self.children:
+            if kind is None or child.kind == kind:
+                yield child
+
+    def first(self, kind: str) -> Optional["TmdlNode"]:
+        return next(self.iter_children(kind), None)
+
+    def walk(self) -> Iterator["TmdlNode"]:
+        """This node and all descendants, depth first in file order."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def flag(self, key: str, default: bool = False) -> bool:
+        """Boolean property: bare flag, true/false text, or default when absent."""
+        value = self.properties.get(key)
+        if value is None:
+            return default
+        if isinstance(value, bool):
+            return value
+        return str(value).strip().lower() == "true"
+
+    def text(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Property value with surrounding quotes removed."""
+        value = self.properties.get(key)
+        if value is None or isinstance(value, bool):
+            return default
+        return unquote(value)
+
+
+def unquote(value: str) -> str:
+    """Strip one pair of matching single or double quotes."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+def typed_value(value: Any) -> Any:
+    """Property text as the core TMDL parser reports it: unquoted, numbers converted."""
+    if not isinstance(value, str) or not value:
+        return value
+    value = unquote(value)
+    try:
+        return float(value) if '.' in value else int(value)
+    except ValueError:
+        return value
+
+
+def split_name(text: str) -> Tuple[Optional[str], str]:
+    """
+    Split an object name from the rest of a declaration.
+
+    Handles 'quoted names' (with '' escapes), "double quoted" and bare names.
+
+    Returns:
+        Tuple of (name or None, remainder starting at '=' or empty)
+    """
+    text = text.strip()
+    if not text:
+        return None, ""
+    quote = text[0]
+    if quote in "'\"":
+        match = (_SINGLE_QUOTED_RE if quote == "'" else _DOUBLE_QUOTED_RE).match(text)
+        if match is None:
+            # Unterminated quote: the rest of the line is the name
+            return text[1:].replace(quote * 2, quote), ""
+        return match.group(1).replace(quote * 2, quote), text[match.end():].strip()
+    eq = text.find("=")
+    if eq == -1:
+        return text, ""
+    return text[:eq].strip() or None, text[eq:]
+
+
+def _depth(line: str) -> int:
+    """Indentation level: one per tab, one per four spaces."""
+    indent = line[:len(line) - len(line.lstrip(" \t"))]
+    if not indent:
+        return 0
+    return indent.count("\t") + indent.count(" ") // 4
+
+
+class _Lines:
+    """Line source with one line of pushback, tracking 1-based line numbers."""
+
+    __slots__ = ("_iter", "_pending", "number")
+
+    def __init__(self, lines: Iterable[str]):
+        self._iter = iter(lines)
+        self._pending: Optional[str] = None
+        self.number = 0
+
+    def next(self) -> Optional[str]:
+        if self._pending is not None:
+            line, self._pending = self._pending, None
+        else:
+            line = next(self._iter, None)
+            if line is None:
+                return None
+            line = line.rstrip("\r\n")
+        self.number += 1
+        return line
+
+    def push_back(self, line: str) -> None:
+        self._pending = line
+        self.number -= 1
+
+
+def _looks_like_member(stripped: str) -> bool:
+    """True for lines that start a property or object rather than continue an expression."""
+    if _PROPERTY_RE.match(stripped):
+        return True
+    head = stripped.split(None, 1)[0]
+    return head in OBJECT_KEYWORDS
+
+
+def _read_expression(source: _Lines, first: str, owner_depth: int, member_depth: int) -> Optional[str]:
+    """
+    Collect an expression that starts after '=' and may continue on following lines.
+
+    Args:
+        source: Line source positioned after the owning line
+        first: Text after '=' on the owning line
+        owner_depth: Depth of the owning line; continuation lines are deeper
+        member_depth: Depth at which the owner's own properties live. When the
+            expression starts on its own lines, continuation lines at that depth are
+            accepted while they do not look like members (tolerates expressions
+            indented one level short of the spec)
+    """
+    first = first.strip()
+    if first.startswith(_FENCE):
+        body = [first[len(_FENCE):]] if first[len(_FENCE):].strip() else []
+        while True:
+            line = source.next()
+            if line is None:
+                break
+            if line.strip().endswith(_FENCE):
+                tail = line.strip()[:-len(_FENCE)]
+                if tail:
+                    body.append(tail)
+                break
+            body.append(line)
+        return textwrap.dedent("\n".join(body)).strip() or None
+
+    body: List[str] = []
+    blanks: List[str] = []
+    base: Optional[int] = None
+    while True:
+        line = source.next()
+        if line is None:
+            break
+        stripped = line.strip()
+        if not stripped:
+            blanks.append("")
+            continue
+        depth = _depth(line)
+        if depth <= (member_depth if first else owner_depth):
+            source.push_back(line)
+            break
+        if base is None:
+            base = depth
+        if depth < base or (depth <= member_depth and _looks_like_member(stripped)):
+            source.push_back(line)
+            break
+        body.extend(blanks)
+        blanks = []
+        body.append(line)
+
+    continuation = textwrap.dedent("\n".join(body)) if body else ""
+    if first and continuation:
+        return f"{first}\n{continuation}".strip()
+    return (first or continuation).strip() or None
+
+
+def iter_tmdl_events(lines: Iterable[str]) -> Iterator[Tuple[str, TmdlNode]]:
+    """
+    Parse TMDL lines in one pass, yielding ("start", node) and ("end", node) events.
+
+    Nodes are linked into their parent's children as they are read; the parent of
+    top-level declarations is an implicit document node (kind "document").
+    """
+    source = _Lines(lines)
+    root = TmdlNode("document", None, 0, -1)
+    stack: List[TmdlNode] = [root]
+    description: List[str] = []
+    # Last line that belonged to an object (descriptions belong to the next one)
+    last_line = 0
+
+    while True:
+        line = source.next()
+        if line is None:
+            break
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("///"):
+            description.append(stripped[3:].strip())
+            continue
+
+        depth = _depth(line)
+        while stack[-1].depth >= depth:
+            node = stack.pop()
+            node.end_line = last_line
+            yield "end", node
+        parent = stack[-1]
+        last_line = source.number
+
+        match = _PROPERTY_RE.match(stripped)
+        if match:
+            parent.properties[match.group(1)] = match.group(2).strip()
+            description = []
+            continue
+
+        match = _ASSIGNMENT_RE.match(stripped)
+        if match:
+            expression = _read_expression(source, match.group(2), depth, depth)
+            last_line = source.number
+            if expression is not None:
+                parent.expressions[match.group(1)] = expression
+            description = []
+            continue
+
+        head, _, rest = stripped.partition(" ")
+        if head in OBJECT_KEYWORDS:
+            name, remainder = split_name(rest)
+            node = TmdlNode(head, name, source.number, depth)
+            if description:
+                node.description = "\n".join(description)
+                description = []
+            if remainder.startswith("="):
+                node.value = remainder[1:].strip()
+                if head not in _KIND_VALUE_KEYWORDS:
+                    node.expression = _read_expression(source, node.value, depth, depth + 1)
+                    last_line = source.number
+            parent.children.append(node)
+            stack.append(node)
+            yield "start", node
+            continue
+
+        if head == stripped and head.isidentifier():
+            parent.properties[head] = True
+        description = []
+
+    while len(stack) > 1:
+        node = stack.pop()
+        node.end_line = last_line
+        yield "end", node
+    root.end_line = last_line
+    yield "end", root
+
+
+def parse_tmdl_text(content: str) -> TmdlNode:
+    """Parse TMDL text into a document node whose children are the top-level objects."""
+    root = None
+    for event, node in iter_tmdl_events(content.splitlines()):
+        if event == "end" and node.kind == "document":
+            root = node
+    return root
+
+
+def find_object(
+    lines: Iterable[str],
+    kind: str,
+    name: str,
+    case_sensitive: bool = False,
+) -> Optional[Tuple[TmdlNode, List[TmdlNode]]]:
+    """
+    Stream lines until the first complete object of a kind with a given name.
+
+    Returns:
+        Tuple of (node, ancestors from the document down) or None when absent
+    """
+    wanted = name if case_sensitive else name.lower()
+    path: List[TmdlNode] = []
+    for event, node in iter_tmdl_events(lines):
+        if event == "start":
+            path.append(node)
+            continue
+        if path and path[-1] is node:
+            path.pop()
+        if node.kind == kind and node.name is not None:
+            found = node.name if case_sensitive else node.name.lower()
+            if found == wanted:
+                return node, path
+    return None
+
+
+__all__ = [
+    "OBJECT_KEYWORDS",
+    "TmdlNode",
+    "iter_tmdl_events",
+    "parse_tmdl_text",
+    "find_object",
+    "split_name",
+    "typed_value",
+    "unquote",
+]
@@ -9,9 +9,11 @@ import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Any, Tuple
 from enum import Enum
 
+from core.tmdl.tmdl_parse_cache import get_tmdl_parse_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -121,6 +123,7 @@ class TmdlValidator:
         self.config = config or {}
         self.validation_rules = self.config.get("validation_rules", {})
         self.linting_enabled = self.config.get("linting", {}).get("enabled", True)
+        self._cache = get_tmdl_parse_cache()
 
         # Will be populated during validation
         self.tables: Set[str] = set()
@@ -228,16 +231,28 @@ class TmdlValidator:
 
                 # Parse file to extract columns and measures
                 try:
-                    content = table_file.read_text(encoding="utf-8")
-                    self._extract_columns_and_measures(
-                        content, table_name, self.columns[table_name], self.measures[table_name]
-                    )
+                    columns, measures = self._read_parsed(table_file, "validator_objects", self._object_names)
+                    self.columns[table_name].update(columns)
+                    self.measures[table_name].update(measures)
                 except Exception as e:
                     logger.warning(f"Could not parse {table_file}: {e}")
 
         except Exception as e:
             logger.error(f"Error collecting model objects: {e}", exc_info=True)
 
+    def _read_parsed(self, file_path: Path, kind: str, parse: Callable[[str], Any]) -> Any:
+        """Parse a file through the shared TMDL parse cache (re-run only when the file changed)"""
+        if self._cache is None:
+            return parse(file_path.read_text(encoding="utf-8"))
+        return self._cache.parsed(file_path, kind, parse)
+
+    def _object_names(self, content: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Column and measure names declared in table TMDL content"""
+        columns: Set[str] = set()
+        measures: Set[str] = set()
+        self._extract_columns_and_measures(content, "", columns, measures)
+        return frozenset(columns), frozenset(measures)
+
     def _extract_columns_and_measures(
         self, content: str, table_name: str, columns: Set[str], measures: Set[str]
     ) -> None:
@@ -267,58 +282,11 @@ class TmdlValidator:
     def _validate_file(self, file_path: Path, result: ValidationResult) -> None:
         """Validate a single TMDL file for syntax errors"""
         try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            for line_num, line in enumerate(lines, start=1):
-                # Check indentation (should be tabs or spaces, but consistent)
-                if line and not line[0].isspace() and not line[0].isalpha():
-                    if line[0] not in {"\t", " "} and ":" not in line:
-                        result.warnings.append(
-                            ValidationError(
-                                file=str(file_path),
-                                line=line_num,
-                                column=0,
-                                severity=ValidationSeverity.WARNING,
-                                code="TMDL002",
-                                message="Unexpected character at line start",
-                                suggestion="Check indentation and formatting"
-                            )
-                        )
-
-                # Check for unclosed strings
-                stripped = line.strip()
-                if stripped.count("'") % 2 != 0 or stripped.count('"') % 2 != 0:
-                    if not stripped.endswith("\\"):  # Allow line continuations
-                        result.errors.append(
-                            ValidationError(
-                                file=str(file_path),
-                                line=line_num,
-                                column=0,
-                                severity=ValidationSeverity.ERROR,
-                                code="TMDL003",
-                                message="Unclosed string literal",
-                                suggestion="Add closing quote"
-                            )
-                        )
-
-                # Check dataType values
-                if "dataType:" in line or "datatype:" in line:
-                    match = re.search(r"dataType:\s*(\w+)", line, re.IGNORECASE)
-                    if match:
-                        data_type = match.group(1)
-                        if data_type not in self.VALID_DATA_TYPES:
-                            result.errors.append(
-                                ValidationError(
-                                    file=str(file_path),
-                                    line=line_num,
-                                    column=line.index("dataType"),
-                                    severity=ValidationSeverity.ERROR,
-                                    code="TMDL001",
-                                    message=f"Invalid data type '{data_type}'. Valid types: {', '.join(sorted(self.VALID_DATA_TYPES))}",
-                                    suggestion=f"Use a valid data type (e.g., 'string', 'int64', 'double')"
-                                )
-                            )
+            errors, warnings = self._read_parsed(
+                file_path, "validator_syntax", lambda content: self._check_syntax(content, file_path)
+            )
+            result.errors.extend(errors)
+            result.warnings.extend(warnings)
 
         except Exception as e:
             logger.error(f"Error validating file {file_path}: {e}", exc_info=True)
@@ -334,6 +302,66 @@ class TmdlValidator:
                 )
             )
 
+    def _check_syntax(
+        self, content: str, file_path: Path
+    ) -> Tuple[List[ValidationError], List[ValidationError]]:
+        """Syntax errors and warnings for one file's content"""
+        errors: List[ValidationError] = []
+        warnings: List[ValidationError] = []
+        lines = content.split("\n")
+
+        for line_num, line in enumerate(lines, start=1):
+            # Check indentation (should be tabs or spaces, but consistent)
+            if line and not line[0].isspace() and not line[0].isalpha():
+                if line[0] not in {"\t", " "} and ":" not in line:
+                    warnings.append(
+                        ValidationError(
+                            file=str(file_path),
+                            line=line_num,
+                            column=0,
+                            severity=ValidationSeverity.WARNING,
+                            code="TMDL002",
+                            message="Unexpected character at line start",
+                            suggestion="Check indentation and formatting"
+                        )
+                    )
+
+            # Check for unclosed strings
+            stripped = line.strip()
+            if stripped.count("'") % 2 != 0 or stripped.count('"') % 2 != 0:
+                if not stripped.endswith("\\"):  # Allow line continuations
+                    errors.append(
+                        ValidationError(
+                            file=str(file_path),
+                            line=line_num,
+                            column=0,
+                            severity=ValidationSeverity.ERROR,
+                            code="TMDL003",
+                            message="Unclosed string literal",
+                            suggestion="Add closing quote"
+                        )
+                    )
+
+            # Check dataType values
+            if "dataType:" in line or "datatype:" in line:
+                match = re.search(r"dataType:\s*(\w+)", line, re.IGNORECASE)
+                if match:
+                    data_type = match.group(1)
+                    if data_type not in self.VALID_DATA_TYPES:
+                        errors.append(
+                            ValidationError(
+                                file=str(file_path),
+                                line=line_num,
+                                column=line.index("dataType"),
+                                severity=ValidationSeverity.ERROR,
+                                code="TMDL001",
+                                message=f"Invalid data type '{data_type}'. Valid types: {', '.join(sorted(self.VALID_DATA_TYPES))}",
+                                suggestion=f"Use a valid data type (e.g., 'string', 'int64', 'double')"
+                            )
+                        )
+
+        return errors, warnings
+
     def _validate_references(self, result: ValidationResult) -> None:
         """Validate that all references (columns, measures) exist in the model"""
         # This is a simplified version - full implementation would parse DAX expressions
@@ -390,7 +418,7 @@ class TmdlValidator:
 
         for table_file in tables_dir.glob("*.tmdl"):
             try:
-                content = table_file.read_text(encoding="utf-8")
+                content = self._cache.content(table_file) if self._cache else table_file.read_text(encoding="utf-8")
                 measure_count = content.count("measure ")
 
                 if measure_count > 100:
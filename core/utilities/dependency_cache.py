@@ -256,65 +256,49 @@ def compute_all_dependencies(
         # Fallback: return without table (shouldn't happen often)
         return f"[{name}]"
 
-    # Compute dependencies for each measure
+    # Build the full dependency graph in one pass: every expression is parsed once and
+    # forward/reverse adjacency (measure->measures, measure->columns, column->measures)
+    # is built together, so per-item lookups below are O(degree).
     logger.info(f"Computing dependencies for {len(all_measures)} measures...")
-    for idx, m_data in enumerate(all_measures):
+    graph = dependency_analyzer.build_dependency_graph(measures_result.get('rows', []) if measures_result.get('success') else [])
+
+    for m_data in all_measures:
         m_table = m_data['table']
         m_name = m_data['name']
         m_key = f"{m_table}[{m_name}]"
 
-        if idx > 0 and idx % 50 == 0:
-            logger.info(f"  Progress: {idx}/{len(all_measures)} measures...")
-
-        try:
-            # Get dependencies for this measure
-            m_deps = dependency_analyzer.analyze_dependencies(m_table, m_name, include_diagram=False)
-            if m_deps.get('success'):
-                # Get what uses this measure
-                m_usage = dependency_analyzer.find_measure_usage(m_table, m_name)
-                m_used_by = m_usage.get('used_by', []) if m_usage.get('success') else []
-
-                # Resolve measure references (some may have empty table names)
-                upstream_measures = []
-                for t, n in m_deps.get('referenced_measures', []):
-                    ref = resolve_measure_ref(t, n)
-                    if ref not in upstream_measures:
-                        upstream_measures.append(ref)
-
-                # Columns - use 'Unknown' if table name is missing
-                upstream_columns = []
-                for t, n in m_deps.get('referenced_columns', []):
-                    if n:  # Only require name, table can be empty
-                        table_name = t if t else 'Unknown'
-                        col_ref = f"{table_name}[{n}]"
-                        if col_ref not in upstream_columns:
-                            upstream_columns.append(col_ref)
-
-                all_dependencies[m_key] = {
-                    'key': m_key,
-                    'type': 'measure',
-                    'table': m_table,
-                    'name': m_name,
-                    'upstream': {
-                        'measures': upstream_measures,
-                        'columns': upstream_columns
-                    },
-                    'downstream': {
-                        'measures': [f"{item.get('table', '')}[{item.get('measure', '')}]"
-                                   for item in m_used_by if item.get('table') and item.get('measure')],
-                        'visuals': []
-                    }
-                }
-        except Exception as e:
-            logger.debug(f"Could not compute dependencies for {m_key}: {e}")
-            all_dependencies[m_key] = {
-                'key': m_key,
-                'type': 'measure',
-                'table': m_table,
-                'name': m_name,
-                'upstream': {'measures': [], 'columns': []},
-                'downstream': {'measures': [], 'visuals': []}
+        refs = graph.get_references(m_table, m_name) or {}
+
+        # Resolve measure references (some may have empty table names)
+        upstream_measures = []
+        for t, n in refs.get('measures', []):
+            ref = resolve_measure_ref(t, n)
+            if ref not in upstream_measures:
+                upstream_measures.append(ref)
+
+        # Columns - use 'Unknown' if table name is missing
+        upstream_columns = []
+        for t, n in refs.get('columns', []):
+            if n:  # Only require name, table can be empty
+                table_name = t if t else 'Unknown'
+                col_ref = f"{table_name}[{n}]"
+                if col_ref not in upstream_columns:
+                    upstream_columns.append(col_ref)
+
+        all_dependencies[m_key] = {
+            'key': m_key,
+            'type': 'measure',
+            'table': m_table,
+            'name': m_name,
+            'upstream': {
+                'measures': upstream_measures,
+                'columns': upstream_columns
+            },
+            'downstream': {
+                'measures': [f"{u['table']}[{u['name']}]" for u in graph.get_measure_users(m_table, m_name)],
+                'visuals': []
             }
+        }
 
     logger.info(f"Computed dependencies for {len(all_dependencies)} measures")
 
@@ -325,20 +309,16 @@ def compute_all_dependencies(
         c_key = f"{c_table}[{c_name}]"
 
         if c_key not in all_dependencies:
-            # Find which measures use this column
-            using_measures = []
-            for m_key, m_deps in all_dependencies.items():
-                if m_deps.get('type') == 'measure':
-                    if c_key in m_deps.get('upstream', {}).get('columns', []):
-                        using_measures.append(m_key)
-
             all_dependencies[c_key] = {
                 'key': c_key,
                 'type': 'column',
                 'table': c_table,
                 'name': c_name,
                 'upstream': {'measures': [], 'columns': []},
-                'downstream': {'measures': using_measures, 'visuals': []}
+                'downstream': {
+                    'measures': [f"{u['table']}[{u['name']}]" for u in graph.get_column_users(c_table, c_name)],
+                    'visuals': []
+                }
             }
 
     logger.info(f"Total items with dependencies: {len(all_dependencies)}")
@@ -47,7 +47,8 @@ def analyze_pbip_repository(
     exclude_folders: list,
     verbose: bool = False,
     bpa_rules_path: str = None,
-    enable_enhanced: bool = True
+    enable_enhanced: bool = True,
+    data_mode: str = "inline"
 ) -> dict:
     """
     Analyze a PBIP repository and generate comprehensive report.
@@ -59,6 +60,8 @@ def analyze_pbip_repository(
         verbose: Enable verbose logging
         bpa_rules_path: Optional path to BPA rules JSON file
         enable_enhanced: Enable enhanced analysis features (lineage, quality metrics, etc.)
+        data_mode: 'inline' embeds the report data in the HTML file, 'external'
+            writes it to a folder next to it
 
     Returns:
         Dictionary with analysis results
@@ -235,7 +238,8 @@ def analyze_pbip_repository(
             dependencies,
             output_path,
             os.path.basename(repo_path),
-            enhanced_results=enhanced_results
+            enhanced_results=enhanced_results,
+            data_mode=data_mode
         )
 
         logger.info(f"  HTML report generated: {html_path}")
@@ -327,6 +331,12 @@ Examples:
         help="Disable enhanced analysis features (use basic analysis only)"
     )
 
+    parser.add_argument(
+        "--external-data",
+        action="store_true",
+        help="Write the report data next to the HTML file instead of embedding it (for very large models)"
+    )
+
     args = parser.parse_args()
 
     # Setup logging
@@ -349,7 +359,8 @@ Examples:
             args.exclude,
             args.verbose,
             args.bpa_rules,
-            not args.no_enhanced
+            not args.no_enhanced,
+            "external" if args.external_data else "inline"
         )
 
         if result.get("success"):
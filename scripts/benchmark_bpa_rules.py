@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark BPA rule evaluation: compiled closures vs the string interpreter.
+
+Builds a synthetic TMSL model (tables with columns, measures, partitions and
+relationships) and runs analyze_model with every rule of a rules file, once
+with compiled rules and once with all rules forced through the interpreter.
+The interpreter run keeps analyze_model's 60 s budget, so on large models it
+stops early (reported in the run notes).
+
+The incremental line re-runs the compiled rules after editing one measure,
+with fingerprints seeded by a previous incremental run, and checks that the
+violations equal a full run on the edited model.
+
+Usage:
+    python scripts/benchmark_bpa_rules.py [--columns 20000] [--rules config/bpa_rules_comprehensive.json]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+import warnings
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.analysis.bpa_analyzer import BPAAnalyzer
+
+
+def build_model(columns: int, columns_per_table: int = 50, seed: int = 3):
+    rng = random.Random(seed)
+    names = ["Amount", "Price", "CustomerKey", "ProductID", "City", "Month Name", "Year",
+             "Quantity", "Description", "Order Date", "Region_Code", "Revenue"]
+    types = ["string", "int64", "double", "dateTime", "decimal"]
+    expressions = [
+        "SUM(Sales[Amount])",
+        "CALCULATE(SUM(Sales[Amount]), FILTER(ALL(Sales), Sales[Qty] > 1))",
+        "SUMX(FILTER(Sales, Sales[Qty] > 0), Sales[Amount] / Sales[Qty])",
+        "VAR x = [Total] RETURN IF(ISBLANK(x), 0, x)",
+        "IFERROR([A] / [B], 0)",
+    ]
+    tables = []
+    for t in range((columns + columns_per_table - 1) // columns_per_table):
+        prefix = rng.choice(["Fact", "Dim", "LocalDateTable_", ""])
+        cols = [{
+            "name": f"{rng.choice(names)} {c}",
+            "dataType": rng.choice(types),
+            "isHidden": rng.random() < 0.3,
+            "summarizeBy": rng.choice(["none", "sum", "count"]),
+        } for c in range(columns_per_table)]
+        measures = [{
+            "name": f"Measure {t}_{m}",
+            "expression": rng.choice(expressions),
+            "formatString": rng.choice(["", "#,0"]),
+        } for m in range(5)]
+        tables.append({
+            "name": f"{prefix}Table{t}",
+            "columns": cols,
+            "measures": measures,
+            "partitions": [{"name": f"P{t}", "source": {"type": "m", "expression": "let x = 1 in x"}}],
+        })
+    relationships = [{
+        "fromTable": tables[i]["name"], "fromColumn": tables[i]["columns"][0]["name"],
+        "toTable": tables[i + 1]["name"], "toColumn": tables[i + 1]["columns"][0]["name"],
+        "crossFilteringBehavior": rng.choice(["oneDirection", "bothDirections"]),
+    } for i in range(len(tables) - 1)]
+    return {"model": {"tables": tables, "relationships": relationships}}
+
+
+def run(analyzer, model, incremental=False):
+    start = time.perf_counter()
+    violations = analyzer.analyze_model(model, incremental=incremental)
+    return (time.perf_counter() - start) * 1000, violations
+
+
+def violation_keys(violations):
+    return sorted((v.rule_id, v.object_type, v.object_name, v.table_name or '') for v in violations)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark compiled BPA rules')
+    parser.add_argument('--columns', type=int, default=20000, help='Columns in the synthetic model')
+    parser.add_argument('--rules', default=os.path.join(parent_dir, 'config', 'bpa_rules_comprehensive.json'))
+    args = parser.parse_args()
+    warnings.simplefilter('ignore', FutureWarning)  # .NET-style character classes in some rule regexes
+
+    model = build_model(args.columns)
+    analyzer = BPAAnalyzer(args.rules)
+    compiled = sum(1 for rule in analyzer.rules if rule.compiled is not None)
+    print(f"{len(analyzer.rules)} rules ({compiled} compiled), {args.columns} columns")
+
+    compiled_ms, violations = run(analyzer, model)
+    print(f"  compiled     {compiled_ms:10.0f} ms   {len(violations)} violations")
+
+    analyzer.analyze_model(model, incremental=True)
+    edited = copy.deepcopy(model)
+    edited['model']['tables'][0]['measures'][0]['expression'] = 'SUM(Sales[Quantity])'
+    incremental_ms, incremental = run(analyzer, edited, incremental=True)
+    stats = analyzer.get_incremental_stats()
+    same = violation_keys(incremental) == violation_keys(run(analyzer, edited)[1])
+    print(f"  incremental  {incremental_ms:10.0f} ms   {stats['objects_skipped']}/{stats['objects_total']} objects "
+          f"unchanged, {stats['evaluations_skipped']} evaluations skipped, "
+          f"{'same as full run' if same else 'MISMATCH with full run'}")
+
+    for rule in analyzer.rules:
+        rule.compiled = None
+    interpreted_ms, interpreted = run(analyzer, model)
+    notes = "; ".join(analyzer.get_run_notes())
+    print(f"  interpreter  {interpreted_ms:10.0f} ms   {len(interpreted)} violations"
+          f"{'   (' + notes + ')' if notes else ''}")
+    print(f"  speedup      {interpreted_ms / compiled_ms:10.1f}x")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
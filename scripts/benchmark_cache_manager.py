@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark EnhancedCacheManager sizing and eviction.
+
+- sizing: for query-result-shaped values (dict with a list of row dicts),
+  compares sys.getsizeof (the old estimate), estimate_size and the memory
+  actually allocated (tracemalloc), with the estimation time
+- budget: fills a cache with a small max_size_mb and reports the accounted
+  bytes against the traced memory held by the cache
+- eviction: time per set() on a full cache for each policy
+
+Usage:
+    python scripts/benchmark_cache_manager.py [--rows 5000] [--entries 20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.infrastructure.cache_manager import EnhancedCacheManager, estimate_size
+
+
+def make_result(rows, seed=0):
+    return {
+        'success': True,
+        'columns': ['Date[Year]', 'Product[Name]', '[Sales]'],
+        'rows': [{'Date[Year]': str(2000 + (i + seed) % 25), 'Product[Name]': f"Product {i + seed}",
+                  '[Sales]': str((i + seed) * 1.5)} for i in range(rows)],
+        'row_count': rows,
+    }
+
+
+def traced(build):
+    tracemalloc.start()
+    value = build()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, used
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark EnhancedCacheManager')
+    parser.add_argument('--rows', type=int, default=5000, help='Rows per cached result')
+    parser.add_argument('--entries', type=int, default=20000, help='Entries for the eviction timing')
+    args = parser.parse_args()
+    ok = True
+
+    print("sizing")
+    for rows in (10, 1000, args.rows):
+        value, actual = traced(lambda: make_result(rows))
+        start = time.perf_counter()
+        estimate = estimate_size(value)
+        ms = (time.perf_counter() - start) * 1000
+        error = (estimate - actual) / actual * 100
+        ok &= rows < 1000 or abs(error) < 25  # tiny values: literal keys are interned, not traced
+        print(f"  {rows:6} rows  getsizeof {sys.getsizeof(value):9}  estimate {estimate:10} ({ms:5.2f} ms)  "
+              f"actual {actual:10}  error {error:+5.1f}%")
+
+    print("budget (max_size_mb=5)")
+    cache = EnhancedCacheManager({'ttl_seconds': 0, 'max_entries': 0, 'max_size_mb': 5})
+    tracemalloc.start()
+    for seed in range(12):
+        cache.set(f"q{seed}", make_result(args.rows, seed))
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    stats = cache.get_stats()
+    ok &= stats['size_bytes'] <= 5 * 1024 * 1024 and stats['evictions'] > 0
+    print(f"  {stats['size']} entries kept, {stats['evictions']} evicted, accounted {stats['size_mb']} MB, "
+          f"traced {held / 1024 / 1024:.2f} MB")
+
+    print(f"eviction ({args.entries} entries, full cache)")
+    for policy in ('lru', 'lfu', 'ttl'):
+        cache = EnhancedCacheManager({'ttl_seconds': 0, 'max_entries': args.entries, 'max_size_mb': 0,
+                                      'eviction_policy': policy})
+        for i in range(args.entries):
+            cache.set(f"k{i}", i)
+            if i % 3 == 0:
+                cache.get(f"k{i}")
+        start = time.perf_counter()
+        for i in range(args.entries, args.entries + 5000):
+            cache.set(f"k{i}", i)
+            cache.get(f"k{i}")
+        us = (time.perf_counter() - start) / 5000 * 1e6
+        print(f"  {policy}: {us:6.1f} us per set+get, {cache.evictions} evictions")
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
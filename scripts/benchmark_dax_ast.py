@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared DAX syntax tree against per-check regex scanning.
+
+Builds a synthetic corpus of large measures and compares:
+- legacy: the regex passes the DAX best-practice checks used to run (one full-text
+  scan per pattern, per measure)
+- ast (cold): tokenize + parse every measure once
+- ast (warm): all DAX analyzers walking the memoized trees
+
+Usage:
+    python scripts/benchmark_dax_ast.py [--measures 200] [--size 40] [--rounds 3]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.dax.dax_ast import clear_parse_cache, get_parse_cache_info, parse_dax
+from core.dax.dax_best_practices import DaxBestPracticesAnalyzer
+from core.dax.context_analyzer import DaxContextAnalyzer
+from core.dax.call_tree_builder import CallTreeBuilder
+from core.dax.code_rewriter import DaxCodeRewriter, VariableOptimizationScanner
+
+# Patterns the best-practice checks scanned with before the shared tree existed
+LEGACY_PATTERNS = [
+    r'(SUMX|AVERAGEX|MINX|MAXX)\s*\(\s*FILTER\s*\(',
+    r'COUNTROWS\s*\(\s*FILTER\s*\(',
+    r'FILTER\s*\(\s*(ALL|ALLSELECTED)\s*\(',
+    r'CALCULATE\s*\([^)]*CALCULATE\s*\(',
+    r'(SUMX|AVERAGEX|COUNTX|FILTER)\s*\([^)]*RELATED\s*\(',
+    r'IF\s*\([^=]+\s*=\s*0\s*,\s*[^,]+\s*,\s*[^/]+\s*/\s*[^)]+\)',
+    r'CALCULATE\s*\([^)]*,\s*VALUES\s*\(',
+    r'FILTER\s*\([^)]*,\s*\[[^\]]+\]\s*[><!=]',
+    r'(SUMX|AVERAGEX)\s*\(([^,]+),\s*\2\[([^\]]+)\]\s*\)',
+    r'\[[^\]]+\]',
+    r'\bVAR\s+([A-Z]|V\d+)\s*=',
+    r'CALCULATE\s*\([^)]*,\s*FILTER\s*\([^,]+,\s*[^,]+\s*[<>=!]+\s*[^)]+\)',
+    r'\b(IFERROR|ISERROR)\s*\(',
+    r'\bADDCOLUMNS\s*\(',
+    r'(SUMX|AVERAGEX|COUNTX|MINX|MAXX)\s*\([^,]+,\s*IF\s*\(',
+    r'\b[A-Z]+\s*\(',
+]
+
+FRAGMENTS = [
+    "SUMX(FILTER(Sales, Sales[Qty] > {n}), Sales[Amount])",
+    "CALCULATE([Total Sales], 'Date'[Year] = {n}, ALL(Product))",
+    "COUNTROWS(FILTER(ALL(Customer), [Margin] > {n}))",
+    "IF([Cost] = 0, BLANK(), [Revenue] / [Cost])",
+    "AVERAGEX(Sales, Sales[Price] * RELATED(Product[Weight]))",
+    "CALCULATE(CALCULATE(SUM(Sales[Amount]), KEEPFILTERS(Sales[Region] = \"R{n}\")), VALUES(Store[Id]))",
+    "IFERROR(DIVIDE([A], [B]), 0) // trailing comment {n}",
+]
+
+
+def build_corpus(measures: int, size: int, seed: int = 7) -> list:
+    """Generate synthetic measures of roughly size fragments each."""
+    rng = random.Random(seed)
+    corpus = []
+    for m in range(measures):
+        parts = [f"VAR v{i} = {rng.choice(FRAGMENTS).format(n=rng.randint(0, 999))}" for i in range(size // 2)]
+        body = " +\n    ".join(rng.choice(FRAGMENTS).format(n=rng.randint(0, 999)) for _ in range(size - size // 2))
+        corpus.append("\n".join(parts) + f"\nRETURN\n    {body} + {m}")
+    return corpus
+
+
+def run_legacy(corpus: list) -> int:
+    compiled = [re.compile(p, re.IGNORECASE) for p in LEGACY_PATTERNS]
+    hits = 0
+    for dax in corpus:
+        for pattern in compiled:
+            hits += sum(1 for _ in pattern.finditer(dax))
+    return hits
+
+
+def run_parse(corpus: list) -> int:
+    return sum(len(parse_dax(dax).calls) for dax in corpus)
+
+
+def run_analyzers(corpus: list) -> int:
+    best_practices = DaxBestPracticesAnalyzer()
+    context = DaxContextAnalyzer()
+    call_tree = CallTreeBuilder()
+    rewriter = DaxCodeRewriter()
+    scanner = VariableOptimizationScanner()
+    found = 0
+    for dax in corpus:
+        found += best_practices.analyze(dax).get('total_issues', 0)
+        found += len(context.analyze_context_transitions(dax).transitions)
+        call_tree.build_call_tree(dax)
+        rewriter.rewrite_dax(dax)
+        found += scanner.scan_for_optimizations(dax).get('opportunities_found', 0)
+    return found
+
+
+def timed(fn, corpus: list, rounds: int) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(corpus)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the shared DAX syntax tree')
+    parser.add_argument('--measures', type=int, default=200, help='Number of measures in the corpus')
+    parser.add_argument('--size', type=int, default=40, help='Fragments per measure')
+    parser.add_argument('--rounds', type=int, default=3, help='Timing rounds (best is reported)')
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.measures, args.size)
+    total_chars = sum(len(d) for d in corpus)
+    print(f"Corpus: {len(corpus)} measures, {total_chars:,} characters "
+          f"(avg {total_chars // max(len(corpus), 1):,} per measure)")
+
+    legacy = timed(run_legacy, corpus, args.rounds)
+    print(f"legacy regex passes ({len(LEGACY_PATTERNS)} scans/measure): {legacy * 1000:8.1f} ms")
+
+    cold = float('inf')
+    for _ in range(args.rounds):
+        clear_parse_cache()
+        start = time.perf_counter()
+        run_parse(corpus)
+        cold = min(cold, time.perf_counter() - start)
+    print(f"ast parse (cold, 1 pass/measure):           {cold * 1000:8.1f} ms")
+
+    warm = timed(run_parse, corpus, args.rounds)
+    print(f"ast lookup (warm):                          {warm * 1000:8.1f} ms")
+
+    analyzers = timed(run_analyzers, corpus, 1)
+    print(f"all analyzers on shared trees:              {analyzers * 1000:8.1f} ms")
+    print(f"parse cache: {get_parse_cache_info()}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
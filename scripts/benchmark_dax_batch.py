@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark execute_dax_batch against one validate_and_execute_dax call per query.
+
+Drives OptimizedQueryExecutor through set_command_factory() with a fake ADOMD
+command: each command costs a fixed round-trip latency plus a small per-query
+evaluation time, and a command text with several EVALUATE statements returns
+one result set per statement (NextResult). A query containing ERROR() makes
+the whole command fail, as the engine does.
+
+Runs a visual-validation-sized set of ROW/SUMMARIZECOLUMNS queries
+sequentially and batched (query cache bypassed), checks both give the same
+rows, then runs a batch with one failing query to show the sequential
+fallback keeps per-query errors.
+
+Usage:
+    python scripts/benchmark_dax_batch.py [--queries 40] [--latency-ms 15] [--eval-ms 2]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.infrastructure.query_executor import OptimizedQueryExecutor
+
+_STATEMENT = re.compile(r"EVALUATE\b(.*?)(?=\bEVALUATE\b|\Z)", re.S | re.I)
+
+
+class Server:
+    latency_s = 0.015
+    eval_s = 0.002
+    commands = 0
+
+
+class FakeReader:
+    def __init__(self, statements):
+        self._sets = [[('Value', f"{abs(hash(s.strip())) % 100000}")] for s in statements]
+        self._current = 0
+        self._pos = -1
+
+    @property
+    def FieldCount(self):
+        return len(self._sets[self._current][0])
+
+    def GetName(self, i):
+        return f"[{self._sets[self._current][0][0]}]"
+
+    def Read(self):
+        self._pos += 1
+        return self._pos < 1
+
+    def GetValue(self, i):
+        return self._sets[self._current][0][1]
+
+    def NextResult(self):
+        time.sleep(Server.eval_s)
+        self._current += 1
+        self._pos = -1
+        return self._current < len(self._sets)
+
+    def Close(self):
+        pass
+
+
+class FakeCommand:
+    def __init__(self, query, connection):
+        self.query = query
+        self.CommandTimeout = 0
+
+    def ExecuteReader(self):
+        Server.commands += 1
+        time.sleep(Server.latency_s + Server.eval_s)
+        if 'ERROR(' in self.query:
+            raise RuntimeError("The query raised an error: bad measure")
+        return FakeReader(_STATEMENT.findall(self.query))
+
+
+def make_queries(count):
+    return [f"EVALUATE ROW(\"Value\", CALCULATE([Total Sales], 'Product'[Category] = \"Cat {i}\"))"
+            for i in range(count)]
+
+
+def values(results):
+    return [(r.get('success'), (r.get('rows') or [{}])[0].get('[Value]'), r.get('error')) for r in results]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark batched DAX execution')
+    parser.add_argument('--queries', type=int, default=40, help='Queries per run')
+    parser.add_argument('--latency-ms', type=float, default=15.0, help='Fake round-trip latency per command')
+    parser.add_argument('--eval-ms', type=float, default=2.0, help='Fake evaluation time per query')
+    args = parser.parse_args()
+    Server.latency_s = args.latency_ms / 1000
+    Server.eval_s = args.eval_ms / 1000
+
+    executor = OptimizedQueryExecutor(connection=object())
+    executor.set_command_factory(FakeCommand)
+    queries = make_queries(args.queries)
+
+    Server.commands = 0
+    start = time.perf_counter()
+    sequential = [executor.validate_and_execute_dax(q, 0, bypass_cache=True) for q in queries]
+    seq_ms, seq_commands = (time.perf_counter() - start) * 1000, Server.commands
+
+    Server.commands = 0
+    start = time.perf_counter()
+    batched = executor.execute_dax_batch(queries, 0, bypass_cache=True)
+    batch_ms, batch_commands = (time.perf_counter() - start) * 1000, Server.commands
+
+    same = values(sequential) == values(batched)
+    print(f"{args.queries} queries, {args.latency_ms:.0f} ms round trip, {args.eval_ms:.0f} ms evaluation")
+    print(f"  sequential {seq_ms:8.0f} ms  ({seq_commands} commands)")
+    print(f"  batched    {batch_ms:8.0f} ms  ({batch_commands} commands)   results identical: {same}")
+    print(f"  per-query times (first 3): {[r['execution_time_ms'] for r in batched[:3]]}")
+
+    failing = queries[:5] + ["EVALUATE ROW(\"Value\", ERROR(\"bad measure\"))"] + queries[5:10]
+    Server.commands = 0
+    mixed = executor.execute_dax_batch(failing, 0, bypass_cache=True)
+    errors = [i for i, r in enumerate(mixed) if not r.get('success')]
+    fallback = all(r.get('batch_fallback') for r in mixed)
+    print(f"  with a failing query: {Server.commands} commands, failed positions {errors}, "
+          f"fallback {'used' if fallback else 'not used'}")
+
+    return 0 if same and errors == [5] and batch_commands < seq_commands else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
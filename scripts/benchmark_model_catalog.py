@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared model catalog against per-caller INFO.* queries.
+
+Drives OptimizedQueryExecutor with a fake validate_and_execute_dax that
+answers INFO.TABLES/COLUMNS/MEASURES/RELATIONSHIPS (plain, TOPN-limited or
+filtered on TableID) after a fixed latency, with the executor's query cache
+emulated for non-bypassed queries. A session runs the metadata reads of a
+typical tool sequence (table list, columns per table, measure list,
+relationship list, column usage mapping), then a measure is added as a
+CRUD write would and the session runs again.
+
+Compares the catalog disabled (every caller queries INFO.*) with the catalog
+enabled, and reports whether the second session saw the new measure.
+
+Usage:
+    python scripts/benchmark_model_catalog.py [--tables 40] [--latency-ms 25]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.analysis.column_usage_analyzer import ColumnUsageAnalyzer
+from core.config.config_manager import config
+from core.infrastructure.model_catalog import invalidate_model_catalog
+from core.infrastructure.query_executor import OptimizedQueryExecutor
+
+_INFO = re.compile(r"INFO\.(\w+)\(\)")
+_TOPN = re.compile(r"TOPN\((\d+),")
+_TABLE_FILTER = re.compile(r"\[TableID\] = (\d+)")
+
+
+class FakeExecutor(OptimizedQueryExecutor):
+    """Serves synthetic INFO.* rows; every round trip costs a fixed latency."""
+
+    def __init__(self, tables, latency_s):
+        super().__init__(None)
+        self.latency_s = latency_s
+        self.queries = 0
+        self.stamp = 1
+        self._memo = {}
+        self.info = {
+            'TABLES': [{'[ID]': t, '[Name]': f"Table {t}"} for t in range(tables)],
+            'COLUMNS': [{'[ID]': t * 100 + c, '[TableID]': t, '[ExplicitName]': f"Column {c}", '[Type]': 1}
+                        for t in range(tables) for c in range(20)],
+            'MEASURES': [{'[ID]': t * 100 + m, '[TableID]': t, '[Name]': f"Measure {t}.{m}",
+                          '[Expression]': f"SUM('Table {t}'[Column {m}])"}
+                         for t in range(tables) for m in range(5)],
+            'RELATIONSHIPS': [{'[ID]': t, '[FromTableID]': t, '[FromColumnID]': t * 100,
+                               '[ToTableID]': t + 1, '[ToColumnID]': (t + 1) * 100, '[IsActive]': True}
+                              for t in range(tables - 1)],
+        }
+
+    def add_measure(self):
+        self.info['MEASURES'].append({'[ID]': 99999, '[TableID]': 0, '[Name]': 'New Measure',
+                                      '[Expression]': "SUM('Table 0'[Column 1])"})
+        self.stamp += 1
+
+    def execute_dmv_query(self, query):
+        self.queries += 1
+        time.sleep(self.latency_s)
+        return {'success': True, 'data': [{'CUBE_NAME': 'Model', 'LAST_SCHEMA_UPDATE': str(self.stamp),
+                                           'LAST_DATA_UPDATE': '0'}]}
+
+    def validate_and_execute_dax(self, query, top_n=0, bypass_cache=False, columnar=False):
+        if not bypass_cache and query in self._memo:
+            return dict(self._memo[query], rows=[dict(r) for r in self._memo[query]['rows']])
+        self.queries += 1
+        time.sleep(self.latency_s)
+        rows = [dict(r) for r in self.info[_INFO.search(query).group(1)]]
+        table_filter = _TABLE_FILTER.search(query)
+        if table_filter:
+            rows = [r for r in rows if r['[TableID]'] == int(table_filter.group(1))]
+        limit = _TOPN.search(query)
+        if limit:
+            rows = rows[:int(limit.group(1))]
+        result = {'success': True, 'rows': rows, 'row_count': len(rows)}
+        if not bypass_cache:
+            self._memo[query] = dict(result, rows=[dict(r) for r in rows])
+        return result
+
+
+def session(executor, analyzer):
+    tables = [row['Name'] for row in executor.execute_info_query('TABLES', top_n=10000)['rows']]
+    for table in tables:
+        executor.execute_info_query('COLUMNS', table_name=table)
+    measures = executor.execute_info_query('MEASURES', exclude_columns=['Expression'])['rows']
+    executor.execute_info_query('RELATIONSHIPS')
+    analyzer.build_complete_mapping()
+    return any(row.get('Name') == 'New Measure' for row in measures)
+
+
+def run(tables, latency_s, catalog_enabled):
+    config.config.setdefault('performance', {})['model_catalog'] = catalog_enabled
+    executor = FakeExecutor(tables, latency_s)
+    analyzer = ColumnUsageAnalyzer(executor)
+
+    start = time.perf_counter()
+    session(executor, analyzer)
+    first_ms, first_queries = (time.perf_counter() - start) * 1000, executor.queries
+
+    executor.add_measure()
+    invalidate_model_catalog()  # what the CRUD managers do after SaveChanges
+    start = time.perf_counter()
+    seen = session(executor, analyzer)
+    second_ms = (time.perf_counter() - start) * 1000
+    return first_ms, first_queries, second_ms, executor.queries - first_queries, seen
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the shared model catalog')
+    parser.add_argument('--tables', type=int, default=40, help='Tables in the synthetic model')
+    parser.add_argument('--latency-ms', type=float, default=25.0, help='Fake round-trip latency')
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    print(f"{args.tables} tables, {args.latency_ms:.0f} ms per round trip")
+    results = {}
+    for label, enabled in (('per-caller', False), ('catalog', True)):
+        first_ms, first_q, second_ms, second_q, seen = run(args.tables, latency, enabled)
+        results[label] = seen
+        print(f"  {label:10}  session {first_ms:8.0f} ms ({first_q:3} queries)   "
+              f"after write {second_ms:8.0f} ms ({second_q:3} queries), "
+              f"new measure {'visible' if seen else 'NOT visible'}")
+    return 0 if results['catalog'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark HybridReader measure lookups with and without the object index.
+
+Builds a synthetic analysis package (tmdl/ + analysis/), then times exact and
+pattern measure lookups twice: against the legacy layout (every table file is
+parsed until a match) and with analysis/object_index.json present. Results of
+both paths are compared.
+
+Usage:
+    python scripts/benchmark_object_index.py [--tables 300] [--lookups 50]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.model.hybrid_reader import HybridReader
+from core.model.object_index import INDEX_FILE_NAME, build_object_index
+from core.utilities.json_utils import dumps_json
+from benchmark_tmdl_parse_cache import build_project
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return (time.perf_counter() - start) * 1000, value
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark HybridReader lookups with the object index')
+    parser.add_argument('--tables', type=int, default=300, help='Tables in the synthetic project')
+    parser.add_argument('--columns', type=int, default=25, help='Columns per table')
+    parser.add_argument('--measures', type=int, default=15, help='Measures per table')
+    parser.add_argument('--lookups', type=int, default=50, help='Random exact lookups to time')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        definition = build_project(root / "source", args.tables, args.columns, args.measures)
+        package = root / "package"
+        shutil.copytree(definition, package / "tmdl")
+        # Measure names are unique across a model; make the synthetic ones unique too
+        for path in (package / "tmdl" / "tables").glob("*.tmdl"):
+            text = path.read_text(encoding="utf-8")
+            path.write_text(text.replace("measure 'Measure ", f"measure '{path.stem} Measure "), encoding="utf-8")
+        (package / "analysis").mkdir()
+
+        ms, index = timed(lambda: build_object_index(package / "tmdl"))
+        index_bytes = len(dumps_json(index))
+        print(f"Index: {len(index['measures'])} measures, {len(index['columns'])} columns, "
+              f"{index_bytes / 1024:.0f} KB, built in {ms:.0f} ms")
+
+        names = [entry[0] for entry in index["measures"]]
+        rng = random.Random(7)
+        targets = [rng.choice(names) for _ in range(args.lookups)]
+        pattern = "Table 1.* Measure 1[0-2]$"
+
+        def run(reader):
+            exact = [reader.get_measure_from_tmdl(name) for name in targets]
+            return exact, reader.find_measures_by_pattern(pattern)
+
+        legacy_ms, legacy = timed(lambda: run(HybridReader(str(package))))
+        (package / "analysis" / INDEX_FILE_NAME).write_text(dumps_json(index), encoding="utf-8")
+        indexed_ms, indexed = timed(lambda: run(HybridReader(str(package))))
+
+        def key(measures):
+            return sorted((m["name"], m.get("table"), m["expression"]) for m in measures)
+
+        same = legacy[0] == indexed[0] and key(legacy[1]) == key(indexed[1])
+        print(f"{args.lookups} exact lookups + 1 pattern search ({len(indexed[1])} matches)")
+        print(f"  scan   {legacy_ms:9.1f} ms")
+        print(f"  index  {indexed_ms:9.1f} ms   speedup {legacy_ms / indexed_ms:6.1f}x   "
+              f"{'identical' if same else 'MISMATCH'}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
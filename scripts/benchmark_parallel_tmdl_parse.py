@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark process-pool TMDL table parsing on a synthetic project.
+
+Writes a TMDL definition folder with N tables, then parses it with
+core.tmdl TmdlParser and the PBIP TmdlModelAnalyzer, sequentially and with
+process pools of increasing size. The parse cache is bypassed so every run
+parses every file. Each parallel result is checked against the sequential one.
+
+Usage:
+    python scripts/benchmark_parallel_tmdl_parse.py [--tables 500] [--workers 1,2,4,8] [--chunk-size 25]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.pbip.pbip_model_analyzer import TmdlModelAnalyzer
+from core.tmdl.parallel_parse import shutdown_parse_pool
+from core.tmdl.tmdl_parser import TmdlParser
+from benchmark_tmdl_parse_cache import build_project
+
+
+def best_of(fn, rounds: int):
+    best = float('inf')
+    value = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, value
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark process-pool TMDL table parsing')
+    parser.add_argument('--tables', type=int, default=500, help='Tables in the synthetic project')
+    parser.add_argument('--columns', type=int, default=25, help='Columns per table')
+    parser.add_argument('--measures', type=int, default=15, help='Measures per table')
+    parser.add_argument('--workers', default='1,2,4,8', help='Comma-separated worker counts')
+    parser.add_argument('--chunk-size', type=int, default=25, help='Table files per worker task')
+    parser.add_argument('--rounds', type=int, default=3, help='Timing rounds (best is reported)')
+    args = parser.parse_args()
+    worker_counts = [int(w) for w in args.workers.split(',') if w.strip()]
+
+    print(f"Project: {args.tables} tables x {args.columns} columns, {args.measures} measures "
+          f"({os.cpu_count()} CPUs, chunk size {args.chunk_size})")
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        definition = build_project(root, args.tables, args.columns, args.measures)
+        tables_path = str(definition / "tables")
+
+        parsers = [
+            ('TmdlParser', lambda **kw: TmdlParser(str(root), use_cache=False, **kw)._parse_tables()),
+            ('TmdlModelAnalyzer', lambda **kw: TmdlModelAnalyzer(**kw)._parse_tables(tables_path)),
+        ]
+        for label, parse in parsers:
+            sequential_ms, expected = best_of(lambda: parse(parallel=False), args.rounds)
+            print(f"{label}")
+            print(f"  {'sequential':14s} {sequential_ms:8.1f} ms")
+            for workers in worker_counts:
+                # Warm the pool first so process start-up is not timed
+                parse(parallel=True, workers=workers, chunk_size=args.chunk_size)
+                ms, tables = best_of(
+                    lambda: parse(parallel=True, workers=workers, chunk_size=args.chunk_size), args.rounds
+                )
+                same = tables == expected
+                failures += not same
+                print(f"  {f'{workers} workers':14s} {ms:8.1f} ms   speedup {sequential_ms / ms:5.2f}x   "
+                      f"{'identical' if same else 'MISMATCH'}")
+
+    shutdown_parse_pool()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
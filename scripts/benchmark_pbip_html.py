@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak memory of PbipHtmlGenerator.generate_full_report by model size.
+
+Builds synthetic model/report/dependency data of growing size and, for each
+size, measures with tracemalloc (input data excluded):
+- stream: generate_full_report (template streamed to disk, data written as
+  sections), inline and external, compressed and plain
+- string: the document built as one string with the data as a single
+  json.dumps literal, as the generator used to do
+Reports peak traced memory, time and output size. Streaming peak should stay
+flat as the model grows while the single-string peak grows with it.
+
+Usage:
+    python scripts/benchmark_pbip_html.py [--sizes 100,400,1600] [--measures 20] [--columns 15]
+"""
+
+import argparse
+import html
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.pbip.pbip_html_generator import PbipHtmlGenerator
+
+
+def make_data(tables, measures, columns):
+    model = {'model_folder': 'Bench.SemanticModel', 'relationships': [], 'expressions': [], 'tables': []}
+    measure_to_measure = {}
+    for t in range(tables):
+        name = f"Table {t}"
+        model['tables'].append({
+            'name': name,
+            'columns': [{'name': f"Column {c}", 'data_type': 'string', 'source_column': f"Column {c}",
+                         'description': f"Column {c} of {name}"} for c in range(columns)],
+            'measures': [{'name': f"Measure {t}.{m}", 'display_folder': f"Folder {m % 5}",
+                          'expression': f"CALCULATE(SUM('{name}'[Column {m % columns}]), ALL('Date'))"}
+                         for m in range(measures)],
+        })
+        for m in range(measures):
+            measure_to_measure[f"{name}[Measure {t}.{m}]"] = [f"{name}[Measure {t}.{(m + 1) % measures}]"]
+        if t:
+            model['relationships'].append({'from_table': name, 'from_column': 'Column 0',
+                                           'to_table': 'Table 0', 'to_column': 'Column 0'})
+    report = {'report': {'filters': []}, 'pages': [
+        {'name': f"page{p}", 'display_name': f"Page {p}", 'visuals': [
+            {'id': f"v{p}.{v}", 'visual_type': 'card',
+             'fields': {'measures': [{'table': f"Table {v % tables}", 'measure': f"Measure {v % tables}.0"}]}}
+            for v in range(30)]}
+        for p in range(max(1, tables // 20))]}
+    dependencies = {'summary': {'total_tables': tables, 'total_measures': tables * measures},
+                    'measure_to_measure': measure_to_measure, 'unused_measures': [], 'unused_columns': []}
+    return model, report, dependencies
+
+
+def build_single_string(generator, model, report, dependencies, repo_name):
+    """The document as one string with the data as one JSON literal (how the generator worked before)."""
+    data_json_str = json.dumps({'model': model, 'report': report, 'dependencies': dependencies,
+                                'enhanced': None, 'repository_name': repo_name}, indent=2, ensure_ascii=False)
+    return (f"<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n{generator._get_head_section(html.escape(repo_name))}\n"
+            f"{generator._get_styles()}\n</head>\n{generator._get_body_content()}\n"
+            f"<script>const pbipData = {data_json_str};</script>\n{generator._get_vue_app_script()}\n</html>")
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    ms = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, ms, peak / (1024 * 1024)
+
+
+def output_size(path):
+    total = os.path.getsize(path)
+    data_dir = os.path.splitext(path)[0] + '_data'
+    if os.path.isdir(data_dir):
+        total += sum(os.path.getsize(os.path.join(data_dir, f)) for f in os.listdir(data_dir))
+    return total / (1024 * 1024)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark PBIP HTML report generation memory')
+    parser.add_argument('--sizes', default='100,400,1600', help='Comma-separated table counts')
+    parser.add_argument('--measures', type=int, default=20, help='Measures per table')
+    parser.add_argument('--columns', type=int, default=15, help='Columns per table')
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(',')]
+
+    generator = PbipHtmlGenerator()
+    variants = [('inline gzip', 'inline', True), ('inline json', 'inline', False),
+                ('external gzip', 'external', True), ('external json', 'external', False)]
+    peaks = {label: [] for label, _, _ in variants}
+    string_peaks = []
+    out_dir = tempfile.mkdtemp(prefix='pbip_html_bench_')
+    try:
+        for tables in sizes:
+            model, report, dependencies = make_data(tables, args.measures, args.columns)
+            print(f"{tables} tables, {tables * args.measures} measures, {tables * args.columns} columns")
+
+            document, ms, peak = measure(lambda: build_single_string(generator, model, report, dependencies, 'Bench'))
+            string_peaks.append(peak)
+            print(f"  {'single string':14} peak {peak:8.1f} MB  {ms:8.0f} ms  {len(document) / (1024 * 1024):8.1f} MB output")
+            del document
+
+            for label, data_mode, compress in variants:
+                target = os.path.join(out_dir, label.replace(' ', '_'))
+                path, ms, peak = measure(lambda: generator.generate_full_report(
+                    model, report, dependencies, target, 'Bench', data_mode=data_mode, compress_data=compress))
+                peaks[label].append(peak)
+                print(f"  {label:14} peak {peak:8.1f} MB  {ms:8.0f} ms  {output_size(path):8.1f} MB output")
+                shutil.rmtree(target, ignore_errors=True)
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    growth = {label: values[-1] / values[0] for label, values in peaks.items()}
+    print(f"peak growth from {sizes[0]} to {sizes[-1]} tables: single string {string_peaks[-1] / string_peaks[0]:.1f}x, "
+          + ', '.join(f"{label} {g:.1f}x" for label, g in growth.items()))
+    flat = all(g < 2 for g in growth.values())
+    lower = all(values[-1] < string_peaks[-1] for values in peaks.values())
+    return 0 if flat and lower else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark the model-version-aware query cache.
+
+Drives OptimizedQueryExecutor through set_command_factory() with a fake
+ADOMD command (fixed latency per round trip) and a fake MDSCHEMA_CUBES stamp,
+then walks through a session:
+- the same query re-sent with different whitespace and comments
+- a repeat after the TTL has passed while the model is unchanged
+- a repeat after a model write (stamp changed, CRUD-style invalidation)
+
+Usage:
+    python scripts/benchmark_query_cache.py [--latency-ms 25] [--ttl 1]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.infrastructure.model_catalog import invalidate_model_catalog
+from core.infrastructure.query_executor import OptimizedQueryExecutor
+
+QUERIES = [
+    "EVALUATE SUMMARIZECOLUMNS('Date'[Year], \"Sales\", [Total Sales])",
+    """-- yearly sales
+EVALUATE
+    SUMMARIZECOLUMNS( 'Date'[Year],
+        "Sales", [Total Sales] )  /* per year */""",
+]
+
+
+class FakeModel:
+    schema_stamp = 1
+    sales = 100
+    latency_s = 0.025
+    round_trips = 0
+
+
+class FakeReader:
+    def __init__(self):
+        self._rows = [(2025, FakeModel.sales), (2026, FakeModel.sales * 2)]
+        self._pos = -1
+        self.FieldCount = 2
+
+    def GetName(self, i):
+        return ['Date[Year]', '[Sales]'][i]
+
+    def Read(self):
+        self._pos += 1
+        return self._pos < len(self._rows)
+
+    def GetValue(self, i):
+        return self._rows[self._pos][i]
+
+    def Close(self):
+        pass
+
+
+class FakeCommand:
+    def __init__(self, query, connection):
+        self.CommandTimeout = 0
+
+    def ExecuteReader(self):
+        FakeModel.round_trips += 1
+        time.sleep(FakeModel.latency_s)
+        return FakeReader()
+
+
+class FakeExecutor(OptimizedQueryExecutor):
+    def execute_dmv_query(self, dmv_query):
+        FakeModel.round_trips += 1
+        time.sleep(FakeModel.latency_s)
+        return {'success': True, 'data': [{'CUBE_NAME': 'Model', 'LAST_SCHEMA_UPDATE': str(FakeModel.schema_stamp),
+                                           'LAST_DATA_UPDATE': '0'}]}
+
+
+def step(executor, label, query):
+    before = FakeModel.round_trips
+    start = time.perf_counter()
+    result = executor.validate_and_execute_dax(query)
+    ms = (time.perf_counter() - start) * 1000
+    hit = result.get('cache', {}).get('hit', False)
+    print(f"  {label:34} {ms:7.1f} ms  {FakeModel.round_trips - before} round trips  "
+          f"{'hit ' if hit else 'miss'}  sales={result['rows'][0]['[Sales]']}")
+    return hit
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the model-version-aware query cache')
+    parser.add_argument('--latency-ms', type=float, default=25.0, help='Fake round-trip latency')
+    parser.add_argument('--ttl', type=float, default=1.0, help='cache_ttl_seconds for the run')
+    args = parser.parse_args()
+    FakeModel.latency_s = args.latency_ms / 1000
+
+    executor = FakeExecutor(connection=object())
+    executor.set_command_factory(FakeCommand)
+    executor.cache_ttl_seconds = max(1, int(args.ttl))
+
+    expected = [
+        step(executor, 'first run', QUERIES[0]) is False,
+        step(executor, 'reformatted + comments', QUERIES[1]) is True,
+    ]
+    time.sleep(executor.cache_ttl_seconds + 0.2)
+    expected.append(step(executor, 'after TTL, model unchanged', QUERIES[0]) is True)
+
+    FakeModel.schema_stamp += 1
+    FakeModel.sales += 1
+    invalidate_model_catalog()  # what the CRUD managers do after SaveChanges
+    expected.append(step(executor, 'after write', QUERIES[0]) is False)
+    expected.append(step(executor, 'repeat after write', QUERIES[1]) is True)
+
+    print(f"  stats: {executor.get_cache_stats()}")
+    return 0 if all(expected) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
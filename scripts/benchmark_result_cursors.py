@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark paging through a large tool result with and without result cursors.
+
+Registers a fake tool that "executes a query" (fixed latency, then builds
+N row dicts) and paginates it with apply_pagination, then pages through the
+whole result via ToolDispatcher.dispatch:
+- rerun: result cursors disabled; every page re-runs the tool and slices
+- cursor: the first call holds the remainder (spilled to a temp file when
+  large); later pages are read from it without calling the tool
+Checks that both walks return the same rows and reports the cursor stats.
+
+Usage:
+    python scripts/benchmark_result_cursors.py [--rows 50000] [--page-size 500] [--latency-ms 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.config.config_manager import config
+from core.infrastructure.result_cursors import get_result_cursor_store
+from core.validation.pagination_helpers import apply_pagination
+from server.dispatch import ToolDispatcher
+from server.registry import ToolDefinition, get_registry
+
+TOOL = 'Bench_Run_Query'
+
+
+class FakeQuery:
+    rows = 50000
+    latency_s = 0.2
+    runs = 0
+
+
+def handle_bench_query(args):
+    FakeQuery.runs += 1
+    time.sleep(FakeQuery.latency_s)
+    rows = [{'Customer[Name]': f"Customer {i}", 'Date[Year]': str(2000 + i % 25), '[Sales]': str(i * 1.25)}
+            for i in range(FakeQuery.rows)]
+    result = {'success': True, 'columns': list(rows[0]), 'row_count': len(rows), 'rows': rows}
+    return apply_pagination(result, args)
+
+
+def walk(dispatcher, page_size):
+    FakeQuery.runs = 0
+    args = {'page_size': page_size}
+    seen = []
+    pages = 0
+    start = time.perf_counter()
+    while True:
+        result = dispatcher.dispatch(TOOL, dict(args))
+        if not result.get('success'):
+            raise RuntimeError(result)
+        seen.extend(row['Customer[Name]'] for row in result['rows'])
+        pages += 1
+        if not result.get('has_more'):
+            break
+        args['next_token'] = result['next_token']
+    return (time.perf_counter() - start) * 1000, pages, FakeQuery.runs, seen
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark result cursors')
+    parser.add_argument('--rows', type=int, default=50000, help='Rows in the fake result')
+    parser.add_argument('--page-size', type=int, default=500, help='Rows per page')
+    parser.add_argument('--latency-ms', type=float, default=200.0, help='Fake query latency')
+    args = parser.parse_args()
+    FakeQuery.rows = args.rows
+    FakeQuery.latency_s = args.latency_ms / 1000
+
+    get_registry().register(ToolDefinition(name=TOOL, description='benchmark', handler=handle_bench_query,
+                                           input_schema={'type': 'object', 'properties': {}}))
+    dispatcher = ToolDispatcher()
+
+    results = {}
+    for label, enabled in (('rerun', False), ('cursor', True)):
+        config.config.setdefault('performance', {})['result_cursors'] = enabled
+        ms, pages, runs, seen = walk(dispatcher, args.page_size)
+        results[label] = seen
+        print(f"  {label:7} {pages:4} pages in {ms:9.0f} ms  ({runs} tool runs, {ms / pages:7.2f} ms/page)")
+    print(f"  cursor stats: {get_result_cursor_store().get_stats()}")
+
+    same = results['rerun'] == results['cursor'] and len(results['cursor']) == args.rows
+    print(f"  rows identical: {same}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark DAX result materialization with a pure-Python fake ADOMD reader.
+
+Compares, for one wide result set:
+- legacy: one dict per row with every value passed through str() (the old reader loop)
+- rows: the current default format (stringified rows built from column arrays)
+- columnar: typed column arrays plus schema, no row dicts
+- columnar + to_rows(): typed rows materialized on demand
+
+Runs on any platform: the executor is driven through set_command_factory().
+
+Usage:
+    python scripts/benchmark_result_sets.py [--rows 10000] [--columns 12] [--rounds 5]
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.infrastructure.query_executor import OptimizedQueryExecutor
+
+
+class FakeReader:
+    """Pure-Python stand-in for AdomdDataReader."""
+
+    def __init__(self, columns, rows):
+        self._columns = columns
+        self._rows = rows
+        self._pos = -1
+        self.FieldCount = len(columns)
+
+    def GetName(self, i):
+        return self._columns[i]
+
+    def Read(self):
+        self._pos += 1
+        return self._pos < len(self._rows)
+
+    def GetValue(self, i):
+        return self._rows[self._pos][i]
+
+    def Close(self):
+        pass
+
+
+class FakeCommand:
+    """Stand-in for AdomdCommand; serves the same synthetic table for any query."""
+
+    columns = []
+    rows = []
+
+    def __init__(self, query, connection):
+        self.CommandTimeout = 0
+
+    def ExecuteReader(self):
+        return FakeReader(self.columns, self.rows)
+
+
+def build_table(rows: int, columns: int, seed: int = 11):
+    rng = random.Random(seed)
+    base = datetime.datetime(2024, 1, 1)
+    kinds = ['int', 'float', 'str', 'date']
+    names = [f"Sales[{kinds[c % 4]}_{c}]" for c in range(columns)]
+    data = []
+    for r in range(rows):
+        row = []
+        for c in range(columns):
+            kind = kinds[c % 4]
+            if kind == 'int':
+                row.append(rng.randint(0, 1_000_000))
+            elif kind == 'float':
+                row.append(rng.random() * 1000)
+            elif kind == 'str':
+                row.append(f"Customer {rng.randint(0, 5000)}")
+            else:
+                row.append(base + datetime.timedelta(days=r % 365))
+        data.append(row)
+    return names, data
+
+
+def legacy_read(reader):
+    """The reader loop used before column arrays."""
+    columns = [reader.GetName(i) for i in range(reader.FieldCount)]
+    rows = []
+    while reader.Read():
+        row = {}
+        for i, col in enumerate(columns):
+            try:
+                val = reader.GetValue(i)
+                if val is None:
+                    row[col] = None
+                elif hasattr(val, 'isoformat'):
+                    row[col] = val.isoformat()
+                else:
+                    row[col] = str(val)
+            except Exception:
+                row[col] = "<read_error>"
+        rows.append(row)
+    return rows
+
+
+def measure(fn, rounds: int):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark DAX result materialization')
+    parser.add_argument('--rows', type=int, default=10000, help='Rows in the result set')
+    parser.add_argument('--columns', type=int, default=12, help='Columns in the result set')
+    parser.add_argument('--rounds', type=int, default=5, help='Timing rounds (best is reported)')
+    args = parser.parse_args()
+
+    FakeCommand.columns, FakeCommand.rows = build_table(args.rows, args.columns)
+    executor = OptimizedQueryExecutor(connection=object())
+    executor.set_command_factory(FakeCommand)
+    query = "EVALUATE 'Sales'"
+
+    cases = [
+        ('legacy row dicts', lambda: legacy_read(FakeCommand(query, None).ExecuteReader())),
+        ('rows (default format)', lambda: executor.validate_and_execute_dax(query, bypass_cache=True)),
+        ('columnar', lambda: executor.validate_and_execute_dax(query, bypass_cache=True, columnar=True)),
+        ('columnar + to_rows()', lambda: executor.validate_and_execute_dax(
+            query, bypass_cache=True, columnar=True)['result_set'].to_rows()),
+    ]
+
+    print(f"Result set: {args.rows:,} rows x {args.columns} columns (fake ADOMD reader)")
+    for label, fn in cases:
+        seconds, peak = measure(fn, args.rounds)
+        print(f"{label:24s} {seconds * 1000:8.1f} ms   peak {peak / 1024 / 1024:7.1f} MB")
+
+    sample = executor.validate_and_execute_dax(query, bypass_cache=True, columnar=True)
+    print("schema:", ", ".join(f"{c['name']}:{c['type']}" for c in sample['schema'][:4]), "...")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark sample data extraction with a fake query executor.
+
+The fake executor sleeps for a fixed latency per query (standing in for the
+server round trip) and returns typed columnar results for synthetic tables of
+mixed width. Like the real executor, which holds the connection's command
+lock while a query runs and its reader is read, it answers one query at a
+time, so concurrent workers can only overlap conversion and writing.
+Compares:
+- legacy: sequential queries, row dicts -> one DataFrame -> one parquet file,
+  then re-split when the file is over the part budget (the old pipeline)
+- pipeline: SampleDataExtractor with 1 and N workers, batched frames and
+  rolling part files
+
+Each variant runs twice: once for wall time and once under tracemalloc for
+peak memory (tracing slows Python code down, so the two are kept apart).
+
+Usage:
+    python scripts/benchmark_sample_extraction.py [--tables 24] [--rows 20000] [--latency-ms 200]
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import polars as pl
+
+from core.infrastructure.result_set import ColumnarResult
+from core.model.sample_data_extractor import SampleDataExtractor
+
+
+class FakeQueryExecutor:
+    """Answers every sample query with a synthetic table after a fixed latency."""
+
+    def __init__(self, tables, rows, latency_s, seed=5):
+        self.latency_s = latency_s
+        # One connection: queries and result reads are serialized (see adomd_commands)
+        self._command_lock = threading.Lock()
+        self._tables = {}
+        rng = random.Random(seed)
+        base = datetime.datetime(2024, 1, 1)
+        for t, name in enumerate(tables):
+            width = (6, 20, 60)[t % 3]
+            columns = [f"{name}[c{c}]" for c in range(width)]
+            data = []
+            for c in range(width):
+                kind = c % 4
+                if kind == 0:
+                    data.append([rng.randint(0, 10 ** 6) for _ in range(rows)])
+                elif kind == 1:
+                    data.append([rng.random() * 1000 for _ in range(rows)])
+                elif kind == 2:
+                    data.append([f"text {rng.randint(0, 5000)}" for _ in range(rows)])
+                else:
+                    data.append([base + datetime.timedelta(hours=rng.randint(0, 9000)) for _ in range(rows)])
+            self._tables[name] = (columns, data)
+
+    def validate_and_execute_dax(self, query, top_n=0, bypass_cache=False, columnar=False):
+        with self._command_lock:
+            time.sleep(self.latency_s)
+            name = query.split("'")[1]
+            columns, data = self._tables[name]
+            raw = [values[:top_n] for values in data] if top_n else [list(values) for values in data]
+            if columnar:
+                result_set = ColumnarResult.from_raw(columns, raw)
+                return {'success': True, 'columns': columns, 'result_set': result_set,
+                        'row_count': result_set.row_count}
+            rows = [dict(zip(columns, (str(v) for v in values))) for values in zip(*raw)]
+            return {'success': True, 'columns': columns, 'rows': rows, 'row_count': len(rows)}
+
+
+def legacy_extract(executor, tables, sample_rows, out_dir, max_size):
+    """The pre-pipeline loop: sequential, row dicts, write then split."""
+    count = 0
+    for table in tables:
+        result = executor.validate_and_execute_dax(f"EVALUATE '{table}'", top_n=sample_rows, bypass_cache=True)
+        rows = result.get('rows', [])
+        df = pl.DataFrame(rows, infer_schema_length=None)
+        path = out_dir / f"{table}.parquet"
+        df.write_parquet(path, compression="snappy", use_pyarrow=False)
+        size = path.stat().st_size
+        if size > max_size:
+            path.unlink()
+            chunk = max(100, int((max_size / size) * len(df) * 0.8))
+            for n, start in enumerate(range(0, len(df), chunk)):
+                df[start:start + chunk].write_parquet(out_dir / f"{table}_part{n}.parquet",
+                                                      compression="snappy", use_pyarrow=False)
+        count += 1
+    return count
+
+
+def measure(label, fn):
+    start = time.perf_counter()
+    files = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<22} {elapsed:9.0f} ms   peak {peak / 1024 / 1024:7.1f} MB   {files} files")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark sample data extraction')
+    parser.add_argument('--tables', type=int, default=24, help='Synthetic tables (widths cycle 6/20/60)')
+    parser.add_argument('--rows', type=int, default=20000, help='Sample rows per table')
+    parser.add_argument('--latency-ms', type=float, default=200.0, help='Fake query latency')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent queries for the pipeline run')
+    parser.add_argument('--part-mb', type=float, default=4.0, help='Part budget (small to exercise rollover)')
+    args = parser.parse_args()
+
+    tables = [f"Table{i}" for i in range(args.tables)]
+    executor = FakeQueryExecutor(tables, args.rows, args.latency_ms / 1000)
+    part_bytes = int(args.part_mb * 1024 * 1024)
+    print(f"{args.tables} tables x {args.rows} rows, {args.latency_ms:g} ms per query, "
+          f"{args.part_mb:g} MB parts")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def run_dir(name):
+            path = Path(tmp) / name
+            path.mkdir()
+            return path
+
+        legacy_dir = run_dir("legacy")
+        base = measure("legacy", lambda: legacy_extract(executor, tables, args.rows, legacy_dir, part_bytes)
+                       and len(list(legacy_dir.iterdir())))
+
+        for workers in sorted({1, args.workers}):
+            out_dir = run_dir(f"pipeline{workers}")
+            extractor = SampleDataExtractor(executor, out_dir, workers=workers, max_part_bytes=part_bytes)
+            elapsed = measure(f"pipeline ({workers} workers)",
+                              lambda: extractor.extract(tables, args.rows) and len(list(out_dir.iterdir())))
+            print(f"  {'':<22} speedup {base / elapsed:5.1f}x")
+
+        # Row counts must match the legacy output
+        def rows(directory, table):
+            files = list(directory.glob(f"{table}.parquet")) + list(directory.glob(f"{table}_part*.parquet"))
+            return pl.scan_parquet([str(p) for p in files]).select(pl.len()).collect().item()
+
+        same = all(rows(legacy_dir, t) == rows(Path(tmp) / f"pipeline{args.workers}", t) for t in tables)
+        print(f"  row counts {'identical' if same else 'MISMATCH'}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark metadata search: FILTER(INFO.*(), SEARCH(...)) round trips vs the local index.
+
+Uses a fake executor that answers INFO.TABLES/COLUMNS/MEASURES/RELATIONSHIPS with synthetic
+rows after a fixed latency (the round trip) and evaluates SEARCH() filters in
+Python. Compares, for a set of search texts:
+- dax: one filtered INFO query per search (the old path)
+- index: MetadataSearchIndex.search on an index built once from the model catalog
+and checks that both return the same objects.
+
+Usage:
+    python scripts/benchmark_search_index.py [--measures 5000] [--columns 20000] [--latency-ms 25]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.execution.search_index import get_live_search_index
+
+SEARCHES = ["sales", "Amount", "ytd", "CALCULATE", "Sales[Qty]", "margin %", "zzz_missing"]
+
+
+class FakeExecutor:
+    """Serves synthetic INFO.* rows; every query costs a fixed latency."""
+
+    def __init__(self, tables, columns, measures, latency_s):
+        self.info = {'TABLES': tables, 'COLUMNS': columns, 'MEASURES': measures, 'RELATIONSHIPS': []}
+        self.latency_s = latency_s
+        self.queries = 0
+
+    def execute_dmv_query(self, query):
+        self.queries += 1
+        time.sleep(self.latency_s)
+        return {'success': True, 'data': [{'CUBE_NAME': 'Model', 'LAST_SCHEMA_UPDATE': '2026-01-01',
+                                           'LAST_DATA_UPDATE': '2026-01-02'}]}
+
+    def validate_and_execute_dax(self, query, top_n=0, bypass_cache=False, columnar=False):
+        self.queries += 1
+        time.sleep(self.latency_s)
+        for name, rows in self.info.items():
+            if f"INFO.{name}()" in query:
+                return {'success': True, 'rows': [dict(row) for row in rows]}
+        return {'success': False, 'error': 'unsupported query'}
+
+    def dax_search_measures(self, text):
+        """What FILTER(INFO.MEASURES(), SEARCH(text, [Name]) || SEARCH(text, [Expression])) returns"""
+        self.queries += 1
+        time.sleep(self.latency_s)
+        folded = text.casefold()
+        return [row for row in self.info['MEASURES']
+                if folded in row['Name'].casefold() or folded in row['Expression'].casefold()]
+
+
+def build_rows(measure_count, column_count, seed=11):
+    rng = random.Random(seed)
+    words = ["Sales", "Amount", "Margin %", "Cost", "Qty", "YTD", "Customer", "Region", "Budget", "Forecast"]
+    expressions = ["SUM(Sales[Amount])", "CALCULATE([Total Sales], DATESYTD('Date'[Date]))",
+                   "DIVIDE([Margin], [Sales])", "SUMX(Sales, Sales[Qty] * Sales[Price])", "[Cost] - [Budget]"]
+    tables = [{'ID': i, 'Name': f"{rng.choice(words)} Table {i}"} for i in range(max(1, column_count // 50))]
+    columns = [{'ID': i, 'TableID': rng.randrange(len(tables)), 'ExplicitName': f"{rng.choice(words)} {i}",
+                'Type': 1, 'DataType': 2, 'IsHidden': False} for i in range(column_count)]
+    measures = [{'ID': i, 'TableID': rng.randrange(len(tables)), 'Name': f"{rng.choice(words)} {rng.choice(words)} {i}",
+                 'Expression': rng.choice(expressions), 'DisplayFolder': rng.choice(words), 'DataType': 8,
+                 'IsHidden': False} for i in range(measure_count)]
+    return tables, columns, measures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the metadata search index')
+    parser.add_argument('--measures', type=int, default=5000, help='Measures in the synthetic model')
+    parser.add_argument('--columns', type=int, default=20000, help='Columns in the synthetic model')
+    parser.add_argument('--latency-ms', type=float, default=25.0, help='Fake round-trip latency')
+    args = parser.parse_args()
+
+    executor = FakeExecutor(*build_rows(args.measures, args.columns), args.latency_ms / 1000)
+
+    start = time.perf_counter()
+    index = get_live_search_index(executor)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(index)} objects indexed in {build_ms:.0f} ms ({executor.queries} queries, incl. model version check)")
+
+    mismatches = 0
+    dax_total = index_total = 0.0
+    for text in SEARCHES:
+        start = time.perf_counter()
+        expected = executor.dax_search_measures(text)
+        dax_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        found = index.search(text, kinds=('measure',), fields=('name', 'expression'))
+        index_ms = (time.perf_counter() - start) * 1000
+
+        same = [row['ID'] for row in expected] == [row['ID'] for row in found]
+        mismatches += not same
+        dax_total += dax_ms
+        index_total += index_ms
+        print(f"  {text!r:14} {len(found):6} hits   dax {dax_ms:8.2f} ms   index {index_ms:8.3f} ms"
+              f"{'' if same else '   MISMATCH'}")
+
+    print(f"  total                      dax {dax_total:8.2f} ms   index {index_total:8.3f} ms")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Benchmark the real server process: readiness, first list calls and first tool calls.
+
+Launches src/run_server.py over stdio (python -X importtime) and talks MCP
+JSON-RPC to it like a client would:
+- ready: spawn until the initialize response
+- list_tools / list_resources: spawn until each list response (and the
+  request on its own)
+- first call: latency of the first call to each offline tool category
+  (TMDL, PBIP, hybrid reader, SVG) against a generated PBIP project, which
+  includes loading the category's handler module
+- importtime: -X importtime output split into startup and per-call imports,
+  with the slowest modules and time per top-level package
+
+The connection layer is stubbed by default: pythonnet is blocked so ADOMD.NET
+and TOM never load, and instance detection returns nothing (--no-stub uses
+the real one). Tools run with the generated project as working directory, so
+tool paths are relative.
+
+Results are written as JSON; --compare flags summary metrics that got slower
+than a previous result file by more than --tolerance.
+
+Usage:
+    python scripts/benchmark_server_startup.py [--repeat 3] [--tables 20] [--isolate]
+        [--output results.json] [--compare previous.json] [--tolerance 0.2] [--no-stub]
+"""
+
+import argparse
+import json
+import os
+import platform
+import queue
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+SERVER_SCRIPT = os.path.join(parent_dir, 'src', 'run_server.py')
+PROJECT = 'Bench'
+PROTOCOL_VERSION = '2024-11-05'
+
+BOOTSTRAP = """
+import os, runpy, sys
+sys.path[0] = os.path.dirname({server!r})
+sys.path.insert(1, {root!r})
+if {stub!r}:
+    sys.modules['clr'] = None
+    from core.infrastructure import connection_manager
+    connection_manager.PowerBIDesktopDetector.find_powerbi_instances = lambda self: []
+sys.argv = [{server!r}]
+runpy.run_path({server!r}, run_name='__main__')
+"""
+
+def first_calls(project_dir):
+    """(label, tool, arguments) of each first call, in call order."""
+    return [
+        ('tmdl', '02_TMDL_Operations', {
+            'operation': 'find_replace', 'tmdl_path': f'{PROJECT}.SemanticModel/definition',
+            'pattern': 'Amount', 'replacement': 'Amount', 'dry_run': True}),
+        # Relative output paths resolve against the server root, so keep the report in the project folder
+        ('pbip', '07_Analyze_PBIP_Repository', {
+            'pbip_path': f'{PROJECT}.pbip', 'output_path': os.path.join(project_dir, 'pbip_report')}),
+        ('hybrid', '07_PBIP_Sample_Data', {'analysis_path': f'{PROJECT}_analysis'}),
+        ('svg', 'SVG_Visual_Operations', {'operation': 'list_templates'}),
+    ]
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def build_project(root, tables):
+    """Small PBIP project: semantic model (TMDL), report with one page, empty hybrid analysis package."""
+    model_dir = os.path.join(root, f'{PROJECT}.SemanticModel')
+    definition = os.path.join(model_dir, 'definition')
+    names = ['Date'] + [f'Fact{i}' for i in range(1, tables)]
+
+    write(os.path.join(root, f'{PROJECT}.pbip'), json.dumps(
+        {'version': '1.0', 'artifacts': [{'report': {'path': f'{PROJECT}.Report'}}]}))
+    write(os.path.join(model_dir, 'definition.pbism'), json.dumps({'version': '4.0', 'settings': {}}))
+    write(os.path.join(definition, 'database.tmdl'), 'database\n\tcompatibilityLevel: 1567\n')
+    write(os.path.join(definition, 'model.tmdl'),
+          'model Model\n\tculture: en-US\n\n' + ''.join(f"ref table '{name}'\n" for name in names))
+    write(os.path.join(definition, 'tables', 'Date.tmdl'),
+          "table Date\n\n\tcolumn Date\n\t\tdataType: dateTime\n\t\tsourceColumn: Date\n\n"
+          "\tcolumn Year\n\t\tdataType: int64\n\t\tsourceColumn: Year\n")
+    relationships = []
+    for name in names[1:]:
+        write(os.path.join(definition, 'tables', f'{name}.tmdl'),
+              f"table {name}\n\n"
+              f"\tmeasure 'Total {name}' = SUM({name}[Amount])\n\t\tformatString: #,0\n\t\tdisplayFolder: KPIs\n\n"
+              f"\tmeasure '{name} YoY' = [Total {name}] - CALCULATE([Total {name}], SAMEPERIODLASTYEAR('Date'[Date]))\n"
+              f"\t\tdisplayFolder: KPIs\n\n"
+              f"\tcolumn Amount\n\t\tdataType: decimal\n\t\tsourceColumn: Amount\n\n"
+              f"\tcolumn OrderDate\n\t\tdataType: dateTime\n\t\tsourceColumn: OrderDate\n")
+        relationships.append(f"relationship {name}_Date\n\tfromColumn: {name}.OrderDate\n\ttoColumn: Date.Date\n")
+    write(os.path.join(definition, 'relationships.tmdl'), '\n'.join(relationships))
+
+    report_dir = os.path.join(root, f'{PROJECT}.Report')
+    write(os.path.join(report_dir, 'definition.pbir'), json.dumps(
+        {'version': '4.0', 'datasetReference': {'byPath': {'path': f'../{PROJECT}.SemanticModel'}}}))
+    pages = os.path.join(report_dir, 'definition', 'pages')
+    write(os.path.join(report_dir, 'definition', 'report.json'), json.dumps({'themeCollection': {}}))
+    write(os.path.join(pages, 'pages.json'), json.dumps({'pageOrder': ['page1'], 'activePageName': 'page1'}))
+    write(os.path.join(pages, 'page1', 'page.json'), json.dumps(
+        {'name': 'page1', 'displayName': 'Overview', 'width': 1280, 'height': 720}))
+    for i, name in enumerate(names[1:]):
+        write(os.path.join(pages, 'page1', 'visuals', f'visual{i}', 'visual.json'), json.dumps({
+            'name': f'visual{i}',
+            'position': {'x': 20 * i, 'y': 0, 'width': 200, 'height': 120},
+            'visual': {'visualType': 'card', 'query': {'queryState': {'Values': {'projections': [{
+                'field': {'Measure': {'Expression': {'SourceRef': {'Entity': name}}, 'Property': f'Total {name}'}},
+                'queryRef': f'{name}.Total {name}'}]}}}},
+        }))
+
+    os.makedirs(os.path.join(root, f'{PROJECT}_analysis', 'analysis'), exist_ok=True)
+    os.makedirs(os.path.join(root, f'{PROJECT}_analysis', 'sample_data'), exist_ok=True)
+
+
+class StdioClient:
+    """Newline-delimited JSON-RPC over the server's stdin/stdout; stderr is collected."""
+
+    def __init__(self, args, cwd):
+        self.start = time.perf_counter()
+        self.proc = subprocess.Popen(args, cwd=cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE, text=True, encoding='utf-8', bufsize=1)
+        self.messages = queue.Queue()
+        self.stderr = []
+        self._next_id = 0
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    def _read_stdout(self):
+        for line in self.proc.stdout:
+            try:
+                self.messages.put(json.loads(line))
+            except ValueError:
+                continue
+        self.messages.put(None)
+
+    def _read_stderr(self):
+        for line in self.proc.stderr:
+            self.stderr.append(line.rstrip('\n'))
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def notify(self, method, params=None):
+        self._send({'jsonrpc': '2.0', 'method': method, 'params': params or {}})
+
+    def request(self, method, params=None, timeout=120.0):
+        self._next_id += 1
+        request_id = self._next_id
+        self._send({'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params or {}})
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                message = self.messages.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                raise TimeoutError(f"{method}: no response within {timeout:.0f} s")
+            if message is None:
+                raise RuntimeError(f"{method}: server exited ({self.last_error()})")
+            if message.get('id') != request_id:
+                continue
+            if 'error' in message:
+                raise RuntimeError(f"{method}: {message['error'].get('message')}")
+            return message.get('result') or {}
+
+    def _send(self, message):
+        self.proc.stdin.write(json.dumps(message) + '\n')
+        self.proc.stdin.flush()
+
+    def settle(self, quiet_s=0.05):
+        """Wait until stderr stops growing so import lines land in the right phase."""
+        count = -1
+        while count != len(self.stderr):
+            count = len(self.stderr)
+            time.sleep(quiet_s)
+        return count
+
+    def last_error(self):
+        lines = [line for line in self.stderr if not line.startswith('import time:')]
+        return lines[-1] if lines else f"exit code {self.proc.poll()}"
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+        except Exception:
+            self.proc.kill()
+            self.proc.wait()
+
+
+def parse_importtime(lines, top):
+    """Totals, slowest modules (self time) and time per top-level package from -X importtime lines."""
+    modules = []
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        modules.append((name.strip(), int(parts[0]), int(parts[1]), (len(name) - len(name.lstrip()) - 1) // 2))
+
+    packages = {}
+    for name, self_us, _, _ in modules:
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return {
+        'modules': len(modules),
+        'total_ms': round(sum(self_us for _, self_us, _, _ in modules) / 1000, 2),
+        'slowest': [{'module': name, 'self_ms': round(self_us / 1000, 2), 'cumulative_ms': round(cum_us / 1000, 2)}
+                    for name, self_us, cum_us, _ in sorted(modules, key=lambda m: -m[1])[:top]],
+        'packages': {package: round(us / 1000, 2)
+                     for package, us in sorted(packages.items(), key=lambda item: -item[1])[:top]},
+    }
+
+
+def call_ok(result):
+    """A tools/call result counts as a success unless it is an error or a success=false payload."""
+    if result.get('isError'):
+        return False, 'isError'
+    for item in result.get('content') or []:
+        try:
+            payload = json.loads(item.get('text', ''))
+        except ValueError:
+            continue
+        if isinstance(payload, dict) and payload.get('success') is False:
+            return False, str(payload.get('error'))[:200]
+    return True, None
+
+
+def run_server(project_dir, calls, stub, top):
+    """One server process: initialize, list_tools, list_resources, then each first call."""
+    code = BOOTSTRAP.format(root=parent_dir, stub=stub, server=SERVER_SCRIPT)
+    client = StdioClient([sys.executable, '-X', 'importtime', '-c', code], cwd=project_dir)
+    run = {}
+    try:
+        client.request('initialize', {'protocolVersion': PROTOCOL_VERSION, 'capabilities': {},
+                                      'clientInfo': {'name': 'benchmark_server_startup', 'version': '1.0'}})
+        run['ready_ms'] = round(client.elapsed_ms(), 2)
+        client.notify('notifications/initialized')
+
+        for label, method, key in (('list_tools', 'tools/list', 'tools'),
+                                   ('list_resources', 'resources/list', 'resources')):
+            start = time.perf_counter()
+            result = client.request(method)
+            run[f'{label}_request_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            run[f'{label}_ms'] = round(client.elapsed_ms(), 2)
+            run[key] = len(result.get(key) or [])
+        startup_lines = client.settle()
+
+        run['first_call'] = {}
+        phase_imports = {}
+        mark = startup_lines
+        for label, tool, arguments in calls:
+            start = time.perf_counter()
+            result = client.request('tools/call', {'name': tool, 'arguments': arguments})
+            ms = (time.perf_counter() - start) * 1000
+            ok, error = call_ok(result)
+            run['first_call'][label] = {'tool': tool, 'ms': round(ms, 2), 'success': ok}
+            if error:
+                run['first_call'][label]['error'] = error
+            end = client.settle()
+            phase_imports[label] = parse_importtime(client.stderr[mark:end], top)
+            mark = end
+
+        run['importtime'] = {'startup': parse_importtime(client.stderr[:startup_lines], top), **phase_imports}
+    except Exception as e:
+        run['error'] = str(e)
+    finally:
+        client.close()
+    return run
+
+
+def summarize(runs):
+    """Median of each metric over the successful runs, flattened to dotted keys."""
+    ok = [r for r in runs if 'error' not in r]
+    metrics = {}
+    for run in ok:
+        values = {key: run[key] for key in ('ready_ms', 'list_tools_ms', 'list_resources_ms',
+                                            'list_tools_request_ms', 'list_resources_request_ms')}
+        for label, call in run['first_call'].items():
+            values[f'first_call.{label}_ms'] = call['ms']
+        for phase, imports in run['importtime'].items():
+            values[f'importtime.{phase}_ms'] = imports['total_ms']
+        for key, value in values.items():
+            metrics.setdefault(key, []).append(value)
+    return {key: round(statistics.median(values), 2) for key, values in metrics.items()}
+
+
+def compare(summary, options, previous_path, tolerance, min_ms=5.0):
+    """Metrics slower than the previous result by more than tolerance (and min_ms)."""
+    with open(previous_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    previous = data.get('summary', {})
+    regressions = []
+    print(f"compared with {previous_path} ({data.get('commit') or 'unknown commit'})")
+    differing = {key for key in ('tables', 'isolate', 'stub_connection')
+                 if data.get('options', {}).get(key) != options[key]}
+    if differing:
+        print(f"  note: options differ from the previous run ({', '.join(sorted(differing))})")
+    for key, value in summary.items():
+        if key not in previous:
+            continue
+        old = previous[key]
+        delta = value - old
+        slower = delta > min_ms and value > old * (1 + tolerance)
+        if slower:
+            regressions.append(key)
+        print(f"  {key:34} {old:9.1f} -> {value:9.1f} ms  ({delta:+8.1f}){'  REGRESSION' if slower else ''}")
+    return regressions
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=parent_dir, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark server readiness and first-call latency over stdio')
+    parser.add_argument('--repeat', type=int, default=3, help='Server launches (medians go to the summary)')
+    parser.add_argument('--tables', type=int, default=20, help='Tables in the generated PBIP project')
+    parser.add_argument('--isolate', action='store_true',
+                        help='Fresh server per first call (otherwise calls share one server, in order)')
+    parser.add_argument('--top', type=int, default=15, help='Slowest modules/packages kept per phase')
+    parser.add_argument('--output', help='Result JSON (default: exports/benchmarks/server_startup_<time>.json)')
+    parser.add_argument('--compare', help='Previous result JSON to compare the summary against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Relative slowdown counted as a regression')
+    parser.add_argument('--no-stub', action='store_true', help='Use the real connection layer')
+    args = parser.parse_args()
+
+    from server.tool_catalog import load_tool_catalog
+    catalog_current = load_tool_catalog() is not None
+
+    project_dir = tempfile.mkdtemp(prefix='pbixray_bench_')
+    runs = []
+    try:
+        build_project(project_dir, max(2, args.tables))
+        calls = first_calls(project_dir)
+        for i in range(args.repeat):
+            if args.isolate:
+                run = None
+                for call in calls:
+                    single = run_server(project_dir, [call], not args.no_stub, args.top)
+                    if run is None:
+                        run = single
+                    elif 'error' in single:
+                        run['error'] = single['error']
+                    else:
+                        run['first_call'].update(single['first_call'])
+                        run['importtime'][call[0]] = single['importtime'][call[0]]
+            else:
+                run = run_server(project_dir, calls, not args.no_stub, args.top)
+            runs.append(run)
+
+            if 'error' in run:
+                print(f"run {i + 1}: FAILED  {run['error']}")
+                continue
+            timings = '  '.join(f"{label} {c['ms']:.0f}{'' if c['success'] else '!'}"
+                              for label, c in run['first_call'].items())
+            print(f"run {i + 1}: ready {run['ready_ms']:7.0f} ms  list_tools {run['list_tools_ms']:7.0f} ms  "
+                  f"list_resources {run['list_resources_ms']:7.0f} ms  ({run['tools']} tools)  first calls: {timings}")
+    finally:
+        shutil.rmtree(project_dir, ignore_errors=True)
+
+    summary = summarize(runs)
+    ok_runs = [r for r in runs if 'error' not in r]
+    if ok_runs:
+        startup = ok_runs[-1]['importtime']['startup']
+        print(f"startup imports: {startup['modules']} modules, {startup['total_ms']:.0f} ms; slowest packages:")
+        for package, ms in list(startup['packages'].items())[:8]:
+            print(f"  {package:30} {ms:8.1f} ms")
+        failed = sorted({label for r in ok_runs for label, c in r['first_call'].items() if not c['success']})
+        if failed:
+            print(f"first calls that returned an error (latency still recorded): {', '.join(failed)}")
+
+    options = {'repeat': args.repeat, 'tables': args.tables, 'isolate': args.isolate,
+               'stub_connection': not args.no_stub, 'tool_catalog_current': catalog_current}
+    output = args.output or os.path.join(parent_dir, 'exports', 'benchmarks',
+                                         f"server_startup_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'benchmark': 'server_startup',
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'options': options,
+            'summary': summary,
+            'runs': runs,
+        }, f, indent=2)
+    print(f"results written to {output}")
+
+    regressions = compare(summary, options, args.compare, args.tolerance) if args.compare else []
+    return 0 if ok_runs and len(ok_runs) == len(runs) and not regressions else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark server cold start: handler module import times and time to first list_tools.
+
+Every measurement runs in a fresh interpreter so nothing is already imported:
+- per module: import time of each handler module on its own (including the
+  analyzers and libraries it pulls in), slowest first
+- startup: registry + register_all_handlers + building the tool list, eager
+  (every handler module imported) vs lazy (tools listed from the catalog
+  snapshot), reported as in-process time and wall time including interpreter
+  start. The eager run writes the snapshot the lazy run uses.
+
+Usage:
+    python scripts/benchmark_startup.py [--repeat 3] [--top 15]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+try:
+    import {module}
+    print(json.dumps({{'ms': (time.perf_counter() - start) * 1000, 'modules': len(sys.modules)}}))
+except Exception as e:
+    print(json.dumps({{'error': f"{{type(e).__name__}}: {{e}}"}}))
+"""
+
+STARTUP_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+try:
+    from server.registry import HandlerRegistry
+    from server.handlers import register_all_handlers
+    registry = HandlerRegistry()
+    register_all_handlers(registry, lazy={lazy})
+    try:
+        tools = registry.get_all_tools_as_mcp()
+    except ImportError:
+        tools = [{{'name': t.name, 'description': t.description, 'inputSchema': t.input_schema}}
+                 for t in sorted(registry.get_all_tools(), key=lambda t: (t.sort_order, t.name))]
+    print(json.dumps({{'ms': (time.perf_counter() - start) * 1000, 'tools': len(tools),
+                      'modules': len(sys.modules)}}))
+except Exception as e:
+    print(json.dumps({{'error': f"{{type(e).__name__}}: {{e}}"}}))
+"""
+
+
+def run_probe(code):
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=parent_dir)
+    wall_ms = (time.perf_counter() - start) * 1000
+    lines = [line for line in proc.stdout.splitlines() if line.startswith('{')]
+    result = json.loads(lines[-1]) if lines else {'error': (proc.stderr.strip().splitlines() or ['no output'])[-1]}
+    result['wall_ms'] = wall_ms
+    return result
+
+
+def best_of(code, repeat):
+    runs = [run_probe(code) for _ in range(repeat)]
+    ok = [r for r in runs if 'error' not in r]
+    return min(ok, key=lambda r: r['ms']) if ok else runs[-1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark server cold start')
+    parser.add_argument('--repeat', type=int, default=3, help='Fresh interpreters per measurement (best is kept)')
+    parser.add_argument('--top', type=int, default=15, help='Slowest modules to show')
+    args = parser.parse_args()
+
+    from server.handlers import HANDLER_REGISTRATIONS
+    modules = list(dict.fromkeys(module for module, _ in HANDLER_REGISTRATIONS))
+
+    print(f"handler module import times ({len(modules)} modules, fresh interpreter each)")
+    timings = []
+    for module in modules:
+        result = best_of(IMPORT_PROBE.format(root=parent_dir, module=module), args.repeat)
+        timings.append((module, result))
+    timings.sort(key=lambda item: -item[1].get('ms', float('inf')))
+    for module, result in timings[:args.top]:
+        if 'error' in result:
+            print(f"  {module:58} FAILED  {result['error']}")
+        else:
+            print(f"  {module:58} {result['ms']:8.1f} ms  ({result['modules']} modules loaded)")
+    print(f"  sum of isolated imports: {sum(r.get('ms', 0) for _, r in timings):.0f} ms")
+
+    print("time to first list_tools")
+    results = {}
+    for label, lazy in (('eager', False), ('lazy', True)):
+        result = best_of(STARTUP_PROBE.format(root=parent_dir, lazy=lazy), args.repeat)
+        results[label] = result
+        if 'error' in result:
+            print(f"  {label:6} FAILED  {result['error']}")
+        else:
+            print(f"  {label:6} {result['ms']:8.1f} ms in process  {result['wall_ms']:8.1f} ms wall  "
+                  f"{result['tools']} tools  {result['modules']} modules loaded")
+
+    ok = all('error' not in r for r in results.values())
+    return 0 if ok and results['eager']['tools'] == results['lazy']['tools'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark the TMDL parse cache on a synthetic project.
+
+Writes a TMDL definition folder with N tables, then times:
+- cold parse_full_model() and validate_syntax()
+- the same calls with nothing changed
+- the same calls after editing one table file
+
+Usage:
+    python scripts/benchmark_tmdl_parse_cache.py [--tables 300] [--columns 25] [--measures 15]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.tmdl.tmdl_parse_cache import get_tmdl_parse_cache
+from core.tmdl.tmdl_parser import TmdlParser
+from core.tmdl.validator import TmdlValidator
+
+
+def table_tmdl(index: int, columns: int, measures: int, revision: int = 0) -> str:
+    name = f"Table {index:03d}"
+    lines = [f"table '{name}'", f"\tlineageTag: t-{index}", ""]
+    for c in range(columns):
+        lines += [
+            f"\tcolumn 'Column {c}'",
+            f"\t\tdataType: {'int64' if c % 2 else 'string'}",
+            f"\t\tsourceColumn: Column {c}",
+            f"\t\tsummarizeBy: none",
+            "",
+        ]
+    for m in range(measures):
+        lines += [
+            f"\tmeasure 'Measure {m}' = SUM('{name}'[Column {m % columns}]) * {revision + 1}",
+            "\t\tformatString: #,0",
+            "",
+        ]
+    lines += [f"\tpartition '{name}' = m", "\t\tmode: import", ""]
+    return "\n".join(lines)
+
+
+def build_project(root: Path, tables: int, columns: int, measures: int) -> Path:
+    definition = root / "definition"
+    (definition / "tables").mkdir(parents=True)
+    (definition / "database.tmdl").write_text("database 'Benchmark'\n\tcompatibilityLevel: 1600\n", encoding="utf-8")
+    (definition / "model.tmdl").write_text("model Model\n\tculture: en-US\n", encoding="utf-8")
+    relationships = []
+    for i in range(tables):
+        (definition / "tables" / f"Table {i:03d}.tmdl").write_text(
+            table_tmdl(i, columns, measures), encoding="utf-8"
+        )
+        if i:
+            relationships += [
+                f"relationship r{i}",
+                f"\tfromColumn: 'Table {i:03d}'.'Column 1'",
+                "\ttoColumn: 'Table 000'.'Column 1'",
+                "",
+            ]
+    (definition / "relationships.tmdl").write_text("\n".join(relationships), encoding="utf-8")
+    return definition
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return (time.perf_counter() - start) * 1000, value
+
+
+def table_named(model, index):
+    return next(t for t in model['tables'] if t['name'] == f"Table {index:03d}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the TMDL parse cache')
+    parser.add_argument('--tables', type=int, default=300, help='Tables in the synthetic project')
+    parser.add_argument('--columns', type=int, default=25, help='Columns per table')
+    parser.add_argument('--measures', type=int, default=15, help='Measures per table')
+    args = parser.parse_args()
+
+    cache = get_tmdl_parse_cache()
+    if cache is None:
+        print("tmdl.parse_cache is disabled in the configuration")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        definition = build_project(root, args.tables, args.columns, args.measures)
+        edited = definition / "tables" / "Table 007.tmdl"
+
+        uncached_ms, _ = timed(lambda: TmdlParser(str(root), use_cache=False).parse_full_model())
+        cold_ms, model = timed(lambda: TmdlParser(str(root)).parse_full_model())
+        cold_validate_ms, _ = timed(lambda: TmdlValidator().validate_syntax(str(definition)))
+        warm_ms, _ = timed(lambda: TmdlParser(str(root)).parse_full_model())
+        warm_validate_ms, _ = timed(lambda: TmdlValidator().validate_syntax(str(definition)))
+
+        untouched = model['tables'][0]
+        edited.write_text(table_tmdl(7, args.columns, args.measures, revision=1), encoding="utf-8")
+        reads_before = cache.get_stats()['reads']
+        edit_ms, reparsed = timed(lambda: TmdlParser(str(root)).parse_full_model())
+        edit_validate_ms, result = timed(lambda: TmdlValidator().validate_syntax(str(definition)))
+        stats = cache.get_stats()
+
+        print(f"Project: {args.tables} tables x {args.columns} columns, {args.measures} measures")
+        print(f"{'parse, no cache':28s} {uncached_ms:8.1f} ms")
+        print(f"{'parse, cold cache':28s} {cold_ms:8.1f} ms   validate {cold_validate_ms:8.1f} ms")
+        print(f"{'parse, unchanged':28s} {warm_ms:8.1f} ms   validate {warm_validate_ms:8.1f} ms")
+        print(f"{'parse, one table edited':28s} {edit_ms:8.1f} ms   validate {edit_validate_ms:8.1f} ms")
+        print(f"files re-read after the edit: {stats['reads'] - reads_before}")
+        try:
+            reparsed['tables'][0]['name'] = 'changed'
+            read_only = False
+        except TypeError:
+            read_only = True
+        print(f"unchanged tables reused: {any(t is untouched for t in reparsed['tables'])}, "
+              f"earlier snapshot unchanged: {table_named(model, 7) is not table_named(reparsed, 7)}, "
+              f"read-only: {read_only}, validation files checked: {result.files_checked}")
+        print("cache:", stats)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Compare TMDL parser throughput before and after the streaming parser.
+
+The baseline parsers are loaded from git history (the commit before
+core/tmdl/tmdl_stream.py was added, or --baseline REV) and run on the same
+synthetic table files as the current adapters:
+
+- core.tmdl.tmdl_parser.TmdlParser table parsing
+- core.pbip.pbip_model_analyzer.TmdlParser generic parsing
+- core.model.tmdl_parser.TMDLParser.parse_file
+- one measure lookup across every table file (HybridReader.get_measure_from_tmdl)
+
+Usage:
+    python scripts/benchmark_tmdl_parsers.py [--tables 300] [--rounds 3] [--baseline REV]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.model import tmdl_parser as model_parser
+from core.pbip import pbip_model_analyzer
+from core.tmdl import tmdl_parser as core_parser
+from benchmark_tmdl_parse_cache import build_project
+
+MODULES = {
+    'core': 'core/tmdl/tmdl_parser.py',
+    'pbip': 'core/pbip/pbip_model_analyzer.py',
+    'model': 'core/model/tmdl_parser.py',
+}
+
+
+def git(*args: str) -> str:
+    return subprocess.run(
+        ['git', *args], cwd=parent_dir, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def default_baseline() -> str:
+    added = git('log', '--diff-filter=A', '--format=%H', '--', 'core/tmdl/tmdl_stream.py')
+    return f"{added.splitlines()[-1]}^" if added else 'HEAD'
+
+
+def load_baseline(rev: str, key: str) -> types.ModuleType:
+    """Import a module's source as of rev under a private name."""
+    module = types.ModuleType(f"baseline_{key}")
+    module.__file__ = os.path.join(parent_dir, MODULES[key])
+    exec(compile(git('show', f"{rev}:{MODULES[key]}"), module.__file__, 'exec'), module.__dict__)
+    return module
+
+
+def best_of(fn, rounds: int) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def content_parser(module):
+    parser = module.TmdlParser.__new__(module.TmdlParser)
+    parser._cache = None
+    return parser
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare TMDL parser throughput, baseline vs streaming parser')
+    parser.add_argument('--tables', type=int, default=300, help='Tables in the synthetic project')
+    parser.add_argument('--columns', type=int, default=25, help='Columns per table')
+    parser.add_argument('--measures', type=int, default=15, help='Measures per table')
+    parser.add_argument('--rounds', type=int, default=3, help='Timing rounds (best is reported)')
+    parser.add_argument('--baseline', default=None, help='Git revision with the pre-streaming parsers')
+    args = parser.parse_args()
+
+    rev = args.baseline or default_baseline()
+    old = {key: load_baseline(rev, key) for key in MODULES}
+    new = {'core': core_parser, 'pbip': pbip_model_analyzer, 'model': model_parser}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        definition = build_project(Path(tmp), args.tables, args.columns, args.measures)
+        table_files = sorted((definition / "tables").glob("*.tmdl"))
+        contents = [path.read_text(encoding="utf-8") for path in table_files]
+        megabytes = sum(len(text) for text in contents) / 1024 / 1024
+        # The looked-up measure exists only in the last table file
+        target = "Needle Measure"
+        contents[-1] += f"\n\tmeasure '{target}' = 1\n"
+
+        def core_tables(module):
+            p = content_parser(module)
+            return lambda: [p._parse_table_content(text) for text in contents]
+
+        def pbip_tables(module):
+            p = module.TmdlParser()
+            return lambda: [p._parse_content(text) for text in contents]
+
+        def model_files(module):
+            return lambda: [module.TMDLParser.parse_file(path) for path in table_files]
+
+        def lookup(module):
+            def run():
+                # Like get_measure_from_tmdl: scan files until the measure is found
+                for text in contents:
+                    found = module.TMDLParser.parse_measure(text, target)
+                    if found:
+                        return found
+            return run
+
+        cases = [
+            ('core TmdlParser tables', 'core', core_tables),
+            ('pbip TmdlParser tables', 'pbip', pbip_tables),
+            ('model TMDLParser.parse_file', 'model', model_files),
+            ('measure lookup, all files', 'model', lookup),
+        ]
+
+        print(f"{len(contents)} table files, {megabytes:.1f} MB; baseline {rev}")
+        print(f"{'case':30s} {'baseline':>10s} {'streaming':>10s} {'speedup':>8s} {'MB/s':>7s}")
+        for label, key, make in cases:
+            before = best_of(make(old[key]), args.rounds)
+            after = best_of(make(new[key]), args.rounds)
+            print(f"{label:30s} {before * 1000:8.1f}ms {after * 1000:8.1f}ms {before / after:7.2f}x "
+                  f"{megabytes / after:7.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark VertiPaq cardinality fallback: per-column queries vs batched UNION queries.
+
+Uses a fake connection whose storage DMV is unavailable, so every column goes
+through the DAX fallback. Each fake query costs a fixed latency (the round
+trip). Compares:
+- per-column: one COUNTROWS(DISTINCT(...)) query per column (the old fallback)
+- batched: VertiPaqAnalyzer.analyze_dax_columns on a cold per-connection cache
+- warm: the same call again on the shared cache (model version stamp reused within
+  performance.model_version_recheck_s, so no query)
+- construct: new analyzers on a fresh connection that are never used (no query)
+
+Usage:
+    python scripts/benchmark_vertipaq_cardinality.py [--columns 30] [--latency-ms 25]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.dax.vertipaq_analyzer import VertiPaqAnalyzer
+from core.infrastructure.result_set import ColumnarResult
+
+_ROW = re.compile(r'ROW\("Column", "((?:[^"]|"")*)"')
+
+
+class FakeExecutor:
+    """Answers cardinality ROW/UNION queries; storage DMVs are unavailable."""
+
+    def __init__(self, latency_s):
+        self.latency_s = latency_s
+        self.queries = 0
+
+    def execute_dmv_query(self, query):
+        self.queries += 1
+        time.sleep(self.latency_s)
+        if 'MDSCHEMA_CUBES' in query:
+            return {'success': True, 'data': [{'CUBE_NAME': 'Model', 'LAST_SCHEMA_UPDATE': '2026-01-01',
+                                               'LAST_DATA_UPDATE': '2026-01-02'}]}
+        return {'success': False, 'error': 'DMV not available', 'data': []}
+
+    def validate_and_execute_dax(self, query, top_n=0, bypass_cache=False, columnar=False):
+        self.queries += 1
+        time.sleep(self.latency_s)
+        names = [name.replace('""', '"') for name in _ROW.findall(query)]
+        if not names:
+            # Legacy single-column query
+            names = [re.search(r"DISTINCT\((.+?)\)\)", query).group(1)]
+        raw = [names, [1000 + len(n) for n in names], [50000] * len(names)]
+        result_set = ColumnarResult.from_raw(['[Column]', '[Cardinality]', '[TotalRows]'], raw)
+        return {'success': True, 'result_set': result_set}
+
+
+class FakeConnectionState:
+    def __init__(self, executor):
+        self.query_executor = executor
+
+    def is_connected(self):
+        return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark batched VertiPaq cardinality')
+    parser.add_argument('--columns', type=int, default=30, help='Columns referenced by the measure')
+    parser.add_argument('--latency-ms', type=float, default=25.0, help='Fake round-trip latency')
+    args = parser.parse_args()
+
+    refs = [f"'Sales {i % 4}'[Column {i}]" for i in range(args.columns)]
+    dax = "SUMX(" + ", ".join(refs) + ")"
+    latency = args.latency_ms / 1000
+
+    legacy = FakeExecutor(latency)
+    start = time.perf_counter()
+    for ref in refs:
+        legacy.validate_and_execute_dax(f"EVALUATE ROW(\"Cardinality\", COUNTROWS(DISTINCT({ref})))", top_n=1)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    executor = FakeExecutor(latency)
+    state = FakeConnectionState(executor)
+    start = time.perf_counter()
+    cold = VertiPaqAnalyzer(state).analyze_dax_columns(dax)
+    cold_ms = (time.perf_counter() - start) * 1000
+    cold_queries = executor.queries
+
+    start = time.perf_counter()
+    warm = VertiPaqAnalyzer(state).analyze_dax_columns(dax)
+    warm_ms = (time.perf_counter() - start) * 1000
+
+    idle = FakeExecutor(latency)
+    for _ in range(10):
+        VertiPaqAnalyzer(FakeConnectionState(idle))
+
+    ok = cold['columns_with_metrics'] == args.columns == warm['columns_with_metrics'] and idle.queries == 0
+    print(f"{args.columns} columns, {args.latency_ms:g} ms per round trip")
+    print(f"  per-column  {legacy_ms:8.1f} ms   {legacy.queries} queries")
+    print(f"  batched     {cold_ms:8.1f} ms   {cold_queries} queries (incl. version + DMV probe)")
+    print(f"  warm cache  {warm_ms:8.1f} ms   {executor.queries - cold_queries} queries")
+    print(f"  construct   10 analyzers   {idle.queries} queries")
+    print(f"  metrics for all columns: {'yes' if ok else 'NO'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
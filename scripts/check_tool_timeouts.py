@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Exercise per-tool timeout enforcement against a stub query executor that sleeps.
+
+Checks that:
+- analyze_queries_batch stops at its budget and returns the queries it finished
+- comprehensive_analysis skips the stages left once the budget expires
+- the dispatcher abandons a handler that ignores its token after budget + grace
+
+Usage:
+    python scripts/check_tool_timeouts.py [--delay 0.3] [--budget 1.0]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add parent directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from core.config.config_manager import config
+from core.infrastructure.cancellation import CancellationToken, cancellation_scope
+from core.orchestration.analysis_orchestrator import AnalysisOrchestrator
+
+
+class SleepingQueryExecutor:
+    """Query executor stub: every call sleeps, then succeeds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    def _sleep(self):
+        self.calls += 1
+        time.sleep(self.delay)
+
+    def validate_and_execute_dax(self, query, top_n=0, **kwargs):
+        self._sleep()
+        return {'success': True, 'rows': [{'[Value]': 1}]}
+
+    def execute_dax_batch(self, queries, top_n=0, **kwargs):
+        # One command per batch, so one sleep
+        self._sleep()
+        return [{'success': True, 'rows': [{'[Value]': 1}]} for _ in queries]
+
+    def execute_info_query(self, kind, **kwargs):
+        self._sleep()
+        return {'success': True, 'rows': []}
+
+    def get_tmsl_definition(self):
+        self._sleep()
+        return {'success': False, 'error': 'stub executor has no TMSL'}
+
+
+class SleepingValidator:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def validate_model_integrity(self):
+        time.sleep(self.delay)
+        return {'success': True, 'issues': [], 'total_issues': 0}
+
+
+class StubConnectionState:
+    def __init__(self, delay: float):
+        self.query_executor = SleepingQueryExecutor(delay)
+        self.model_validator = SleepingValidator(delay * 3)
+        self.performance_analyzer = None
+        self.performance_optimizer = None
+        self.bpa_analyzer = None
+
+    def is_connected(self) -> bool:
+        return True
+
+
+class FixedTimeouts:
+    """ToolTimeoutManager stand-in with one budget for every tool."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def get_budget(self, tool_name):
+        return self.seconds
+
+
+def check(label: str, ok: bool, detail: str) -> bool:
+    print(f"[{'PASS' if ok else 'FAIL'}] {label}: {detail}")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Check per-tool timeout enforcement')
+    parser.add_argument('--delay', type=float, default=0.3, help='Seconds each stub call sleeps')
+    parser.add_argument('--budget', type=float, default=1.0, help='Tool budget in seconds')
+    args = parser.parse_args()
+
+    orchestrator = AnalysisOrchestrator(config)
+    results = []
+
+    state = StubConnectionState(args.delay)
+    queries = ['EVALUATE {1}'] * 20
+    # Small batches so the budget runs out between them
+    config.config.setdefault('performance', {})['dax_batch_max_queries'] = 2
+    start = time.perf_counter()
+    with cancellation_scope(CancellationToken(args.budget, 'analyze_queries_batch')):
+        batch = orchestrator.analyze_queries_batch(state, queries, runs=1)
+    elapsed = time.perf_counter() - start
+    results.append(check(
+        'analyze_queries_batch',
+        bool(batch.get('partial')) and 0 < len(batch['items']) < len(queries) and elapsed < args.budget + args.delay * 2,
+        f"{len(batch['items'])}/{len(queries)} queries in {elapsed:.2f}s, stopped at {batch.get('cancellation', {}).get('stopped_at')}"
+    ))
+
+    state = StubConnectionState(args.delay)
+    with cancellation_scope(CancellationToken(args.delay, 'comprehensive_analysis')):
+        analysis = orchestrator.comprehensive_analysis(state)
+    results.append(check(
+        'comprehensive_analysis',
+        bool(analysis.get('partial')) and list(analysis['analyses']) == ['integrity'],
+        f"ran {list(analysis['analyses'])}, stopped at {analysis.get('cancellation', {}).get('stopped_at')}"
+    ))
+
+    try:
+        from server.dispatch import ToolDispatcher
+        from server.registry import ToolDefinition, get_registry
+    except ImportError as e:
+        print(f"[SKIP] dispatcher: {e}")
+        return 0 if all(results) else 1
+
+    def runaway(arguments):
+        time.sleep(args.budget * 4)
+        return {'success': True}
+
+    get_registry().register(ToolDefinition(
+        name='zz_Runaway_Check', description='Sleeps past its budget', handler=runaway,
+        input_schema={'type': 'object', 'properties': {}}, category='debug'
+    ))
+    dispatcher = ToolDispatcher(timeout_manager=FixedTimeouts(args.budget))
+    dispatcher.timeout_grace = args.delay
+    start = time.perf_counter()
+    outcome = asyncio.run(dispatcher.dispatch_async('zz_Runaway_Check', {}))
+    elapsed = time.perf_counter() - start
+    results.append(check(
+        'dispatcher hard timeout',
+        outcome.get('error_type') == 'timeout' and elapsed < args.budget * 2 + args.delay,
+        f"returned after {elapsed:.2f}s: {outcome.get('error')}"
+    ))
+    dispatcher.shutdown()
+    return 0 if all(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
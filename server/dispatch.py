@@ -2,32 +2,145 @@
 Central Tool Dispatcher
 Routes tool calls to appropriate handlers with error handling
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from server.middleware import continue_from_cursor
 from server.registry import get_registry
+from core.config.config_manager import config
+from core.infrastructure.cancellation import CancellationToken, OperationCancelled, cancellation_scope
 from core.validation.error_handler import ErrorHandler
 
 logger = logging.getLogger(__name__)
 
+# Tools that always change model or server state
+MUTATING_TOOLS = frozenset({
+    '01_Connect_To_Instance',
+    '03_Batch_Operations',
+    '03_Manage_Transactions',
+    '08_Update_Documentation_Word',
+    '09_Set_PBIP_Path',
+})
+
+# 'operation' values that change the model (02_* CRUD tools, TMDL automation)
+MUTATING_OPERATIONS = frozenset({
+    'create', 'update', 'delete', 'rename', 'move', 'activate', 'deactivate', 'refresh',
+    'find_replace', 'bulk_rename', 'migrate_measures',
+})
+
+
+def is_mutating_call(tool_name: str, arguments: Optional[Dict[str, Any]]) -> bool:
+    """True if a tool call may modify the model and must run alone on its connection."""
+    if tool_name in MUTATING_TOOLS:
+        return True
+    operation = (arguments or {}).get('operation')
+    return isinstance(operation, str) and operation.lower() in MUTATING_OPERATIONS
+
+
+class ConnectionGate:
+    """
+    Reader/writer gate for one connection, used on the event loop thread.
+
+    Read-only calls share the gate. A mutating call waits until the reads
+    already running have finished, and new reads queue behind it until it
+    is done. Each slot is held until the worker thread returns.
+    """
+
+    def __init__(self):
+        self.readers = 0
+        self.writing = False
+        self.writers_waiting = 0
+        self._waiters: List[asyncio.Future] = []
+
+    async def _wait_until(self, ready) -> None:
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _wake(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def acquire_read(self) -> None:
+        await self._wait_until(lambda: not self.writing and not self.writers_waiting)
+        self.readers += 1
+
+    def release_read(self) -> None:
+        self.readers -= 1
+        self._wake()
+
+    async def acquire_write(self) -> None:
+        self.writers_waiting += 1
+        try:
+            await self._wait_until(lambda: not self.writing and not self.readers)
+        finally:
+            self.writers_waiting -= 1
+            self._wake()  # readers held back by a cancelled writer may go again
+        self.writing = True
+
+    def release_write(self) -> None:
+        self.writing = False
+        self._wake()
+
+
 class ToolDispatcher:
     """Dispatches tool calls to registered handlers"""
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None, timeout_manager=None):
         self.registry = get_registry()
         self._call_count = 0
 
-    def dispatch(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        # Per-tool budgets (ToolTimeoutManager); None disables enforcement
+        self.timeout_manager = timeout_manager
+        self.enforce_timeouts = bool(config.get('performance.enforce_tool_timeouts', True))
+        self.timeout_grace = float(config.get('performance.timeout_grace_seconds', 5) or 0)
+        self._timed_out_calls = 0
+
+        # Worker pool: read-only tools run concurrently, mutating tools run alone
+        # on their connection (see ConnectionGate) before they reach the pool
+        self.max_workers = max(1, int(max_workers or config.get('performance.dispatch_workers', 8) or 8))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._gates: Dict[str, ConnectionGate] = {}
+
+        self._stats_lock = threading.Lock()
+        self._started_at = time.time()
+        self._queued = 0
+        self._active = 0
+        self._peak_active = 0
+        self._pooled_calls = 0
+        self._serialized_calls = 0
+        self._started_calls = 0
+        self._queue_time_total = 0.0
+        self._queue_time_max = 0.0
+        self._busy_time_total = 0.0
+
+    def dispatch(self, tool_name: str, arguments: Dict[str, Any],
+                 token: Optional[CancellationToken] = None) -> Dict[str, Any]:
         """
         Dispatch a tool call to its handler
 
         Args:
             tool_name: Name of the tool to invoke
             arguments: Tool arguments
+            token: Cancellation token for the call (created from the tool's budget if omitted)
 
         Returns:
             Result dictionary from the handler
         """
-        self._call_count += 1
+        with self._stats_lock:
+            self._call_count += 1
+        if token is None:
+            token = self.create_token(tool_name)
 
         try:
             # Check if tool exists
@@ -40,12 +153,19 @@ class ToolDispatcher:
                     'available_tools': [t.name for t in self.registry.get_all_tools()[:10]]
                 }
 
+            # Follow-up pages of a paginated result are read from its cursor, not re-run
+            if arguments and arguments.get('next_token'):
+                page = continue_from_cursor(tool_name, arguments)
+                if page is not None:
+                    return page
+
             # Get handler
             handler = self.registry.get_handler(tool_name)
 
             # Execute handler
             logger.debug(f"Dispatching tool: {tool_name}")
-            result = handler(arguments)
+            with cancellation_scope(token):
+                result = handler(arguments)
 
             # Ensure result is a dict
             if not isinstance(result, dict):
@@ -54,14 +174,179 @@ class ToolDispatcher:
 
             return result
 
+        except OperationCancelled as e:
+            # A checkpoint outside any orchestrator's partial-result handling
+            logger.warning(f"Tool {tool_name} cancelled: {e}")
+            return self._timeout_result(tool_name, token)
         except Exception as e:
             logger.error(f"Error dispatching tool {tool_name}: {e}", exc_info=True)
             return ErrorHandler.handle_unexpected_error(tool_name, e)
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get dispatcher statistics"""
+    async def dispatch_async(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Dispatch a tool call on the worker pool without blocking the event loop
+
+        Read-only tools run concurrently. Model-mutating tools (see is_mutating_call)
+        go through the connection's gate: each one waits for running reads to
+        finish, holds back new ones, and runs alone against the connection.
+
+        Each call gets a CancellationToken from its timeout budget. Orchestrators
+        check it and return partial results; a read-only call that ignores it is
+        abandoned once the budget plus a grace period has passed.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments
+
+        Returns:
+            Result dictionary from the handler
+        """
+        loop = asyncio.get_running_loop()
+        ticket = {'enqueued_at': time.perf_counter(), 'started': False, 'abandoned': False}
+        with self._stats_lock:
+            self._queued += 1
+
+        gate = self._gates.setdefault(self._lane_key(), ConnectionGate())
+        try:
+            if not is_mutating_call(tool_name, arguments):
+                with self._stats_lock:
+                    self._pooled_calls += 1
+                # Budget runs from enqueue, so pool and gate queueing count against it
+                ticket['token'] = self.create_token(tool_name)
+                await gate.acquire_read()
+                future = self._submit(loop, gate.release_read, tool_name, arguments, ticket)
+                return await self._await_with_budget(tool_name, future, ticket['token'])
+
+            await gate.acquire_write()
+            with self._stats_lock:
+                self._serialized_calls += 1
+            # Cooperative cancellation only: abandoning a half-applied change
+            # would let other calls in while the worker is still writing
+            ticket['token'] = self.create_token(tool_name)
+            return await asyncio.shield(self._submit(loop, gate.release_write, tool_name, arguments, ticket))
+        finally:
+            with self._stats_lock:
+                # Cancelled before a worker picked it up: it will never run
+                if not ticket['started']:
+                    ticket['abandoned'] = True
+                    self._queued -= 1
+
+    def _submit(self, loop: asyncio.AbstractEventLoop, release, tool_name: str,
+                arguments: Dict[str, Any], ticket: Dict[str, Any]) -> "asyncio.Future":
+        """Run the call on the pool; the gate slot is released when the worker returns, not when the caller stops waiting."""
+        try:
+            future = loop.run_in_executor(self._get_executor(), self._run_worker, tool_name, arguments, ticket)
+        except BaseException:
+            release()
+            raise
+        future.add_done_callback(lambda _: release())
+        return future
+
+    def _run_worker(self, tool_name: str, arguments: Dict[str, Any], ticket: Dict[str, Any]) -> Dict[str, Any]:
+        """Run dispatch() on a worker thread, recording queue and busy time."""
+        started_at = time.perf_counter()
+        waited = started_at - ticket['enqueued_at']
+        with self._stats_lock:
+            if ticket['abandoned']:
+                return {'success': False, 'error': 'Tool call was cancelled', 'error_type': 'cancelled'}
+            ticket['started'] = True
+            self._queued -= 1
+            self._active += 1
+            self._peak_active = max(self._peak_active, self._active)
+            self._started_calls += 1
+            self._queue_time_total += waited
+            self._queue_time_max = max(self._queue_time_max, waited)
+        if waited > 1.0:
+            logger.debug(f"Tool {tool_name} waited {waited * 1000:.0f}ms for a worker")
+        try:
+            return self.dispatch(tool_name, arguments, ticket.get('token'))
+        finally:
+            with self._stats_lock:
+                self._active -= 1
+                self._busy_time_total += time.perf_counter() - started_at
+
+    def create_token(self, tool_name: str) -> CancellationToken:
+        """Cancellation token carrying the tool's timeout budget (none unless one is configured)."""
+        timeout = None
+        if self.enforce_timeouts and self.timeout_manager is not None:
+            timeout = self.timeout_manager.get_budget(tool_name)
+        return CancellationToken(timeout, label=tool_name)
+
+    async def _await_with_budget(self, tool_name: str, future: "asyncio.Future", token: CancellationToken) -> Dict[str, Any]:
+        """Await a worker result, giving up once the budget plus grace has passed."""
+        if token.timeout is None:
+            return await future
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), token.timeout + self.timeout_grace)
+        except asyncio.TimeoutError:
+            # The worker thread cannot be killed; it stops at its next checkpoint
+            token.cancel(f"timeout after {token.timeout:g}s")
+            logger.error(f"Tool {tool_name} exceeded its {token.timeout:g}s budget; returning without result")
+            return self._timeout_result(tool_name, token)
+
+    def _timeout_result(self, tool_name: str, token: CancellationToken) -> Dict[str, Any]:
+        with self._stats_lock:
+            self._timed_out_calls += 1
         return {
-            'total_calls': self._call_count,
-            'registered_tools': len(self.registry.get_all_tools()),
-            'categories': self.registry.list_categories()
+            'success': False,
+            'error': f'{tool_name} did not finish within its {token.timeout or 0:g}s budget',
+            'error_type': 'timeout',
+            'timed_out': True,
+            'elapsed_seconds': round(token.elapsed(), 2),
+            'suggestion': 'Narrow the request (scope, depth, table or query count) or raise tool_timeouts in the config',
         }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._stats_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="tool-worker"
+                    )
+        return self._executor
+
+    @staticmethod
+    def _lane_key() -> str:
+        """Gate key for the active connection."""
+        try:
+            from core.infrastructure.connection_state import connection_state
+            manager = connection_state.connection_manager
+            return getattr(manager, 'connection_string', None) or 'default'
+        except Exception:
+            return 'default'
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dispatcher statistics"""
+        with self._stats_lock:
+            elapsed = max(time.time() - self._started_at, 1e-9)
+            started = self._started_calls
+            gates = list(self._gates.values())
+            return {
+                'total_calls': self._call_count,
+                'timed_out_calls': self._timed_out_calls,
+                'registered_tools': len(self.registry.get_all_tools()),
+                'categories': self.registry.list_categories(),
+                'loaded_handler_modules_ms': self.registry.get_load_stats(),
+                'worker_pool': {
+                    'max_workers': self.max_workers,
+                    'active_workers': self._active,
+                    'peak_active_workers': self._peak_active,
+                    'queued_calls': self._queued,
+                    'concurrent_calls': self._pooled_calls,
+                    'serialized_calls': self._serialized_calls,
+                    'avg_queue_ms': round(self._queue_time_total / started * 1000, 2) if started > 0 else 0,
+                    'max_queue_ms': round(self._queue_time_max * 1000, 2),
+                    'utilization_percent': round(
+                        self._busy_time_total / (elapsed * self.max_workers) * 100, 2
+                    ),
+                    'serialized_lanes': len(self._gates),
+                    'active_reads': sum(gate.readers for gate in gates),
+                    'writes_waiting': sum(gate.writers_waiting for gate in gates),
+                },
+            }
@@ -1,90 +1,103 @@
 """
 Server Handlers Package
 Individual handler modules for different tool categories
+
+Handler modules are not imported here. register_all_handlers() lists tools
+from the tool catalog snapshot (server/tool_catalog.py) and imports each
+module on the first call to one of its tools; without a current snapshot it
+imports them all, registers eagerly and writes the snapshot.
 """
-from server.handlers.connection_handler import register_connection_handlers
-from server.handlers.metadata_handler import register_metadata_handlers
-from server.handlers.query_handler import register_query_handlers
-from server.handlers.analysis_handler import register_analysis_handlers
-from server.handlers.dependencies_handler import register_dependencies_handlers
-from server.handlers.column_usage_handler import register_column_usage_handler, register_export_dax_measures_handler
-from server.handlers.export_handler import register_export_handlers
-from server.handlers.documentation_handler import register_documentation_handlers
-from server.handlers.comparison_handler import register_comparison_handlers
-from server.handlers.pbip_handler import register_pbip_handlers
-from server.handlers.slicer_operations_handler import register_slicer_operations_handler
-from server.handlers.visual_operations_handler import register_visual_operations_handler
-from server.handlers.report_info_handler import register_report_info_handler
-from server.handlers.tmdl_handler import register_tmdl_operations_handler
-from server.handlers.dax_context_handler import register_dax_handlers
-from server.handlers.user_guide_handler import register_user_guide_handlers
-from server.handlers.hybrid_analysis_handler import register_hybrid_analysis_handlers
-from server.handlers.aggregation_handler import register_aggregation_handler
-from server.handlers.bookmark_theme_handler import register_bookmark_theme_handlers
-from server.handlers.debug_handler import register_debug_handlers
-# Workflow handlers are internalized and not registered as public tools
-
-# Phase 1 Consolidated Operations (Tool Consolidation Plan)
-from server.handlers.table_operations_handler import register_table_operations_handler
-from server.handlers.column_operations_handler import register_column_operations_handler
-from server.handlers.measure_operations_handler import register_measure_operations_handler
-
-# Phase 2 Extended CRUD Operations
-from server.handlers.relationship_operations_handler import register_relationship_operations_handler
-from server.handlers.calculation_group_operations_handler import register_calculation_group_operations_handler
-from server.handlers.role_operations_handler import register_role_operations_handler
-
-# Phase 3 Batch Operations & Transactions
-from server.handlers.batch_operations_handler import register_batch_operations_handler
-from server.handlers.transaction_management_handler import register_transaction_management_handler
-
-# SVG Visual Generation
-from server.handlers.svg_handler import register_svg_operations_handler
-
-def register_all_handlers(registry):
-    """Register all handlers with the registry"""
-    # Register all proper handlers (no more bridge!)
-    register_connection_handlers(registry)
+import logging
+from typing import List, Optional, Tuple
+
+from core.config.config_manager import config
+from server.tool_catalog import load_tool_catalog, save_tool_catalog, source_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# (handler module, register function), in registration order
+HANDLER_REGISTRATIONS: List[Tuple[str, str]] = [
+    ('server.handlers.connection_handler', 'register_connection_handlers'),
 
     # Phase 1: Consolidated operations (replaces parts of metadata handlers)
-    register_table_operations_handler(registry)
-    register_column_operations_handler(registry)
-    register_measure_operations_handler(registry)
+    ('server.handlers.table_operations_handler', 'register_table_operations_handler'),
+    ('server.handlers.column_operations_handler', 'register_column_operations_handler'),
+    ('server.handlers.measure_operations_handler', 'register_measure_operations_handler'),
 
     # Phase 2: Extended CRUD operations
-    register_relationship_operations_handler(registry)
-    register_calculation_group_operations_handler(registry)
-    register_role_operations_handler(registry)
+    ('server.handlers.relationship_operations_handler', 'register_relationship_operations_handler'),
+    ('server.handlers.calculation_group_operations_handler', 'register_calculation_group_operations_handler'),
+    ('server.handlers.role_operations_handler', 'register_role_operations_handler'),
 
     # Phase 3: Batch operations & transactions
-    register_batch_operations_handler(registry)
-    register_transaction_management_handler(registry)
-
-    register_metadata_handlers(registry)
-    register_query_handlers(registry)
-    register_analysis_handlers(registry)
-    register_dependencies_handlers(registry)
-    register_column_usage_handler(registry)
-    register_export_dax_measures_handler(registry)
-    register_export_handlers(registry)
-    register_documentation_handlers(registry)
-    register_comparison_handlers(registry)
-    register_pbip_handlers(registry)
-    register_slicer_operations_handler(registry)
-    register_visual_operations_handler(registry)
-    register_report_info_handler(registry)
-    register_tmdl_operations_handler(registry)
-    register_dax_handlers(registry)
-    register_user_guide_handlers(registry)
-    register_hybrid_analysis_handlers(registry)
-    register_aggregation_handler(registry)
-    register_bookmark_theme_handlers(registry)
-    register_debug_handlers(registry)
+    ('server.handlers.batch_operations_handler', 'register_batch_operations_handler'),
+    ('server.handlers.transaction_management_handler', 'register_transaction_management_handler'),
+
+    ('server.handlers.metadata_handler', 'register_metadata_handlers'),
+    ('server.handlers.query_handler', 'register_query_handlers'),
+    ('server.handlers.analysis_handler', 'register_analysis_handlers'),
+    ('server.handlers.dependencies_handler', 'register_dependencies_handlers'),
+    ('server.handlers.column_usage_handler', 'register_column_usage_handler'),
+    ('server.handlers.column_usage_handler', 'register_export_dax_measures_handler'),
+    ('server.handlers.export_handler', 'register_export_handlers'),
+    ('server.handlers.documentation_handler', 'register_documentation_handlers'),
+    ('server.handlers.comparison_handler', 'register_comparison_handlers'),
+    ('server.handlers.pbip_handler', 'register_pbip_handlers'),
+    ('server.handlers.slicer_operations_handler', 'register_slicer_operations_handler'),
+    ('server.handlers.visual_operations_handler', 'register_visual_operations_handler'),
+    ('server.handlers.report_info_handler', 'register_report_info_handler'),
+    ('server.handlers.tmdl_handler', 'register_tmdl_operations_handler'),
+    ('server.handlers.dax_context_handler', 'register_dax_handlers'),
+    ('server.handlers.user_guide_handler', 'register_user_guide_handlers'),
+    ('server.handlers.hybrid_analysis_handler', 'register_hybrid_analysis_handlers'),
+    ('server.handlers.aggregation_handler', 'register_aggregation_handler'),
+    ('server.handlers.bookmark_theme_handler', 'register_bookmark_theme_handlers'),
+    ('server.handlers.debug_handler', 'register_debug_handlers'),
     # Workflow handlers are internalized and not registered as public tools
 
     # SVG Visual Generation
-    register_svg_operations_handler(registry)
+    ('server.handlers.svg_handler', 'register_svg_operations_handler'),
+]
+
+
+def register_all_handlers(registry, lazy: Optional[bool] = None):
+    """
+    Register all handlers with the registry
+
+    Args:
+        registry: HandlerRegistry to fill
+        lazy: List tools from the catalog snapshot and defer module imports
+            (default: performance.lazy_handlers)
+    """
+    if lazy is None:
+        lazy = bool(config.get('performance.lazy_handlers', True))
+    fingerprint = source_fingerprint()
+
+    if lazy:
+        catalog = load_tool_catalog(fingerprint)
+        if catalog is not None:
+            for entry in catalog:
+                registry.register_lazy(entry)
+            logger.info(f"Listed {len(catalog)} tools from the tool catalog; handler modules load on first use")
+            return
+
+    tools = []
+    for module_name, register_name in HANDLER_REGISTRATIONS:
+        for name in registry.load_module(module_name, register_name):
+            tool = registry.get_tool_def(name)
+            tools.append({
+                'name': tool.name,
+                'description': tool.description,
+                'input_schema': tool.input_schema,
+                'category': tool.category,
+                'sort_order': tool.sort_order,
+                'module': module_name,
+                'register': register_name,
+            })
+    save_tool_catalog(tools, fingerprint)
+
 
 __all__ = [
+    'HANDLER_REGISTRATIONS',
     'register_all_handlers',
 ]
@@ -822,6 +822,7 @@ def handle_full_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
     include_performance = args.get('include_performance', True)
     include_integrity = args.get('include_integrity', True)
     max_seconds = args.get('max_seconds', None)
+    incremental_bpa = args.get('incremental_bpa', False)
 
     # Run the analysis
     result = agent_policy.analysis_orch.comprehensive_analysis(
@@ -831,7 +832,8 @@ def handle_full_analysis(args: Dict[str, Any]) -> Dict[str, Any]:
         include_bpa=include_bpa,
         include_performance=include_performance,
         include_integrity=include_integrity,
-        max_seconds=max_seconds
+        max_seconds=max_seconds,
+        incremental_bpa=incremental_bpa
     )
 
     # Enrich issues with business impact context
@@ -5,6 +5,7 @@ Handles DAX context analysis and debugging operations with integrated validation
 from typing import Dict, Any, Tuple, Optional
 import logging
 from server.registry import ToolDefinition
+from core.infrastructure.adomd_commands import read_scalar
 from core.infrastructure.connection_state import connection_state
 from core.validation.error_handler import ErrorHandler
 
@@ -81,10 +82,9 @@ def _get_server_db_model(conn_state):
         try:
             db_query = "SELECT [CATALOG_NAME] FROM $SYSTEM.DBSCHEMA_CATALOGS"
             cmd = AdomdCommand(db_query, connection)
-            reader = cmd.ExecuteReader()
-            if reader.Read():
-                db_name = str(reader.GetValue(0))
-            reader.Close()
+            value = read_scalar(cmd, connection)
+            if value is not None:
+                db_name = str(value)
         except Exception:
             db_name = None
 
@@ -945,6 +945,7 @@ def handle_get_debug_status(args: Dict[str, Any]) -> Dict[str, Any]:
                     'compare_measures': is_connected
                 },
                 'pages': pages,
+                'caches': _get_cache_stats(is_connected),
                 'recommendations': _get_recommendations(pbip_info, is_connected)
             }
 
@@ -953,6 +954,22 @@ def handle_get_debug_status(args: Dict[str, Any]) -> Dict[str, Any]:
         return ErrorHandler.handle_unexpected_error('get_debug_status', e)
 
 
+def _get_cache_stats(is_connected: bool) -> Dict[str, Any]:
+    """Statistics of the server cache, the connection's query cache and result cursors."""
+    caches: Dict[str, Any] = {}
+    policy = connection_state.agent_policy
+    cache_manager = getattr(policy, 'cache_manager', None) if policy else None
+    if cache_manager is not None:
+        caches['server'] = cache_manager.get_stats()
+    if is_connected and connection_state.query_executor:
+        caches['query'] = connection_state.query_executor.get_cache_stats()
+    from core.infrastructure.result_cursors import get_result_cursor_store
+    cursor_store = get_result_cursor_store()
+    if cursor_store is not None:
+        caches['result_cursors'] = cursor_store.get_stats()
+    return caches
+
+
 def _get_recommendations(pbip_info: Dict, is_connected: bool) -> List[str]:
     """Generate recommendations based on current status."""
     recommendations = []
@@ -1667,7 +1684,7 @@ def register_debug_handlers(registry):
         ),
         ToolDefinition(
             name="09_Get_Debug_Status",
-            description="[09_Debug] Get the current debug capabilities status - shows whether PBIP and model connection are available.",
+            description="[09_Debug] Get the current debug capabilities status - shows whether PBIP and model connection are available. compact=false adds cache statistics (bytes and hit rates).",
             handler=handle_get_debug_status,
             input_schema={
                 "type": "object",
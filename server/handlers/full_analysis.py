@@ -214,6 +214,8 @@ def run_full_analysis(
                     'description': v.description
                 })
             sections['bpa'] = {'success': True, 'violations_count': len(viols), 'summary': summary, 'violations': trimmed}
+            if isinstance(bpa_cfg, dict) and bpa_cfg.get('incremental') and hasattr(bpa_analyzer, 'get_incremental_stats'):
+                sections['bpa']['incremental'] = bpa_analyzer.get_incremental_stats()
             if isinstance(bpa_cfg, dict) and bpa_cfg:
                 sections['bpa'].setdefault('notes', []).append('BPA fast mode with configured filters applied')
         else:
@@ -7,8 +7,11 @@ Provides MCP tool handlers for PBIP dependency analysis.
 import logging
 import traceback
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
+from core.execution.search_helper import SearchHelper
+from core.execution.search_index import get_file_search_index
+from core.model.hybrid_reader import HybridReader
 from core.pbip.pbip_dependency_engine import PbipDependencyEngine
 from core.pbip.pbip_model_analyzer import TmdlModelAnalyzer
 from core.pbip.pbip_report_analyzer import PbirReportAnalyzer
@@ -200,6 +203,127 @@ def handle_generate_pbip_dependency_diagram(
         }
 
 
+def handle_read_hybrid_sample_data(
+    analysis_path: str,
+    table_name: Optional[str] = None,
+    max_rows: int = 100,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Read sample rows exported by the hybrid analysis.
+
+    The parquet parts are scanned lazily with column projection and filter
+    pushdown, so only the requested rows are materialized.
+
+    Args:
+        analysis_path: Exported hybrid analysis folder
+        table_name: Table to read; omitted = list tables with sample data
+        max_rows: Maximum rows to return
+        columns: Optional column projection
+        filters: Optional predicates ({"column", "op", "value"}), ANDed
+
+    Returns:
+        Result dictionary with rows, columns and the table's total row count
+    """
+    try:
+        reader = HybridReader(analysis_path)
+        if not table_name:
+            return {
+                'success': True,
+                'tables': reader.list_sample_data_tables()
+            }
+
+        sample = reader.read_sample_data(table_name, max_rows=max_rows, columns=columns, filters=filters)
+        if sample is None:
+            return {
+                'success': False,
+                'error': f"No sample data available for table '{table_name}'",
+                'error_type': 'not_found',
+                'available_tables': reader.list_sample_data_tables()
+            }
+        return {'success': True, 'table': table_name, **sample}
+
+    except ValueError as e:
+        return {
+            'success': False,
+            'error': str(e),
+            'error_type': 'invalid_input'
+        }
+    except Exception as e:
+        logger.error(f"Error reading hybrid sample data: {str(e)}\n{traceback.format_exc()}")
+        return {
+            'success': False,
+            'error': f"Sample data read failed: {str(e)}",
+            'error_type': 'read_error'
+        }
+
+
+def handle_search_pbip_metadata(
+    path: str,
+    search_text: str,
+    types: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+    mode: str = 'substring',
+    max_results: int = 200
+) -> Dict[str, Any]:
+    """
+    Search tables, columns and measures of an offline model.
+
+    Uses the in-process metadata index built from the TMDL files, so no
+    connection to Power BI Desktop is needed.
+
+    Args:
+        path: PBIP project, .SemanticModel folder, TMDL definition folder or hybrid package
+        search_text: Text to find (* and ? wildcards in substring mode)
+        types: Object types to search (tables, columns, measures)
+        fields: Fields to match in (name, description, display_folder, expression)
+        mode: "substring", "token" or "prefix"
+        max_results: Maximum results to return
+
+    Returns:
+        Result dictionary with matching objects
+    """
+    try:
+        index = get_file_search_index(path)
+        if index is None:
+            return {
+                'success': False,
+                'error': f"No TMDL definition found under: {path}",
+                'error_type': 'not_found'
+            }
+
+        result = SearchHelper.search_objects_indexed(
+            index, search_text, types or ['tables', 'columns', 'measures'],
+            fields=fields or ['name'], mode=mode
+        )
+        rows = result['rows']
+        truncated = len(rows) > max_results
+        result.update({
+            'rows': rows[:max_results],
+            'results': rows[:max_results],
+            'row_count': min(len(rows), max_results),
+            'count': len(rows),
+            'truncated': truncated,
+            'indexed_objects': len(index)
+        })
+        return result
+
+    except ValueError as e:
+        return {
+            'success': False,
+            'error': str(e),
+            'error_type': 'invalid_input'
+        }
+    except Exception as e:
+        logger.error(f"Error searching PBIP metadata: {str(e)}\n{traceback.format_exc()}")
+        return {
+            'success': False,
+            'error': f"Metadata search failed: {str(e)}",
+            'error_type': 'search_error'
+        }
+
+
 def register_hybrid_analysis_handlers(registry):
     """Register hybrid analysis tool handlers"""
 
@@ -218,4 +342,22 @@ def register_hybrid_analysis_handlers(registry):
         sort_order=72  # 07 = PBIP Analysis
     ))
 
-    logger.info("Registered 1 hybrid analysis handler")
+    registry.register(ToolDefinition(
+        name='07_PBIP_Sample_Data',
+        description='[PBIP Analysis] Read sample rows from an exported hybrid analysis package. Supports column projection and simple filters (==, !=, >, <, in, contains, is_null...) pushed down to the parquet scan. Omit table_name to list tables with sample data.',
+        handler=make_handler(handle_read_hybrid_sample_data),
+        input_schema=TOOL_SCHEMAS['hybrid_sample_data'],
+        category='pbip',
+        sort_order=73  # 07 = PBIP Analysis
+    ))
+
+    registry.register(ToolDefinition(
+        name='07_PBIP_Search',
+        description='[PBIP Analysis] Search tables, columns and measures of a PBIP project or hybrid analysis package offline. Matches names, descriptions, display folders and DAX expressions by substring (with * and ? wildcards), whole words or word prefixes.',
+        handler=make_handler(handle_search_pbip_metadata),
+        input_schema=TOOL_SCHEMAS['pbip_search'],
+        category='pbip',
+        sort_order=73  # 07 = PBIP Analysis
+    ))
+
+    logger.info("Registered 3 hybrid analysis handlers")
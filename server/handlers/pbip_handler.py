@@ -173,11 +173,17 @@ def handle_analyze_pbip_repository(args: Dict[str, Any]) -> Dict[str, Any]:
                 enhanced_results=result
             )
 
-            return {
+            response = {
                 'success': True,
                 'html_report': html_file_path,
                 'message': f'HTML report generated: {html_file_path}'
             }
+            if result.get('partial'):
+                # Budget expired during the enhanced analysis; report covers what finished
+                response['partial'] = True
+                response['timed_out'] = result.get('timed_out', False)
+                response['cancellation'] = result.get('cancellation')
+            return response
         except Exception as html_error:
             logger.error(f"HTML generation failed: {html_error}", exc_info=True)
             return {
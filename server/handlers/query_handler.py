@@ -7,6 +7,7 @@ import logging
 from server.registry import ToolDefinition
 from core.infrastructure.connection_state import connection_state
 from core.validation.error_handler import ErrorHandler
+from core.validation.pagination_helpers import apply_pagination
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,8 @@ def handle_run_dax(args: Dict[str, Any]) -> Dict[str, Any]:
         max_rows=top_n
     )
 
-    return result
+    # Optional paging; later pages are served from the result cursor without re-running the query
+    return apply_pagination(result, args)
 
 def handle_get_data_sources(args: Dict[str, Any]) -> Dict[str, Any]:
     """List data sources with fallback to TOM"""
@@ -92,6 +94,14 @@ def register_query_handlers(registry):
                         "description": "Execution mode: 'auto' (smart choice), 'analyze' or 'profile' (with timing analysis), 'simple' (preview only)",
                         "enum": ["auto", "analyze", "profile", "simple"],
                         "default": "auto"
+                    },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Return the rows in pages of this size (optional)"
+                    },
+                    "next_token": {
+                        "type": "string",
+                        "description": "Token from the previous page; the page is read from the held result, not re-queried"
                     }
                 },
                 "required": ["query"]
@@ -16,7 +16,10 @@ def paginate(result: Any, page_size: Optional[int], next_token: Optional[str], l
         list_keys: Keys in result dict that contain lists to paginate
 
     Returns:
-        Result with paginated data and next_token if more data available
+        Result with paginated data and next_token if more data available.
+        The rows after the page are held in the result cursor store and the
+        token names the cursor, so the dispatcher can serve the next page
+        without running the tool again (see continue_from_cursor).
     """
     if not isinstance(result, dict) or not result.get('success'):
         return result
@@ -33,14 +36,14 @@ def paginate(result: Any, page_size: Optional[int], next_token: Optional[str], l
             'error_type': 'ValidationError'
         }
 
-    # Parse token (format: "key:offset")
+    # Parse token (format: "key:offset", or "key:offset:cursor" when the rest is held in a cursor)
     start_offset = 0
     target_key = None
     if next_token:
         try:
-            parts = next_token.split(':', 1)
-            if len(parts) == 2:
-                target_key, offset_str = parts
+            parts = next_token.split(':', 2)
+            if len(parts) >= 2:
+                target_key, offset_str = parts[0], parts[1]
                 start_offset = int(offset_str)
                 # Validate offset is non-negative and reasonable
                 if start_offset < 0 or start_offset > 1000000:
@@ -76,6 +79,9 @@ def paginate(result: Any, page_size: Optional[int], next_token: Optional[str], l
 
         if token is not None:
             new_token = f"{key}:{token}"
+            cursor_id = _open_cursor(result, key, arr, int(token), page_size)
+            if cursor_id:
+                new_token = f"{new_token}:{cursor_id}"
             break
 
     # Add pagination metadata
@@ -88,6 +94,61 @@ def paginate(result: Any, page_size: Optional[int], next_token: Optional[str], l
 
     return result
 
+def _open_cursor(result: dict, key: str, arr: list, end: int, page_size: int) -> Optional[str]:
+    """Hold the rows after this page in the cursor store so later pages skip the re-run."""
+    try:
+        from core.infrastructure.result_cursors import get_result_cursor_store
+        from core.infrastructure.cancellation import current_cancellation_token
+        store = get_result_cursor_store()
+        if store is None:
+            return None
+        envelope = {k: v for k, v in result.items() if k not in (key, 'next_token', 'has_more')}
+        return store.open(arr[end:], envelope, current_cancellation_token().label, key,
+                          page_size, end, len(arr))
+    except Exception:
+        return None
+
+def continue_from_cursor(tool_name: str, arguments: Optional[dict]) -> Optional[dict]:
+    """
+    Serve a follow-up page from the cursor named in next_token
+
+    Args:
+        tool_name: Tool being called (cursors are only served to the tool that opened them)
+        arguments: Tool arguments (next_token, optional page_size)
+
+    Returns:
+        The page result, or None when the token has no live cursor (the tool
+        then runs and paginates as usual)
+    """
+    next_token = (arguments or {}).get('next_token')
+    if not isinstance(next_token, str) or next_token.count(':') != 2:
+        return None
+    key, offset_str, cursor_id = next_token.split(':', 2)
+    page_size = (arguments or {}).get('page_size')
+    try:
+        offset = int(offset_str)
+        page_size = int(page_size) if page_size else None
+    except (ValueError, TypeError):
+        return None
+    if page_size is not None and not 0 < page_size <= 10000:
+        return None
+
+    from core.infrastructure.result_cursors import get_result_cursor_store
+    store = get_result_cursor_store()
+    page = store.read_page(cursor_id, offset, page_size, owner=tool_name) if store is not None else None
+    if page is None or page['cursor'].list_key != key:
+        return None
+
+    result = {k: (list(v) if isinstance(v, list) else v) for k, v in page['cursor'].envelope.items()}
+    result[key] = page['rows']
+    result['from_cursor'] = True
+    if page['next_offset'] is not None:
+        result['next_token'] = f"{key}:{page['next_offset']}:{cursor_id}"
+        result['has_more'] = True
+    else:
+        result['has_more'] = False
+    return result
+
 def paginate_section(arr: Any, size: Optional[Any], offset: int = 0) -> Tuple[list, Optional[str]]:
     """
     Paginate a single array section
@@ -136,13 +197,15 @@ def schema_sample(rows: List[dict], sample_size: int) -> dict:
         'is_sample': total > sample_size
     }
 
-def truncate_if_needed(result: dict, max_tokens: int = 100000) -> dict:
+def truncate_if_needed(result: dict, max_tokens: int = 100000, estimated_tokens: Optional[int] = None) -> dict:
     """
     Truncate large results to prevent token overflow
 
     Args:
         result: Result dictionary
         max_tokens: Approximate max tokens (rough estimate: 4 chars = 1 token)
+        estimated_tokens: Token estimate from an encode the caller already did
+            (the result is serialized here otherwise)
 
     Returns:
         Possibly truncated result with metadata
@@ -152,8 +215,8 @@ def truncate_if_needed(result: dict, max_tokens: int = 100000) -> dict:
 
     try:
         # Rough token estimation
-        json_str = json.dumps(result)
-        estimated_tokens = len(json_str) // 4
+        if estimated_tokens is None:
+            estimated_tokens = len(json.dumps(result)) // 4
 
         if estimated_tokens <= max_tokens:
             return result
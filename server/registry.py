@@ -4,7 +4,10 @@ Manages registration and lookup of tool handlers
 """
 from typing import Dict, Callable, Any, List
 from dataclasses import dataclass
+import importlib
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +21,38 @@ class ToolDefinition:
     category: str = "general"
     sort_order: int = 999  # Default to end if not specified
 
+class LazyHandler:
+    """
+    Placeholder handler of a tool listed from the tool catalog
+
+    The first call imports the handler module and runs its register function,
+    which replaces the placeholders of all the module's tools with the real
+    definitions, then forwards the call.
+    """
+
+    def __init__(self, registry: "HandlerRegistry", tool_name: str, module_name: str, register_name: str):
+        self.registry = registry
+        self.tool_name = tool_name
+        self.module_name = module_name
+        self.register_name = register_name
+
+    def __call__(self, args: Dict[str, Any]) -> Any:
+        self.registry.load_module(self.module_name, self.register_name)
+        handler = self.registry.get_handler(self.tool_name)
+        if isinstance(handler, LazyHandler):
+            raise KeyError(f"Tool {self.tool_name} was not registered by {self.module_name}.{self.register_name}")
+        return handler(args)
+
+
 class HandlerRegistry:
     """Central registry for all tool handlers"""
 
     def __init__(self):
         self._handlers: Dict[str, ToolDefinition] = {}
         self._categories: Dict[str, List[str]] = {}
+        # (module, register function) -> import + registration time in ms
+        self._loaded_modules: Dict[tuple, float] = {}
+        self._load_lock = threading.RLock()
 
     def register(self, tool_def: ToolDefinition) -> None:
         """Register a tool handler"""
@@ -32,7 +61,8 @@ class HandlerRegistry:
         # Track by category
         if tool_def.category not in self._categories:
             self._categories[tool_def.category] = []
-        self._categories[tool_def.category].append(tool_def.name)
+        if tool_def.name not in self._categories[tool_def.category]:
+            self._categories[tool_def.category].append(tool_def.name)
 
         logger.debug(f"Registered tool: {tool_def.name} (category: {tool_def.category})")
 
@@ -81,6 +111,41 @@ class HandlerRegistry:
         """Check if tool is registered"""
         return tool_name in self._handlers
 
+    def register_lazy(self, entry: Dict[str, Any]) -> None:
+        """Register a tool from a tool catalog entry; its module is imported on first call"""
+        self.register(ToolDefinition(
+            name=entry['name'],
+            description=entry['description'],
+            handler=LazyHandler(self, entry['name'], entry['module'], entry['register']),
+            input_schema=entry['input_schema'],
+            category=entry.get('category', 'general'),
+            sort_order=entry.get('sort_order', 999),
+        ))
+
+    def load_module(self, module_name: str, register_name: str) -> List[str]:
+        """
+        Import a handler module and run its register function (once)
+
+        Returns:
+            Names of the tools the register function defined
+        """
+        key = (module_name, register_name)
+        with self._load_lock:
+            if key in self._loaded_modules:
+                return []
+            start = time.perf_counter()
+            before = {name: tool.handler for name, tool in self._handlers.items()}
+            register = getattr(importlib.import_module(module_name), register_name)
+            register(self)
+            self._loaded_modules[key] = round((time.perf_counter() - start) * 1000, 2)
+            logger.debug(f"Loaded {module_name} in {self._loaded_modules[key]}ms")
+            return [name for name, tool in self._handlers.items() if before.get(name) is not tool.handler]
+
+    def get_load_stats(self) -> Dict[str, float]:
+        """Import + registration time (ms) of each handler module loaded so far"""
+        with self._load_lock:
+            return {f"{module}.{register}": ms for (module, register), ms in self._loaded_modules.items()}
+
 # Global registry instance
 _registry = HandlerRegistry()
 
@@ -0,0 +1,158 @@
+"""
+Response Pipeline
+Serializes each tool result once; that encode drives token estimation,
+limits info, the overflow guard and truncation
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import logging
+
+from server.middleware import truncate_if_needed
+
+logger = logging.getLogger(__name__)
+
+# Tools whose over-limit responses are blocked instead of truncated
+HIGH_TOKEN_TOOLS = frozenset({
+    'full_analysis', 'export_tmdl', 'analyze_model_bpa',
+    '05_Live_Model_Full_Analysis', '11_TMDL_Operations'
+})
+
+# Below this many characters (~1000 tokens) skip suggestions and truncation
+SMALL_RESPONSE_CHARS = 4000
+
+# Containers nested deeper than this are encoded in one C-level json.dumps call
+_STREAM_DEPTH = 2
+
+_dumps = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def _iter_json(value: Any, depth: int = 0) -> Iterator[str]:
+    """Yield the compact JSON encoding of value in chunks (top-level keys and list items)."""
+    if depth < _STREAM_DEPTH and isinstance(value, dict) and value and all(type(k) is str for k in value):
+        prefix = '{'
+        for key, item in value.items():
+            yield f"{prefix}{_dumps(key)}:"
+            yield from _iter_json(item, depth + 1)
+            prefix = ','
+        yield '}'
+    elif depth < _STREAM_DEPTH and isinstance(value, (list, tuple)) and value:
+        prefix = '['
+        for item in value:
+            yield prefix
+            yield from _iter_json(item, depth + 1)
+            prefix = ','
+        yield ']'
+    else:
+        yield _dumps(value)
+
+
+@dataclass
+class EncodedResponse:
+    """Compact JSON for a result, or its prefix if encoding stopped at the size cap."""
+    text: str
+    chars: int
+    complete: bool
+
+
+def encode_response(result: Any, max_chars: Optional[int] = None) -> EncodedResponse:
+    """
+    Encode a result as compact JSON, stopping early past max_chars
+
+    Args:
+        result: JSON-serializable result
+        max_chars: Stop once the encoding is at least this long (None = no cap)
+
+    Returns:
+        EncodedResponse; when complete is False, chars is a lower bound
+    """
+    chunks: List[str] = []
+    chars = 0
+    for chunk in _iter_json(result):
+        chunks.append(chunk)
+        chars += len(chunk)
+        if max_chars is not None and chars >= max_chars:
+            return EncodedResponse(''.join(chunks), chars, False)
+    return EncodedResponse(''.join(chunks), chars, True)
+
+
+class ResponsePipeline:
+    """Turns a handler result into the response text with one serialization."""
+
+    def __init__(self, agent_policy, limits_manager):
+        self.agent_policy = agent_policy
+        self.limits_manager = limits_manager
+
+    def process(self, tool_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Attach limits info, block or truncate oversized results
+
+        Returns:
+            Dict with 'result' (the final result dict) and 'text' (its JSON)
+        """
+        if self.limits_manager is None:
+            return {'result': result, 'text': _dumps(result)}
+
+        token_limits = self.limits_manager.token
+        chars_per_token = token_limits.chars_per_token
+        max_tokens = token_limits.max_result_tokens
+
+        encoded = encode_response(result, max_chars=max_tokens * chars_per_token)
+        estimated_tokens = encoded.chars // chars_per_token
+        if not encoded.complete:
+            logger.debug(f"{tool_name}: encoding stopped at {encoded.chars:,} chars (over the token budget)")
+
+        had_limits_info = '_limits_info' in result
+        result = self.agent_policy.wrap_response_with_limits_info(result, tool_name, estimated_tokens=estimated_tokens)
+        limits_info = result.get('_limits_info') or {}
+        token_info = limits_info.get('token_usage', {})
+
+        if encoded.chars >= SMALL_RESPONSE_CHARS:
+            if token_info.get('level') == 'over' and tool_name in HIGH_TOKEN_TOOLS:
+                blocked = self._blocked_response(tool_name, token_info, encoded.complete)
+                return {'result': blocked, 'text': _dumps(blocked)}
+
+            suggestion = self.agent_policy.suggest_optimizations(tool_name, result)
+            if suggestion:
+                result.setdefault('_limits_info', {})['suggestion'] = suggestion
+
+            truncated = truncate_if_needed(result, max_tokens, estimated_tokens=estimated_tokens)
+            if truncated is not result:
+                # Truncation builds a new, smaller dict; encode that instead
+                return {'result': truncated, 'text': _dumps(truncated)}
+
+        if not encoded.complete:
+            return {'result': result, 'text': _dumps(result)}
+        if '_limits_info' not in result:
+            return {'result': result, 'text': encoded.text}
+        if had_limits_info or encoded.text == '{}':
+            return {'result': result, 'text': _dumps(result)}
+
+        # _limits_info was appended last: splice it onto the encoding made above
+        text = f"{encoded.text[:-1]},\"_limits_info\":{_dumps(result['_limits_info'])}}}"
+        return {'result': result, 'text': text}
+
+    @staticmethod
+    def _blocked_response(tool_name: str, token_info: Dict[str, Any], complete: bool) -> Dict[str, Any]:
+        estimated = token_info['estimated_tokens']
+        at_least = '' if complete else 'at least '
+        return {
+            'success': False,
+            'error': 'Response would exceed token limit',
+            'error_type': 'token_limit_exceeded',
+            'estimated_tokens': estimated,
+            'max_tokens': token_info['max_tokens'],
+            'percentage': token_info['percentage'],
+            'requires_user_confirmation': True,
+            'tool_name': tool_name,
+            'message': (
+                f"The '{tool_name}' tool would return {at_least}{estimated:,} tokens, "
+                f"exceeding the {token_info['max_tokens']:,} token limit ({token_info['percentage']}). "
+                f"\n\nThis response has been BLOCKED to prevent automatic overflow. "
+                f"\n\nPlease choose one of these options:"
+                f"\n  1. Use 'summary_only=true' parameter for a compact summary"
+                f"\n  2. Use pagination with 'limit' and 'offset' parameters"
+                f"\n  3. Export results to a file instead (use export tools)"
+                f"\n  4. Ask me to proceed anyway (response will be truncated)"
+            )
+        }
@@ -0,0 +1,80 @@
+"""
+Tool Catalog Snapshot
+Tool metadata saved after a full registration so later starts can list tools
+without importing the handler modules.
+
+The snapshot (exports/cache/tool_catalog.json) holds every tool's name,
+description, input schema, category and sort order, plus the handler module
+and register function that define it. It is only used while its source
+fingerprint matches: size and mtime of every .py file under server/, where
+all tool definitions and schemas live. Any edit there makes the next start
+register eagerly and write a fresh snapshot.
+"""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+
+_SERVER_DIR = Path(__file__).parent
+
+
+def _catalog_path() -> Path:
+    """exports/cache under the project root (where the other caches live)."""
+    return _SERVER_DIR.parent / "exports" / "cache" / "tool_catalog.json"
+
+
+def source_fingerprint() -> str:
+    """Hash of the size and mtime of the files that define tools."""
+    digest = hashlib.sha1(str(CATALOG_VERSION).encode())
+    for path in sorted(_SERVER_DIR.rglob("*.py")):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.relative_to(_SERVER_DIR).as_posix()}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def load_tool_catalog(fingerprint: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Tool entries of the snapshot
+
+    Args:
+        fingerprint: Current source fingerprint (computed if omitted)
+
+    Returns:
+        Entries in registration order, or None when there is no snapshot or it
+        was written for different sources
+    """
+    path = _catalog_path()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable tool catalog {path}: {e}")
+        return None
+    if data.get('fingerprint') != (fingerprint or source_fingerprint()):
+        return None
+    tools = data.get('tools')
+    return tools if isinstance(tools, list) and tools else None
+
+
+def save_tool_catalog(tools: List[Dict[str, Any]], fingerprint: Optional[str] = None) -> None:
+    """Write the snapshot (best effort; a read-only install just keeps registering eagerly)."""
+    path = _catalog_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint or source_fingerprint(), 'tools': tools}, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.debug(f"Could not write tool catalog {path}: {e}")
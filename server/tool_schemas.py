@@ -499,6 +499,11 @@ TOOL_SCHEMAS = {
                 "description": "Optional maximum execution time in seconds (primarily affects BPA analysis)",
                 "minimum": 5,
                 "maximum": 300
+            },
+            "incremental_bpa": {
+                "type": "boolean",
+                "description": "Re-check BPA rules only for objects changed since the previous incremental run on this connection (first run is full). Result includes skip statistics",
+                "default": False
             }
         },
         "required": [],
@@ -528,6 +533,11 @@ TOOL_SCHEMAS = {
                 "scope": "all",
                 "depth": "balanced",
                 "max_seconds": 30
+            },
+            {
+                "_description": "Re-run BPA after editing a few measures (only changed objects are re-checked)",
+                "scope": "best_practices",
+                "incremental_bpa": True
             }
         ]
     },
@@ -863,6 +873,118 @@ Display BOTH outputs to the user - formatted_output first, then mermaid_diagram_
         ]
     },
 
+    'hybrid_sample_data': {
+        "type": "object",
+        "properties": {
+            "analysis_path": {
+                "type": "string",
+                "description": "Path to an exported hybrid analysis folder (contains analysis/ and sample_data/)"
+            },
+            "table_name": {
+                "type": "string",
+                "description": "Table to read. Omit to list the tables that have sample data."
+            },
+            "max_rows": {
+                "type": "integer",
+                "description": "Maximum rows to return (default: 100)",
+                "default": 100
+            },
+            "columns": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Optional column projection; only these columns are read"
+            },
+            "filters": {
+                "type": "array",
+                "description": "Optional predicates, combined with AND and pushed down to the parquet scan",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "column": {"type": "string"},
+                        "op": {
+                            "type": "string",
+                            "enum": ["==", "!=", ">", ">=", "<", "<=", "in", "not_in", "contains", "is_null", "not_null"],
+                            "default": "=="
+                        },
+                        "value": {"description": "Comparison value (a list for in / not_in)"}
+                    },
+                    "required": ["column"]
+                }
+            }
+        },
+        "required": ["analysis_path"],
+        "examples": [
+            {
+                "_description": "Preview 20 rows of two columns",
+                "analysis_path": "C:/exports/MyModel_analysis",
+                "table_name": "Sales",
+                "max_rows": 20,
+                "columns": ["OrderDate", "Amount"]
+            },
+            {
+                "_description": "Rows for one region with a large amount",
+                "analysis_path": "C:/exports/MyModel_analysis",
+                "table_name": "Sales",
+                "filters": [
+                    {"column": "Region", "op": "==", "value": "West"},
+                    {"column": "Amount", "op": ">", "value": 1000}
+                ]
+            }
+        ]
+    },
+
+    'pbip_search': {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "PBIP project folder, .SemanticModel folder, TMDL definition folder or exported hybrid analysis package"
+            },
+            "search_text": {
+                "type": "string",
+                "description": "Text to find. In substring mode * and ? act as wildcards."
+            },
+            "types": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["tables", "columns", "measures"]},
+                "description": "Object types to search (default: all)"
+            },
+            "fields": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["name", "description", "display_folder", "expression"]},
+                "description": "Fields to match in; an object matches if any field does (default: name)"
+            },
+            "mode": {
+                "type": "string",
+                "enum": ["substring", "token", "prefix"],
+                "description": "substring: case-insensitive contains; token: every word appears as a word; prefix: every word starts a word",
+                "default": "substring"
+            },
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum results to return (default: 200)",
+                "default": 200
+            }
+        },
+        "required": ["path", "search_text"],
+        "examples": [
+            {
+                "_description": "Measures whose DAX uses a column",
+                "path": "C:/repos/MyProject",
+                "search_text": "Sales[Amount]",
+                "types": ["measures"],
+                "fields": ["expression"]
+            },
+            {
+                "_description": "Objects with a word starting with 'rev' in name or description",
+                "path": "C:/exports/MyModel_analysis",
+                "search_text": "rev",
+                "fields": ["name", "description"],
+                "mode": "prefix"
+            }
+        ]
+    },
+
     # Slicer Operations (Tool 13) - PBIP Slicer Configuration & Visual Interactions
     'slicer_operations': {
         "type": "object",
@@ -38,6 +38,7 @@ from core.infrastructure.connection_state import connection_state
 # Import handler registry system
 from server.registry import get_registry
 from server.dispatch import ToolDispatcher
+from server.response_pipeline import ResponsePipeline
 from server.handlers import register_all_handlers
 from server.resources import get_resource_manager
 
@@ -85,7 +86,7 @@ connection_state.set_connection_manager(connection_manager)
 # Initialize handler registry and dispatcher
 registry = get_registry()
 register_all_handlers(registry)
-dispatcher = ToolDispatcher()
+dispatcher = ToolDispatcher(timeout_manager=timeout_manager)
 
 # Initialize MCP server
 app = Server("MCP-PowerBi-Finvision")
@@ -99,6 +100,7 @@ agent_policy = AgentPolicy(
 
 # Set agent_policy in connection_state so handlers can access it
 connection_state.agent_policy = agent_policy
+response_pipeline = ResponsePipeline(agent_policy, limits_manager)
 
 
 @app.list_tools()
@@ -174,73 +176,29 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent | ImageConten
                 'retry_after': rate_limiter.get_retry_after(name)
             }, separators=(',', ':')))]
 
-        # Dispatch to handler
-        result = dispatcher.dispatch(name, arguments)
+        # Dispatch to handler on the worker pool (keeps the event loop responsive)
+        result = await dispatcher.dispatch_async(name, arguments)
 
         # Record telemetry
         _dur = round((time.time() - _t0) * 1000, 2)
         logger.debug("Tool %s completed in %sms", name, _dur)
 
-        # Token tracking and limits awareness for all responses
-        if isinstance(result, dict):
-            # Check response size for optimization decisions
-            result_str = str(result)
-            is_likely_small = len(result_str) < 4000  # ~1000 tokens estimate
-
-            # Always add limits info (even for small responses)
-            result = agent_policy.wrap_response_with_limits_info(result, name)
-
-            # Only do expensive checks for large responses
-            if not is_likely_small:
-                # Check for token overflow (only for high-token tools)
-                if result.get('_limits_info', {}).get('token_usage', {}).get('level') == 'over':
-                    high_token_tools = {
-                        'full_analysis', 'export_tmdl', 'analyze_model_bpa',
-                        '05_Live_Model_Full_Analysis', '11_TMDL_Operations'
-                    }
-                    if name in high_token_tools:
-                        token_info = result['_limits_info']['token_usage']
-                        return [TextContent(type="text", text=json.dumps({
-                            'success': False,
-                            'error': 'Response would exceed token limit',
-                            'error_type': 'token_limit_exceeded',
-                            'estimated_tokens': token_info['estimated_tokens'],
-                            'max_tokens': token_info['max_tokens'],
-                            'percentage': token_info['percentage'],
-                            'requires_user_confirmation': True,
-                            'tool_name': name,
-                            'message': (
-                                f"The '{name}' tool would return {token_info['estimated_tokens']:,} tokens, "
-                                f"exceeding the {token_info['max_tokens']:,} token limit ({token_info['percentage']}%). "
-                                f"\n\nThis response has been BLOCKED to prevent automatic overflow. "
-                                f"\n\nPlease choose one of these options:"
-                                f"\n  1. Use 'summary_only=true' parameter for a compact summary"
-                                f"\n  2. Use pagination with 'limit' and 'offset' parameters"
-                                f"\n  3. Export results to a file instead (use export tools)"
-                                f"\n  4. Ask me to proceed anyway (response will be truncated)"
-                            )
-                        }, separators=(',', ':')))]
-
-                # Add optimization suggestions (only for large results)
-                suggestion = agent_policy.suggest_optimizations(name, result)
-                if suggestion:
-                    if '_limits_info' not in result:
-                        result['_limits_info'] = {}
-                    result['_limits_info']['suggestion'] = suggestion
-
-                # Apply global truncation
-                max_tokens = limits_manager.token.max_result_tokens
-                from server.middleware import truncate_if_needed
-                result = truncate_if_needed(result, max_tokens)
-
         # Special handling for get_recent_logs
         if name == "get_recent_logs" and isinstance(result, dict) and 'logs' in result:
             return [TextContent(type="text", text=result['logs'])]
 
-        # Handle responses with diagram content - generate professional HTML
-        if isinstance(result, dict) and '_image_content' in result:
-            result.pop('_image_content')  # Remove image content, we'll use Mermaid HTML instead
+        if not isinstance(result, dict):
+            return [TextContent(type="text", text=json.dumps(result, separators=(',', ':')))]
+
+        # Diagram content is replaced by generated HTML below; never serialize it
+        image_content = result.pop('_image_content', None)
 
+        # Token tracking, limits info and truncation off a single serialization
+        response = response_pipeline.process(name, result)
+        result = response['result']
+
+        # Handle responses with diagram content - generate professional HTML
+        if image_content is not None:
             # Get the mermaid code from diagram_metadata or regenerate
             mermaid_code = result.get('_mermaid_code', '')
             measure_info = result.get('measure', {})
@@ -250,7 +208,7 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent | ImageConten
             if 'formatted_output' in result:
                 text_output = result['formatted_output']
             else:
-                text_output = json.dumps(result, separators=(',', ':'))
+                text_output = response['text']
 
             # Generate and open HTML if we have mermaid code
             if mermaid_code:
@@ -277,7 +235,7 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent | ImageConten
 
             return [TextContent(type="text", text=text_output)]
 
-        return [TextContent(type="text", text=json.dumps(result, separators=(',', ':')))]
+        return [TextContent(type="text", text=response['text'])]
 
     except Exception as e:
         logger.error(f"Error in {name}: {e}", exc_info=True)